@@ -0,0 +1,9 @@
+"""Cache"""
+from .question_key import normalize_question, answer_cache_key
+from .single_flight import SingleFlight
+
+__all__ = [
+    'normalize_question',
+    'answer_cache_key',
+    'SingleFlight'
+]
@@ -0,0 +1,21 @@
+"""
+Chaves de cache a partir do texto da pergunta
+"""
+import re
+import unicodedata
+from typing import Optional
+
+
+_NON_WORD = re.compile(r"[^\w]+", re.UNICODE)
+
+
+def normalize_question(text: str) -> str:
+    """Minúsculas, sem acentos, pontuação nem espaços repetidos"""
+    decomposed = unicodedata.normalize("NFKD", text.lower())
+    without_accents = "".join(char for char in decomposed if not unicodedata.combining(char))
+    return _NON_WORD.sub(" ", without_accents).strip()
+
+
+def answer_cache_key(question_text: str, user_id: Optional[str], top_k: int) -> str:
+    """Chave da resposta: usuário/tenant, top_k e pergunta normalizada"""
+    return f"{user_id or ''}|{top_k}|{normalize_question(question_text)}"
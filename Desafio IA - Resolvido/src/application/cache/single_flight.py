@@ -0,0 +1,56 @@
+"""
+Coalescência de chamadas idênticas simultâneas (single-flight)
+"""
+import threading
+from concurrent.futures import Future
+from typing import Callable, Dict, Hashable, Tuple, TypeVar
+
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """
+    Executa uma única vez as chamadas com a mesma chave em andamento
+
+    A primeira chamada de uma chave executa a função; as que chegam enquanto
+    ela está em andamento esperam e recebem o mesmo resultado (ou a mesma
+    exceção). Nada é guardado depois que a chamada termina: não é um cache.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, Future] = {}
+
+    def do(self, key: Hashable, function: Callable[[], T]) -> Tuple[T, bool]:
+        """
+        Executa `function` ou espera a execução em andamento da chave
+
+        Returns:
+            (resultado, se foi compartilhado de outra chamada)
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._calls[key] = future
+
+        if not leader:
+            return future.result(), True
+
+        try:
+            result = function()
+            future.set_result(result)
+            return result, False
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+    @property
+    def in_flight(self) -> int:
+        with self._lock:
+            return len(self._calls)
@@ -1,10 +1,49 @@
 """Data Transfer Objects"""
 from .process_document_dto import ProcessDocumentInputDTO, ProcessDocumentOutputDTO
-from .ask_question_dto import AskQuestionInputDTO, AskQuestionOutputDTO
+from .ask_question_dto import AskQuestionInputDTO, AskQuestionOutputDTO, ReasoningOutputDTO
+from .index_dto import IndexOperationOutputDTO
+from .cache_dto import WarmCacheInputDTO, WarmCacheOutputDTO
+from .replay_dto import ReplayInputDTO, ReplayReportDTO
+from .watch_dto import WatchInputDTO, WatchEventDTO, WatchSummaryDTO
+from .pdf_calibration_dto import (
+    PDFCalibrationInputDTO,
+    PDFBackendResultDTO,
+    PDFCalibrationOutputDTO
+)
+from .retrieval_tuning_dto import (
+    TuningExampleDTO,
+    RetrievalTuningInputDTO,
+    RetrievalTuningRowDTO,
+    RetrievalTuningOutputDTO
+)
+from .benchmark_dto import (
+    DimensionBenchmarkInputDTO,
+    DimensionBenchmarkRowDTO,
+    DimensionBenchmarkOutputDTO
+)
 
 __all__ = [
     'ProcessDocumentInputDTO',
     'ProcessDocumentOutputDTO',
     'AskQuestionInputDTO',
-    'AskQuestionOutputDTO'
+    'AskQuestionOutputDTO',
+    'ReasoningOutputDTO',
+    'IndexOperationOutputDTO',
+    'WarmCacheInputDTO',
+    'WarmCacheOutputDTO',
+    'ReplayInputDTO',
+    'ReplayReportDTO',
+    'DimensionBenchmarkInputDTO',
+    'DimensionBenchmarkRowDTO',
+    'DimensionBenchmarkOutputDTO',
+    'PDFCalibrationInputDTO',
+    'PDFBackendResultDTO',
+    'PDFCalibrationOutputDTO',
+    'WatchInputDTO',
+    'WatchEventDTO',
+    'WatchSummaryDTO',
+    'TuningExampleDTO',
+    'RetrievalTuningInputDTO',
+    'RetrievalTuningRowDTO',
+    'RetrievalTuningOutputDTO'
 ]
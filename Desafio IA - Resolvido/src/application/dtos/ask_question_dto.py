@@ -1,16 +1,21 @@
 """
 DTOs para perguntas e respostas
 """
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+
+from src.domain.entities import SearchFilter
 
 
 @dataclass
 class AskQuestionInputDTO:
     """Input para fazer pergunta"""
     question_text: str
-    top_k: int = 5
+    top_k: Optional[int] = None  # None = padrão das configurações (TOP_K_RESULTS)
     user_id: Optional[str] = None
+    search_filter: Optional[SearchFilter] = None
+    fast_mode: Optional[bool] = None  # None = padrão das configurações
+    deadline_ms: Optional[float] = None  # prazo da requisição (None = padrão, 0 = sem prazo)
 
 
 @dataclass
@@ -22,6 +27,10 @@ class AskQuestionOutputDTO:
     reasoning: str
     citation: Optional[str]
     success: bool
+    timings: Dict[str, float] = field(default_factory=dict)  # ms por etapa
+    cached: bool = False  # servida pelo cache de respostas
+    coalesced: bool = False  # compartilhada de uma pergunta idêntica em andamento
+    degraded: bool = False  # prazo esgotado: apenas os trechos recuperados
 
     def to_dict(self) -> dict:
         """Converte para dicionário"""
@@ -32,3 +41,11 @@ class AskQuestionOutputDTO:
             "raciocinio": self.reasoning,
             "citacao": self.citation or "N/A"
         }
+
+
+@dataclass
+class ReasoningOutputDTO:
+    """Output do raciocínio gerado sob demanda"""
+    reasoning: str
+    success: bool
+    timings: Dict[str, float] = field(default_factory=dict)  # ms por etapa
@@ -0,0 +1,36 @@
+"""
+DTOs para avaliação de dimensões de embedding
+"""
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+
+@dataclass
+class DimensionBenchmarkInputDTO:
+    """Input da comparação de dimensões"""
+    dimensions: List[int]
+    top_k: int = 5
+    rerank_factor: int = 4
+    sample_size: int = 200
+    distance_space: str = "cosine"
+
+
+@dataclass
+class DimensionBenchmarkRowDTO:
+    """Resultado de uma dimensão (com ou sem re-rank)"""
+    dimension: int
+    rerank: bool
+    recall: float
+    search_ms: float
+    index_bytes: int
+
+
+@dataclass
+class DimensionBenchmarkOutputDTO:
+    """Output da comparação de dimensões"""
+    success: bool
+    full_dimension: int = 0
+    chunks_count: int = 0
+    queries_count: int = 0
+    rows: List[DimensionBenchmarkRowDTO] = field(default_factory=list)
+    message: Optional[str] = None
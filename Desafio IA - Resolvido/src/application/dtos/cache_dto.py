@@ -0,0 +1,26 @@
+"""
+DTOs para aquecimento do cache de respostas
+"""
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass
+class WarmCacheInputDTO:
+    """Input do aquecimento do cache"""
+    max_clusters: int = 50
+    min_count: int = 2  # ocorrências mínimas de um grupo de perguntas
+    similarity: float = 0.92  # similaridade (cosseno) para agrupar perguntas
+    max_questions: int = 5000  # perguntas distintas mais frequentes consideradas
+    since_days: int = 0  # 0 = log inteiro
+
+
+@dataclass
+class WarmCacheOutputDTO:
+    """Output do aquecimento do cache"""
+    success: bool
+    questions_count: int = 0
+    clusters_count: int = 0
+    answers_cached: int = 0
+    failed_count: int = 0
+    message: Optional[str] = None
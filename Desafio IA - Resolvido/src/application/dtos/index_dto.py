@@ -0,0 +1,14 @@
+"""
+DTOs para manutenção do índice vetorial
+"""
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass
+class IndexOperationOutputDTO:
+    """Output de uma operação de manutenção do índice"""
+    operation: str
+    chunks_count: int
+    success: bool
+    message: Optional[str] = None
@@ -0,0 +1,37 @@
+"""
+DTOs para calibração dos backends de extração de PDF
+"""
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+
+@dataclass
+class PDFCalibrationInputDTO:
+    """Input da calibração"""
+    file_paths: List[str]
+    reference: str = "pypdf"  # backend cujo texto define a paridade
+    min_parity: float = 0.95  # similaridade mínima com a referência
+
+
+@dataclass
+class PDFBackendResultDTO:
+    """Medição de um backend sobre a amostra"""
+    name: str
+    version: str
+    seconds: float
+    pages_count: int
+    chars_count: int
+    parity: float  # F1 dos termos por página em relação à referência
+    errors: int
+    acceptable: bool
+
+
+@dataclass
+class PDFCalibrationOutputDTO:
+    """Output da calibração"""
+    success: bool
+    selected: str = ""
+    reference: str = ""
+    files_count: int = 0
+    results: List[PDFBackendResultDTO] = field(default_factory=list)
+    message: Optional[str] = None
@@ -1,8 +1,8 @@
 """
 DTOs para processamento de documentos
 """
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, field
+from typing import Dict, Optional
 
 
 @dataclass
@@ -11,6 +11,7 @@ class ProcessDocumentInputDTO:
     file_path: str
     chunk_size: int = 1000
     chunk_overlap: int = 200
+    tenant_id: Optional[str] = None
 
 
 @dataclass
@@ -21,3 +22,4 @@ class ProcessDocumentOutputDTO:
     chunks_count: int
     success: bool
     message: Optional[str] = None
+    timings: Dict[str, float] = field(default_factory=dict)  # ms por etapa
@@ -0,0 +1,31 @@
+"""
+DTOs para replay de tráfego (teste de carga)
+"""
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+
+
+@dataclass
+class ReplayInputDTO:
+    """Input do replay"""
+    log_path: str
+    rate_scale: float = 1.0  # 2.0 = duas vezes mais rápido; 0 = sem espera entre chegadas
+    virtual_users: int = 8  # requisições simultâneas
+    limit: int = 0  # 0 = log inteiro
+
+
+@dataclass
+class ReplayReportDTO:
+    """Relatório do replay (tempos em ms)"""
+    success: bool
+    requests: int = 0
+    errors: int = 0
+    duration_s: float = 0.0
+    throughput_rps: float = 0.0
+    error_rate: float = 0.0
+    cache_hit_rate: float = 0.0
+    latency_ms: Dict[str, float] = field(default_factory=dict)  # chegada -> resposta
+    service_ms: Dict[str, float] = field(default_factory=dict)  # início -> resposta
+    stages_ms: Dict[str, Dict[str, float]] = field(default_factory=dict)
+    recorded_ms: Dict[str, float] = field(default_factory=dict)  # tempos do tráfego original
+    message: Optional[str] = None
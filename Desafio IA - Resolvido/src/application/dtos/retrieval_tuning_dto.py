@@ -0,0 +1,53 @@
+"""
+DTOs para ajuste dos parâmetros de recuperação (chunking e top_k)
+"""
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+
+@dataclass
+class TuningExampleDTO:
+    """Pergunta rotulada com o trecho que responde a ela"""
+    question: str
+    passage: str
+    source: Optional[str] = None  # restringe a busca do trecho a um PDF
+
+
+@dataclass
+class RetrievalTuningInputDTO:
+    """Input do ajuste"""
+    file_paths: List[str]
+    examples: List[TuningExampleDTO]
+    chunk_sizes: List[int] = field(default_factory=lambda: [500, 750, 1000, 1500])
+    chunk_overlaps: List[int] = field(default_factory=lambda: [0, 100, 200])
+    top_ks: List[int] = field(default_factory=lambda: [3, 5, 8])
+    min_coverage: float = 0.8  # fração do trecho coberta pelos chunks para contar acerto
+    recall_tolerance: float = 0.02  # recall abaixo do melhor aceito em troca de prompt menor
+    apply: bool = True  # grava a configuração escolhida
+
+
+@dataclass
+class RetrievalTuningRowDTO:
+    """Resultado de uma configuração"""
+    chunk_size: int
+    chunk_overlap: int
+    top_k: int
+    recall: float  # recall@k
+    context_chars: float  # tamanho médio do contexto enviado ao modelo
+    search_ms: float  # busca exata por pergunta
+    chunks_count: int
+    pareto: bool = False
+
+
+@dataclass
+class RetrievalTuningOutputDTO:
+    """Output do ajuste"""
+    success: bool
+    examples_count: int = 0
+    unmatched_count: int = 0  # trechos não encontrados nos PDFs (ignorados)
+    embedded_count: int = 0  # textos enviados ao modelo de embedding
+    cached_count: int = 0  # textos servidos pelo cache de embeddings
+    rows: List[RetrievalTuningRowDTO] = field(default_factory=list)
+    selected: Optional[RetrievalTuningRowDTO] = None
+    applied: bool = False
+    message: Optional[str] = None
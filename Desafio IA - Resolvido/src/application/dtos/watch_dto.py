@@ -0,0 +1,38 @@
+"""
+DTOs para ingestão contínua da pasta de documentos
+"""
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass
+class WatchInputDTO:
+    """Input da observação da pasta"""
+    folder: str
+    debounce_s: float = 2.0  # silêncio exigido após a última escrita do arquivo
+    max_workers: int = 2  # arquivos processados em paralelo
+    chunk_size: int = 1000
+    chunk_overlap: int = 200
+    sync_on_start: bool = True  # ingere PDFs da pasta que ainda não estão no índice
+    tenant_id: Optional[str] = None  # dono dos documentos ingeridos (None = compartilhados)
+
+
+@dataclass
+class WatchEventDTO:
+    """Resultado de um arquivo tratado"""
+    action: str  # ingest ou delete
+    filename: str
+    success: bool
+    chunks_count: int = 0
+    seconds: float = 0.0
+    message: Optional[str] = None
+
+
+@dataclass
+class WatchSummaryDTO:
+    """Output ao encerrar a observação"""
+    success: bool
+    ingested: int = 0
+    deleted: int = 0
+    failed: int = 0
+    message: Optional[str] = None
@@ -0,0 +1,8 @@
+"""Metrics"""
+from .metrics_collector import MetricsCollector, RequestMetrics, Histogram
+
+__all__ = [
+    'MetricsCollector',
+    'RequestMetrics',
+    'Histogram'
+]
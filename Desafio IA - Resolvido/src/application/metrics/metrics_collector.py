@@ -0,0 +1,177 @@
+"""
+Coletor de métricas por etapa (latência, contadores e histogramas)
+"""
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Tuple
+
+from src.domain.repositories import IMetricsExporter
+
+
+# Buckets padrão (segundos), mesmos do cliente oficial do Prometheus
+DEFAULT_BUCKETS = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0
+)
+
+
+class Histogram:
+    """Histograma cumulativo com buckets fixos"""
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self.bucket_counts = [0] * len(self.buckets)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        """Registra uma observação"""
+        self.sum += value
+        self.count += 1
+        for i, upper_bound in enumerate(self.buckets):
+            if value <= upper_bound:
+                self.bucket_counts[i] += 1
+
+    def to_dict(self) -> dict:
+        """Converte para dicionário"""
+        return {
+            "buckets": [
+                [upper_bound, count]
+                for upper_bound, count in zip(self.buckets, self.bucket_counts)
+            ],
+            "sum": self.sum,
+            "count": self.count
+        }
+
+
+class RequestMetrics:
+    """Métricas de uma única requisição (timers por etapa e contadores)"""
+
+    def __init__(self, operation: str):
+        self.operation = operation
+        self.timings: Dict[str, float] = {}
+        self.counters: Dict[str, float] = {}
+        self._started_at = time.perf_counter()
+
+    @contextmanager
+    def stage(self, name: str):
+        """Mede o tempo de uma etapa (acumula se a etapa se repetir)"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_timing(name, time.perf_counter() - start)
+
+    def add_timing(self, name: str, seconds: float) -> None:
+        """Adiciona tempo (em segundos) a uma etapa"""
+        self.timings[name] = self.timings.get(name, 0.0) + seconds
+
+    def add_timings(self, timings: Dict[str, float]) -> None:
+        """Adiciona tempos medidos em outra camada (ex: repositório de IA)"""
+        for name, seconds in timings.items():
+            self.add_timing(name, seconds)
+
+    def increment(self, name: str, value: float = 1) -> None:
+        """Incrementa um contador"""
+        self.counters[name] = self.counters.get(name, 0) + value
+
+    @property
+    def elapsed(self) -> float:
+        """Tempo total desde o início da requisição (segundos)"""
+        return time.perf_counter() - self._started_at
+
+    def timings_ms(self) -> Dict[str, float]:
+        """Retorna os tempos por etapa em milissegundos"""
+        return {
+            name: round(seconds * 1000, 3)
+            for name, seconds in self.timings.items()
+        }
+
+
+class MetricsCollector:
+    """
+    Agrega métricas de todas as requisições
+
+    Mantém um histograma por (operação, etapa) e contadores por
+    (operação, nome). A cada requisição concluída repassa o evento e o
+    agregado para os exportadores configurados.
+    """
+
+    def __init__(
+        self,
+        exporters: Optional[List[IMetricsExporter]] = None,
+        buckets: Tuple[float, ...] = DEFAULT_BUCKETS
+    ):
+        self.exporters = exporters or []
+        self.buckets = buckets
+        self._histograms: Dict[Tuple[str, str], Histogram] = {}
+        self._counters: Dict[Tuple[str, str], float] = {}
+        self._lock = threading.Lock()
+
+    def start_request(self, operation: str) -> RequestMetrics:
+        """Inicia a coleta de uma requisição"""
+        return RequestMetrics(operation)
+
+    def finish(self, request: RequestMetrics, success: bool) -> Dict[str, float]:
+        """
+        Finaliza a requisição, agrega e exporta suas métricas
+
+        Args:
+            request: Métricas da requisição
+            success: Se a requisição foi bem sucedida
+
+        Returns:
+            Tempos por etapa em milissegundos (inclui "total")
+        """
+        request.timings["total"] = request.elapsed
+        status = "success" if success else "error"
+
+        with self._lock:
+            for stage, seconds in request.timings.items():
+                key = (request.operation, stage)
+                if key not in self._histograms:
+                    self._histograms[key] = Histogram(self.buckets)
+                self._histograms[key].observe(seconds)
+
+            for name, value in request.counters.items():
+                self._add_counter(request.operation, name, value)
+            self._add_counter(request.operation, f"requests_{status}", 1)
+
+            snapshot = self._snapshot_unlocked()
+
+        event = {
+            "operation": request.operation,
+            "success": success,
+            "timings_ms": request.timings_ms(),
+            "counters": dict(request.counters)
+        }
+
+        for exporter in self.exporters:
+            try:
+                exporter.export(event, snapshot)
+            except Exception as e:
+                # Métricas nunca devem derrubar a requisição
+                print(f"Erro ao exportar métricas: {str(e)}")
+
+        return event["timings_ms"]
+
+    def snapshot(self) -> Dict:
+        """Retorna o agregado atual de histogramas e contadores"""
+        with self._lock:
+            return self._snapshot_unlocked()
+
+    def _add_counter(self, operation: str, name: str, value: float) -> None:
+        key = (operation, name)
+        self._counters[key] = self._counters.get(key, 0) + value
+
+    def _snapshot_unlocked(self) -> Dict:
+        return {
+            "histograms": [
+                {"operation": operation, "stage": stage, **histogram.to_dict()}
+                for (operation, stage), histogram in sorted(self._histograms.items())
+            ],
+            "counters": [
+                {"operation": operation, "name": name, "value": value}
+                for (operation, name), value in sorted(self._counters.items())
+            ]
+        }
@@ -0,0 +1,10 @@
+"""Resilience"""
+from .deadline import Deadline, DeadlineExceeded
+from .hedging import HedgedCaller, LatencyTracker
+
+__all__ = [
+    'Deadline',
+    'DeadlineExceeded',
+    'HedgedCaller',
+    'LatencyTracker'
+]
@@ -0,0 +1,40 @@
+"""
+Prazo de uma requisição (propagado entre as etapas)
+"""
+import time
+from typing import Optional
+
+
+class DeadlineExceeded(Exception):
+    """Uma etapa não terminou dentro do prazo da requisição"""
+
+    def __init__(self, stage: str):
+        super().__init__(f"Prazo esgotado na etapa '{stage}'")
+        self.stage = stage
+
+
+class Deadline:
+    """Instante limite da requisição (sem prazo quando timeout_s é None)"""
+
+    def __init__(self, timeout_s: Optional[float] = None):
+        self.timeout_s = timeout_s
+        self.expires_at = time.monotonic() + timeout_s if timeout_s else None
+
+    @classmethod
+    def from_ms(cls, timeout_ms: Optional[float]) -> "Deadline":
+        """Prazo em milissegundos (None ou <= 0 = sem prazo)"""
+        return cls(timeout_ms / 1000 if timeout_ms and timeout_ms > 0 else None)
+
+    @property
+    def bounded(self) -> bool:
+        return self.expires_at is not None
+
+    def remaining(self) -> Optional[float]:
+        """Segundos restantes (None = sem prazo)"""
+        if self.expires_at is None:
+            return None
+        return max(0.0, self.expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        return self.expires_at is not None and time.monotonic() >= self.expires_at
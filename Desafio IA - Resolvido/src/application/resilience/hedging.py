@@ -0,0 +1,165 @@
+"""
+Chamadas com hedge: duplicata após o percentil de latência observado
+"""
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Callable, Deque, Dict, Optional, Set, Tuple, TypeVar
+
+import numpy as np
+
+from src.application.resilience.deadline import Deadline, DeadlineExceeded
+
+
+T = TypeVar("T")
+
+
+class LatencyTracker:
+    """Janela das latências mais recentes de uma operação"""
+
+    def __init__(self, window: int = 200, min_samples: int = 20):
+        """
+        Args:
+            window: Latências mantidas
+            min_samples: Amostras necessárias antes de informar percentis
+        """
+        self.min_samples = min_samples
+        self._samples: Deque[float] = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float) -> None:
+        with self._lock:
+            self._samples.append(seconds)
+
+    def percentile(self, percentile: float) -> Optional[float]:
+        """Percentil da janela (None com poucas amostras)"""
+        with self._lock:
+            if len(self._samples) < self.min_samples:
+                return None
+            samples = np.fromiter(self._samples, dtype=np.float64)
+        return float(np.percentile(samples, percentile))
+
+
+class HedgedCaller:
+    """
+    Executa chamadas lentas com prazo e hedge
+
+    Se a chamada não responde até o percentil `percentile` das latências
+    recentes da operação, uma duplicata é enviada e vale a primeira resposta
+    bem-sucedida (sem exceção e aceita por `accept`, para repositórios que
+    devolvem o erro no resultado em vez de levantar). Quando o prazo acaba
+    antes, levanta DeadlineExceeded; a chamada abandonada termina em segundo
+    plano (não há como cancelar a requisição HTTP) e sua latência continua
+    alimentando a janela.
+
+    Sem prazo e com percentile = 0, a chamada roda direto na thread atual.
+    """
+
+    def __init__(
+        self,
+        percentile: float = 0.0,
+        min_samples: int = 20,
+        window: int = 200,
+        max_workers: int = 32
+    ):
+        """
+        Args:
+            percentile: Percentil de latência que dispara o hedge (0 desativa)
+            min_samples: Amostras de uma operação antes do primeiro hedge
+            window: Latências mantidas por operação
+            max_workers: Chamadas simultâneas (incluindo as abandonadas)
+        """
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.window = window
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="hedge")
+        self._trackers: Dict[str, LatencyTracker] = {}
+        self._lock = threading.Lock()
+
+    def tracker(self, operation: str) -> LatencyTracker:
+        with self._lock:
+            if operation not in self._trackers:
+                self._trackers[operation] = LatencyTracker(self.window, self.min_samples)
+            return self._trackers[operation]
+
+    def call(
+        self,
+        operation: str,
+        function: Callable[[], T],
+        deadline: Optional[Deadline] = None,
+        accept: Optional[Callable[[T], bool]] = None
+    ) -> Tuple[T, bool]:
+        """
+        Executa `function` respeitando o prazo
+
+        Args:
+            operation: Nome da operação (uma janela de latências por nome)
+            function: Chamada sem argumentos (reexecutada no hedge)
+            deadline: Prazo da requisição (None = sem prazo)
+            accept: Diz se o resultado é uma resposta válida (None = todo
+                resultado sem exceção). Resultados recusados não vencem as
+                tentativas pendentes nem entram na janela de latências
+
+        Returns:
+            (resultado, se o hedge foi enviado); se todas as tentativas
+            forem recusadas, o último resultado recusado
+
+        Raises:
+            DeadlineExceeded: Nenhuma resposta dentro do prazo
+        """
+        deadline = deadline or Deadline()
+        tracker = self.tracker(operation)
+
+        if not deadline.bounded and self.percentile <= 0:
+            return self._timed(function, tracker, accept), False
+
+        hedge_after = tracker.percentile(self.percentile) if self.percentile > 0 else None
+        started = time.monotonic()
+        pending: Set[Future] = {self._executor.submit(self._timed, function, tracker, accept)}
+        hedged = False
+        error: Optional[BaseException] = None
+        rejected: Optional[Future] = None
+
+        while pending:
+            timeout = deadline.remaining()
+            if hedge_after is not None and not hedged:
+                until_hedge = max(0.0, hedge_after - (time.monotonic() - started))
+                timeout = until_hedge if timeout is None else min(timeout, until_hedge)
+
+            done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is not None:
+                    error = future.exception()
+                elif accept is None or accept(future.result()):
+                    return future.result(), hedged
+                else:
+                    rejected = future
+
+            if deadline.expired:
+                raise DeadlineExceeded(operation)
+
+            if (
+                pending and hedge_after is not None and not hedged
+                and time.monotonic() - started >= hedge_after
+            ):
+                pending.add(self._executor.submit(self._timed, function, tracker, accept))
+                hedged = True
+
+        # Todas as tentativas falharam (o hedge não é um retry: não reenvia)
+        if rejected is not None:
+            return rejected.result(), hedged
+        raise error
+
+    @staticmethod
+    def _timed(
+        function: Callable[[], T],
+        tracker: LatencyTracker,
+        accept: Optional[Callable[[T], bool]] = None
+    ) -> T:
+        start = time.perf_counter()
+        result = function()
+        # Falhas rápidas não são latência real (puxariam o percentil do hedge para baixo)
+        if accept is None or accept(result):
+            tracker.record(time.perf_counter() - start)
+        return result
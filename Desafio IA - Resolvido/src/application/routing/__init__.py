@@ -0,0 +1,7 @@
+"""Routing"""
+from .answer_router import AnswerRouter, RoutingDecision
+
+__all__ = [
+    'AnswerRouter',
+    'RoutingDecision'
+]
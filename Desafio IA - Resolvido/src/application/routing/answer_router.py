@@ -0,0 +1,102 @@
+"""
+Roteamento da geração pela confiança da busca
+"""
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from src.domain.repositories import IRoutingLogRepository
+
+
+@dataclass(frozen=True)
+class RoutingDecision:
+    """Rota escolhida para uma pergunta"""
+    route: str  # not_found, light ou full
+    best_distance: Optional[float] = None
+
+    @property
+    def light(self) -> bool:
+        return self.route == AnswerRouter.LIGHT
+
+
+class AnswerRouter:
+    """
+    Decide se e com qual modelo uma pergunta é respondida
+
+    Usa a menor distância entre a pergunta e os chunks recuperados (mesma
+    métrica do índice, menor = mais próximo):
+    - acima de `not_found_distance`: nada relevante, responde "não
+      encontrado" sem chamar o modelo;
+    - até `light_distance`: pergunta fácil, vai para o modelo leve;
+    - caso contrário: modelo completo.
+
+    Limiar 0 desativa a rota correspondente. As decisões (com a confiança
+    da resposta final) vão para o log de roteamento, usado na calibração.
+    """
+
+    NOT_FOUND = "not_found"
+    LIGHT = "light"
+    FULL = "full"
+
+    def __init__(
+        self,
+        not_found_distance: float = 0.0,
+        light_distance: float = 0.0,
+        log_repository: Optional[IRoutingLogRepository] = None
+    ):
+        """
+        Inicializa o roteador
+
+        Args:
+            not_found_distance: Distância acima da qual não há contexto útil
+            light_distance: Distância até a qual o modelo leve responde
+            log_repository: Destino das decisões (None não registra)
+        """
+        if not_found_distance and light_distance and light_distance >= not_found_distance:
+            raise ValueError("light_distance deve ser menor que not_found_distance")
+
+        self.not_found_distance = not_found_distance
+        self.light_distance = light_distance
+        self.log_repository = log_repository
+
+    def route(self, context_chunks: List[Dict]) -> RoutingDecision:
+        """Escolhe a rota a partir das distâncias dos chunks recuperados"""
+        distances = [
+            chunk["distance"] for chunk in context_chunks
+            if chunk.get("distance") is not None
+        ]
+        if not distances:
+            # Sem distâncias não há como avaliar a busca
+            return RoutingDecision(route=self.FULL)
+
+        best_distance = float(min(distances))
+
+        if self.not_found_distance and best_distance > self.not_found_distance:
+            return RoutingDecision(route=self.NOT_FOUND, best_distance=best_distance)
+        if self.light_distance and best_distance <= self.light_distance:
+            return RoutingDecision(route=self.LIGHT, best_distance=best_distance)
+        return RoutingDecision(route=self.FULL, best_distance=best_distance)
+
+    def log(
+        self,
+        question_text: str,
+        decision: RoutingDecision,
+        context_chunks: List[Dict],
+        confidence: str
+    ) -> None:
+        """Registra a decisão e o resultado da resposta"""
+        if self.log_repository is None:
+            return
+
+        try:
+            self.log_repository.record({
+                "question": question_text,
+                "route": decision.route,
+                "best_distance": decision.best_distance,
+                "distances": [chunk.get("distance") for chunk in context_chunks],
+                "not_found_distance": self.not_found_distance,
+                "light_distance": self.light_distance,
+                "confidence": confidence
+            })
+        except Exception as e:
+            # O log de calibração nunca deve derrubar a requisição
+            print(f"Erro ao registrar roteamento: {str(e)}")
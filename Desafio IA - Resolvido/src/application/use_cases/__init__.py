@@ -1,8 +1,22 @@
 """Use Cases"""
 from .process_documents_use_case import ProcessDocumentsUseCase
 from .ask_question_use_case import AskQuestionUseCase
+from .manage_index_use_case import ManageIndexUseCase
+from .benchmark_dimensions_use_case import BenchmarkDimensionsUseCase
+from .warm_answer_cache_use_case import WarmAnswerCacheUseCase
+from .replay_traffic_use_case import ReplayTrafficUseCase
+from .calibrate_pdf_backends_use_case import CalibratePDFBackendsUseCase
+from .watch_documents_use_case import WatchDocumentsUseCase
+from .tune_retrieval_use_case import TuneRetrievalUseCase
 
 __all__ = [
     'ProcessDocumentsUseCase',
-    'AskQuestionUseCase'
+    'AskQuestionUseCase',
+    'ManageIndexUseCase',
+    'BenchmarkDimensionsUseCase',
+    'WarmAnswerCacheUseCase',
+    'ReplayTrafficUseCase',
+    'CalibratePDFBackendsUseCase',
+    'WatchDocumentsUseCase',
+    'TuneRetrievalUseCase'
 ]
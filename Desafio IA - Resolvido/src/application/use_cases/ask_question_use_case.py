@@ -1,17 +1,29 @@
 """
 Use Case: Fazer Pergunta
 """
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import replace
 from datetime import datetime
+from typing import Callable, Deque, Dict, Hashable, Iterable, Iterator, List, Optional, Tuple
 
-from src.domain.entities import Question
+from src.domain.entities import Question, SearchFilter
 from src.domain.repositories import (
     IVectorStoreRepository,
-    IAIRepository
+    IAIRepository,
+    IAnswerCacheRepository,
+    IQueryLogRepository
 )
 from src.application.dtos import (
     AskQuestionInputDTO,
-    AskQuestionOutputDTO
+    AskQuestionOutputDTO,
+    ReasoningOutputDTO
 )
+from src.application.metrics import MetricsCollector, RequestMetrics
+from src.application.routing import AnswerRouter, RoutingDecision
+from src.application.cache import SingleFlight, answer_cache_key, normalize_question
+from src.application.resilience import Deadline, DeadlineExceeded, HedgedCaller
 
 
 class AskQuestionUseCase:
@@ -20,18 +32,58 @@ class AskQuestionUseCase:
 
     Responsabilidades:
     - Validar pergunta
+    - Registrar a pergunta e consultar o cache de respostas pré-calculadas
     - Buscar chunks relevantes
+    - Rotear pela confiança da busca (não encontrado, modelo leve ou completo)
     - Gerar resposta com IA
     - Retornar resposta estruturada
+
+    Com prazo, embedding e geração rodam pelo HedgedCaller (hedge após o
+    percentil de latência configurado). Se a geração não cabe no prazo, a
+    resposta é degradada: os trechos recuperados, sem chamada ao modelo.
+
+    Com `single_flight`, perguntas idênticas simultâneas (mesmo texto
+    normalizado, parâmetros e geração do índice) esperam a que já está em
+    andamento e recebem a mesma resposta.
     """
 
+    # Trechos listados na resposta degradada
+    DEGRADED_EXCERPTS = 3
+
     def __init__(
         self,
         vector_store_repository: IVectorStoreRepository,
-        ai_repository: IAIRepository
+        ai_repository: IAIRepository,
+        metrics: Optional[MetricsCollector] = None,
+        fast_mode: bool = False,
+        router: Optional[AnswerRouter] = None,
+        answer_cache: Optional[IAnswerCacheRepository] = None,
+        query_log: Optional[IQueryLogRepository] = None,
+        hedging: Optional[HedgedCaller] = None,
+        deadline_ms: float = 0.0,
+        top_k: int = 5,
+        single_flight: Optional[SingleFlight] = None,
+        generation_source: Optional[Callable[[], int]] = None
     ):
         self.vector_store_repository = vector_store_repository
         self.ai_repository = ai_repository
+        self.metrics = metrics or MetricsCollector()
+        # Padrão para perguntas sem fast_mode (raciocínio via explain)
+        self.fast_mode = fast_mode
+        # Sem limiares configurados, tudo vai para o modelo completo
+        self.router = router or AnswerRouter()
+        self.answer_cache = answer_cache
+        self.query_log = query_log
+        # Sem hedge nem prazo, as chamadas rodam direto na thread da requisição
+        self.hedging = hedging or HedgedCaller()
+        # Prazo das perguntas sem deadline_ms (0 = sem prazo)
+        self.deadline_ms = deadline_ms
+        # Chunks recuperados por pergunta sem top_k
+        self.top_k = top_k
+        # Coalescência de perguntas idênticas em andamento (None desativa)
+        self.single_flight = single_flight
+        # Geração do índice em uso (sem fonte: índice único)
+        self.generation_source = generation_source
 
     def execute(
         self,
@@ -44,8 +96,37 @@ class AskQuestionUseCase:
             input_dto: Dados da pergunta
 
         Returns:
-            Resposta estruturada
+            Resposta estruturada (com tempos por etapa em `timings`)
         """
+        request_metrics = self.metrics.start_request("ask_question")
+
+        if self.single_flight is None:
+            output_dto = self._answer(input_dto, request_metrics)
+        else:
+            output_dto, shared = self.single_flight.do(
+                self._flight_key(input_dto),
+                lambda: self._answer(input_dto, request_metrics)
+            )
+            if shared:
+                # Cópia: tempos e log são de cada requisição
+                request_metrics.increment("coalesced")
+                output_dto = replace(output_dto, timings={}, coalesced=True)
+
+        output_dto.timings = self.metrics.finish(
+            request_metrics,
+            success=output_dto.success
+        )
+        self._log_query(input_dto, output_dto)
+        return output_dto
+
+    def _answer(
+        self,
+        input_dto: AskQuestionInputDTO,
+        request_metrics: RequestMetrics
+    ) -> AskQuestionOutputDTO:
+        """Executa as etapas da pergunta registrando métricas"""
+        deadline = self._deadline(input_dto)
+        context_chunks: List[Dict] = []
         try:
             # Cria entidade Question
             question = Question(
@@ -65,33 +146,334 @@ class AskQuestionUseCase:
                     success=False
                 )
 
-            # Gera embedding da pergunta
-            query_embedding = self.ai_repository.generate_embeddings(question.text)
+            cached = self._cached_output(input_dto, request_metrics)
+            if cached is not None:
+                return cached
 
-            # Busca chunks relevantes usando o embedding
+            context_chunks = self._retrieve(question, input_dto, request_metrics, deadline)
+
+            if not context_chunks:
+                return AskQuestionOutputDTO(
+                    answer="Nenhum documento encontrado. Execute o processamento primeiro.",
+                    source="N/A",
+                    confidence="baixa",
+                    reasoning="Base de dados vazia",
+                    citation=None,
+                    success=False
+                )
+
+            return self._generate(
+                question,
+                context_chunks,
+                request_metrics,
+                fast=self._fast(input_dto),
+                deadline=deadline
+            )
+
+        except DeadlineExceeded as e:
+            return self._degraded_output(e.stage, context_chunks, deadline, request_metrics)
+        except Exception as e:
+            return self._error_output(e, request_metrics)
+
+    def _retrieve(
+        self,
+        question: Question,
+        input_dto: AskQuestionInputDTO,
+        request_metrics: RequestMetrics,
+        deadline: Optional[Deadline] = None
+    ) -> List[Dict]:
+        """Gera o embedding da pergunta e busca os chunks relevantes"""
+        with request_metrics.stage("embedding"):
+            query_embedding, hedged = self.hedging.call(
+                "embedding",
+                lambda: self.ai_repository.generate_embeddings(question.text),
+                deadline
+            )
+        if hedged:
+            request_metrics.increment("hedged_embedding")
+
+        with request_metrics.stage("retrieval"):
             context_chunks = self.vector_store_repository.search_similar(
                 query=question.text,
-                top_k=input_dto.top_k,
-                query_embedding=query_embedding
+                top_k=self._top_k(input_dto),
+                query_embedding=query_embedding,
+                search_filter=self._search_filter(input_dto)
             )
+        request_metrics.increment("chunks_retrieved", len(context_chunks))
+        return context_chunks
+
+    def explain(
+        self,
+        input_dto: AskQuestionInputDTO,
+        answer_text: str
+    ) -> ReasoningOutputDTO:
+        """
+        Gera o raciocínio de uma resposta do modo rápido (sob demanda)
+
+        Refaz a busca com os mesmos parâmetros da pergunta, então o
+        raciocínio se baseia nos mesmos chunks usados na resposta.
+
+        Args:
+            input_dto: Pergunta original
+            answer_text: Resposta já exibida
+
+        Returns:
+            Raciocínio passo a passo
+        """
+        request_metrics = self.metrics.start_request("explain_answer")
+
+        try:
+            question = Question(
+                text=input_dto.question_text,
+                created_at=datetime.now(),
+                user_id=input_dto.user_id
+            )
+            context_chunks = self._retrieve(question, input_dto, request_metrics)
+
+            with request_metrics.stage("generation"):
+                reasoning = self.ai_repository.generate_reasoning(
+                    question=question,
+                    context_chunks=context_chunks,
+                    answer_text=answer_text
+                )
+            output_dto = ReasoningOutputDTO(reasoning=reasoning, success=True)
+
+        except Exception as e:
+            request_metrics.increment("errors")
+            output_dto = ReasoningOutputDTO(
+                reasoning=f"Erro ao gerar raciocínio: {str(e)}",
+                success=False
+            )
+
+        output_dto.timings = self.metrics.finish(
+            request_metrics,
+            success=output_dto.success
+        )
+        return output_dto
+
+    def execute_batch(
+        self,
+        input_dtos: Iterable[AskQuestionInputDTO],
+        batch_size: int = 32,
+        max_workers: int = 4
+    ) -> Iterator[AskQuestionOutputDTO]:
+        """
+        Responde várias perguntas, na ordem de entrada
+
+        Embeddings e buscas são feitos em lote (uma chamada por lote) e as
+        gerações rodam em paralelo com no máximo `max_workers` simultâneas.
+
+        Args:
+            input_dtos: Perguntas
+            batch_size: Perguntas por lote de embedding/busca
+            max_workers: Gerações simultâneas
+
+        Yields:
+            Respostas na mesma ordem das perguntas
+        """
+        pending: Deque[Future] = deque()
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for batch in self._chunked(input_dtos, batch_size):
+                pending.extend(self._submit_batch(batch, executor))
+
+                # Mantém no máximo um lote em espera além do atual
+                while len(pending) > batch_size:
+                    yield pending.popleft().result()
+
+            while pending:
+                yield pending.popleft().result()
+
+    def _submit_batch(
+        self,
+        batch: List[AskQuestionInputDTO],
+        executor: ThreadPoolExecutor
+    ) -> List[Future]:
+        """Embeda e busca o lote inteiro e agenda as gerações"""
+        futures: List[Future] = []
+        valid: List[Tuple[int, Question, RequestMetrics]] = []
+        deadlines: List[Deadline] = []
+
+        for input_dto in batch:
+            request_metrics = self.metrics.start_request("ask_question")
+            future: Future = Future()
+            futures.append(future)
+            deadlines.append(self._deadline(input_dto))
+
+            try:
+                question = Question(
+                    text=input_dto.question_text,
+                    created_at=datetime.now(),
+                    user_id=input_dto.user_id
+                )
+            except ValueError as e:
+                self._resolve(future, input_dto, self._error_output(e, request_metrics), request_metrics)
+                continue
+
+            if not question.is_valid:
+                self._resolve(future, input_dto, AskQuestionOutputDTO(
+                    answer="Pergunta muito curta ou inválida",
+                    source="N/A",
+                    confidence="baixa",
+                    reasoning="Pergunta não atende critérios mínimos",
+                    citation=None,
+                    success=False
+                ), request_metrics)
+                continue
+
+            cached = self._cached_output(input_dto, request_metrics)
+            if cached is not None:
+                self._resolve(future, input_dto, cached, request_metrics)
+                continue
+
+            valid.append((len(futures) - 1, question, request_metrics))
+
+        if not valid:
+            return futures
+
+        try:
+            # Um embedding em lote para todas as perguntas
+            embed_start = time.perf_counter()
+            embeddings = self.ai_repository.generate_embeddings_batch(
+                [question.text for _, question, _ in valid]
+            )
+            embed_seconds = time.perf_counter() - embed_start
+
+            # Uma busca em lote por filtro distinto (tenant/metadados)
+            positions_by_filter: Dict[SearchFilter, List[int]] = {}
+            for position, (index, _, _) in enumerate(valid):
+                search_filter = self._search_filter(batch[index])
+                positions_by_filter.setdefault(search_filter, []).append(position)
+
+            results: List[List[Dict]] = [[] for _ in valid]
+            search_start = time.perf_counter()
+            for search_filter, positions in positions_by_filter.items():
+                group_results = self.vector_store_repository.search_similar_batch(
+                    query_embeddings=[embeddings[position] for position in positions],
+                    top_k=max(self._top_k(batch[valid[position][0]]) for position in positions),
+                    search_filter=search_filter
+                )
+                for position, context_chunks in zip(positions, group_results):
+                    results[position] = context_chunks
+            search_seconds = time.perf_counter() - search_start
+        except Exception as e:
+            for index, _, request_metrics in valid:
+                self._resolve(
+                    futures[index], batch[index], self._error_output(e, request_metrics), request_metrics
+                )
+            return futures
+
+        for (index, question, request_metrics), context_chunks in zip(valid, results):
+            # Tempo do lote rateado entre as perguntas
+            request_metrics.add_timing("embedding", embed_seconds / len(valid))
+            request_metrics.add_timing("retrieval", search_seconds / len(valid))
+
+            context_chunks = context_chunks[:self._top_k(batch[index])]
+            request_metrics.increment("chunks_retrieved", len(context_chunks))
 
             if not context_chunks:
-                return AskQuestionOutputDTO(
+                self._resolve(futures[index], batch[index], AskQuestionOutputDTO(
                     answer="Nenhum documento encontrado. Execute o processamento primeiro.",
                     source="N/A",
                     confidence="baixa",
                     reasoning="Base de dados vazia",
                     citation=None,
                     success=False
-                )
+                ), request_metrics)
+                continue
 
-            # Gera resposta com IA
-            answer = self.ai_repository.generate_answer(
-                question=question,
-                context_chunks=context_chunks
+            executor.submit(
+                self._generate_into,
+                futures[index],
+                batch[index],
+                question,
+                context_chunks,
+                request_metrics,
+                deadlines[index]
             )
 
-            return AskQuestionOutputDTO(
+        return futures
+
+    def _generate_into(
+        self,
+        future: Future,
+        input_dto: AskQuestionInputDTO,
+        question: Question,
+        context_chunks: List[Dict],
+        request_metrics: RequestMetrics,
+        deadline: Optional[Deadline] = None
+    ) -> None:
+        """Gera a resposta (em thread do pool) e resolve o future"""
+        try:
+            output_dto = self._generate(
+                question, context_chunks, request_metrics,
+                fast=self._fast(input_dto),
+                deadline=deadline
+            )
+        except DeadlineExceeded as e:
+            output_dto = self._degraded_output(e.stage, context_chunks, deadline, request_metrics)
+        except Exception as e:
+            output_dto = self._error_output(e, request_metrics)
+        self._resolve(future, input_dto, output_dto, request_metrics)
+
+    def _resolve(
+        self,
+        future: Future,
+        input_dto: AskQuestionInputDTO,
+        output_dto: AskQuestionOutputDTO,
+        request_metrics: RequestMetrics
+    ) -> None:
+        """Finaliza métricas, registra a pergunta e entrega a resposta ao future"""
+        output_dto.timings = self.metrics.finish(
+            request_metrics,
+            success=output_dto.success
+        )
+        self._log_query(input_dto, output_dto)
+        future.set_result(output_dto)
+
+    def _generate(
+        self,
+        question: Question,
+        context_chunks: List[Dict],
+        request_metrics: RequestMetrics,
+        fast: bool = False,
+        deadline: Optional[Deadline] = None
+    ) -> AskQuestionOutputDTO:
+        """Roteia pela confiança da busca e gera a resposta com IA"""
+        decision = self.router.route(context_chunks)
+        request_metrics.increment(f"route_{decision.route}")
+
+        if decision.route == AnswerRouter.NOT_FOUND:
+            output_dto = self._not_found_output(decision)
+        else:
+            if deadline is not None and deadline.expired:
+                raise DeadlineExceeded("generation")
+
+            # O hedge reavalia o tempo restante ao ser enviado
+            answer, hedged = self.hedging.call(
+                "generation",
+                lambda: self.ai_repository.generate_answer(
+                    question=question,
+                    context_chunks=context_chunks,
+                    fast=fast,
+                    light=decision.light,
+                    timeout=deadline.remaining() if deadline is not None else None
+                ),
+                deadline,
+                # O repositório devolve o erro na resposta: não pode vencer o hedge pendente
+                accept=lambda answer: answer is not None and not (answer.metadata or {}).get("error")
+            )
+            if hedged:
+                request_metrics.increment("hedged_generation")
+            if answer is None:
+                raise RuntimeError("O modelo não retornou resposta")
+            metadata = answer.metadata or {}
+            if metadata.get("error") == "generation" and deadline is not None and deadline.expired:
+                # Timeout do próprio cliente do modelo
+                raise DeadlineExceeded("generation")
+            self._record_answer_metadata(request_metrics, metadata)
+
+            output_dto = AskQuestionOutputDTO(
                 answer=answer.text,
                 source=answer.source,
                 confidence=answer.confidence.value,
@@ -100,12 +482,215 @@ class AskQuestionUseCase:
                 success=True
             )
 
-        except Exception as e:
+        self.router.log(question.text, decision, context_chunks, output_dto.confidence)
+        return output_dto
+
+    def _not_found_output(self, decision: RoutingDecision) -> AskQuestionOutputDTO:
+        """Resposta sem chamada ao modelo quando nenhum chunk é relevante"""
+        return AskQuestionOutputDTO(
+            answer="Não foi possível encontrar essa informação nos documentos fornecidos.",
+            source="N/A",
+            confidence="baixa",
+            reasoning=(
+                f"Nenhum trecho relevante: menor distância {decision.best_distance:.3f} "
+                f"acima do limiar {self.router.not_found_distance:.3f}"
+            ),
+            citation=None,
+            success=True
+        )
+
+    def _degraded_output(
+        self,
+        stage: str,
+        context_chunks: List[Dict],
+        deadline: Optional[Deadline],
+        request_metrics: RequestMetrics
+    ) -> AskQuestionOutputDTO:
+        """Resposta sem geração quando o prazo acaba: os trechos recuperados"""
+        request_metrics.increment("degraded")
+        request_metrics.increment(f"deadline_{stage}")
+        timeout_ms = deadline.timeout_s * 1000 if deadline is not None and deadline.timeout_s else 0
+
+        if not context_chunks:
             return AskQuestionOutputDTO(
-                answer=f"Erro ao processar pergunta: {str(e)}",
+                answer="O tempo limite da pergunta esgotou antes da busca nos documentos. Tente novamente.",
                 source="N/A",
                 confidence="baixa",
-                reasoning="Erro no processamento",
+                reasoning=f"Prazo de {timeout_ms:.0f} ms esgotado na etapa '{stage}'",
                 citation=None,
-                success=False
+                success=False,
+                degraded=True
+            )
+
+        excerpts = [
+            f"- [{chunk['source']}] {self._excerpt(chunk['text'])}"
+            for chunk in context_chunks[:self.DEGRADED_EXCERPTS]
+        ]
+        return AskQuestionOutputDTO(
+            answer=(
+                "Não houve tempo para gerar a resposta completa. "
+                "Trechos mais relevantes dos documentos:\n" + "\n".join(excerpts)
+            ),
+            source=context_chunks[0]["source"],
+            confidence="baixa",
+            reasoning=(
+                f"Prazo de {timeout_ms:.0f} ms esgotado na etapa '{stage}': "
+                "resposta com os trechos recuperados, sem geração"
+            ),
+            citation=self._excerpt(context_chunks[0]["text"]),
+            success=True,
+            degraded=True
+        )
+
+    @staticmethod
+    def _excerpt(text: str, max_chars: int = 300) -> str:
+        text = " ".join(text.split())
+        if len(text) <= max_chars:
+            return text
+        return text[:max_chars - 1].rstrip() + "…"
+
+    def _deadline(self, input_dto: AskQuestionInputDTO) -> Deadline:
+        """Prazo da pergunta (ou o padrão do use case)"""
+        if input_dto.deadline_ms is None:
+            return Deadline.from_ms(self.deadline_ms)
+        return Deadline.from_ms(input_dto.deadline_ms)
+
+    def _log_query(
+        self,
+        input_dto: AskQuestionInputDTO,
+        output_dto: AskQuestionOutputDTO
+    ) -> None:
+        """Registra a pergunta e seus tempos (aquecimento do cache e replay de carga)"""
+        if self.query_log is None:
+            return
+
+        try:
+            self.query_log.record({
+                "question": input_dto.question_text,
+                "user_id": input_dto.user_id,
+                "top_k": self._top_k(input_dto),
+                "fast_mode": input_dto.fast_mode,
+                "filtered": self._has_filter(input_dto),
+                "success": output_dto.success,
+                "cached": output_dto.cached,
+                "coalesced": output_dto.coalesced,
+                "degraded": output_dto.degraded,
+                "timings_ms": output_dto.timings
+            })
+        except Exception as e:
+            # O log de perguntas nunca deve derrubar a requisição
+            print(f"Erro ao registrar pergunta: {str(e)}")
+
+    def _cached_output(
+        self,
+        input_dto: AskQuestionInputDTO,
+        request_metrics: RequestMetrics
+    ) -> Optional[AskQuestionOutputDTO]:
+        """Resposta pré-calculada da pergunta (sem embedding, busca nem geração)"""
+        if self.answer_cache is None:
+            return None
+        # Respostas aquecidas não consideram filtros de fonte, página ou data
+        if self._has_filter(input_dto):
+            return None
+
+        with request_metrics.stage("cache_lookup"):
+            cached = self.answer_cache.get(
+                answer_cache_key(input_dto.question_text, input_dto.user_id, self._top_k(input_dto))
             )
+
+        if cached is None:
+            request_metrics.increment("cache_misses")
+            return None
+
+        request_metrics.increment("cache_hits")
+        return AskQuestionOutputDTO(
+            answer=cached["answer"],
+            source=cached["source"],
+            confidence=cached["confidence"],
+            reasoning=cached.get("reasoning", ""),
+            citation=cached.get("citation"),
+            success=True,
+            cached=True
+        )
+
+    def _fast(self, input_dto: AskQuestionInputDTO) -> bool:
+        """Modo rápido da pergunta (ou o padrão do use case)"""
+        if input_dto.fast_mode is None:
+            return self.fast_mode
+        return input_dto.fast_mode
+
+    def _flight_key(self, input_dto: AskQuestionInputDTO) -> Hashable:
+        """Perguntas com a mesma chave têm a mesma resposta"""
+        return (
+            normalize_question(input_dto.question_text),
+            input_dto.user_id,
+            self._top_k(input_dto),
+            self._fast(input_dto),
+            self._search_filter(input_dto),
+            self.deadline_ms if input_dto.deadline_ms is None else input_dto.deadline_ms,
+            self.generation_source() if self.generation_source is not None else 0
+        )
+
+    def _top_k(self, input_dto: AskQuestionInputDTO) -> int:
+        """Chunks recuperados da pergunta (ou o padrão do use case)"""
+        if input_dto.top_k is None:
+            return self.top_k
+        return input_dto.top_k
+
+    @staticmethod
+    def _has_filter(input_dto: AskQuestionInputDTO) -> bool:
+        return input_dto.search_filter is not None and not input_dto.search_filter.is_empty
+
+    @staticmethod
+    def _search_filter(input_dto: AskQuestionInputDTO) -> SearchFilter:
+        """Filtro da busca: filtros do input + tenant (user_id)"""
+        search_filter = input_dto.search_filter or SearchFilter()
+        return search_filter.with_tenant(input_dto.user_id)
+
+    @staticmethod
+    def _error_output(
+        error: Exception,
+        request_metrics: RequestMetrics
+    ) -> AskQuestionOutputDTO:
+        """Resposta padrão para erros no processamento"""
+        request_metrics.increment("errors")
+        return AskQuestionOutputDTO(
+            answer=f"Erro ao processar pergunta: {str(error)}",
+            source="N/A",
+            confidence="baixa",
+            reasoning="Erro no processamento",
+            citation=None,
+            success=False
+        )
+
+    @staticmethod
+    def _chunked(
+        items: Iterable[AskQuestionInputDTO],
+        size: int
+    ) -> Iterator[List[AskQuestionInputDTO]]:
+        """Agrupa um iterável em listas de até `size` itens"""
+        batch: List[AskQuestionInputDTO] = []
+        for item in items:
+            batch.append(item)
+            if len(batch) >= size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    @staticmethod
+    def _record_answer_metadata(
+        request_metrics: RequestMetrics,
+        metadata: Optional[dict]
+    ) -> None:
+        """Incorpora tempos, tokens e erros reportados pelo repositório de IA"""
+        if not metadata:
+            return
+
+        request_metrics.add_timings(metadata.get("timings", {}))
+
+        for name, value in metadata.get("usage", {}).items():
+            request_metrics.increment(name, value)
+
+        if metadata.get("error"):
+            request_metrics.increment("errors")
@@ -0,0 +1,169 @@
+"""
+Use Case: Comparar dimensões de embedding (recall x tamanho x latência)
+"""
+import time
+from typing import List
+
+import numpy as np
+
+from src.domain.repositories import IVectorStoreRepository
+from src.application.dtos import (
+    DimensionBenchmarkInputDTO,
+    DimensionBenchmarkRowDTO,
+    DimensionBenchmarkOutputDTO
+)
+
+
+class BenchmarkDimensionsUseCase:
+    """
+    Caso de uso: Medir o efeito de indexar menos dimensões
+
+    Usa os vetores completos do índice atual. Uma amostra de chunks serve de
+    queries; o top-k exato com todas as dimensões é a referência (o próprio
+    chunk é excluído). Para cada dimensão mede recall@k, tempo de busca
+    (força bruta, comparável entre dimensões) e tamanho dos vetores, com e
+    sem re-rank pelos vetores completos.
+    """
+
+    def __init__(self, vector_store_repository: IVectorStoreRepository):
+        self.vector_store_repository = vector_store_repository
+
+    def execute(self, input_dto: DimensionBenchmarkInputDTO) -> DimensionBenchmarkOutputDTO:
+        """
+        Executa a comparação
+
+        Args:
+            input_dto: Dimensões e parâmetros da busca
+
+        Returns:
+            Uma linha por dimensão e modo (com/sem re-rank)
+        """
+        try:
+            vectors = self._load_vectors()
+            if len(vectors) <= input_dto.top_k:
+                return DimensionBenchmarkOutputDTO(
+                    success=False,
+                    message="Chunks insuficientes no índice para a comparação"
+                )
+
+            count, full_dimension = vectors.shape
+            rng = np.random.default_rng(0)
+            query_rows = rng.choice(count, size=min(input_dto.sample_size, count), replace=False)
+
+            truth = self._search(vectors, vectors[query_rows], query_rows, input_dto, input_dto.top_k)
+
+            rows = []
+            for dimension in sorted(set(input_dto.dimensions)):
+                if not 0 < dimension <= full_dimension:
+                    continue
+                rows.extend(self._evaluate(vectors, query_rows, truth, dimension, input_dto))
+
+            return DimensionBenchmarkOutputDTO(
+                success=True,
+                full_dimension=full_dimension,
+                chunks_count=count,
+                queries_count=len(query_rows),
+                rows=rows
+            )
+
+        except Exception as e:
+            return DimensionBenchmarkOutputDTO(
+                success=False,
+                message=f"Erro na comparação de dimensões: {str(e)}"
+            )
+
+    def _load_vectors(self) -> np.ndarray:
+        """Vetores completos de todos os chunks do índice"""
+        vectors = []
+        for source in self.vector_store_repository.list_sources():
+            for chunk in self.vector_store_repository.get_chunks_by_source(source):
+                vectors.append(chunk.metadata["embedding"])
+        return np.asarray(vectors, dtype=np.float32)
+
+    def _evaluate(
+        self,
+        vectors: np.ndarray,
+        query_rows: np.ndarray,
+        truth: np.ndarray,
+        dimension: int,
+        input_dto: DimensionBenchmarkInputDTO
+    ) -> List[DimensionBenchmarkRowDTO]:
+        """Recall e latência de uma dimensão, com e sem re-rank"""
+        reduced = self._truncate(vectors, dimension)
+        queries = reduced[query_rows]
+        index_bytes = reduced.nbytes
+        top_k = input_dto.top_k
+
+        start = time.perf_counter()
+        found = self._search(reduced, queries, query_rows, input_dto, top_k)
+        search_ms = (time.perf_counter() - start) * 1000 / len(query_rows)
+        rows = [DimensionBenchmarkRowDTO(
+            dimension=dimension,
+            rerank=False,
+            recall=self._recall(found, truth),
+            search_ms=search_ms,
+            index_bytes=index_bytes
+        )]
+
+        if input_dto.rerank_factor > 1:
+            start = time.perf_counter()
+            candidates = self._search(
+                reduced, queries, query_rows, input_dto, top_k * input_dto.rerank_factor
+            )
+            reranked = np.stack([
+                row_candidates[np.argsort(self._distances(
+                    vectors[[query_row]], vectors[row_candidates], input_dto.distance_space
+                )[0], kind="stable")[:top_k]]
+                for query_row, row_candidates in zip(query_rows, candidates)
+            ])
+            search_ms = (time.perf_counter() - start) * 1000 / len(query_rows)
+            rows.append(DimensionBenchmarkRowDTO(
+                dimension=dimension,
+                rerank=True,
+                recall=self._recall(reranked, truth),
+                search_ms=search_ms,
+                index_bytes=index_bytes
+            ))
+
+        return rows
+
+    def _search(
+        self,
+        vectors: np.ndarray,
+        queries: np.ndarray,
+        query_rows: np.ndarray,
+        input_dto: DimensionBenchmarkInputDTO,
+        k: int
+    ) -> np.ndarray:
+        """Top-k exato por query, excluindo o próprio chunk"""
+        distances = self._distances(queries, vectors, input_dto.distance_space)
+        distances[np.arange(len(query_rows)), query_rows] = np.inf
+        k = min(k, vectors.shape[0] - 1)
+        nearest = np.argpartition(distances, k - 1, axis=1)[:, :k]
+        order = np.take_along_axis(distances, nearest, axis=1).argsort(axis=1, kind="stable")
+        return np.take_along_axis(nearest, order, axis=1)
+
+    @staticmethod
+    def _distances(queries: np.ndarray, vectors: np.ndarray, distance_space: str) -> np.ndarray:
+        products = queries @ vectors.T
+        if distance_space == "ip":
+            return 1.0 - products
+        if distance_space == "l2":
+            return (
+                (queries ** 2).sum(axis=1)[:, None] - 2.0 * products +
+                (vectors ** 2).sum(axis=1)[None, :]
+            )
+        norms = np.linalg.norm(queries, axis=1)[:, None] * np.linalg.norm(vectors, axis=1)[None, :]
+        return 1.0 - products / np.maximum(norms, 1e-12)
+
+    @staticmethod
+    def _truncate(vectors: np.ndarray, dimension: int) -> np.ndarray:
+        """Mesma redução do índice: primeiras dimensões, renormalizadas"""
+        reduced = np.ascontiguousarray(vectors[:, :dimension])
+        norms = np.linalg.norm(reduced, axis=1, keepdims=True)
+        return reduced / np.maximum(norms, 1e-12)
+
+    @staticmethod
+    def _recall(found: np.ndarray, truth: np.ndarray) -> float:
+        hits = sum(len(set(f) & set(t)) for f, t in zip(found.tolist(), truth.tolist()))
+        return hits / truth.size
@@ -0,0 +1,181 @@
+"""
+Use Case: Calibrar os backends de extração de PDF
+"""
+import time
+from collections import Counter
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from src.domain.repositories import IPDFBackend, IPDFCalibrationRepository
+from src.application.cache import normalize_question
+from src.application.dtos import (
+    PDFCalibrationInputDTO,
+    PDFBackendResultDTO,
+    PDFCalibrationOutputDTO
+)
+
+
+# arquivo -> {página: termos normalizados} (None se a extração falhou)
+Extraction = Dict[str, Optional[Dict[int, Counter]]]
+
+
+class CalibratePDFBackendsUseCase:
+    """
+    Caso de uso: Escolher o backend de PDF mais rápido com texto equivalente
+
+    Extrai a amostra com cada backend instalado (sem cache de extração),
+    mede o tempo total e compara o texto de cada página com o do backend de
+    referência (F1 dos termos normalizados, agregado na amostra). O mais
+    rápido entre os que não falharam e atingem `min_parity` é gravado e
+    passa a ser usado com PDF_BACKEND=auto.
+    """
+
+    def __init__(
+        self,
+        backends: Dict[str, IPDFBackend],
+        calibration_repository: IPDFCalibrationRepository
+    ):
+        """
+        Inicializa a calibração
+
+        Args:
+            backends: Backends instalados, por nome
+            calibration_repository: Onde o resultado é gravado
+        """
+        self.backends = backends
+        self.calibration_repository = calibration_repository
+
+    def execute(self, input_dto: PDFCalibrationInputDTO) -> PDFCalibrationOutputDTO:
+        """
+        Executa a calibração
+
+        Args:
+            input_dto: PDFs da amostra, referência e paridade mínima
+
+        Returns:
+            Backend escolhido e a medição de cada backend
+        """
+        try:
+            if not input_dto.file_paths:
+                return PDFCalibrationOutputDTO(success=False, message="Nenhum PDF na amostra")
+            if input_dto.reference not in self.backends:
+                return PDFCalibrationOutputDTO(
+                    success=False,
+                    message=f"Backend de referência não instalado: {input_dto.reference}"
+                )
+
+            # Lê os arquivos antes: o primeiro backend não paga o disco sozinho
+            for path in input_dto.file_paths:
+                with open(path, "rb") as f:
+                    f.read()
+
+            measurements = {
+                name: self._measure(backend, input_dto.file_paths)
+                for name, backend in self.backends.items()
+            }
+            reference_extraction = measurements[input_dto.reference][1]
+
+            results = []
+            for name, (seconds, extraction, chars_count) in measurements.items():
+                errors = sum(1 for pages in extraction.values() if pages is None)
+                parity = self._parity(extraction, reference_extraction)
+                results.append(PDFBackendResultDTO(
+                    name=name,
+                    version=self.backends[name].version,
+                    seconds=seconds,
+                    pages_count=sum(len(pages) for pages in extraction.values() if pages),
+                    chars_count=chars_count,
+                    parity=parity,
+                    errors=errors,
+                    acceptable=errors == 0 and parity >= input_dto.min_parity
+                ))
+
+            acceptable = [result for result in results if result.acceptable]
+            if not acceptable:
+                return PDFCalibrationOutputDTO(
+                    success=False,
+                    reference=input_dto.reference,
+                    files_count=len(input_dto.file_paths),
+                    results=results,
+                    message=(
+                        "Nenhum backend extraiu a amostra sem erros e com "
+                        f"paridade >= {input_dto.min_parity}"
+                    )
+                )
+
+            selected = min(acceptable, key=lambda result: result.seconds)
+            self.calibration_repository.save({
+                "backend": selected.name,
+                "calibrated_at": datetime.now().isoformat(),
+                "reference": input_dto.reference,
+                "min_parity": input_dto.min_parity,
+                "files": list(input_dto.file_paths),
+                "results": [
+                    {
+                        "name": result.name,
+                        "version": result.version,
+                        "seconds": round(result.seconds, 4),
+                        "parity": round(result.parity, 4),
+                        "errors": result.errors
+                    }
+                    for result in results
+                ]
+            })
+
+            return PDFCalibrationOutputDTO(
+                success=True,
+                selected=selected.name,
+                reference=input_dto.reference,
+                files_count=len(input_dto.file_paths),
+                results=results,
+                message=f"Backend selecionado: {selected.name}"
+            )
+
+        except Exception as e:
+            return PDFCalibrationOutputDTO(
+                success=False,
+                message=f"Erro na calibração: {str(e)}"
+            )
+
+    @staticmethod
+    def _measure(backend: IPDFBackend, file_paths: List[str]) -> Tuple[float, Extraction, int]:
+        """Tempo total de extração da amostra, termos de cada página e caracteres"""
+        extraction: Extraction = {}
+        elapsed = 0.0
+        chars_count = 0
+
+        for path in file_paths:
+            start = time.perf_counter()
+            try:
+                pages = backend.extract(path)["pages"]
+            except Exception as e:
+                print(f"  [{backend.name}] falha em {path}: {str(e)}")
+                extraction[path] = None
+                continue
+            finally:
+                elapsed += time.perf_counter() - start
+
+            chars_count += sum(len(text) for _, text in pages)
+            extraction[path] = {
+                page_number: Counter(normalize_question(text).split())
+                for page_number, text in pages
+            }
+
+        return elapsed, extraction, chars_count
+
+    @staticmethod
+    def _parity(extraction: Extraction, reference: Extraction) -> float:
+        """F1 dos termos por página, somado na amostra (1.0 = mesmo texto)"""
+        overlap = 0
+        total = 0
+        for path, reference_pages in reference.items():
+            pages = extraction.get(path)
+            if reference_pages is None or pages is None:
+                continue
+            for page_number in reference_pages.keys() | pages.keys():
+                expected = reference_pages.get(page_number, Counter())
+                found = pages.get(page_number, Counter())
+                overlap += sum((expected & found).values())
+                total += sum(expected.values()) + sum(found.values())
+
+        return 2 * overlap / total if total else 1.0
@@ -0,0 +1,175 @@
+"""
+Use Case: Manutenção do Índice Vetorial
+"""
+from typing import Iterator, Optional
+
+from src.domain.repositories import IVectorStoreRepository, IIndexSnapshotRepository
+from src.domain.entities import DocumentChunk
+from src.application.dtos import IndexOperationOutputDTO
+
+
+class ManageIndexUseCase:
+    """
+    Caso de uso: Operações offline sobre o índice vetorial
+
+    Responsabilidades:
+    - Reconstruir/compactar o índice com a configuração atual
+    - Rebalancear shards após mudança de topologia
+    - Exportar/importar snapshots portáteis do índice
+    - Publicar gerações do índice para os workers de serviço
+    """
+
+    def __init__(
+        self,
+        vector_store_repository: IVectorStoreRepository,
+        snapshot_repository: Optional[IIndexSnapshotRepository] = None
+    ):
+        self.vector_store_repository = vector_store_repository
+        self.snapshot_repository = snapshot_repository
+
+    def rebuild(self) -> IndexOperationOutputDTO:
+        """
+        Reconstrói o índice (métrica de distância e parâmetros HNSW atuais)
+
+        Returns:
+            Resultado da operação
+        """
+        try:
+            copied = self.vector_store_repository.rebuild()
+            return IndexOperationOutputDTO(
+                operation="rebuild",
+                chunks_count=copied,
+                success=True,
+                message=f"Índice reconstruído: {copied} chunks"
+            )
+        except Exception as e:
+            return IndexOperationOutputDTO(
+                operation="rebuild",
+                chunks_count=0,
+                success=False,
+                message=f"Erro ao reconstruir índice: {str(e)}"
+            )
+
+    def rebalance(self) -> IndexOperationOutputDTO:
+        """
+        Move documentos para o shard dono após adicionar/remover shards
+
+        Returns:
+            Resultado da operação (chunks_count = fontes movidas)
+        """
+        try:
+            moved = self.vector_store_repository.rebalance()
+            return IndexOperationOutputDTO(
+                operation="rebalance",
+                chunks_count=moved,
+                success=True,
+                message=f"Rebalanceamento concluído: {moved} documento(s) movido(s)"
+            )
+        except Exception as e:
+            return IndexOperationOutputDTO(
+                operation="rebalance",
+                chunks_count=0,
+                success=False,
+                message=f"Erro ao rebalancear: {str(e)}"
+            )
+
+    def export_snapshot(self, path: str) -> IndexOperationOutputDTO:
+        """
+        Exporta o índice (embeddings, textos e metadados) para um snapshot
+
+        Args:
+            path: Pasta de destino (substituída ao final da gravação)
+
+        Returns:
+            Resultado da operação
+        """
+        try:
+            if self.snapshot_repository is None:
+                raise RuntimeError("Repositório de snapshots não configurado")
+
+            written = self.snapshot_repository.write(path, self._iter_chunks())
+            return IndexOperationOutputDTO(
+                operation="export_snapshot",
+                chunks_count=written,
+                success=True,
+                message=f"Snapshot gravado em {path}: {written} chunks"
+            )
+        except Exception as e:
+            return IndexOperationOutputDTO(
+                operation="export_snapshot",
+                chunks_count=0,
+                success=False,
+                message=f"Erro ao exportar snapshot: {str(e)}"
+            )
+
+    def publish_snapshot(self, root: str) -> IndexOperationOutputDTO:
+        """
+        Publica o índice atual como nova geração (servida por --serve)
+
+        Args:
+            root: Pasta das gerações
+
+        Returns:
+            Resultado da operação
+        """
+        try:
+            if self.snapshot_repository is None:
+                raise RuntimeError("Repositório de snapshots não configurado")
+
+            generation, written = self.snapshot_repository.publish(root, self._iter_chunks())
+            return IndexOperationOutputDTO(
+                operation="publish_snapshot",
+                chunks_count=written,
+                success=True,
+                message=f"Geração {generation} publicada em {root}: {written} chunks"
+            )
+        except Exception as e:
+            return IndexOperationOutputDTO(
+                operation="publish_snapshot",
+                chunks_count=0,
+                success=False,
+                message=f"Erro ao publicar geração: {str(e)}"
+            )
+
+    def import_snapshot(self, path: str) -> IndexOperationOutputDTO:
+        """
+        Recarrega um snapshot no índice vetorial (sem gerar embeddings)
+
+        Args:
+            path: Pasta do snapshot
+
+        Returns:
+            Resultado da operação
+        """
+        try:
+            if self.snapshot_repository is None:
+                raise RuntimeError("Repositório de snapshots não configurado")
+
+            imported = 0
+            for chunks in self.snapshot_repository.read(path):
+                self.vector_store_repository.add_chunks(chunks)
+                imported += len(chunks)
+
+            return IndexOperationOutputDTO(
+                operation="import_snapshot",
+                chunks_count=imported,
+                success=True,
+                message=f"Snapshot importado: {imported} chunks"
+            )
+        except Exception as e:
+            return IndexOperationOutputDTO(
+                operation="import_snapshot",
+                chunks_count=0,
+                success=False,
+                message=f"Erro ao importar snapshot: {str(e)}"
+            )
+
+    def _iter_chunks(self) -> Iterator[DocumentChunk]:
+        """Chunks do índice agrupados por fonte e tenant, em ordem"""
+        for source in self.vector_store_repository.list_sources():
+            chunks = self.vector_store_repository.get_chunks_by_source(source)
+            chunks.sort(key=lambda chunk: (
+                chunk.metadata.get("tenant_id") or "",
+                chunk.chunk_index
+            ))
+            yield from chunks
@@ -1,7 +1,8 @@
 """
 Use Case: Processar Documentos
 """
-from typing import List
+from bisect import bisect_right
+from typing import List, Optional, Tuple
 import os
 from datetime import datetime
 
@@ -9,12 +10,14 @@ from src.domain.entities import Document, DocumentChunk
 from src.domain.repositories import (
     IDocumentRepository,
     IVectorStoreRepository,
-    IAIRepository
+    IAIRepository,
+    IAnswerCacheRepository
 )
 from src.application.dtos import (
     ProcessDocumentInputDTO,
     ProcessDocumentOutputDTO
 )
+from src.application.metrics import MetricsCollector, RequestMetrics
 
 
 class ProcessDocumentsUseCase:
@@ -32,11 +35,17 @@ class ProcessDocumentsUseCase:
         self,
         document_repository: IDocumentRepository,
         vector_store_repository: IVectorStoreRepository,
-        ai_repository: IAIRepository
+        ai_repository: IAIRepository,
+        metrics: Optional[MetricsCollector] = None,
+        pdf_extractor=None,
+        answer_cache: Optional[IAnswerCacheRepository] = None
     ):
         self.document_repository = document_repository
         self.vector_store_repository = vector_store_repository
         self.ai_repository = ai_repository
+        self.metrics = metrics or MetricsCollector()
+        self.pdf_extractor = pdf_extractor
+        self.answer_cache = answer_cache
 
     def execute(
         self,
@@ -49,8 +58,24 @@ class ProcessDocumentsUseCase:
             input_dto: Dados de entrada
 
         Returns:
-            Resultado do processamento
+            Resultado do processamento (com tempos por etapa em `timings`)
         """
+        request_metrics = self.metrics.start_request("process_document")
+
+        output_dto = self._process(input_dto, request_metrics)
+
+        output_dto.timings = self.metrics.finish(
+            request_metrics,
+            success=output_dto.success
+        )
+        return output_dto
+
+    def _process(
+        self,
+        input_dto: ProcessDocumentInputDTO,
+        request_metrics: RequestMetrics
+    ) -> ProcessDocumentOutputDTO:
+        """Executa as etapas do processamento registrando métricas"""
         try:
             # Valida arquivo
             if not os.path.exists(input_dto.file_path):
@@ -66,9 +91,13 @@ class ProcessDocumentsUseCase:
 
             # Extrai texto (será implementado na camada Infrastructure)
             # Por enquanto, retorna estrutura esperada
-            from src.infrastructure.pdf import PDFExtractor
-            extractor = PDFExtractor()
-            text = extractor.extract_text(input_dto.file_path)
+            extractor = self.pdf_extractor
+            if extractor is None:
+                from src.infrastructure.pdf import PDFExtractor
+                extractor = PDFExtractor()
+            with request_metrics.stage("extraction"):
+                pages = extractor.extract_pages(input_dto.file_path)
+            text = "\n".join(page_text for _, page_text in pages)
 
             if not text:
                 return ProcessDocumentOutputDTO(
@@ -85,23 +114,35 @@ class ProcessDocumentsUseCase:
                 chunk_size=input_dto.chunk_size,
                 chunk_overlap=input_dto.chunk_overlap
             )
-            chunk_texts = chunker.split_text(text)
+            with request_metrics.stage("chunking"):
+                chunk_texts = chunker.split_text(text)
+            request_metrics.increment("chunks_created", len(chunk_texts))
 
             # Cria entidade Document
             document_id = filename  # Simplificado
+            if input_dto.tenant_id:
+                document_id = f"{input_dto.tenant_id}:{filename}"
+
+            ingested_at = datetime.now()
+            chunk_pages = self._locate_pages(text, pages, chunk_texts)
             chunks = []
 
-            for i, chunk_text in enumerate(chunk_texts):
-                # Gera embeddings
-                embedding = self.ai_repository.generate_embeddings(chunk_text)
+            # Gera embeddings (uma chamada em lote por documento)
+            with request_metrics.stage("embedding"):
+                embeddings = self.ai_repository.generate_embeddings_batch(chunk_texts)
 
+            for i, (chunk_text, embedding) in enumerate(zip(chunk_texts, embeddings)):
                 chunk = DocumentChunk(
                     id=f"{document_id}_{i}",
                     content=chunk_text,
                     chunk_index=i,
                     metadata={
                         "source": filename,
-                        "embedding": embedding
+                        "embedding": embedding,
+                        "page_start": chunk_pages[i][0],
+                        "page_end": chunk_pages[i][1],
+                        "ingested_at": int(ingested_at.timestamp()),
+                        "tenant_id": input_dto.tenant_id
                     }
                 )
                 chunks.append(chunk)
@@ -111,14 +152,20 @@ class ProcessDocumentsUseCase:
                 filename=filename,
                 content=text,
                 chunks=chunks,
-                created_at=datetime.now()
+                created_at=ingested_at
             )
 
             # Salva no repositório
-            self.document_repository.save(document)
+            with request_metrics.stage("document_save"):
+                self.document_repository.save(document)
 
             # Salva chunks no banco vetorial
-            self.vector_store_repository.add_chunks(chunks)
+            with request_metrics.stage("vector_store_add"):
+                self.vector_store_repository.add_chunks(chunks)
+
+            # Respostas pré-calculadas refletem o índice anterior
+            if self.answer_cache is not None:
+                self.answer_cache.clear()
 
             return ProcessDocumentOutputDTO(
                 document_id=document.id,
@@ -129,6 +176,7 @@ class ProcessDocumentsUseCase:
             )
 
         except Exception as e:
+            request_metrics.increment("errors")
             return ProcessDocumentOutputDTO(
                 document_id="",
                 filename=input_dto.file_path,
@@ -136,3 +184,42 @@ class ProcessDocumentsUseCase:
                 success=False,
                 message=f"Erro ao processar: {str(e)}"
             )
+
+    @staticmethod
+    def _locate_pages(
+        text: str,
+        pages: List[Tuple[int, str]],
+        chunk_texts: List[str]
+    ) -> List[Tuple[int, int]]:
+        """
+        Calcula a página inicial e final de cada chunk
+
+        Args:
+            text: Texto completo (páginas unidas por quebra de linha)
+            pages: Páginas extraídas (número, texto)
+            chunk_texts: Chunks na ordem em que aparecem no texto
+
+        Returns:
+            Lista de (página inicial, página final) por chunk
+        """
+        # Offset onde cada página começa no texto completo
+        page_offsets = []
+        offset = 0
+        for _, page_text in pages:
+            page_offsets.append(offset)
+            offset += len(page_text) + 1
+
+        located = []
+        search_from = 0
+        for chunk_text in chunk_texts:
+            start = text.find(chunk_text, search_from)
+            if start < 0:
+                start = search_from
+            end = start + max(len(chunk_text) - 1, 0)
+            search_from = start + 1
+
+            first = pages[bisect_right(page_offsets, start) - 1][0]
+            last = pages[bisect_right(page_offsets, end) - 1][0]
+            located.append((first, last))
+
+        return located
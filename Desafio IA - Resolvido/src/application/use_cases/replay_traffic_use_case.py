@@ -0,0 +1,210 @@
+"""
+Use Case: Reproduzir tráfego gravado (teste de carga)
+"""
+import queue
+import threading
+import time
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from src.domain.repositories import IQueryLogRepository
+from src.application.dtos import (
+    AskQuestionInputDTO,
+    ReplayInputDTO,
+    ReplayReportDTO
+)
+from src.application.use_cases.ask_question_use_case import AskQuestionUseCase
+
+
+PERCENTILES = (50, 90, 95, 99)
+
+
+class ReplayTrafficUseCase:
+    """
+    Caso de uso: Reproduzir o log de perguntas contra o use case configurado
+
+    As chegadas seguem os intervalos originais do log, divididos por
+    `rate_scale`, e são atendidas por `virtual_users` threads. A carga é de
+    malha aberta: se os usuários virtuais estiverem ocupados, a espera na
+    fila entra na latência (chegada -> resposta), enquanto o tempo de
+    serviço mede só a execução.
+    """
+
+    def __init__(
+        self,
+        ask_use_case: AskQuestionUseCase,
+        query_log_factory: Callable[[str], IQueryLogRepository]
+    ):
+        """
+        Inicializa o replay
+
+        Args:
+            ask_use_case: Use case exercitado (backends reais ou fakes)
+            query_log_factory: Abre o log gravado a partir do caminho
+        """
+        self.ask_use_case = ask_use_case
+        self.query_log_factory = query_log_factory
+
+    def execute(self, input_dto: ReplayInputDTO) -> ReplayReportDTO:
+        """
+        Executa o replay
+
+        Args:
+            input_dto: Log, escala de taxa e usuários virtuais
+
+        Returns:
+            Vazão, percentis de latência, taxa de erro e de acerto do cache
+        """
+        try:
+            records = self._load_records(input_dto)
+            if not records:
+                return ReplayReportDTO(success=False, message="Nenhuma pergunta no log")
+
+            started_at, results = self._replay(records, input_dto)
+            return self._report(records, results, started_at)
+
+        except Exception as e:
+            return ReplayReportDTO(success=False, message=f"Erro no replay: {str(e)}")
+
+    def _load_records(self, input_dto: ReplayInputDTO) -> List[Dict]:
+        """Perguntas do log em ordem de chegada, com o instante relativo (s)"""
+        records = [
+            record for record in self.query_log_factory(input_dto.log_path).read()
+            if record.get("question")
+        ]
+        records.sort(key=lambda record: record.get("timestamp", ""))
+        if input_dto.limit:
+            records = records[:input_dto.limit]
+        if not records:
+            return []
+
+        first = None
+        offset = 0.0
+        for record in records:
+            # Sem timestamp válido: chega junto com a pergunta anterior
+            timestamp = self._parse_timestamp(record)
+            if timestamp is not None:
+                first = first or timestamp
+                offset = (timestamp - first).total_seconds()
+            record["_offset"] = offset / input_dto.rate_scale if input_dto.rate_scale > 0 else 0.0
+        return records
+
+    def _replay(
+        self,
+        records: List[Dict],
+        input_dto: ReplayInputDTO
+    ) -> Tuple[float, List[Dict]]:
+        """Despacha as chegadas no tempo e coleta os resultados dos usuários virtuais"""
+        arrivals: "queue.Queue[Optional[tuple]]" = queue.Queue()
+        results: List[Dict] = []
+        results_lock = threading.Lock()
+
+        def virtual_user():
+            while True:
+                item = arrivals.get()
+                if item is None:
+                    return
+                scheduled, record = item
+
+                started = time.perf_counter()
+                output_dto = self.ask_use_case.execute(AskQuestionInputDTO(
+                    question_text=record["question"],
+                    top_k=record.get("top_k", 5),
+                    user_id=record.get("user_id"),
+                    fast_mode=record.get("fast_mode")
+                ))
+                finished = time.perf_counter()
+
+                with results_lock:
+                    results.append({
+                        "latency": finished - scheduled,
+                        "service": finished - started,
+                        "finished": finished,
+                        "success": output_dto.success,
+                        "cached": output_dto.cached,
+                        "timings_ms": output_dto.timings
+                    })
+
+        users = [
+            threading.Thread(target=virtual_user, daemon=True)
+            for _ in range(max(1, input_dto.virtual_users))
+        ]
+        for user in users:
+            user.start()
+
+        start = time.perf_counter()
+        for record in records:
+            scheduled = start + record["_offset"]
+            delay = scheduled - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            arrivals.put((scheduled, record))
+
+        for _ in users:
+            arrivals.put(None)
+        for user in users:
+            user.join()
+
+        return start, results
+
+    def _report(
+        self,
+        records: List[Dict],
+        results: List[Dict],
+        started_at: float
+    ) -> ReplayReportDTO:
+        """Agrega os resultados do replay"""
+        duration = max(result["finished"] for result in results) - started_at
+        errors = sum(1 for result in results if not result["success"])
+        successes = len(results) - errors
+        cached = sum(1 for result in results if result["cached"])
+
+        stage_values: Dict[str, List[float]] = {}
+        for result in results:
+            for stage, value in result["timings_ms"].items():
+                stage_values.setdefault(stage, []).append(value)
+
+        recorded = [
+            record["timings_ms"]["total"] for record in records
+            if isinstance(record.get("timings_ms"), dict) and "total" in record["timings_ms"]
+        ]
+
+        return ReplayReportDTO(
+            success=True,
+            requests=len(results),
+            errors=errors,
+            duration_s=duration,
+            throughput_rps=len(results) / duration if duration > 0 else 0.0,
+            error_rate=errors / len(results),
+            cache_hit_rate=cached / successes if successes else 0.0,
+            latency_ms=self._percentiles([result["latency"] * 1000 for result in results]),
+            service_ms=self._percentiles([result["service"] * 1000 for result in results]),
+            stages_ms={
+                stage: self._percentiles(values)
+                for stage, values in sorted(stage_values.items())
+            },
+            recorded_ms=self._percentiles(recorded),
+            message=f"{len(results)} pergunta(s) reproduzida(s)"
+        )
+
+    @staticmethod
+    def _percentiles(values: List[float]) -> Dict[str, float]:
+        if not values:
+            return {}
+
+        array = np.asarray(values, dtype=np.float64)
+        report = {
+            f"p{percentile}": round(float(np.percentile(array, percentile)), 3)
+            for percentile in PERCENTILES
+        }
+        report["max"] = round(float(array.max()), 3)
+        return report
+
+    @staticmethod
+    def _parse_timestamp(record: Dict) -> Optional[datetime]:
+        try:
+            return datetime.fromisoformat(record["timestamp"])
+        except (KeyError, TypeError, ValueError):
+            return None
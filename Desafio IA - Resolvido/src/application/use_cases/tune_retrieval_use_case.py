@@ -0,0 +1,315 @@
+"""
+Use Case: Ajustar chunking e top_k com perguntas rotuladas
+"""
+import os
+import re
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from src.domain.repositories import (
+    IAIRepository,
+    IEmbeddingCacheRepository,
+    ISettingsRepository
+)
+from src.application.dtos import (
+    TuningExampleDTO,
+    RetrievalTuningInputDTO,
+    RetrievalTuningRowDTO,
+    RetrievalTuningOutputDTO
+)
+
+
+# Trecho esperado localizado: (arquivo, início, fim) no texto extraído
+PassageSpan = Tuple[str, int, int]
+
+
+class TuneRetrievalUseCase:
+    """
+    Caso de uso: Varrer chunk_size, chunk_overlap e top_k offline
+
+    Cada pergunta rotulada traz o trecho que a responde. O trecho é
+    localizado no texto extraído dos PDFs; para cada chunking os chunks são
+    gerados com o mesmo divisor da ingestão e a busca é exata (cosseno). Há
+    acerto quando os top_k chunks cobrem pelo menos `min_coverage` do
+    trecho. Cada configuração é medida em recall@k, tamanho médio do
+    contexto enviado ao modelo e tempo de busca.
+
+    A escolha considera a fronteira de Pareto entre recall e tamanho do
+    contexto (o tempo de busca, ruidoso nessa escala, só desempata): entre
+    as configurações até `recall_tolerance` abaixo do melhor recall, fica a
+    de menor contexto. A extração usa o cache de extração e os embeddings
+    passam pelo cache de embeddings, então repetir a varredura só embeda
+    chunks inéditos.
+    """
+
+    def __init__(
+        self,
+        pdf_extractor,
+        ai_repository: IAIRepository,
+        chunker_factory: Callable[[int, int], object],
+        embedding_cache: Optional[IEmbeddingCacheRepository] = None,
+        settings_repository: Optional[ISettingsRepository] = None,
+        batch_size: int = 100
+    ):
+        """
+        Inicializa o ajuste
+
+        Args:
+            pdf_extractor: Extrator de PDFs (com cache de extração)
+            ai_repository: Modelo de embedding do índice
+            chunker_factory: Cria o divisor da ingestão (chunk_size, chunk_overlap)
+            embedding_cache: Cache de embeddings (None = embeda tudo a cada varredura)
+            settings_repository: Onde a configuração escolhida é gravada
+            batch_size: Textos por chamada de embedding
+        """
+        self.pdf_extractor = pdf_extractor
+        self.ai_repository = ai_repository
+        self.chunker_factory = chunker_factory
+        self.embedding_cache = embedding_cache
+        self.settings_repository = settings_repository
+        self.batch_size = batch_size
+
+    def execute(self, input_dto: RetrievalTuningInputDTO) -> RetrievalTuningOutputDTO:
+        """
+        Executa a varredura
+
+        Args:
+            input_dto: PDFs, perguntas rotuladas e valores testados
+
+        Returns:
+            Uma linha por configuração e a configuração escolhida
+        """
+        try:
+            texts = self._extract(input_dto.file_paths)
+            if not texts:
+                return RetrievalTuningOutputDTO(success=False, message="Nenhum texto extraído dos PDFs")
+
+            located = [
+                (example, self._locate_passage(example, texts))
+                for example in input_dto.examples
+            ]
+            matched = [(example, span) for example, span in located if span is not None]
+            unmatched = len(located) - len(matched)
+            if not matched:
+                return RetrievalTuningOutputDTO(
+                    success=False,
+                    examples_count=len(located),
+                    unmatched_count=unmatched,
+                    message="Nenhum trecho rotulado foi encontrado nos PDFs"
+                )
+
+            stats = {"embedded": 0, "cached": 0}
+            memo: Dict[str, np.ndarray] = {}
+            queries = self._embed([example.question for example, _ in matched], memo, stats)
+            spans = [span for _, span in matched]
+            top_ks = sorted({k for k in input_dto.top_ks if k > 0})
+
+            rows: List[RetrievalTuningRowDTO] = []
+            for chunk_size in sorted(set(input_dto.chunk_sizes)):
+                for chunk_overlap in sorted(set(input_dto.chunk_overlaps)):
+                    if not 0 <= chunk_overlap < chunk_size:
+                        continue
+                    rows.extend(self._evaluate(
+                        texts, queries, spans, chunk_size, chunk_overlap, top_ks, input_dto, memo, stats
+                    ))
+
+            if not rows:
+                return RetrievalTuningOutputDTO(success=False, message="Nenhuma configuração válida")
+
+            self._mark_pareto(rows)
+            selected = self._select(rows, input_dto.recall_tolerance)
+
+            applied = False
+            if input_dto.apply and self.settings_repository is not None:
+                self.settings_repository.update({
+                    "CHUNK_SIZE": str(selected.chunk_size),
+                    "CHUNK_OVERLAP": str(selected.chunk_overlap),
+                    "TOP_K_RESULTS": str(selected.top_k)
+                })
+                applied = True
+
+            return RetrievalTuningOutputDTO(
+                success=True,
+                examples_count=len(located),
+                unmatched_count=unmatched,
+                embedded_count=stats["embedded"],
+                cached_count=stats["cached"],
+                rows=rows,
+                selected=selected,
+                applied=applied,
+                message=(
+                    f"chunk_size={selected.chunk_size}, chunk_overlap={selected.chunk_overlap}, "
+                    f"top_k={selected.top_k} (recall@k {selected.recall:.1%})"
+                )
+            )
+
+        except Exception as e:
+            return RetrievalTuningOutputDTO(
+                success=False,
+                message=f"Erro no ajuste de recuperação: {str(e)}"
+            )
+
+    def _extract(self, file_paths: List[str]) -> Dict[str, str]:
+        """Texto de cada PDF, unido como na ingestão"""
+        texts = {}
+        for file_path in file_paths:
+            pages = self.pdf_extractor.extract_pages(file_path)
+            text = "\n".join(page_text for _, page_text in pages)
+            if text:
+                texts[os.path.basename(file_path)] = text
+        return texts
+
+    @staticmethod
+    def _locate_passage(example: TuningExampleDTO, texts: Dict[str, str]) -> Optional[PassageSpan]:
+        """Posição do trecho (ignora caixa e espaços; a quebra de linha do PDF varia)"""
+        words = example.passage.split()
+        if not words:
+            return None
+
+        pattern = re.compile(r"\s+".join(re.escape(word) for word in words), re.IGNORECASE)
+        for source, text in texts.items():
+            if example.source and source != os.path.basename(example.source):
+                continue
+            match = pattern.search(text)
+            if match:
+                return source, match.start(), match.end()
+        return None
+
+    def _evaluate(
+        self,
+        texts: Dict[str, str],
+        queries: np.ndarray,
+        spans: List[PassageSpan],
+        chunk_size: int,
+        chunk_overlap: int,
+        top_ks: List[int],
+        input_dto: RetrievalTuningInputDTO,
+        memo: Dict[str, np.ndarray],
+        stats: Dict[str, int]
+    ) -> List[RetrievalTuningRowDTO]:
+        """Recall, contexto e busca de um chunking para cada top_k"""
+        chunker = self.chunker_factory(chunk_size, chunk_overlap)
+
+        chunk_texts: List[str] = []
+        chunk_spans: List[PassageSpan] = []
+        for source, text in texts.items():
+            pieces = chunker.split_text(text)
+            chunk_texts.extend(pieces)
+            chunk_spans.extend((source, start, end) for start, end in self._chunk_offsets(text, pieces))
+
+        vectors = self._embed(chunk_texts, memo, stats)
+        lengths = np.asarray([len(chunk) for chunk in chunk_texts], dtype=np.float64)
+
+        max_k = min(max(top_ks), len(chunk_texts))
+        start = time.perf_counter()
+        similarities = queries @ vectors.T
+        nearest = np.argpartition(-similarities, max_k - 1, axis=1)[:, :max_k]
+        order = np.take_along_axis(-similarities, nearest, axis=1).argsort(axis=1, kind="stable")
+        ranked = np.take_along_axis(nearest, order, axis=1)
+        search_ms = (time.perf_counter() - start) * 1000 / len(queries)
+
+        rows = []
+        for top_k in top_ks:
+            retrieved = ranked[:, :min(top_k, max_k)]
+            hits = sum(
+                self._coverage(span, [chunk_spans[i] for i in row]) >= input_dto.min_coverage
+                for span, row in zip(spans, retrieved.tolist())
+            )
+            rows.append(RetrievalTuningRowDTO(
+                chunk_size=chunk_size,
+                chunk_overlap=chunk_overlap,
+                top_k=top_k,
+                recall=hits / len(spans),
+                context_chars=float(lengths[retrieved].sum(axis=1).mean()),
+                search_ms=search_ms,
+                chunks_count=len(chunk_texts)
+            ))
+        return rows
+
+    def _embed(
+        self,
+        texts: List[str],
+        memo: Dict[str, np.ndarray],
+        stats: Dict[str, int]
+    ) -> np.ndarray:
+        """Embeddings normalizados (L2): memória da varredura, cache e modelo"""
+        missing = list(dict.fromkeys(text for text in texts if text not in memo))
+        model_id = self.ai_repository.embedding_model_id
+
+        if missing and self.embedding_cache is not None:
+            cached = self.embedding_cache.get_many(model_id, missing)
+            for text, embedding in zip(missing, cached):
+                if embedding is not None:
+                    memo[text] = self._normalize(embedding)
+            stats["cached"] += sum(1 for embedding in cached if embedding is not None)
+            missing = [text for text in missing if text not in memo]
+
+        for start in range(0, len(missing), self.batch_size):
+            batch = missing[start:start + self.batch_size]
+            embeddings = self.ai_repository.generate_embeddings_batch(batch)
+            if self.embedding_cache is not None:
+                self.embedding_cache.put_many(model_id, batch, embeddings)
+            for text, embedding in zip(batch, embeddings):
+                memo[text] = self._normalize(embedding)
+            stats["embedded"] += len(batch)
+
+        return np.stack([memo[text] for text in texts])
+
+    @staticmethod
+    def _normalize(embedding: List[float]) -> np.ndarray:
+        vector = np.asarray(embedding, dtype=np.float32)
+        return vector / max(float(np.linalg.norm(vector)), 1e-12)
+
+    @staticmethod
+    def _chunk_offsets(text: str, chunk_texts: List[str]) -> List[Tuple[int, int]]:
+        """(início, fim) de cada chunk no texto (chunks em ordem, com overlap)"""
+        offsets = []
+        search_from = 0
+        for chunk_text in chunk_texts:
+            start = text.find(chunk_text, search_from)
+            if start < 0:
+                start = search_from
+            offsets.append((start, start + len(chunk_text)))
+            search_from = start + 1
+        return offsets
+
+    @staticmethod
+    def _coverage(span: PassageSpan, chunk_spans: List[PassageSpan]) -> float:
+        """Fração do trecho coberta pela união dos chunks recuperados"""
+        source, start, end = span
+        intervals = sorted(
+            (max(start, chunk_start), min(end, chunk_end))
+            for chunk_source, chunk_start, chunk_end in chunk_spans
+            if chunk_source == source and chunk_start < end and chunk_end > start
+        )
+
+        covered = 0
+        position = start
+        for interval_start, interval_end in intervals:
+            interval_start = max(interval_start, position)
+            if interval_end > interval_start:
+                covered += interval_end - interval_start
+                position = interval_end
+        return covered / (end - start)
+
+    @staticmethod
+    def _mark_pareto(rows: List[RetrievalTuningRowDTO]) -> None:
+        """Marca as linhas não dominadas em (recall maior, contexto menor)"""
+        for row in rows:
+            row.pareto = not any(
+                other.recall >= row.recall and other.context_chars <= row.context_chars and
+                (other.recall > row.recall or other.context_chars < row.context_chars)
+                for other in rows
+            )
+
+    @staticmethod
+    def _select(rows: List[RetrievalTuningRowDTO], recall_tolerance: float) -> RetrievalTuningRowDTO:
+        """Menor contexto da fronteira entre as de recall próximo do melhor"""
+        best_recall = max(row.recall for row in rows)
+        candidates = [
+            row for row in rows
+            if row.pareto and row.recall >= best_recall - recall_tolerance
+        ]
+        return min(candidates, key=lambda row: (row.context_chars, row.search_ms))
@@ -0,0 +1,243 @@
+"""
+Use Case: Aquecer o cache de respostas a partir do log de perguntas
+"""
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from src.domain.repositories import (
+    IAIRepository,
+    IAnswerCacheRepository,
+    IQueryLogRepository
+)
+from src.application.cache import answer_cache_key, normalize_question
+from src.application.dtos import (
+    AskQuestionInputDTO,
+    WarmCacheInputDTO,
+    WarmCacheOutputDTO
+)
+from src.application.use_cases.ask_question_use_case import AskQuestionUseCase
+
+
+@dataclass
+class QuestionCluster:
+    """Grupo de perguntas equivalentes (variações de uma mesma dúvida)"""
+    user_id: Optional[str]
+    top_k: int
+    leader: str  # pergunta mais frequente do grupo (texto original)
+    members: List[str] = field(default_factory=list)  # perguntas normalizadas
+    count: int = 0
+
+
+class WarmAnswerCacheUseCase:
+    """
+    Caso de uso: Pré-calcular as respostas das perguntas mais frequentes
+
+    Lê o log de perguntas, agrupa as variações de uma mesma pergunta
+    (texto normalizado idêntico ou embeddings com similaridade acima do
+    limiar, por usuário e top_k), responde a pergunta mais frequente de cada
+    grupo e grava a resposta sob a chave de todas as variações. Respostas
+    com confiança baixa (não encontradas ou com erro) não são armazenadas.
+    O cache é substituído inteiro, então deve rodar após cada reingestão.
+    """
+
+    def __init__(
+        self,
+        query_log: IQueryLogRepository,
+        answer_cache: IAnswerCacheRepository,
+        ai_repository: IAIRepository,
+        ask_use_case: AskQuestionUseCase,
+        batch_size: int = 32,
+        max_workers: int = 4
+    ):
+        """
+        Inicializa o aquecimento
+
+        Args:
+            query_log: Log das perguntas recebidas
+            answer_cache: Cache que será preenchido
+            ai_repository: Embeddings usados no agrupamento
+            ask_use_case: Gera as respostas (sem cache nem log de perguntas)
+            batch_size: Perguntas por lote de embedding/busca
+            max_workers: Gerações simultâneas
+        """
+        self.query_log = query_log
+        self.answer_cache = answer_cache
+        self.ai_repository = ai_repository
+        self.ask_use_case = ask_use_case
+        self.batch_size = batch_size
+        self.max_workers = max_workers
+
+    def execute(self, input_dto: Optional[WarmCacheInputDTO] = None) -> WarmCacheOutputDTO:
+        """
+        Executa o aquecimento
+
+        Args:
+            input_dto: Limites do agrupamento (padrão: WarmCacheInputDTO())
+
+        Returns:
+            Quantidade de perguntas lidas, grupos respondidos e chaves gravadas
+        """
+        input_dto = input_dto or WarmCacheInputDTO()
+
+        try:
+            frequencies = self._load_frequencies(input_dto)
+            questions_count = sum(sum(counter.values()) for counter, _ in frequencies.values())
+
+            clusters = []
+            for (user_id, top_k), (counter, originals) in frequencies.items():
+                clusters.extend(self._cluster(user_id, top_k, counter, originals, input_dto))
+
+            clusters = sorted(
+                (cluster for cluster in clusters if cluster.count >= input_dto.min_count),
+                key=lambda cluster: cluster.count,
+                reverse=True
+            )[:input_dto.max_clusters]
+
+            entries, failed = self._answer_clusters(clusters)
+            self.answer_cache.replace_all(entries)
+
+            return WarmCacheOutputDTO(
+                success=True,
+                questions_count=questions_count,
+                clusters_count=len(clusters),
+                answers_cached=len(entries),
+                failed_count=failed,
+                message=(
+                    f"{len(clusters) - failed} grupo(s) de perguntas respondido(s), "
+                    f"{len(entries)} variação(ões) no cache"
+                )
+            )
+
+        except Exception as e:
+            return WarmCacheOutputDTO(
+                success=False,
+                message=f"Erro ao aquecer o cache: {str(e)}"
+            )
+
+    def _load_frequencies(
+        self,
+        input_dto: WarmCacheInputDTO
+    ) -> Dict[Tuple[Optional[str], int], Tuple[Counter, Dict[str, Counter]]]:
+        """Frequência das perguntas normalizadas por (usuário, top_k)"""
+        since = None
+        if input_dto.since_days:
+            since = (datetime.now() - timedelta(days=input_dto.since_days)).isoformat()
+
+        # (usuário, top_k) -> (contagem por pergunta normalizada, textos originais)
+        frequencies: Dict[Tuple[Optional[str], int], Tuple[Counter, Dict[str, Counter]]] = (
+            defaultdict(lambda: (Counter(), defaultdict(Counter)))
+        )
+        for record in self.query_log.read():
+            # Perguntas com filtros não usam o cache
+            if record.get("filtered") or not record.get("question"):
+                continue
+            if since and record.get("timestamp", "") < since:
+                continue
+
+            normalized = normalize_question(record["question"])
+            if not normalized:
+                continue
+
+            counter, originals = frequencies[(record.get("user_id"), record.get("top_k", 5))]
+            counter[normalized] += 1
+            originals[normalized][record["question"].strip()] += 1
+
+        return frequencies
+
+    def _cluster(
+        self,
+        user_id: Optional[str],
+        top_k: int,
+        counter: Counter,
+        originals: Dict[str, Counter],
+        input_dto: WarmCacheInputDTO
+    ) -> List[QuestionCluster]:
+        """
+        Agrupamento guloso por similaridade (líder = pergunta mais frequente)
+
+        Percorre as perguntas da mais para a menos frequente; cada uma entra
+        no grupo cujo líder é mais similar, se acima do limiar, ou abre um
+        grupo novo.
+        """
+        questions = [question for question, _ in counter.most_common(input_dto.max_questions)]
+        embeddings = self._embed(questions)
+
+        clusters: List[QuestionCluster] = []
+        # Embeddings dos líderes (linha i = grupo i)
+        leaders = np.empty_like(embeddings)
+        for question, embedding in zip(questions, embeddings):
+            cluster = None
+            if clusters:
+                similarities = leaders[:len(clusters)] @ embedding
+                best = int(np.argmax(similarities))
+                if similarities[best] >= input_dto.similarity:
+                    cluster = clusters[best]
+
+            if cluster is None:
+                leaders[len(clusters)] = embedding
+                cluster = QuestionCluster(
+                    user_id=user_id,
+                    top_k=top_k,
+                    leader=originals[question].most_common(1)[0][0]
+                )
+                clusters.append(cluster)
+
+            cluster.members.append(question)
+            cluster.count += counter[question]
+
+        return clusters
+
+    def _embed(self, questions: List[str]) -> np.ndarray:
+        """Embeddings normalizados (L2) das perguntas, em lotes"""
+        vectors = []
+        for start in range(0, len(questions), self.batch_size):
+            vectors.extend(self.ai_repository.generate_embeddings_batch(
+                questions[start:start + self.batch_size]
+            ))
+
+        matrix = np.asarray(vectors, dtype=np.float32).reshape(len(questions), -1)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        return matrix / np.maximum(norms, 1e-12)
+
+    def _answer_clusters(
+        self,
+        clusters: List[QuestionCluster]
+    ) -> Tuple[Dict[str, Dict], int]:
+        """Responde o líder de cada grupo e replica a resposta nas variações"""
+        input_dtos = (
+            AskQuestionInputDTO(
+                question_text=cluster.leader,
+                top_k=cluster.top_k,
+                user_id=cluster.user_id,
+                fast_mode=False  # com raciocínio: serve perguntas rápidas e completas
+            )
+            for cluster in clusters
+        )
+        outputs = self.ask_use_case.execute_batch(
+            input_dtos,
+            batch_size=self.batch_size,
+            max_workers=self.max_workers
+        )
+
+        entries: Dict[str, Dict] = {}
+        failed = 0
+        for cluster, output_dto in zip(clusters, outputs):
+            if not output_dto.success or output_dto.confidence == "baixa":
+                failed += 1
+                continue
+
+            answer = {
+                "answer": output_dto.answer,
+                "source": output_dto.source,
+                "confidence": output_dto.confidence,
+                "reasoning": output_dto.reasoning,
+                "citation": output_dto.citation
+            }
+            for member in cluster.members:
+                entries[answer_cache_key(member, cluster.user_id, cluster.top_k)] = answer
+
+        return entries, failed
@@ -0,0 +1,223 @@
+"""
+Use Case: Manter o índice sincronizado com a pasta de documentos
+"""
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional
+
+from src.domain.repositories import (
+    IAnswerCacheRepository,
+    IDocumentRepository,
+    IFolderWatcher,
+    IVectorStoreRepository
+)
+from src.application.dtos import (
+    ProcessDocumentInputDTO,
+    WatchInputDTO,
+    WatchEventDTO,
+    WatchSummaryDTO
+)
+from src.application.use_cases.process_documents_use_case import ProcessDocumentsUseCase
+
+
+class WatchDocumentsUseCase:
+    """
+    Caso de uso: Ingerir e remover PDFs conforme a pasta muda
+
+    Os eventos do observador só marcam o arquivo como pendente; ele entra na
+    fila de trabalho depois de `debounce_s` segundos sem novos eventos (a
+    cópia terminou). Na execução, o estado do arquivo decide a ação: se
+    existe, é reingerido (o upsert substitui a versão anterior, que segue na
+    busca até lá e permanece se a reingestão falhar); se não existe mais,
+    sai do índice. No máximo `max_workers` arquivos são processados ao mesmo
+    tempo e nunca o mesmo arquivo duas vezes em paralelo; eventos que chegam
+    durante o processamento geram uma nova rodada para o arquivo.
+    """
+
+    def __init__(
+        self,
+        process_use_case: ProcessDocumentsUseCase,
+        document_repository: IDocumentRepository,
+        vector_store_repository: IVectorStoreRepository,
+        watcher_factory: Callable[[str], IFolderWatcher],
+        answer_cache: Optional[IAnswerCacheRepository] = None
+    ):
+        """
+        Inicializa a observação
+
+        Args:
+            process_use_case: Ingestão de um PDF
+            document_repository: Documentos processados (removidos com o arquivo)
+            vector_store_repository: Índice vetorial
+            watcher_factory: Cria o observador da pasta
+            answer_cache: Cache de respostas (limpo quando um documento sai)
+        """
+        self.process_use_case = process_use_case
+        self.document_repository = document_repository
+        self.vector_store_repository = vector_store_repository
+        self.watcher_factory = watcher_factory
+        self.answer_cache = answer_cache
+
+    def execute(
+        self,
+        input_dto: WatchInputDTO,
+        on_event: Optional[Callable[[WatchEventDTO], None]] = None,
+        stop_event: Optional[threading.Event] = None
+    ) -> WatchSummaryDTO:
+        """
+        Observa a pasta até `stop_event` ou Ctrl+C
+
+        Args:
+            input_dto: Pasta, debounce e concorrência
+            on_event: Chamado com o resultado de cada arquivo tratado
+            stop_event: Encerra a observação quando definido
+
+        Returns:
+            Totais de arquivos ingeridos, removidos e com erro
+        """
+        summary = WatchSummaryDTO(success=True)
+        try:
+            watcher = self.watcher_factory(input_dto.folder)
+        except Exception as e:
+            return WatchSummaryDTO(success=False, message=f"Erro ao observar a pasta: {str(e)}")
+
+        # caminho -> instante do último evento (0 = pronto para processar)
+        pending: Dict[str, float] = {}
+        running: Dict[str, Future] = {}
+        poll_timeout = min(0.5, max(input_dto.debounce_s / 2, 0.05))
+
+        try:
+            if input_dto.sync_on_start:
+                pending.update((path, 0.0) for path in self._unindexed(input_dto.folder))
+
+            with ThreadPoolExecutor(
+                max_workers=max(1, input_dto.max_workers),
+                thread_name_prefix="watch"
+            ) as executor:
+                try:
+                    while not (stop_event is not None and stop_event.is_set()):
+                        for _, path in watcher.poll(poll_timeout):
+                            pending[path] = time.monotonic()
+                        self._collect(running, summary, on_event)
+                        self._dispatch(pending, running, executor, input_dto)
+                except KeyboardInterrupt:
+                    pass
+
+                # Arquivos em andamento terminam; pendentes ficam para a próxima execução
+                self._collect(running, summary, on_event, wait=True)
+
+        except Exception as e:
+            summary.success = False
+            summary.message = f"Erro na observação da pasta: {str(e)}"
+            return summary
+        finally:
+            watcher.close()
+
+        summary.message = (
+            f"{summary.ingested} ingerido(s), {summary.deleted} removido(s), "
+            f"{summary.failed} com erro"
+        )
+        return summary
+
+    def _unindexed(self, folder: str) -> List[str]:
+        """PDFs da pasta que ainda não estão no índice"""
+        indexed = set(self.vector_store_repository.list_sources())
+        return [
+            os.path.join(folder, filename)
+            for filename in sorted(os.listdir(folder))
+            if filename.lower().endswith(".pdf")
+            and not filename.startswith(".")
+            and filename not in indexed
+        ]
+
+    def _dispatch(
+        self,
+        pending: Dict[str, float],
+        running: Dict[str, Future],
+        executor: ThreadPoolExecutor,
+        input_dto: WatchInputDTO
+    ) -> None:
+        """Envia à fila os arquivos estáveis, respeitando o limite de concorrência"""
+        now = time.monotonic()
+        ready = sorted(
+            (last_event, path) for path, last_event in pending.items()
+            if now - last_event >= input_dto.debounce_s and path not in running
+        )
+        for _, path in ready[:max(0, input_dto.max_workers - len(running))]:
+            del pending[path]
+            running[path] = executor.submit(self._handle, path, input_dto)
+
+    @staticmethod
+    def _collect(
+        running: Dict[str, Future],
+        summary: WatchSummaryDTO,
+        on_event: Optional[Callable[[WatchEventDTO], None]],
+        wait: bool = False
+    ) -> None:
+        """Recolhe os arquivos concluídos"""
+        for path, future in list(running.items()):
+            if not (wait or future.done()):
+                continue
+            del running[path]
+            event = future.result()
+
+            if not event.success:
+                summary.failed += 1
+            elif event.action == "delete":
+                summary.deleted += 1
+            else:
+                summary.ingested += 1
+
+            if on_event is not None:
+                on_event(event)
+
+    def _handle(self, path: str, input_dto: WatchInputDTO) -> WatchEventDTO:
+        """Reingere ou remove o arquivo conforme o estado atual"""
+        filename = os.path.basename(path)
+        start = time.perf_counter()
+
+        try:
+            if not os.path.exists(path):
+                self.vector_store_repository.delete_by_source(filename)
+                # Mesmo id que a ingestão usou (prefixado pelo tenant)
+                self.document_repository.delete(
+                    f"{input_dto.tenant_id}:{filename}" if input_dto.tenant_id else filename
+                )
+                if self.answer_cache is not None:
+                    self.answer_cache.clear()
+                return WatchEventDTO(
+                    action="delete",
+                    filename=filename,
+                    success=True,
+                    seconds=time.perf_counter() - start,
+                    message="Documento removido do índice"
+                )
+
+            # Sem remoção prévia: o upsert é idempotente e descarta os chunks que
+            # não existem na nova versão, então a versão anterior continua na
+            # busca durante a reingestão e é mantida se ela falhar
+            output_dto = self.process_use_case.execute(ProcessDocumentInputDTO(
+                file_path=path,
+                chunk_size=input_dto.chunk_size,
+                chunk_overlap=input_dto.chunk_overlap,
+                tenant_id=input_dto.tenant_id
+            ))
+            return WatchEventDTO(
+                action="ingest",
+                filename=filename,
+                success=output_dto.success,
+                chunks_count=output_dto.chunks_count,
+                seconds=time.perf_counter() - start,
+                message=output_dto.message
+            )
+
+        except Exception as e:
+            return WatchEventDTO(
+                action="ingest" if os.path.exists(path) else "delete",
+                filename=filename,
+                success=False,
+                seconds=time.perf_counter() - start,
+                message=str(e)
+            )
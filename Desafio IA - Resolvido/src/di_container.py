@@ -4,20 +4,68 @@ Dependency Injection Container - Clean Architecture
 Este módulo centraliza a criação e injeção de dependências,
 seguindo os princípios SOLID (especialmente D - Dependency Inversion)
 """
-from dataclasses import dataclass
+import json
+import os
+import re
+from dataclasses import dataclass, replace
+from functools import partial
+from typing import Callable, Optional
 
-from src.infrastructure.config import Settings
-from src.infrastructure.ai import GeminiAIRepository
+from src.infrastructure.config import Settings, EnvFileSettingsRepository
+from src.infrastructure.ai import GeminiAIRepository, LocalEmbeddingAIRepository
 from src.infrastructure.storage import (
     ChromaVectorStoreRepository,
-    InMemoryDocumentRepository
+    InMemoryDocumentRepository,
+    SQLiteDocumentRepository,
+    SQLiteAnswerCacheRepository,
+    SQLiteEmbeddingCacheRepository,
+    ShardedVectorStoreRepository,
+    ProcessVectorStoreShard,
+    NumpyIndexSnapshotRepository,
+    IndexSnapshot,
+    SnapshotVectorStoreRepository,
+    GenerationalSnapshotVectorStoreRepository,
+    current_generation,
+    generation_path,
+    is_generations_root,
+    ReducedDimensionVectorStoreRepository,
+    FullVectorStore
 )
+from src.infrastructure.watch import create_folder_watcher
+from src.infrastructure.fakes import FakeAIRepository, FakeVectorStoreRepository
+from src.infrastructure.pdf import (
+    PDFExtractor,
+    TextChunker,
+    JsonPDFCalibrationRepository,
+    available_pdf_backends,
+    create_pdf_backend,
+    is_pdf_backend_available
+)
+from src.infrastructure.metrics import (
+    PrometheusMetricsExporter,
+    JsonLogMetricsExporter,
+    JsonlRoutingLogRepository,
+    JsonlQueryLogRepository
+)
+from src.application.metrics import MetricsCollector
+from src.application.routing import AnswerRouter
+from src.application.resilience import HedgedCaller
+from src.application.cache import SingleFlight
+from src.application.dtos import WarmCacheInputDTO, WatchInputDTO
 from src.application.use_cases import (
     ProcessDocumentsUseCase,
-    AskQuestionUseCase
+    AskQuestionUseCase,
+    ManageIndexUseCase,
+    BenchmarkDimensionsUseCase,
+    WarmAnswerCacheUseCase,
+    ReplayTrafficUseCase,
+    CalibratePDFBackendsUseCase,
+    WatchDocumentsUseCase,
+    TuneRetrievalUseCase
 )
 from src.presentation.cli import MainCLI
 from src.presentation.web import StreamlitApp
+from src.presentation.server import PreforkServer
 
 
 @dataclass
@@ -31,14 +79,22 @@ class DIContainer:
     """
 
     settings: Settings
+    # Geração do índice definida pelo supervisor (workers de --serve)
+    generation_source: Optional[Callable[[], int]] = None
+    # Slot do worker de --serve (métricas em arquivo próprio)
+    worker_slot: Optional[int] = None
 
     def __post_init__(self):
         """Inicializa repositórios após criação"""
         self._document_repository = None
         self._vector_store_repository = None
         self._ai_repository = None
+        self._answer_cache_repository = None
+        self._metrics_collector = None
+        self._hedged_caller = None
         self._process_use_case = None
         self._ask_use_case = None
+        self._manage_index_use_case = None
 
     # ==========================================
     # Camada Infrastructure (Adapters)
@@ -48,31 +104,286 @@ class DIContainer:
     def document_repository(self):
         """Repositório de documentos (singleton)"""
         if self._document_repository is None:
-            self._document_repository = InMemoryDocumentRepository()
+            if self.settings.document_db_path:
+                self._document_repository = SQLiteDocumentRepository(
+                    db_path=self.settings.document_db_path
+                )
+            else:
+                self._document_repository = InMemoryDocumentRepository()
         return self._document_repository
 
     @property
     def vector_store_repository(self):
         """Repositório vetorial (singleton)"""
         if self._vector_store_repository is None:
-            self._vector_store_repository = ChromaVectorStoreRepository(
-                persist_directory=self.settings.chroma_db_path
-            )
+            if self.settings.vector_store_backend == 'snapshot' and is_generations_root(self.settings.snapshot_path):
+                # Pasta de gerações: acompanha a publicação atual
+                self._vector_store_repository = GenerationalSnapshotVectorStoreRepository(
+                    root=self.settings.snapshot_path,
+                    generation_source=self.generation_source,
+                    embedding_model=self.ai_repository.embedding_model_id
+                )
+            elif self.settings.vector_store_backend == 'snapshot':
+                self._vector_store_repository = SnapshotVectorStoreRepository(
+                    snapshot_path=self.settings.snapshot_path,
+                    embedding_model=self.ai_repository.embedding_model_id
+                )
+            elif self.settings.vector_store_backend == 'fake':
+                self._vector_store_repository = FakeVectorStoreRepository(
+                    search_ms=self.settings.fake_search_ms
+                )
+            elif self.settings.vector_store_shards > 1:
+                self._vector_store_repository = self._create_sharded_vector_store()
+            else:
+                self._warn_if_sharded_index()
+                self._vector_store_repository = self._chroma_factory(
+                    self.settings.chroma_db_path
+                )()
+
+            if self.settings.embedding_dimension and self.settings.vector_store_backend not in ('snapshot', 'fake'):
+                # Índice com as primeiras N dimensões; vetores completos em disco.
+                # O snapshot trunca as queries à dimensão gravada no manifest
+                # (completa com re-rank, reduzida sem ele)
+                self._vector_store_repository = ReducedDimensionVectorStoreRepository(
+                    inner=self._vector_store_repository,
+                    dimension=self.settings.embedding_dimension,
+                    full_vectors=FullVectorStore(
+                        os.path.join(self.settings.chroma_db_path, 'full_vectors.db')
+                    ) if self.settings.rerank_factor > 1 else None,
+                    rerank_factor=self.settings.rerank_factor,
+                    distance_space=self.settings.chroma_distance_space
+                )
         return self._vector_store_repository
 
+    def _chroma_factory(self, persist_directory: str):
+        """Fábrica (picklable) de repositórios ChromaDB com a configuração atual"""
+        return partial(
+            ChromaVectorStoreRepository,
+            persist_directory=persist_directory,
+            distance_space=self.settings.chroma_distance_space,
+            hnsw_construction_ef=self.settings.hnsw_construction_ef,
+            hnsw_search_ef=self.settings.hnsw_search_ef,
+            hnsw_m=self.settings.hnsw_m,
+            batch_size=self.settings.chroma_batch_size,
+            tenant_partitioning=self.settings.tenant_partitioning,
+            embedding_model=self.ai_repository.embedding_model_id,
+            embedding_dimension=self.settings.embedding_dimension
+        )
+
+    def _create_sharded_vector_store(self):
+        """Um shard por subpasta de chroma_db_path (shard_0, shard_1, ...)"""
+        shards = {}
+        for i in range(self.settings.vector_store_shards):
+            name = f"shard_{i}"
+            factory = self._chroma_factory(
+                os.path.join(self.settings.chroma_db_path, name)
+            )
+            if self.settings.vector_store_shard_mode == 'process':
+                shards[name] = ProcessVectorStoreShard(factory)
+            else:
+                shards[name] = factory()
+
+        sharded = ShardedVectorStoreRepository(shards)
+        self._migrate_shard_topology(sharded)
+        return sharded
+
+    def _shard_topology_path(self) -> str:
+        return os.path.join(self.settings.chroma_db_path, 'shards.json')
+
+    def _migrate_shard_topology(self, sharded: ShardedVectorStoreRepository) -> None:
+        """
+        Na primeira abertura com outra quantidade de shards, traz o índice
+        para a topologia atual: o índice não particionado da raiz e shards
+        que saíram da topologia são absorvidos e as fontes fora do dono são
+        rebalanceadas. A quantidade fica registrada em shards.json.
+        """
+        root = self.settings.chroma_db_path
+        count = self.settings.vector_store_shards
+        if self._recorded_shard_count() == count:
+            return
+
+        orphans = []
+        if os.path.exists(os.path.join(root, 'chroma.sqlite3')):
+            orphans.append(root)
+        names = sorted(os.listdir(root)) if os.path.isdir(root) else []
+        for name in names:
+            match = re.fullmatch(r"shard_(\d+)", name)
+            if match and int(match.group(1)) >= count:
+                orphans.append(os.path.join(root, name))
+
+        moved = sum(sharded.absorb(self._chroma_factory(path)()) for path in orphans)
+        moved += sharded.rebalance()
+        if moved:
+            print(f"✓ {moved} documento(s) movido(s) para a topologia de {count} shard(s)")
+
+        os.makedirs(root, exist_ok=True)
+        with open(self._shard_topology_path(), 'w', encoding='utf-8') as f:
+            json.dump({"shards": count}, f)
+
+    def _warn_if_sharded_index(self) -> None:
+        """Avisa quando o índice está em shards e VECTOR_STORE_SHARDS voltou a 1"""
+        recorded = self._recorded_shard_count()
+        if recorded and recorded > 1:
+            print(
+                f"[AVISO] O índice está dividido em {recorded} shards em "
+                f"{self.settings.chroma_db_path}; use VECTOR_STORE_SHARDS={recorded}."
+            )
+
+    def _recorded_shard_count(self) -> Optional[int]:
+        try:
+            with open(self._shard_topology_path(), encoding='utf-8') as f:
+                return int(json.load(f)["shards"])
+        except (FileNotFoundError, ValueError, KeyError, TypeError):
+            return None
+
+    @property
+    def snapshot_repository(self):
+        """Repositório de snapshots do índice"""
+        return NumpyIndexSnapshotRepository(
+            distance_space=self.settings.chroma_distance_space,
+            embedding_model=self.ai_repository.embedding_model_id
+        )
+
+    @property
+    def pdf_calibration_repository(self):
+        """Resultado da calibração dos backends de PDF"""
+        return JsonPDFCalibrationRepository(file_path=self.settings.pdf_calibration_path)
+
+    @property
+    def pdf_backend(self):
+        """Backend de PDF de PDF_BACKEND (auto = calibrado, senão pypdf)"""
+        name = self.settings.pdf_backend
+        if name == 'auto':
+            calibration = self.pdf_calibration_repository.load()
+            name = calibration.get("backend", 'pypdf') if calibration else 'pypdf'
+            if not is_pdf_backend_available(name):
+                print(f"[AVISO] Backend de PDF calibrado '{name}' indisponível; usando pypdf")
+                name = 'pypdf'
+        return create_pdf_backend(name)
+
+    @property
+    def pdf_extractor(self):
+        """Extrator de PDFs com cache de extração"""
+        return PDFExtractor(
+            cache_dir=self.settings.extraction_cache_path or None,
+            backend=self.pdf_backend
+        )
+
+    @property
+    def answer_cache_repository(self):
+        """Cache de respostas pré-calculadas (singleton; None se desativado)"""
+        if self._answer_cache_repository is None and self.settings.answer_cache_path:
+            self._answer_cache_repository = SQLiteAnswerCacheRepository(
+                db_path=self.settings.answer_cache_path
+            )
+        return self._answer_cache_repository
+
+    @property
+    def query_log_repository(self):
+        """Log das perguntas recebidas (None se desativado)"""
+        if not self.settings.query_log_path:
+            return None
+        return JsonlQueryLogRepository(file_path=self.settings.query_log_path)
+
     @property
     def ai_repository(self):
         """Repositório de IA (singleton)"""
-        if self._ai_repository is None:
+        if self._ai_repository is None and self.settings.ai_backend == 'fake':
+            # Sem rede: embeddings e respostas determinísticos (teste de carga)
+            self._ai_repository = FakeAIRepository(
+                embedding_ms=self.settings.fake_embedding_ms,
+                generation_ms=self.settings.fake_generation_ms,
+                light_generation_ms=self.settings.fake_light_generation_ms,
+                slow_ratio=self.settings.fake_slow_ratio
+            )
+        elif self._ai_repository is None:
             self._ai_repository = GeminiAIRepository(
-                api_key=self.settings.google_api_key
+                api_key=self.settings.google_api_key,
+                fast_max_output_tokens=self.settings.fast_max_output_tokens,
+                # Sem rota leve, não cria o segundo modelo
+                light_model_name=(
+                    self.settings.light_model_name
+                    if self.settings.route_light_distance else ""
+                )
             )
+            if self.settings.embedding_backend == 'local':
+                # Embeddings em CPU; Gemini continua gerando as respostas
+                self._ai_repository = LocalEmbeddingAIRepository(
+                    answer_repository=self._ai_repository,
+                    dimension=self.settings.local_embedding_dimension
+                )
+            elif self.settings.embedding_backend != 'gemini':
+                raise ValueError(
+                    f"EMBEDDING_BACKEND desconhecido: {self.settings.embedding_backend}"
+                )
         return self._ai_repository
 
+    @property
+    def metrics_exporters(self):
+        """Exportadores de métricas configurados em METRICS_EXPORTERS"""
+        names = [
+            name.strip().lower()
+            for name in self.settings.metrics_exporters.split(',')
+            if name.strip()
+        ]
+        exporters = []
+
+        for name in names:
+            if name == 'prometheus':
+                # Workers de --serve: um .prom por slot (o collector lê *.prom da pasta)
+                if self.worker_slot is None:
+                    file_name, labels = 'metrics.prom', None
+                else:
+                    file_name = f'metrics-worker-{self.worker_slot}.prom'
+                    labels = {'worker': str(self.worker_slot)}
+                exporters.append(PrometheusMetricsExporter(
+                    file_path=os.path.join(self.settings.metrics_path, file_name),
+                    min_interval_s=self.settings.metrics_export_interval_s,
+                    labels=labels
+                ))
+            elif name == 'json':
+                exporters.append(JsonLogMetricsExporter(
+                    file_path=os.path.join(self.settings.metrics_path, 'metrics.jsonl')
+                ))
+            else:
+                raise ValueError(f"Exportador de métricas desconhecido: {name}")
+
+        return exporters
+
     # ==========================================
     # Camada Application (Use Cases)
     # ==========================================
 
+    @property
+    def metrics_collector(self):
+        """Coletor de métricas compartilhado pelos use cases (singleton)"""
+        if self._metrics_collector is None:
+            self._metrics_collector = MetricsCollector(
+                exporters=self.metrics_exporters
+            )
+        return self._metrics_collector
+
+    @property
+    def answer_router(self):
+        """Roteador da geração (limiares de ROUTE_*_DISTANCE)"""
+        return AnswerRouter(
+            not_found_distance=self.settings.route_not_found_distance,
+            light_distance=self.settings.route_light_distance,
+            log_repository=JsonlRoutingLogRepository(
+                file_path=self.settings.routing_log_path
+            ) if self.settings.routing_log_path else None
+        )
+
+    @property
+    def hedged_caller(self):
+        """Hedge das chamadas ao modelo (singleton: histórico de latência compartilhado)"""
+        if self._hedged_caller is None:
+            self._hedged_caller = HedgedCaller(
+                percentile=self.settings.hedge_percentile,
+                min_samples=self.settings.hedge_min_samples
+            )
+        return self._hedged_caller
+
     @property
     def process_documents_use_case(self):
         """Use case de processamento de documentos"""
@@ -80,7 +391,10 @@ class DIContainer:
             self._process_use_case = ProcessDocumentsUseCase(
                 document_repository=self.document_repository,
                 vector_store_repository=self.vector_store_repository,
-                ai_repository=self.ai_repository
+                ai_repository=self.ai_repository,
+                metrics=self.metrics_collector,
+                pdf_extractor=self.pdf_extractor,
+                answer_cache=self.answer_cache_repository
             )
         return self._process_use_case
 
@@ -90,10 +404,105 @@ class DIContainer:
         if self._ask_use_case is None:
             self._ask_use_case = AskQuestionUseCase(
                 vector_store_repository=self.vector_store_repository,
-                ai_repository=self.ai_repository
+                ai_repository=self.ai_repository,
+                metrics=self.metrics_collector,
+                fast_mode=self.settings.fast_mode,
+                router=self.answer_router,
+                answer_cache=self.answer_cache_repository,
+                query_log=self.query_log_repository,
+                hedging=self.hedged_caller,
+                deadline_ms=self.settings.deadline_ms,
+                top_k=self.settings.top_k_results,
+                single_flight=SingleFlight() if self.settings.coalesce_questions else None,
+                generation_source=self.generation_source
             )
         return self._ask_use_case
 
+    @property
+    def replay_use_case(self):
+        """Use case de replay de tráfego (as perguntas reproduzidas não são gravadas)"""
+        return ReplayTrafficUseCase(
+            ask_use_case=AskQuestionUseCase(
+                vector_store_repository=self.vector_store_repository,
+                ai_repository=self.ai_repository,
+                metrics=self.metrics_collector,
+                fast_mode=self.settings.fast_mode,
+                router=self.answer_router,
+                answer_cache=self.answer_cache_repository,
+                hedging=self.hedged_caller,
+                deadline_ms=self.settings.deadline_ms,
+                top_k=self.settings.top_k_results,
+                single_flight=SingleFlight() if self.settings.coalesce_questions else None,
+                generation_source=self.generation_source
+            ),
+            query_log_factory=JsonlQueryLogRepository
+        )
+
+    @property
+    def warm_cache_use_case(self):
+        """Use case de aquecimento do cache (None sem cache ou log de perguntas)"""
+        if self.answer_cache_repository is None or not self.settings.query_log_path:
+            return None
+
+        return WarmAnswerCacheUseCase(
+            query_log=self.query_log_repository,
+            answer_cache=self.answer_cache_repository,
+            ai_repository=self.ai_repository,
+            # Sem cache nem log: as respostas vêm do modelo e não contam como tráfego
+            ask_use_case=AskQuestionUseCase(
+                vector_store_repository=self.vector_store_repository,
+                ai_repository=self.ai_repository,
+                metrics=self.metrics_collector,
+                router=self.answer_router
+            )
+        )
+
+    @property
+    def watch_use_case(self):
+        """Use case de ingestão contínua da pasta de documentos"""
+        return WatchDocumentsUseCase(
+            process_use_case=self.process_documents_use_case,
+            document_repository=self.document_repository,
+            vector_store_repository=self.vector_store_repository,
+            watcher_factory=partial(
+                create_folder_watcher,
+                poll_interval=self.settings.watch_poll_interval,
+                backend=self.settings.watch_backend
+            ),
+            answer_cache=self.answer_cache_repository
+        )
+
+    @property
+    def calibrate_pdf_use_case(self):
+        """Use case de calibração dos backends de PDF instalados"""
+        return CalibratePDFBackendsUseCase(
+            backends=available_pdf_backends(),
+            calibration_repository=self.pdf_calibration_repository
+        )
+
+    @property
+    def tune_retrieval_use_case(self):
+        """Use case de ajuste de chunking e top_k (grava no .env)"""
+        return TuneRetrievalUseCase(
+            pdf_extractor=self.pdf_extractor,
+            ai_repository=self.ai_repository,
+            chunker_factory=TextChunker,
+            embedding_cache=SQLiteEmbeddingCacheRepository(
+                db_path=self.settings.embedding_cache_path
+            ) if self.settings.embedding_cache_path else None,
+            settings_repository=EnvFileSettingsRepository(file_path=self.settings.env_file_path)
+        )
+
+    @property
+    def manage_index_use_case(self):
+        """Use case de manutenção do índice vetorial"""
+        if self._manage_index_use_case is None:
+            self._manage_index_use_case = ManageIndexUseCase(
+                vector_store_repository=self.vector_store_repository,
+                snapshot_repository=self.snapshot_repository
+            )
+        return self._manage_index_use_case
+
     # ==========================================
     # Camada Presentation (UI)
     # ==========================================
@@ -103,7 +512,33 @@ class DIContainer:
         return MainCLI(
             process_use_case=self.process_documents_use_case,
             ask_use_case=self.ask_question_use_case,
-            docs_folder=self.settings.docs_folder
+            docs_folder=self.settings.docs_folder,
+            index_use_case=self.manage_index_use_case,
+            benchmark_use_case=BenchmarkDimensionsUseCase(
+                vector_store_repository=self.vector_store_repository
+            ),
+            warm_cache_use_case=self.warm_cache_use_case,
+            replay_use_case=self.replay_use_case,
+            calibrate_pdf_use_case=self.calibrate_pdf_use_case,
+            tune_retrieval_use_case=self.tune_retrieval_use_case,
+            chunk_size=self.settings.chunk_size,
+            chunk_overlap=self.settings.chunk_overlap,
+            watch_use_case=self.watch_use_case,
+            watch_input=WatchInputDTO(
+                folder=self.settings.docs_folder,
+                debounce_s=self.settings.watch_debounce_s,
+                max_workers=self.settings.watch_workers,
+                chunk_size=self.settings.chunk_size,
+                chunk_overlap=self.settings.chunk_overlap
+            ),
+            server_factory=self.create_prefork_server,
+            index_generations_path=self.settings.index_generations_path,
+            publish_index_on_ingest=self.settings.publish_index_on_ingest,
+            warm_cache_input=WarmCacheInputDTO(
+                max_clusters=self.settings.warm_cache_clusters,
+                min_count=self.settings.warm_cache_min_count,
+                similarity=self.settings.warm_cache_similarity
+            )
         )
 
     def create_streamlit_app(self) -> StreamlitApp:
@@ -111,7 +546,55 @@ class DIContainer:
         return StreamlitApp(
             process_use_case=self.process_documents_use_case,
             ask_use_case=self.ask_question_use_case,
-            docs_folder=self.settings.docs_folder
+            docs_folder=self.settings.docs_folder,
+            chunk_size=self.settings.chunk_size,
+            chunk_overlap=self.settings.chunk_overlap,
+            history_max_messages=self.settings.chat_history_max_messages,
+            history_window=self.settings.chat_history_window
+        )
+
+    def create_prefork_server(
+        self,
+        host: Optional[str] = None,
+        port: Optional[int] = None,
+        workers: Optional[int] = None
+    ) -> PreforkServer:
+        """
+        Cria o servidor HTTP multi-worker sobre as gerações publicadas
+
+        Cada worker monta o próprio container depois do fork (conexões e
+        clientes não são compartilhados entre processos).
+        """
+        worker_settings = replace(
+            self.settings,
+            vector_store_backend='snapshot',
+            snapshot_path=self.settings.index_generations_path
+        )
+
+        def create_worker(generation_source: Callable[[], int], slot: int) -> AskQuestionUseCase:
+            return DIContainer(
+                settings=worker_settings,
+                generation_source=generation_source,
+                worker_slot=slot
+            ).ask_question_use_case
+
+        generations_root = self.settings.index_generations_path
+
+        def warm_generation(generation: int) -> None:
+            # Verifica os hashes e traz os vetores para o page cache compartilhado
+            snapshot = IndexSnapshot(generation_path(generations_root, generation), verify=True)
+            try:
+                snapshot.warm()
+            finally:
+                snapshot.close()
+
+        return PreforkServer(
+            worker_factory=create_worker,
+            generation_reader=partial(current_generation, generations_root),
+            generation_warmer=warm_generation,
+            host=host or self.settings.serve_host,
+            port=port or self.settings.serve_port,
+            workers=workers or self.settings.serve_workers
         )
 
     # ==========================================
@@ -2,11 +2,13 @@
 from .document import Document, DocumentChunk
 from .question import Question
 from .answer import Answer, ConfidenceLevel
+from .search_filter import SearchFilter
 
 __all__ = [
     'Document',
     'DocumentChunk',
     'Question',
     'Answer',
-    'ConfidenceLevel'
+    'ConfidenceLevel',
+    'SearchFilter'
 ]
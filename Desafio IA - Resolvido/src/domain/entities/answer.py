@@ -23,6 +23,7 @@ class Answer:
     reasoning: str
     citation: Optional[str]
     created_at: datetime
+    metadata: Optional[dict] = None
 
     def __post_init__(self):
         if not self.text:
@@ -31,7 +32,8 @@ class Answer:
         if not self.source:
             raise ValueError("Fonte não pode ser vazia")
 
-        if not self.reasoning:
+        # Modo rápido: o raciocínio fica vazio até ser pedido (explain)
+        if not self.reasoning and not (self.metadata or {}).get("fast"):
             raise ValueError("Raciocínio não pode ser vazio")
 
     @property
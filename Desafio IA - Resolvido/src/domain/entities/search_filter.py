@@ -0,0 +1,63 @@
+"""
+Value Object SearchFilter - Restrições aplicadas na busca vetorial
+"""
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional, Tuple
+
+
+@dataclass(frozen=True)
+class SearchFilter:
+    """
+    Filtros da busca vetorial
+
+    Os filtros são aplicados pelo banco vetorial (pushdown), antes do
+    ranqueamento, e não depois sobre o top-k.
+    """
+    sources: Optional[Tuple[str, ...]] = None
+    ingested_after: Optional[datetime] = None
+    ingested_before: Optional[datetime] = None
+    page_from: Optional[int] = None
+    page_to: Optional[int] = None
+    tenant_id: Optional[str] = None
+
+    def __post_init__(self):
+        if self.sources is not None:
+            # Aceita lista, mas armazena tupla (mantém o filtro hashable)
+            object.__setattr__(self, "sources", tuple(self.sources))
+
+        if (
+            self.page_from is not None and
+            self.page_to is not None and
+            self.page_from > self.page_to
+        ):
+            raise ValueError("page_from não pode ser maior que page_to")
+
+        if (
+            self.ingested_after is not None and
+            self.ingested_before is not None and
+            self.ingested_after > self.ingested_before
+        ):
+            raise ValueError("ingested_after não pode ser posterior a ingested_before")
+
+    @property
+    def is_empty(self) -> bool:
+        """Verifica se nenhum filtro de metadados foi definido"""
+        return (
+            not self.sources and
+            self.ingested_after is None and
+            self.ingested_before is None and
+            self.page_from is None and
+            self.page_to is None
+        )
+
+    def with_tenant(self, tenant_id: Optional[str]) -> "SearchFilter":
+        """Retorna cópia do filtro com o tenant informado"""
+        return SearchFilter(
+            sources=self.sources,
+            ingested_after=self.ingested_after,
+            ingested_before=self.ingested_before,
+            page_from=self.page_from,
+            page_to=self.page_to,
+            tenant_id=tenant_id
+        )
@@ -2,9 +2,28 @@
 from .document_repository import IDocumentRepository
 from .vector_store_repository import IVectorStoreRepository
 from .ai_repository import IAIRepository
+from .metrics_exporter import IMetricsExporter
+from .index_snapshot_repository import IIndexSnapshotRepository
+from .routing_log_repository import IRoutingLogRepository
+from .answer_cache_repository import IAnswerCacheRepository
+from .query_log_repository import IQueryLogRepository
+from .pdf_backend import IPDFBackend, IPDFCalibrationRepository
+from .folder_watcher import IFolderWatcher
+from .embedding_cache_repository import IEmbeddingCacheRepository
+from .settings_repository import ISettingsRepository
 
 __all__ = [
     'IDocumentRepository',
     'IVectorStoreRepository',
-    'IAIRepository'
+    'IAIRepository',
+    'IMetricsExporter',
+    'IIndexSnapshotRepository',
+    'IRoutingLogRepository',
+    'IAnswerCacheRepository',
+    'IQueryLogRepository',
+    'IPDFBackend',
+    'IPDFCalibrationRepository',
+    'IFolderWatcher',
+    'IEmbeddingCacheRepository',
+    'ISettingsRepository'
 ]
@@ -2,18 +2,31 @@
 Interface do repositório de IA
 """
 from abc import ABC, abstractmethod
-from typing import List, Dict
+from typing import List, Dict, Optional
 from src.domain.entities import Answer, Question
 
 
 class IAIRepository(ABC):
     """Interface para serviço de IA (Gemini, GPT, etc)"""
 
+    @property
+    def embedding_model_id(self) -> str:
+        """
+        Identidade do modelo de embeddings (gravada no índice vetorial)
+
+        Vetores de modelos diferentes não são comparáveis; o índice recusa
+        consultas e gravações com outra identidade.
+        """
+        return type(self).__name__
+
     @abstractmethod
     def generate_answer(
         self,
         question: Question,
-        context_chunks: List[Dict]
+        context_chunks: List[Dict],
+        fast: bool = False,
+        light: bool = False,
+        timeout: Optional[float] = None
     ) -> Answer:
         """
         Gera resposta baseada na pergunta e contexto
@@ -21,12 +34,34 @@ class IAIRepository(ABC):
         Args:
             question: Pergunta do usuário
             context_chunks: Chunks relevantes do contexto
+            fast: Modo rápido (sem raciocínio, saída curta)
+            light: Usa o modelo leve (perguntas fáceis)
+            timeout: Tempo máximo da chamada em segundos (None = sem limite)
 
         Returns:
             Resposta estruturada
         """
         pass
 
+    def generate_reasoning(
+        self,
+        question: Question,
+        context_chunks: List[Dict],
+        answer_text: str
+    ) -> str:
+        """
+        Gera o raciocínio de uma resposta já produzida (sob demanda)
+
+        Args:
+            question: Pergunta do usuário
+            context_chunks: Chunks usados na resposta
+            answer_text: Resposta dada
+
+        Returns:
+            Explicação passo a passo (vazio se não suportado)
+        """
+        return ""
+
     @abstractmethod
     def generate_embeddings(self, text: str) -> List[float]:
         """
@@ -39,3 +74,17 @@ class IAIRepository(ABC):
             Lista de floats representando o vetor
         """
         pass
+
+    def generate_embeddings_batch(self, texts: List[str]) -> List[List[float]]:
+        """
+        Gera embeddings de vários textos
+
+        Implementações podem sobrescrever para usar uma única chamada em lote.
+
+        Args:
+            texts: Textos para gerar embeddings
+
+        Returns:
+            Lista de vetores, na mesma ordem dos textos
+        """
+        return [self.generate_embeddings(text) for text in texts]
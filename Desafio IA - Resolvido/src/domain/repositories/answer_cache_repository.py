@@ -0,0 +1,42 @@
+"""
+Interface do cache de respostas
+"""
+from abc import ABC, abstractmethod
+from typing import Dict, Optional
+
+
+class IAnswerCacheRepository(ABC):
+    """Interface para o cache de respostas pré-calculadas"""
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Dict]:
+        """
+        Busca uma resposta
+
+        Args:
+            key: Chave da pergunta normalizada
+
+        Returns:
+            Resposta armazenada ou None
+        """
+        pass
+
+    @abstractmethod
+    def replace_all(self, entries: Dict[str, Dict]) -> None:
+        """
+        Substitui todo o conteúdo do cache (troca atômica)
+
+        Args:
+            entries: Respostas por chave
+        """
+        pass
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove todas as respostas (índice mudou)"""
+        pass
+
+    @abstractmethod
+    def count(self) -> int:
+        """Quantidade de respostas armazenadas"""
+        pass
@@ -0,0 +1,35 @@
+"""
+Interface do cache de embeddings
+"""
+from abc import ABC, abstractmethod
+from typing import List, Optional
+
+
+class IEmbeddingCacheRepository(ABC):
+    """Interface para o cache de embeddings por (modelo, texto)"""
+
+    @abstractmethod
+    def get_many(self, model_id: str, texts: List[str]) -> List[Optional[List[float]]]:
+        """
+        Busca os embeddings de vários textos
+
+        Args:
+            model_id: Identificador do modelo de embedding
+            texts: Textos buscados
+
+        Returns:
+            Um embedding por texto (None quando ausente)
+        """
+        pass
+
+    @abstractmethod
+    def put_many(self, model_id: str, texts: List[str], embeddings: List[List[float]]) -> None:
+        """
+        Armazena os embeddings de vários textos
+
+        Args:
+            model_id: Identificador do modelo de embedding
+            texts: Textos
+            embeddings: Embedding de cada texto (mesma ordem)
+        """
+        pass
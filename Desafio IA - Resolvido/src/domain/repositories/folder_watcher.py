@@ -0,0 +1,27 @@
+"""
+Interface de observação de pastas
+"""
+from abc import ABC, abstractmethod
+from typing import List, Tuple
+
+
+class IFolderWatcher(ABC):
+    """Interface para receber as mudanças de arquivos de uma pasta"""
+
+    @abstractmethod
+    def poll(self, timeout: float) -> List[Tuple[str, str]]:
+        """
+        Aguarda mudanças
+
+        Args:
+            timeout: Espera máxima em segundos
+
+        Returns:
+            Eventos (tipo, caminho), tipo em "created", "modified" ou "deleted";
+            lista vazia se nada mudou no período
+        """
+        pass
+
+    def close(self) -> None:
+        """Libera os recursos do observador"""
+        pass
@@ -0,0 +1,52 @@
+"""
+Interface do repositório de snapshots do índice vetorial
+"""
+from abc import ABC, abstractmethod
+from typing import Iterable, Iterator, List, Tuple
+from src.domain.entities import DocumentChunk
+
+
+class IIndexSnapshotRepository(ABC):
+    """Interface para snapshots portáteis do índice (exportação/importação)"""
+
+    @abstractmethod
+    def write(self, path: str, chunks: Iterable[DocumentChunk]) -> int:
+        """
+        Grava um snapshot
+
+        Args:
+            path: Pasta de destino
+            chunks: Chunks com embedding em metadata["embedding"], agrupados por fonte
+
+        Returns:
+            Quantidade de chunks gravados
+        """
+        pass
+
+    @abstractmethod
+    def read(self, path: str) -> Iterator[List[DocumentChunk]]:
+        """
+        Lê um snapshot, uma fonte por vez
+
+        Args:
+            path: Pasta do snapshot
+
+        Yields:
+            Todos os chunks de uma fonte (com embeddings)
+        """
+        pass
+
+    def publish(self, root: str, chunks: Iterable[DocumentChunk]) -> Tuple[int, int]:
+        """
+        Grava o snapshot como nova geração e a torna a atual (atômico)
+
+        Args:
+            root: Pasta das gerações
+            chunks: Chunks com embedding em metadata["embedding"], agrupados por fonte
+
+        Returns:
+            (geração publicada, quantidade de chunks gravados)
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} não suporta gerações de snapshot"
+        )
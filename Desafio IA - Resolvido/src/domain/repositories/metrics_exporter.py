@@ -0,0 +1,20 @@
+"""
+Interface do exportador de métricas
+"""
+from abc import ABC, abstractmethod
+from typing import Dict
+
+
+class IMetricsExporter(ABC):
+    """Interface para exportadores de métricas (Prometheus, logs JSON, etc)"""
+
+    @abstractmethod
+    def export(self, event: Dict, snapshot: Dict) -> None:
+        """
+        Exporta as métricas de uma requisição concluída
+
+        Args:
+            event: Métricas da requisição ({operation, success, timings, counters})
+            snapshot: Agregado atual ({histograms, counters})
+        """
+        pass
@@ -0,0 +1,53 @@
+"""
+Interfaces dos backends de extração de PDF e da calibração
+"""
+from abc import ABC, abstractmethod
+from typing import Dict, Optional
+
+
+class IPDFBackend(ABC):
+    """Interface para bibliotecas de extração de texto de PDFs"""
+
+    @property
+    @abstractmethod
+    def name(self) -> str:
+        """Nome do backend (valor de PDF_BACKEND)"""
+        pass
+
+    @property
+    def version(self) -> str:
+        """Versão da biblioteca (entra na chave do cache de extração)"""
+        return ""
+
+    @abstractmethod
+    def extract(self, pdf_path: str) -> Dict:
+        """
+        Extrai texto e metadados
+
+        Args:
+            pdf_path: Caminho para o arquivo PDF
+
+        Returns:
+            {"pages": [(número da página começando em 1, texto), ...] apenas
+            páginas com texto, "metadata": {"title", "author", "pages", "creator"}}
+        """
+        pass
+
+
+class IPDFCalibrationRepository(ABC):
+    """Interface para persistir o resultado da calibração dos backends"""
+
+    @abstractmethod
+    def save(self, calibration: Dict) -> None:
+        """
+        Grava a calibração
+
+        Args:
+            calibration: Backend escolhido e medições de cada backend
+        """
+        pass
+
+    @abstractmethod
+    def load(self) -> Optional[Dict]:
+        """Última calibração gravada (None se não houver)"""
+        pass
@@ -0,0 +1,29 @@
+"""
+Interface do log de perguntas
+"""
+from abc import ABC, abstractmethod
+from typing import Dict, Iterator
+
+
+class IQueryLogRepository(ABC):
+    """Interface para registrar as perguntas recebidas (aquecimento do cache e replay de carga)"""
+
+    @abstractmethod
+    def record(self, entry: Dict) -> None:
+        """
+        Registra uma pergunta
+
+        Args:
+            entry: Pergunta, usuário e parâmetros da busca
+        """
+        pass
+
+    @abstractmethod
+    def read(self) -> Iterator[Dict]:
+        """
+        Lê as perguntas registradas, da mais antiga para a mais recente
+
+        Returns:
+            Iterador de registros ({timestamp, question, user_id, top_k, timings_ms, ...})
+        """
+        pass
@@ -0,0 +1,19 @@
+"""
+Interface do log de decisões de roteamento
+"""
+from abc import ABC, abstractmethod
+from typing import Dict
+
+
+class IRoutingLogRepository(ABC):
+    """Interface para registrar decisões de roteamento (calibração dos limiares)"""
+
+    @abstractmethod
+    def record(self, decision: Dict) -> None:
+        """
+        Registra uma decisão
+
+        Args:
+            decision: Pergunta, rota, distâncias e confiança da resposta
+        """
+        pass
@@ -0,0 +1,19 @@
+"""
+Interface de gravação das configurações
+"""
+from abc import ABC, abstractmethod
+from typing import Dict
+
+
+class ISettingsRepository(ABC):
+    """Interface para gravar configurações ajustadas (lidas no próximo início)"""
+
+    @abstractmethod
+    def update(self, values: Dict[str, str]) -> None:
+        """
+        Grava as variáveis informadas, mantendo as demais
+
+        Args:
+            values: Valores por nome de variável de ambiente
+        """
+        pass
@@ -2,8 +2,8 @@
 Interface do repositório vetorial
 """
 from abc import ABC, abstractmethod
-from typing import List, Dict
-from src.domain.entities import DocumentChunk
+from typing import List, Dict, Optional
+from src.domain.entities import DocumentChunk, SearchFilter
 
 
 class IVectorStoreRepository(ABC):
@@ -18,7 +18,9 @@ class IVectorStoreRepository(ABC):
     def search_similar(
         self,
         query: str,
-        top_k: int = 5
+        top_k: int = 5,
+        query_embedding: Optional[List[float]] = None,
+        search_filter: Optional[SearchFilter] = None
     ) -> List[Dict]:
         """
         Busca chunks similares à query
@@ -26,9 +28,65 @@ class IVectorStoreRepository(ABC):
         Args:
             query: Texto de busca
             top_k: Número de resultados
+            query_embedding: Embedding da query (se já calculado)
+            search_filter: Filtros de metadados aplicados na busca
 
         Returns:
-            Lista de dicionários com {text, source, distance}
+            Lista de dicionários com {id, text, source, distance}
+        """
+        pass
+
+    def search_similar_batch(
+        self,
+        query_embeddings: List[List[float]],
+        top_k: int = 5,
+        search_filter: Optional[SearchFilter] = None
+    ) -> List[List[Dict]]:
+        """
+        Busca chunks similares para várias queries
+
+        Implementações podem sobrescrever para consultar todas de uma vez.
+
+        Args:
+            query_embeddings: Embeddings das queries
+            top_k: Número de resultados por query
+            search_filter: Filtros de metadados aplicados a todas as queries
+
+        Returns:
+            Uma lista de resultados ({id, text, source, distance}) por query
+        """
+        return [
+            self.search_similar(
+                query="",
+                top_k=top_k,
+                query_embedding=embedding,
+                search_filter=search_filter
+            )
+            for embedding in query_embeddings
+        ]
+
+    @abstractmethod
+    def list_sources(self) -> List[str]:
+        """
+        Lista as fontes (arquivos) presentes no índice
+
+        Returns:
+            Nomes das fontes
+        """
+        pass
+
+    @abstractmethod
+    def get_chunks_by_source(self, source: str) -> List[DocumentChunk]:
+        """
+        Retorna os chunks de uma fonte com seus embeddings
+
+        Usado para mover documentos entre índices sem reprocessar.
+
+        Args:
+            source: Nome da fonte
+
+        Returns:
+            Chunks com o embedding em metadata["embedding"]
         """
         pass
 
@@ -46,3 +104,27 @@ class IVectorStoreRepository(ABC):
     def clear(self) -> None:
         """Limpa todo o banco vetorial"""
         pass
+
+    @abstractmethod
+    def rebuild(self) -> int:
+        """
+        Reconstrói/compacta o índice com a configuração atual
+
+        Implementações que não suportam a operação levantam NotImplementedError.
+
+        Returns:
+            Quantidade de chunks no índice reconstruído
+        """
+        pass
+
+    @abstractmethod
+    def rebalance(self) -> int:
+        """
+        Redistribui os chunks entre partições após mudança de topologia
+
+        Implementações que não suportam a operação levantam NotImplementedError.
+
+        Returns:
+            Quantidade de fontes movidas
+        """
+        pass
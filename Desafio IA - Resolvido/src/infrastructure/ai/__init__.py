@@ -1,4 +1,5 @@
 """AI Implementations"""
 from .gemini_ai_repository import GeminiAIRepository
+from .local_embedding_repository import LocalEmbeddingAIRepository
 
-__all__ = ['GeminiAIRepository']
+__all__ = ['GeminiAIRepository', 'LocalEmbeddingAIRepository']
@@ -2,7 +2,8 @@
 Implementação do repositório de IA com Gemini 2.5 Flash
 """
 import json
-from typing import List, Dict
+import time
+from typing import List, Dict, Optional
 import google.generativeai as genai
 from langchain_google_genai import GoogleGenerativeAIEmbeddings
 
@@ -14,45 +15,107 @@ from datetime import datetime
 class GeminiAIRepository(IAIRepository):
     """Implementação concreta usando Gemini 2.5 Flash"""
 
-    def __init__(self, api_key: str):
+    EMBEDDING_MODEL = "models/text-embedding-004"
+
+    # Esquema estrito do modo rápido (sem raciocínio)
+    FAST_RESPONSE_SCHEMA = {
+        "type": "object",
+        "properties": {
+            "resposta": {"type": "string"},
+            "fonte": {"type": "string"},
+            "confianca": {"type": "string", "enum": ["alta", "media", "baixa"]},
+            "citacao": {"type": "string"}
+        },
+        "required": ["resposta", "fonte", "confianca", "citacao"]
+    }
+
+    MODEL_NAME = "gemini-2.5-flash"
+
+    def __init__(
+        self,
+        api_key: str,
+        fast_max_output_tokens: int = 256,
+        light_model_name: str = ""
+    ):
         """
         Inicializa Gemini
 
         Args:
             api_key: Chave da API do Google
+            fast_max_output_tokens: Limite de tokens de saída no modo rápido
+            light_model_name: Modelo das perguntas fáceis (vazio = modelo principal)
         """
         self.api_key = api_key
+        self.fast_max_output_tokens = fast_max_output_tokens
         genai.configure(api_key=api_key)
 
         # Modelo para geração de texto
         # Usando gemini-2.5-flash (mais recente, pode ter quota separada)
-        self.model = genai.GenerativeModel('gemini-2.5-flash')
+        self.model = genai.GenerativeModel(self.MODEL_NAME)
+
+        # Modelo leve (roteamento de perguntas com contexto muito próximo)
+        self.light_model = (
+            genai.GenerativeModel(light_model_name) if light_model_name else self.model
+        )
 
         # Modelo para embeddings
         # Usando text-embedding-004 que pode ter quota separada
         self.embeddings = GoogleGenerativeAIEmbeddings(
-            model="models/text-embedding-004",
+            model=self.EMBEDDING_MODEL,
             google_api_key=api_key
         )
 
+    @property
+    def embedding_model_id(self) -> str:
+        return f"gemini:{self.EMBEDDING_MODEL}"
+
     def generate_answer(
         self,
         question: Question,
-        context_chunks: List[Dict]
+        context_chunks: List[Dict],
+        fast: bool = False,
+        light: bool = False,
+        timeout: Optional[float] = None
     ) -> Answer:
-        """Gera resposta usando Gemini"""
+        """Gera resposta usando Gemini (modo rápido: sem raciocínio, JSON estrito)"""
+        # Tempos por etapa (segundos), repassados ao use case via metadata
+        timings: Dict[str, float] = {}
+        usage: Dict[str, int] = {}
+
         try:
-            # Cria prompt com Chain of Thought
-            prompt = self._create_chain_of_thought_prompt(
-                question.text,
-                context_chunks
-            )
+            # Cria prompt (Chain of Thought ou compacto)
+            start = time.perf_counter()
+            if fast:
+                prompt = self._create_fast_prompt(question.text, context_chunks)
+                generation_config = genai.GenerationConfig(
+                    response_mime_type="application/json",
+                    response_schema=self.FAST_RESPONSE_SCHEMA,
+                    max_output_tokens=self.fast_max_output_tokens,
+                    temperature=0
+                )
+            else:
+                prompt = self._create_chain_of_thought_prompt(
+                    question.text,
+                    context_chunks
+                )
+                generation_config = None
+            timings["prompt_build"] = time.perf_counter() - start
 
-            # Chama Gemini
-            response = self.model.generate_content(prompt)
+            # Chama Gemini (modelo leve ou principal)
+            start = time.perf_counter()
+            model = self.light_model if light else self.model
+            response = model.generate_content(
+                prompt,
+                generation_config=generation_config,
+                # Prazo da requisição: a chamada HTTP é abortada no cliente
+                request_options={"timeout": timeout} if timeout is not None else None
+            )
             response_text = response.text.strip()
+            timings["generation"] = time.perf_counter() - start
+            usage = self._extract_usage(response)
 
             # Remove marcadores de código markdown se presentes
+            start = time.perf_counter()
             if response_text.startswith('```'):
                 lines = response_text.split('\n')
                 response_text = '\n'.join(lines[1:-1])
@@ -61,6 +124,7 @@ class GeminiAIRepository(IAIRepository):
 
             # Parse JSON
             result = json.loads(response_text)
+            timings["json_parse"] = time.perf_counter() - start
 
             # Converte para entidade Answer
             confidence_map = {
@@ -78,7 +142,9 @@ class GeminiAIRepository(IAIRepository):
                 ),
                 reasoning=result.get("raciocinio", ""),
                 citation=result.get("citacao"),
-                created_at=datetime.now()
+                created_at=datetime.now(),
+                # "fast": raciocínio vazio, gerado depois por generate_reasoning
+                metadata={"timings": timings, "usage": usage, "fast": fast}
             )
 
         except json.JSONDecodeError as e:
@@ -89,7 +155,8 @@ class GeminiAIRepository(IAIRepository):
                 confidence=ConfidenceLevel.BAIXA,
                 reasoning="Erro no parse do JSON",
                 citation=None,
-                created_at=datetime.now()
+                created_at=datetime.now(),
+                metadata={"timings": timings, "usage": usage, "error": "json_parse"}
             )
         except Exception as e:
             return Answer(
@@ -98,9 +165,32 @@ class GeminiAIRepository(IAIRepository):
                 confidence=ConfidenceLevel.BAIXA,
                 reasoning="Erro na comunicação com IA",
                 citation=None,
-                created_at=datetime.now()
+                created_at=datetime.now(),
+                metadata={"timings": timings, "usage": usage, "error": "generation"}
             )
 
+    def generate_reasoning(
+        self,
+        question: Question,
+        context_chunks: List[Dict],
+        answer_text: str
+    ) -> str:
+        """Explica, passo a passo, como os documentos levam à resposta dada"""
+        context_text = self._format_context(context_chunks)
+        prompt = f"""Com base APENAS nos documentos abaixo, explique passo a passo o raciocínio que leva à resposta dada. Responda em texto simples, sem JSON.
+
+DOCUMENTOS:
+{context_text}
+
+PERGUNTA: {question.text}
+
+RESPOSTA DADA: {answer_text}
+"""
+        try:
+            return self.model.generate_content(prompt).text.strip()
+        except Exception as e:
+            raise Exception(f"Falha ao gerar raciocínio: {str(e)}")
+
     def generate_embeddings(self, text: str) -> List[float]:
         """Gera embeddings usando Gemini"""
         try:
@@ -112,6 +202,57 @@ class GeminiAIRepository(IAIRepository):
             # em vez de criar embeddings inválidos
             raise Exception(f"Falha ao gerar embeddings: {str(e)}")
 
+    def generate_embeddings_batch(self, texts: List[str]) -> List[List[float]]:
+        """Gera embeddings de vários textos em lote (mesmo task type do embed_query)"""
+        if not texts:
+            return []
+
+        try:
+            return self.embeddings.embed_documents(
+                texts,
+                task_type="retrieval_query"
+            )
+        except Exception as e:
+            print(f"Erro ao gerar embeddings em lote: {str(e)}")
+            raise Exception(f"Falha ao gerar embeddings: {str(e)}")
+
+    @staticmethod
+    def _extract_usage(response) -> Dict[str, int]:
+        """Extrai contagem de tokens da resposta do Gemini (se disponível)"""
+        usage_metadata = getattr(response, "usage_metadata", None)
+        if usage_metadata is None:
+            return {}
+
+        return {
+            "prompt_tokens": getattr(usage_metadata, "prompt_token_count", 0) or 0,
+            "output_tokens": getattr(usage_metadata, "candidates_token_count", 0) or 0,
+            "total_tokens": getattr(usage_metadata, "total_token_count", 0) or 0
+        }
+
+    @staticmethod
+    def _format_context(context_chunks: List[Dict]) -> str:
+        """Formata os chunks como contexto do prompt"""
+        return "\n\n".join([
+            f"[Documento: {chunk['source']}]\n{chunk['text']}"
+            for chunk in context_chunks
+        ])
+
+    def _create_fast_prompt(
+        self,
+        question: str,
+        context_chunks: List[Dict]
+    ) -> str:
+        """Prompt compacto do modo rápido (o formato vem do response_schema)"""
+        return f"""Responda APENAS com base nos documentos. Seja breve. Se a informação não estiver nos documentos, responda "Não foi possível encontrar essa informação nos documentos fornecidos." com fonte "N/A", confianca "baixa" e citacao "N/A".
+
+DOCUMENTOS:
+{self._format_context(context_chunks)}
+
+PERGUNTA: {question}
+
+Campos: resposta (direta), fonte (arquivo PDF), confianca (alta, media ou baixa), citacao (trecho curto do documento).
+"""
+
     def _create_chain_of_thought_prompt(
         self,
         question: str,
@@ -120,10 +261,7 @@ class GeminiAIRepository(IAIRepository):
         """Cria prompt com Chain of Thought"""
 
         # Formata contexto
-        context_text = "\n\n".join([
-            f"[Documento: {chunk['source']}]\n{chunk['text']}"
-            for chunk in context_chunks
-        ])
+        context_text = self._format_context(context_chunks)
 
         prompt = f"""Você é um assistente especializado em responder perguntas com base em documentos fornecidos.
 
@@ -0,0 +1,132 @@
+"""
+Embeddings locais em CPU (sem chamadas de rede)
+"""
+import re
+import unicodedata
+import zlib
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from src.domain.repositories import IAIRepository
+from src.domain.entities import Answer, Question
+
+
+_TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+
+@lru_cache(maxsize=200_000)
+def _hash_feature(feature: str) -> int:
+    """Hash estável entre processos (hash() do Python é aleatorizado)"""
+    return zlib.crc32(feature.encode("utf-8"))
+
+
+class LocalEmbeddingAIRepository(IAIRepository):
+    """
+    Embeddings por feature hashing (palavras + trigramas de caracteres)
+
+    Não precisa de treino nem de arquivos de modelo: cada termo é mapeado
+    para uma dimensão e um sinal por hash, com TF sublinear e normalização
+    L2 (equivalente a um HashingVectorizer). Os trigramas tornam a busca
+    tolerante a flexões e acentuação. A geração de respostas é delegada ao
+    repositório informado.
+    """
+
+    VERSION = 1
+
+    def __init__(
+        self,
+        answer_repository: IAIRepository,
+        dimension: int = 768,
+        char_ngram: int = 3
+    ):
+        """
+        Inicializa o modelo local
+
+        Args:
+            answer_repository: Repositório usado em generate_answer
+            dimension: Dimensão dos vetores
+            char_ngram: Tamanho dos n-gramas de caracteres (0 desativa)
+        """
+        self.answer_repository = answer_repository
+        self.dimension = dimension
+        self.char_ngram = char_ngram
+
+    @property
+    def embedding_model_id(self) -> str:
+        return f"local-hashing-v{self.VERSION}:dim={self.dimension}:char={self.char_ngram}"
+
+    def generate_answer(
+        self,
+        question: Question,
+        context_chunks: List[Dict],
+        fast: bool = False,
+        light: bool = False,
+        timeout: Optional[float] = None
+    ) -> Answer:
+        """Delega a geração ao repositório de respostas"""
+        return self.answer_repository.generate_answer(
+            question, context_chunks, fast=fast, light=light, timeout=timeout
+        )
+
+    def generate_reasoning(
+        self,
+        question: Question,
+        context_chunks: List[Dict],
+        answer_text: str
+    ) -> str:
+        """Delega o raciocínio ao repositório de respostas"""
+        return self.answer_repository.generate_reasoning(question, context_chunks, answer_text)
+
+    def generate_embeddings(self, text: str) -> List[float]:
+        """Gera embedding de um texto"""
+        return self.generate_embeddings_batch([text])[0]
+
+    def generate_embeddings_batch(self, texts: List[str]) -> List[List[float]]:
+        """Gera embeddings em lote (uma matriz por chamada)"""
+        if not texts:
+            return []
+
+        rows: List[int] = []
+        buckets: List[int] = []
+        signs: List[float] = []
+
+        for row, text in enumerate(texts):
+            for bucket, sign in self._features(text):
+                rows.append(row)
+                buckets.append(bucket)
+                signs.append(sign)
+
+        matrix = np.zeros((len(texts), self.dimension), dtype=np.float32)
+        np.add.at(matrix, (np.asarray(rows, dtype=np.int64), np.asarray(buckets, dtype=np.int64)), signs)
+
+        # TF sublinear (preserva o sinal do hashing) + normalização L2
+        matrix = np.sign(matrix) * np.log1p(np.abs(matrix))
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        matrix /= np.maximum(norms, 1e-12)
+
+        return matrix.tolist()
+
+    def _features(self, text: str) -> List[Tuple[int, float]]:
+        """(dimensão, sinal) de cada termo e n-grama do texto"""
+        features = []
+        for token in _TOKEN_PATTERN.findall(self._normalize(text)):
+            features.append(self._bucket(f"w:{token}"))
+
+            if self.char_ngram and len(token) > self.char_ngram:
+                padded = f"<{token}>"
+                for i in range(len(padded) - self.char_ngram + 1):
+                    features.append(self._bucket(f"c:{padded[i:i + self.char_ngram]}"))
+        return features
+
+    def _bucket(self, feature: str) -> Tuple[int, float]:
+        value = _hash_feature(feature)
+        # Bit mais alto define o sinal (reduz colisões construtivas)
+        return value % self.dimension, 1.0 if value & 0x80000000 else -1.0
+
+    @staticmethod
+    def _normalize(text: str) -> str:
+        """Minúsculas e sem acentos"""
+        decomposed = unicodedata.normalize("NFKD", text.lower())
+        return "".join(char for char in decomposed if not unicodedata.combining(char))
@@ -1,4 +1,5 @@
 """Configuration"""
 from .settings import Settings
+from .env_file_settings import EnvFileSettingsRepository
 
-__all__ = ['Settings']
+__all__ = ['Settings', 'EnvFileSettingsRepository']
@@ -0,0 +1,53 @@
+"""
+Gravação de configurações no arquivo .env
+"""
+import os
+import re
+import tempfile
+from typing import Dict
+
+from src.domain.repositories import ISettingsRepository
+
+
+_ASSIGNMENT = re.compile(r"^\s*(?:export\s+)?([A-Za-z_][A-Za-z0-9_]*)\s*=")
+
+
+class EnvFileSettingsRepository(ISettingsRepository):
+    """
+    Atualiza variáveis no .env lido por Settings.from_env
+
+    Linhas existentes são substituídas no lugar (comentários e ordem são
+    mantidos); variáveis novas vão para o final. Variáveis definidas no
+    ambiente do processo continuam tendo precedência sobre o arquivo.
+    """
+
+    def __init__(self, file_path: str = ".env"):
+        """
+        Inicializa o repositório
+
+        Args:
+            file_path: Caminho do arquivo .env
+        """
+        self.file_path = file_path
+
+    def update(self, values: Dict[str, str]) -> None:
+        """Grava de forma atômica (o .env nunca fica pela metade)"""
+        try:
+            with open(self.file_path, encoding="utf-8") as f:
+                lines = f.read().splitlines()
+        except FileNotFoundError:
+            lines = []
+
+        pending = dict(values)
+        for i, line in enumerate(lines):
+            match = _ASSIGNMENT.match(line)
+            if match and match.group(1) in pending:
+                name = match.group(1)
+                lines[i] = f"{name}={pending.pop(name)}"
+        lines.extend(f"{name}={value}" for name, value in pending.items())
+
+        directory = os.path.dirname(os.path.abspath(self.file_path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+        os.replace(tmp_path, self.file_path)
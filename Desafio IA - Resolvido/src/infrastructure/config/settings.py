@@ -16,6 +16,34 @@ class Settings:
     # Paths
     docs_folder: str = "./dados"
     chroma_db_path: str = "./chroma_db"
+    extraction_cache_path: str = "./cache/extraction"  # vazio desativa o cache
+    embedding_cache_path: str = "./cache/embeddings.db"  # cache do ajuste de recuperação
+    env_file_path: str = ".env"  # onde --tune-retrieval grava a configuração escolhida
+    document_db_path: str = "./documents.db"  # vazio = repositório em memória
+
+    # Extração de PDFs
+    pdf_backend: str = "auto"  # auto (calibrado), pypdf, pdfminer ou pypdfium2
+    pdf_calibration_path: str = "./cache/pdf_backend.json"
+
+    # Observação da pasta de documentos (--watch)
+    watch_backend: str = "auto"  # auto (inotify quando disponível), inotify ou polling
+    watch_debounce_s: float = 2.0
+    watch_workers: int = 2
+    watch_poll_interval: float = 2.0
+
+    # Vector Index (ChromaDB / HNSW)
+    chroma_distance_space: str = "cosine"  # cosine, l2 ou ip
+    hnsw_construction_ef: int = 200
+    hnsw_search_ef: int = 100
+    hnsw_m: int = 16
+    chroma_batch_size: int = 0  # 0 = limite máximo do cliente
+    tenant_partitioning: bool = False  # uma coleção por user_id
+    vector_store_shards: int = 1  # > 1 ativa o repositório particionado
+    vector_store_shard_mode: str = "local"  # local (threads) ou process
+    vector_store_backend: str = "chroma"  # chroma, snapshot (somente leitura) ou fake
+    snapshot_path: str = "./snapshots/index"  # snapshot único ou pasta de gerações
+    index_generations_path: str = "./snapshots/generations"
+    publish_index_on_ingest: bool = False  # publica uma geração após cada --process
 
     # Processing
     chunk_size: int = 1000
@@ -25,14 +53,62 @@ class Settings:
     # AI Model
     model_name: str = "gemini-2.0-flash-exp"
     embedding_model: str = "models/embedding-001"
+    fast_mode: bool = False  # respostas sem raciocínio (gerado sob demanda)
+    fast_max_output_tokens: int = 256
+    embedding_backend: str = "gemini"  # gemini (API) ou local (CPU, sem rede)
+    ai_backend: str = "gemini"  # gemini ou fake (determinístico, latência simulada)
+    local_embedding_dimension: int = 768
+    embedding_dimension: int = 0  # dimensões indexadas (0 = vetor completo)
+    rerank_factor: int = 4  # candidatos por resultado no re-rank (<= 1 desativa)
+
+    # Roteamento (distâncias na métrica do índice; 0 desativa)
+    route_not_found_distance: float = 0.0  # acima: "não encontrado" sem chamar o modelo
+    route_light_distance: float = 0.0  # até: modelo leve
+    light_model_name: str = "gemini-2.5-flash-lite"
+    routing_log_path: str = ""  # vazio desativa o log (ex.: ./metrics/routing.jsonl)
+
+    # Cache de respostas (aquecido a partir do log de perguntas)
+    answer_cache_path: str = "./cache/answers.db"  # vazio desativa o cache
+    query_log_path: str = ""  # vazio desativa o log (ex.: ./metrics/queries.jsonl)
+    warm_cache_clusters: int = 50  # grupos de perguntas mais frequentes respondidos
+    warm_cache_min_count: int = 2
+    warm_cache_similarity: float = 0.92
+
+    # Prazo e hedge das perguntas
+    deadline_ms: float = 0.0  # prazo padrão por pergunta (0 = sem prazo)
+    hedge_percentile: float = 0.0  # ex.: 95 envia uma cópia após o p95 da etapa (0 desativa)
+    hedge_min_samples: int = 20  # amostras de latência antes do primeiro hedge
+    coalesce_questions: bool = True  # perguntas idênticas simultâneas compartilham a resposta
+
+    # Web (histórico do chat)
+    chat_history_max_messages: int = 200
+    chat_history_window: int = 6  # mensagens recentes exibidas por completo
+
+    # Backends fake (teste de carga; latências simuladas em ms)
+    fake_embedding_ms: float = 30.0
+    fake_generation_ms: float = 800.0
+    fake_light_generation_ms: float = 300.0
+    fake_search_ms: float = 5.0
+    fake_slow_ratio: float = 0.0  # fração de chamadas lentas (cauda de latência)
+
+    # Serviço HTTP multi-worker (--serve)
+    serve_host: str = "127.0.0.1"
+    serve_port: int = 8000
+    serve_workers: int = 4
+
+    # Metrics
+    metrics_exporters: str = ""  # lista separada por vírgula: prometheus,json
+    metrics_path: str = "./metrics"
+    metrics_export_interval_s: float = 1.0  # intervalo mínimo entre reescritas do .prom
 
     @classmethod
     def from_env(cls) -> "Settings":
         """Carrega configurações do arquivo .env"""
         load_dotenv()
 
-        google_api_key = os.getenv('GOOGLE_API_KEY')
-        if not google_api_key:
+        ai_backend = os.getenv('AI_BACKEND', 'gemini')
+        google_api_key = os.getenv('GOOGLE_API_KEY', '')
+        if not google_api_key and ai_backend != 'fake':
             raise ValueError(
                 "GOOGLE_API_KEY não encontrada. "
                 "Crie um arquivo .env baseado no .env.example"
@@ -42,7 +118,62 @@ class Settings:
             google_api_key=google_api_key,
             docs_folder=os.getenv('DOCS_FOLDER', './dados'),
             chroma_db_path=os.getenv('CHROMA_DB_PATH', './chroma_db'),
+            extraction_cache_path=os.getenv('EXTRACTION_CACHE_PATH', './cache/extraction'),
+            embedding_cache_path=os.getenv('EMBEDDING_CACHE_PATH', './cache/embeddings.db'),
+            env_file_path=os.getenv('ENV_FILE_PATH', '.env'),
+            document_db_path=os.getenv('DOCUMENT_DB_PATH', './documents.db'),
+            pdf_backend=os.getenv('PDF_BACKEND', 'auto'),
+            pdf_calibration_path=os.getenv('PDF_CALIBRATION_PATH', './cache/pdf_backend.json'),
+            watch_backend=os.getenv('WATCH_BACKEND', 'auto'),
+            watch_debounce_s=float(os.getenv('WATCH_DEBOUNCE_S', 2.0)),
+            watch_workers=int(os.getenv('WATCH_WORKERS', 2)),
+            watch_poll_interval=float(os.getenv('WATCH_POLL_INTERVAL', 2.0)),
+            chroma_distance_space=os.getenv('CHROMA_DISTANCE_SPACE', 'cosine'),
+            hnsw_construction_ef=int(os.getenv('HNSW_CONSTRUCTION_EF', 200)),
+            hnsw_search_ef=int(os.getenv('HNSW_SEARCH_EF', 100)),
+            hnsw_m=int(os.getenv('HNSW_M', 16)),
+            chroma_batch_size=int(os.getenv('CHROMA_BATCH_SIZE', 0)),
+            tenant_partitioning=os.getenv('TENANT_PARTITIONING', 'false').lower() == 'true',
+            vector_store_shards=int(os.getenv('VECTOR_STORE_SHARDS', 1)),
+            vector_store_shard_mode=os.getenv('VECTOR_STORE_SHARD_MODE', 'local'),
+            vector_store_backend=os.getenv('VECTOR_STORE_BACKEND', 'chroma'),
+            snapshot_path=os.getenv('SNAPSHOT_PATH', './snapshots/index'),
+            index_generations_path=os.getenv('INDEX_GENERATIONS_PATH', './snapshots/generations'),
+            publish_index_on_ingest=os.getenv('PUBLISH_INDEX_ON_INGEST', 'false').lower() == 'true',
             chunk_size=int(os.getenv('CHUNK_SIZE', 1000)),
             chunk_overlap=int(os.getenv('CHUNK_OVERLAP', 200)),
-            top_k_results=int(os.getenv('TOP_K_RESULTS', 5))
+            top_k_results=int(os.getenv('TOP_K_RESULTS', 5)),
+            fast_mode=os.getenv('FAST_MODE', 'false').lower() == 'true',
+            fast_max_output_tokens=int(os.getenv('FAST_MAX_OUTPUT_TOKENS', 256)),
+            embedding_backend=os.getenv('EMBEDDING_BACKEND', 'gemini'),
+            ai_backend=ai_backend,
+            local_embedding_dimension=int(os.getenv('LOCAL_EMBEDDING_DIMENSION', 768)),
+            embedding_dimension=int(os.getenv('EMBEDDING_DIMENSION', 0)),
+            rerank_factor=int(os.getenv('RERANK_FACTOR', 4)),
+            route_not_found_distance=float(os.getenv('ROUTE_NOT_FOUND_DISTANCE', 0)),
+            route_light_distance=float(os.getenv('ROUTE_LIGHT_DISTANCE', 0)),
+            light_model_name=os.getenv('LIGHT_MODEL_NAME', 'gemini-2.5-flash-lite'),
+            routing_log_path=os.getenv('ROUTING_LOG_PATH', ''),
+            answer_cache_path=os.getenv('ANSWER_CACHE_PATH', './cache/answers.db'),
+            query_log_path=os.getenv('QUERY_LOG_PATH', ''),
+            warm_cache_clusters=int(os.getenv('WARM_CACHE_CLUSTERS', 50)),
+            warm_cache_min_count=int(os.getenv('WARM_CACHE_MIN_COUNT', 2)),
+            warm_cache_similarity=float(os.getenv('WARM_CACHE_SIMILARITY', 0.92)),
+            deadline_ms=float(os.getenv('DEADLINE_MS', 0)),
+            hedge_percentile=float(os.getenv('HEDGE_PERCENTILE', 0)),
+            hedge_min_samples=int(os.getenv('HEDGE_MIN_SAMPLES', 20)),
+            coalesce_questions=os.getenv('COALESCE_QUESTIONS', 'true').lower() == 'true',
+            chat_history_max_messages=int(os.getenv('CHAT_HISTORY_MAX_MESSAGES', 200)),
+            chat_history_window=int(os.getenv('CHAT_HISTORY_WINDOW', 6)),
+            fake_embedding_ms=float(os.getenv('FAKE_EMBEDDING_MS', 30)),
+            fake_generation_ms=float(os.getenv('FAKE_GENERATION_MS', 800)),
+            fake_light_generation_ms=float(os.getenv('FAKE_LIGHT_GENERATION_MS', 300)),
+            fake_search_ms=float(os.getenv('FAKE_SEARCH_MS', 5)),
+            fake_slow_ratio=float(os.getenv('FAKE_SLOW_RATIO', 0)),
+            serve_host=os.getenv('SERVE_HOST', '127.0.0.1'),
+            serve_port=int(os.getenv('SERVE_PORT', 8000)),
+            serve_workers=int(os.getenv('SERVE_WORKERS', 4)),
+            metrics_exporters=os.getenv('METRICS_EXPORTERS', ''),
+            metrics_path=os.getenv('METRICS_PATH', './metrics'),
+            metrics_export_interval_s=float(os.getenv('METRICS_EXPORT_INTERVAL_S', 1.0))
         )
@@ -0,0 +1,8 @@
+"""Fake Implementations (testes de carga sem rede)"""
+from .fake_ai_repository import FakeAIRepository
+from .fake_vector_store import FakeVectorStoreRepository
+
+__all__ = [
+    'FakeAIRepository',
+    'FakeVectorStoreRepository'
+]
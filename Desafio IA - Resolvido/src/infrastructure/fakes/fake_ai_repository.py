@@ -0,0 +1,130 @@
+"""
+Repositório de IA determinístico com latência simulada
+"""
+import random
+import time
+import zlib
+from datetime import datetime
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from src.domain.repositories import IAIRepository
+from src.domain.entities import Answer, Question, ConfidenceLevel
+
+
+class FakeAIRepository(IAIRepository):
+    """
+    Substituto do Gemini para testes de carga
+
+    Embeddings e respostas dependem apenas do texto (mesma entrada, mesma
+    saída em qualquer processo) e cada chamada dorme a latência configurada,
+    com variação de ±20% também derivada do texto. Uma fração `slow_ratio`
+    das chamadas, sorteada a cada chamada, demora `slow_factor` vezes mais
+    (cauda de latência). Não faz chamadas de rede.
+    """
+
+    def __init__(
+        self,
+        dimension: int = 64,
+        embedding_ms: float = 30.0,
+        generation_ms: float = 800.0,
+        light_generation_ms: float = 300.0,
+        fast_generation_ms: float = 300.0,
+        slow_ratio: float = 0.0,
+        slow_factor: float = 10.0
+    ):
+        """
+        Inicializa o repositório
+
+        Args:
+            dimension: Dimensão dos embeddings
+            embedding_ms: Latência por chamada de embedding (lote = uma chamada)
+            generation_ms: Latência da geração completa
+            light_generation_ms: Latência do modelo leve
+            fast_generation_ms: Latência do modo rápido
+            slow_ratio: Fração das chamadas lentas (0 a 1)
+            slow_factor: Multiplicador da latência das chamadas lentas
+        """
+        self.dimension = dimension
+        self.embedding_ms = embedding_ms
+        self.generation_ms = generation_ms
+        self.light_generation_ms = light_generation_ms
+        self.fast_generation_ms = fast_generation_ms
+        self.slow_ratio = slow_ratio
+        self.slow_factor = slow_factor
+
+    @property
+    def embedding_model_id(self) -> str:
+        return f"fake:dim={self.dimension}"
+
+    def generate_answer(
+        self,
+        question: Question,
+        context_chunks: List[Dict],
+        fast: bool = False,
+        light: bool = False,
+        timeout: Optional[float] = None
+    ) -> Answer:
+        """Resposta montada a partir do primeiro chunk"""
+        if light:
+            latency_ms = self.light_generation_ms
+        elif fast:
+            latency_ms = self.fast_generation_ms
+        else:
+            latency_ms = self.generation_ms
+
+        start = time.perf_counter()
+        self._sleep(latency_ms, question.text)
+        generation = time.perf_counter() - start
+
+        best = context_chunks[0] if context_chunks else {"source": "N/A", "text": ""}
+        return Answer(
+            text=f"Resposta simulada para: {question.text}",
+            source=best["source"],
+            confidence=ConfidenceLevel.MEDIA,
+            reasoning="" if fast else "Raciocínio simulado",
+            citation=best["text"][:120] or None,
+            created_at=datetime.now(),
+            metadata={
+                "timings": {"generation": generation},
+                "usage": {"prompt_tokens": 0, "output_tokens": 0, "total_tokens": 0},
+                "fast": fast
+            }
+        )
+
+    def generate_reasoning(
+        self,
+        question: Question,
+        context_chunks: List[Dict],
+        answer_text: str
+    ) -> str:
+        self._sleep(self.generation_ms, question.text)
+        return "Raciocínio simulado"
+
+    def generate_embeddings(self, text: str) -> List[float]:
+        return self.generate_embeddings_batch([text])[0]
+
+    def generate_embeddings_batch(self, texts: List[str]) -> List[List[float]]:
+        """Vetores unitários pseudoaleatórios semeados pelo texto"""
+        if not texts:
+            return []
+
+        self._sleep(self.embedding_ms, texts[0])
+        vectors = []
+        for text in texts:
+            vector = np.random.default_rng(self._seed(text)).standard_normal(self.dimension)
+            vectors.append((vector / np.linalg.norm(vector)).tolist())
+        return vectors
+
+    def _sleep(self, latency_ms: float, text: str) -> None:
+        if latency_ms <= 0:
+            return
+        jitter = 0.8 + 0.4 * ((self._seed(text) >> 8) % 1000) / 1000
+        if self.slow_ratio and random.random() < self.slow_ratio:
+            jitter *= self.slow_factor
+        time.sleep(latency_ms * jitter / 1000)
+
+    @staticmethod
+    def _seed(text: str) -> int:
+        return zlib.crc32(text.encode("utf-8"))
@@ -0,0 +1,154 @@
+"""
+Repositório vetorial em memória com corpus sintético e latência simulada
+"""
+import threading
+import time
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from src.domain.repositories import IVectorStoreRepository
+from src.domain.entities import DocumentChunk, SearchFilter
+
+
+class FakeVectorStoreRepository(IVectorStoreRepository):
+    """
+    Busca exata sobre um corpus sintético (testes de carga)
+
+    O corpus é gerado a partir de uma semente fixa, então os resultados de
+    uma mesma query são sempre os mesmos. Filtros são aplicados apenas por
+    fonte. Chunks adicionados são incluídos no corpus.
+    """
+
+    def __init__(
+        self,
+        dimension: int = 64,
+        chunks_count: int = 2000,
+        sources_count: int = 10,
+        search_ms: float = 5.0,
+        seed: int = 0
+    ):
+        """
+        Gera o corpus
+
+        Args:
+            dimension: Dimensão dos embeddings (igual à do FakeAIRepository)
+            chunks_count: Chunks sintéticos
+            sources_count: Documentos sintéticos
+            search_ms: Latência simulada por busca (lote = uma busca)
+            seed: Semente do corpus
+        """
+        self.search_ms = search_ms
+        self._lock = threading.Lock()
+
+        vectors = np.random.default_rng(seed).standard_normal((chunks_count, dimension))
+        self._vectors = (vectors / np.linalg.norm(vectors, axis=1, keepdims=True)).astype(np.float32)
+        self._ids = [f"sintetico_{i}" for i in range(chunks_count)]
+        self._sources = [f"sintetico_{i % sources_count}.pdf" for i in range(chunks_count)]
+        self._texts = [f"Trecho sintético {i}" for i in range(chunks_count)]
+
+    def add_chunks(self, chunks: List[DocumentChunk]) -> None:
+        if not chunks:
+            return
+
+        vectors = np.asarray([chunk.metadata["embedding"] for chunk in chunks], dtype=np.float32)
+        vectors /= np.maximum(np.linalg.norm(vectors, axis=1, keepdims=True), 1e-12)
+        # Listas novas: buscas em andamento continuam com a versão anterior
+        with self._lock:
+            self._vectors = np.vstack([self._vectors, vectors])
+            self._ids = self._ids + [chunk.id for chunk in chunks]
+            self._sources = self._sources + [chunk.metadata.get("source", "unknown") for chunk in chunks]
+            self._texts = self._texts + [chunk.content for chunk in chunks]
+
+    def search_similar(
+        self,
+        query: str,
+        top_k: int = 5,
+        query_embedding: Optional[List[float]] = None,
+        search_filter: Optional[SearchFilter] = None
+    ) -> List[Dict]:
+        if not query_embedding:
+            raise ValueError("Busca no repositório fake requer query_embedding")
+        return self.search_similar_batch([query_embedding], top_k, search_filter)[0]
+
+    def search_similar_batch(
+        self,
+        query_embeddings: List[List[float]],
+        top_k: int = 5,
+        search_filter: Optional[SearchFilter] = None
+    ) -> List[List[Dict]]:
+        """Distâncias cosseno de todas as queries em uma multiplicação"""
+        if not query_embeddings:
+            return []
+
+        if self.search_ms > 0:
+            time.sleep(self.search_ms / 1000)
+
+        with self._lock:
+            vectors, ids, sources, texts = self._vectors, self._ids, self._sources, self._texts
+
+        queries = np.asarray(query_embeddings, dtype=np.float32)
+        queries /= np.maximum(np.linalg.norm(queries, axis=1, keepdims=True), 1e-12)
+        distances = 1.0 - queries @ vectors.T
+
+        if search_filter is not None and search_filter.sources:
+            allowed = set(search_filter.sources)
+            mask = np.array([source not in allowed for source in sources])
+            distances[:, mask] = np.inf
+
+        results = []
+        for row in distances:
+            order = np.argsort(row, kind="stable")[:top_k]
+            results.append([
+                {
+                    "id": ids[i],
+                    "text": texts[i],
+                    "source": sources[i],
+                    "distance": float(row[i])
+                }
+                for i in order if np.isfinite(row[i])
+            ])
+        return results
+
+    def list_sources(self) -> List[str]:
+        return sorted(set(self._sources))
+
+    def get_chunks_by_source(self, source: str) -> List[DocumentChunk]:
+        with self._lock:
+            rows = [i for i, name in enumerate(self._sources) if name == source]
+            return [
+                DocumentChunk(
+                    id=self._ids[i],
+                    content=self._texts[i],
+                    chunk_index=position,
+                    metadata={"source": source, "embedding": self._vectors[i].tolist()}
+                )
+                for position, i in enumerate(rows)
+            ]
+
+    def delete_by_source(self, source: str) -> bool:
+        with self._lock:
+            keep = [i for i, name in enumerate(self._sources) if name != source]
+            if len(keep) == len(self._sources):
+                return False
+            self._vectors = self._vectors[keep]
+            self._ids = [self._ids[i] for i in keep]
+            self._sources = [self._sources[i] for i in keep]
+            self._texts = [self._texts[i] for i in keep]
+        return True
+
+    def count_chunks(self) -> int:
+        return len(self._ids)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._vectors = self._vectors[:0]
+            self._ids, self._sources, self._texts = [], [], []
+
+    def rebuild(self) -> int:
+        # Arrays em memória: não há nada a compactar
+        return self.count_chunks()
+
+    def rebalance(self) -> int:
+        # Uma única partição
+        return 0
@@ -0,0 +1,12 @@
+"""Metrics Exporters"""
+from .prometheus_exporter import PrometheusMetricsExporter
+from .json_log_exporter import JsonLogMetricsExporter
+from .routing_log import JsonlRoutingLogRepository
+from .query_log import JsonlQueryLogRepository
+
+__all__ = [
+    'PrometheusMetricsExporter',
+    'JsonLogMetricsExporter',
+    'JsonlRoutingLogRepository',
+    'JsonlQueryLogRepository'
+]
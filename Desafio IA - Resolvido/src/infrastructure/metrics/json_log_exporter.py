@@ -0,0 +1,37 @@
+"""
+Exportador de métricas em log JSON (uma linha por requisição)
+"""
+import json
+import os
+import threading
+from datetime import datetime
+from typing import Dict
+
+from src.domain.repositories import IMetricsExporter
+
+
+class JsonLogMetricsExporter(IMetricsExporter):
+    """Grava cada requisição como uma linha JSON (JSON Lines)"""
+
+    def __init__(self, file_path: str = "./metrics/metrics.jsonl"):
+        """
+        Inicializa exportador
+
+        Args:
+            file_path: Caminho do arquivo de log
+        """
+        self.file_path = file_path
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(self.file_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def export(self, event: Dict, snapshot: Dict) -> None:
+        """Adiciona o evento da requisição ao log"""
+        record = {"timestamp": datetime.now().isoformat(), **event}
+        line = json.dumps(record, ensure_ascii=False)
+
+        with self._lock:
+            with open(self.file_path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
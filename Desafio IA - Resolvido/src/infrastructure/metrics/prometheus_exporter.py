@@ -0,0 +1,128 @@
+"""
+Exportador de métricas no formato texto do Prometheus
+"""
+import os
+import tempfile
+import threading
+import time
+from typing import Dict, List, Optional
+
+from src.domain.repositories import IMetricsExporter
+
+
+class PrometheusMetricsExporter(IMetricsExporter):
+    """
+    Escreve o agregado em um arquivo .prom (formato de exposição texto)
+
+    O arquivo pode ser lido pelo textfile collector do node_exporter
+    ou servido por qualquer servidor HTTP estático. O arquivo é reescrito no
+    máximo uma vez a cada `min_interval_s`: eventos nesse intervalo só
+    atualizam o agregado pendente, gravado ao fim do intervalo.
+
+    Cada processo deve ter o próprio arquivo; `labels` fixos (ex.: o worker)
+    distinguem as séries de arquivos lidos pelo mesmo collector.
+    """
+
+    def __init__(
+        self,
+        file_path: str = "./metrics/metrics.prom",
+        prefix: str = "rag",
+        min_interval_s: float = 1.0,
+        labels: Optional[Dict[str, str]] = None
+    ):
+        """
+        Inicializa exportador
+
+        Args:
+            file_path: Caminho do arquivo .prom
+            prefix: Prefixo dos nomes das métricas
+            min_interval_s: Intervalo mínimo entre reescritas (0 = a cada evento)
+            labels: Labels acrescentados a todas as séries
+        """
+        self.file_path = file_path
+        self.prefix = prefix
+        self.min_interval_s = min_interval_s
+        self._constant_labels = "".join(
+            f'{self._sanitize(name)}="{self._escape(value)}",'
+            for name, value in (labels or {}).items()
+        )
+        self._lock = threading.Lock()
+        self._last_write = 0.0
+        self._pending: Optional[Dict] = None
+        self._timer: Optional[threading.Timer] = None
+
+    def export(self, event: Dict, snapshot: Dict) -> None:
+        """Reescreve o arquivo com o agregado atual (escrita atômica, limitada por intervalo)"""
+        with self._lock:
+            wait = self._last_write + self.min_interval_s - time.monotonic()
+            if wait <= 0:
+                self._write(snapshot)
+                return
+
+            self._pending = snapshot
+            if self._timer is None:
+                self._timer = threading.Timer(wait, self.flush)
+                self._timer.start()
+
+    def flush(self) -> None:
+        """Grava o agregado pendente, se houver"""
+        with self._lock:
+            self._timer = None
+            if self._pending is not None:
+                self._write(self._pending)
+
+    def _write(self, snapshot: Dict) -> None:
+        """Escrita atômica (chamada com o lock)"""
+        directory = os.path.dirname(self.file_path) or "."
+        os.makedirs(directory, exist_ok=True)
+
+        # Temporário com nome único, na mesma pasta (os.replace atômico)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".prom.tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(self.render(snapshot))
+            os.replace(tmp_path, self.file_path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+        finally:
+            self._pending = None
+            self._last_write = time.monotonic()
+
+    def render(self, snapshot: Dict) -> str:
+        """Renderiza o agregado no formato texto do Prometheus"""
+        lines: List[str] = []
+
+        histogram_name = f"{self.prefix}_stage_duration_seconds"
+        lines.append(f"# HELP {histogram_name} Duração de cada etapa por operação")
+        lines.append(f"# TYPE {histogram_name} histogram")
+        for histogram in snapshot.get("histograms", []):
+            labels = (
+                f'{self._constant_labels}'
+                f'operation="{self._escape(histogram["operation"])}",'
+                f'stage="{self._escape(histogram["stage"])}"'
+            )
+            for upper_bound, count in histogram["buckets"]:
+                lines.append(f'{histogram_name}_bucket{{{labels},le="{upper_bound}"}} {count}')
+            lines.append(f'{histogram_name}_bucket{{{labels},le="+Inf"}} {histogram["count"]}')
+            lines.append(f"{histogram_name}_sum{{{labels}}} {histogram['sum']}")
+            lines.append(f"{histogram_name}_count{{{labels}}} {histogram['count']}")
+
+        declared = set()
+        for counter in snapshot.get("counters", []):
+            name = f"{self.prefix}_{self._sanitize(counter['name'])}_total"
+            if name not in declared:
+                lines.append(f"# TYPE {name} counter")
+                declared.add(name)
+            labels = f'{self._constant_labels}operation="{self._escape(counter["operation"])}"'
+            lines.append(f"{name}{{{labels}}} {counter['value']}")
+
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def _sanitize(name: str) -> str:
+        return "".join(c if c.isalnum() or c == "_" else "_" for c in name)
+
+    @staticmethod
+    def _escape(value: str) -> str:
+        return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
@@ -0,0 +1,49 @@
+"""
+Log de perguntas em JSON Lines
+"""
+import json
+import os
+import threading
+from datetime import datetime
+from typing import Dict, Iterator
+
+from src.domain.repositories import IQueryLogRepository
+
+
+class JsonlQueryLogRepository(IQueryLogRepository):
+    """Grava cada pergunta recebida como uma linha JSON"""
+
+    def __init__(self, file_path: str = "./metrics/queries.jsonl"):
+        """
+        Inicializa o log
+
+        Args:
+            file_path: Caminho do arquivo de log
+        """
+        self.file_path = file_path
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(self.file_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def record(self, entry: Dict) -> None:
+        """Adiciona a pergunta ao log"""
+        record = {"timestamp": datetime.now().isoformat(), **entry}
+        line = json.dumps(record, ensure_ascii=False)
+
+        with self._lock:
+            with open(self.file_path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+
+    def read(self) -> Iterator[Dict]:
+        """Lê o log (linhas incompletas ou inválidas são ignoradas)"""
+        if not os.path.exists(self.file_path):
+            return
+
+        with open(self.file_path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    continue
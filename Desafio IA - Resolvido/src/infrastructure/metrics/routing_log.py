@@ -0,0 +1,37 @@
+"""
+Log de decisões de roteamento em JSON Lines
+"""
+import json
+import os
+import threading
+from datetime import datetime
+from typing import Dict
+
+from src.domain.repositories import IRoutingLogRepository
+
+
+class JsonlRoutingLogRepository(IRoutingLogRepository):
+    """Grava cada decisão de roteamento como uma linha JSON"""
+
+    def __init__(self, file_path: str = "./metrics/routing.jsonl"):
+        """
+        Inicializa o log
+
+        Args:
+            file_path: Caminho do arquivo de log
+        """
+        self.file_path = file_path
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(self.file_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def record(self, decision: Dict) -> None:
+        """Adiciona a decisão ao log"""
+        record = {"timestamp": datetime.now().isoformat(), **decision}
+        line = json.dumps(record, ensure_ascii=False)
+
+        with self._lock:
+            with open(self.file_path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
@@ -1,5 +1,24 @@
 """PDF Processing"""
 from .pdf_extractor import PDFExtractor
 from .text_chunker import TextChunker
+from .backends import (
+    PypdfBackend,
+    PdfminerBackend,
+    Pypdfium2Backend,
+    available_pdf_backends,
+    create_pdf_backend,
+    is_pdf_backend_available
+)
+from .calibration_repository import JsonPDFCalibrationRepository
 
-__all__ = ['PDFExtractor', 'TextChunker']
+__all__ = [
+    'PDFExtractor',
+    'TextChunker',
+    'PypdfBackend',
+    'PdfminerBackend',
+    'Pypdfium2Backend',
+    'available_pdf_backends',
+    'create_pdf_backend',
+    'is_pdf_backend_available',
+    'JsonPDFCalibrationRepository'
+]
@@ -0,0 +1,179 @@
+"""
+Backends de extração de texto de PDFs
+
+- pypdf: Python puro (dependência obrigatória, referência da extração)
+- pdfminer: pdfminer.six, análise de layout em Python (opcional)
+- pypdfium2: binding do PDFium (C++), em geral o mais rápido (opcional)
+
+Os backends opcionais só são importados quando usados.
+"""
+import importlib.metadata
+import importlib.util
+from typing import Dict, List, Tuple, Type
+
+import pypdf
+from pypdf import PdfReader
+
+from src.domain.repositories import IPDFBackend
+
+
+class PypdfBackend(IPDFBackend):
+    """Extração com pypdf"""
+
+    @property
+    def name(self) -> str:
+        return "pypdf"
+
+    @property
+    def version(self) -> str:
+        return pypdf.__version__
+
+    def extract(self, pdf_path: str) -> Dict:
+        reader = PdfReader(pdf_path)
+        pages = []
+
+        for page_number, page in enumerate(reader.pages, start=1):
+            page_text = page.extract_text()
+            if page_text:
+                pages.append((page_number, page_text))
+
+        metadata = {}
+        if reader.metadata is not None:
+            metadata = {
+                "title": str(reader.metadata.get("/Title", "")),
+                "author": str(reader.metadata.get("/Author", "")),
+                "pages": len(reader.pages),
+                "creator": str(reader.metadata.get("/Creator", ""))
+            }
+
+        return {"pages": pages, "metadata": metadata}
+
+
+class PdfminerBackend(IPDFBackend):
+    """Extração com pdfminer.six (pip install pdfminer.six)"""
+
+    @property
+    def name(self) -> str:
+        return "pdfminer"
+
+    @property
+    def version(self) -> str:
+        return importlib.metadata.version("pdfminer.six")
+
+    def extract(self, pdf_path: str) -> Dict:
+        from pdfminer.high_level import extract_pages
+        from pdfminer.layout import LTTextContainer
+        from pdfminer.pdfdocument import PDFDocument
+        from pdfminer.pdfparser import PDFParser
+        from pdfminer.pdftypes import resolve1
+        from pdfminer.utils import decode_text
+
+        pages: List[Tuple[int, str]] = []
+        page_count = 0
+        for page_number, layout in enumerate(extract_pages(pdf_path), start=1):
+            page_count = page_number
+            page_text = "".join(
+                element.get_text() for element in layout
+                if isinstance(element, LTTextContainer)
+            )
+            if page_text.strip():
+                pages.append((page_number, page_text))
+
+        with open(pdf_path, "rb") as f:
+            info = PDFDocument(PDFParser(f)).info
+
+        metadata = {}
+        if info:
+            def field(key: str) -> str:
+                value = resolve1(info[0].get(key, b""))
+                return decode_text(value) if isinstance(value, bytes) else str(value)
+
+            metadata = {
+                "title": field("Title"),
+                "author": field("Author"),
+                "pages": page_count,
+                "creator": field("Creator")
+            }
+
+        return {"pages": pages, "metadata": metadata}
+
+
+class Pypdfium2Backend(IPDFBackend):
+    """Extração com PDFium (pip install pypdfium2)"""
+
+    @property
+    def name(self) -> str:
+        return "pypdfium2"
+
+    @property
+    def version(self) -> str:
+        return importlib.metadata.version("pypdfium2")
+
+    def extract(self, pdf_path: str) -> Dict:
+        import pypdfium2
+
+        document = pypdfium2.PdfDocument(pdf_path)
+        try:
+            pages = []
+            for index in range(len(document)):
+                page = document[index]
+                text_page = page.get_textpage()
+                try:
+                    page_text = text_page.get_text_range().replace("\r\n", "\n")
+                finally:
+                    text_page.close()
+                    page.close()
+                if page_text.strip():
+                    pages.append((index + 1, page_text))
+
+            info = document.get_metadata_dict()
+            metadata = {
+                "title": info.get("Title", ""),
+                "author": info.get("Author", ""),
+                "pages": len(document),
+                "creator": info.get("Creator", "")
+            } if info else {}
+        finally:
+            document.close()
+
+        return {"pages": pages, "metadata": metadata}
+
+
+# nome -> (classe, módulo importado pelo backend, pacote no pip)
+PDF_BACKENDS: Dict[str, Tuple[Type[IPDFBackend], str, str]] = {
+    "pypdf": (PypdfBackend, "pypdf", "pypdf"),
+    "pdfminer": (PdfminerBackend, "pdfminer", "pdfminer.six"),
+    "pypdfium2": (Pypdfium2Backend, "pypdfium2", "pypdfium2")
+}
+
+
+def is_pdf_backend_available(name: str) -> bool:
+    """Verifica se o backend existe e a biblioteca está instalada"""
+    if name not in PDF_BACKENDS:
+        return False
+    return importlib.util.find_spec(PDF_BACKENDS[name][1]) is not None
+
+
+def available_pdf_backends() -> Dict[str, IPDFBackend]:
+    """Backends instalados, por nome"""
+    return {
+        name: backend_class()
+        for name, (backend_class, _, _) in PDF_BACKENDS.items()
+        if is_pdf_backend_available(name)
+    }
+
+
+def create_pdf_backend(name: str) -> IPDFBackend:
+    """
+    Cria um backend pelo nome
+
+    Raises:
+        ValueError: Backend desconhecido ou biblioteca não instalada
+    """
+    if name not in PDF_BACKENDS:
+        raise ValueError(
+            f"PDF_BACKEND desconhecido: {name} (opções: auto, {', '.join(PDF_BACKENDS)})"
+        )
+    if not is_pdf_backend_available(name):
+        raise ValueError(f"Backend de PDF '{name}' não instalado: pip install {PDF_BACKENDS[name][2]}")
+    return PDF_BACKENDS[name][0]()
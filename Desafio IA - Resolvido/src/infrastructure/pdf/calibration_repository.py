@@ -0,0 +1,41 @@
+"""
+Resultado da calibração dos backends de PDF em JSON
+"""
+import json
+import os
+import tempfile
+from typing import Dict, Optional
+
+from src.domain.repositories import IPDFCalibrationRepository
+
+
+class JsonPDFCalibrationRepository(IPDFCalibrationRepository):
+    """Grava a calibração num arquivo JSON (lido com PDF_BACKEND=auto)"""
+
+    def __init__(self, file_path: str = "./cache/pdf_backend.json"):
+        """
+        Inicializa o repositório
+
+        Args:
+            file_path: Caminho do arquivo da calibração
+        """
+        self.file_path = file_path
+
+    def save(self, calibration: Dict) -> None:
+        """Grava de forma atômica (leitores nunca veem o arquivo pela metade)"""
+        directory = os.path.dirname(self.file_path) or "."
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(calibration, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.file_path)
+
+    def load(self) -> Optional[Dict]:
+        try:
+            with open(self.file_path, encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except ValueError as e:
+            print(f"[AVISO] Calibração de PDF inválida em {self.file_path}: {str(e)}")
+            return None
@@ -1,13 +1,37 @@
 """
 Extrator de texto de PDFs
 """
-from pypdf import PdfReader
-from typing import Optional
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+from typing import Dict, List, Optional, Tuple
+
+from src.domain.repositories import IPDFBackend
+from src.infrastructure.pdf.backends import PypdfBackend
 
 
 class PDFExtractor:
     """Extrai texto de arquivos PDF"""
 
+    # Incrementar quando a forma de extrair/normalizar o texto mudar
+    EXTRACTOR_VERSION = 1
+
+    def __init__(self, cache_dir: Optional[str] = None, backend: Optional[IPDFBackend] = None):
+        """
+        Inicializa extrator
+
+        Args:
+            cache_dir: Pasta do cache de extração (None desativa). O texto de
+                cada página é gravado comprimido, indexado pelo sha256 do PDF
+                e pela versão do extrator e do backend, então reprocessar um
+                arquivo que não mudou não executa a extração novamente.
+            backend: Biblioteca de extração (padrão: pypdf)
+        """
+        self.cache_dir = cache_dir
+        self.backend = backend or PypdfBackend()
+
     def extract_text(self, pdf_path: str) -> Optional[str]:
         """
         Extrai todo o texto de um PDF
@@ -18,20 +42,23 @@ class PDFExtractor:
         Returns:
             Texto extraído ou None em caso de erro
         """
-        try:
-            reader = PdfReader(pdf_path)
-            text_parts = []
+        pages = self.extract_pages(pdf_path)
+        return "\n".join(text for _, text in pages) if pages else None
 
-            for page in reader.pages:
-                page_text = page.extract_text()
-                if page_text:
-                    text_parts.append(page_text)
+    def extract_pages(self, pdf_path: str) -> List[Tuple[int, str]]:
+        """
+        Extrai o texto página a página
 
-            return "\n".join(text_parts) if text_parts else None
+        Args:
+            pdf_path: Caminho para o arquivo PDF
 
-        except Exception as e:
-            print(f"Erro ao extrair texto de {pdf_path}: {str(e)}")
-            return None
+        Returns:
+            Lista de (número da página começando em 1, texto), apenas páginas com texto
+        """
+        extraction = self._extract(pdf_path)
+        if extraction is None:
+            return []
+        return [(page_number, text) for page_number, text in extraction["pages"]]
 
     def extract_metadata(self, pdf_path: str) -> dict:
         """
@@ -43,15 +70,68 @@ class PDFExtractor:
         Returns:
             Dicionário com metadados
         """
+        extraction = self._extract(pdf_path)
+        return extraction["metadata"] if extraction else {}
+
+    # ==========================================
+    # Extração com cache
+    # ==========================================
+
+    def _extract(self, pdf_path: str) -> Optional[Dict]:
+        """Páginas e metadados do PDF (do cache quando disponível)"""
+        try:
+            cache_path = self._cache_path(pdf_path) if self.cache_dir else None
+
+            if cache_path:
+                cached = self._read_cache(cache_path)
+                if cached is not None:
+                    return cached
+
+            extraction = self._read_pdf(pdf_path)
+
+            if cache_path:
+                self._write_cache(cache_path, extraction)
+            return extraction
+
+        except Exception as e:
+            print(f"Erro ao extrair texto de {pdf_path}: {str(e)}")
+            return None
+
+    def _read_pdf(self, pdf_path: str) -> Dict:
+        """Executa o backend (etapa mais cara da ingestão)"""
+        return self.backend.extract(pdf_path)
+
+    def _cache_path(self, pdf_path: str) -> str:
+        """Caminho no cache: sha256 do conteúdo + versões do extrator e do backend"""
+        digest = hashlib.sha256()
+        with open(pdf_path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                digest.update(block)
+        file_hash = digest.hexdigest()
+
+        version = f"v{self.EXTRACTOR_VERSION}-{self.backend.name}{self.backend.version}"
+        return os.path.join(self.cache_dir, file_hash[:2], f"{file_hash}.{version}.json.gz")
+
+    @staticmethod
+    def _read_cache(cache_path: str) -> Optional[Dict]:
+        """Lê entrada do cache (None se ausente ou corrompida)"""
+        if not os.path.exists(cache_path):
+            return None
+        try:
+            with gzip.open(cache_path, "rt", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None  # Entrada corrompida: extrai novamente e sobrescreve
+
+    @staticmethod
+    def _write_cache(cache_path: str, extraction: Dict) -> None:
+        """Grava entrada do cache de forma atômica (ignora falhas de escrita)"""
+        directory = os.path.dirname(cache_path)
         try:
-            reader = PdfReader(pdf_path)
-            metadata = reader.metadata
-
-            return {
-                "title": metadata.get("/Title", ""),
-                "author": metadata.get("/Author", ""),
-                "pages": len(reader.pages),
-                "creator": metadata.get("/Creator", "")
-            }
-        except Exception:
-            return {}
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+            with os.fdopen(fd, "wb") as raw, gzip.GzipFile(fileobj=raw, mode="wb") as f:
+                f.write(json.dumps(extraction, ensure_ascii=False).encode("utf-8"))
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            print(f"[AVISO] Não foi possível gravar o cache de extração: {str(e)}")
@@ -1,8 +1,35 @@
 """Storage Implementations"""
 from .chroma_vector_store import ChromaVectorStoreRepository
 from .in_memory_document_repository import InMemoryDocumentRepository
+from .sqlite_document_repository import SQLiteDocumentRepository
+from .sqlite_answer_cache import SQLiteAnswerCacheRepository
+from .sqlite_embedding_cache import SQLiteEmbeddingCacheRepository
+from .sharded_vector_store import ShardedVectorStoreRepository
+from .process_shard import ProcessVectorStoreShard
+from .index_snapshot import NumpyIndexSnapshotRepository, IndexSnapshot
+from .snapshot_vector_store import SnapshotVectorStoreRepository
+from .index_generations import current_generation, generation_path, is_generations_root
+from .generational_snapshot_store import GenerationalSnapshotVectorStoreRepository
+from .reduced_dimension_vector_store import (
+    ReducedDimensionVectorStoreRepository,
+    FullVectorStore
+)
 
 __all__ = [
     'ChromaVectorStoreRepository',
-    'InMemoryDocumentRepository'
+    'InMemoryDocumentRepository',
+    'SQLiteDocumentRepository',
+    'SQLiteAnswerCacheRepository',
+    'SQLiteEmbeddingCacheRepository',
+    'ShardedVectorStoreRepository',
+    'ProcessVectorStoreShard',
+    'NumpyIndexSnapshotRepository',
+    'IndexSnapshot',
+    'SnapshotVectorStoreRepository',
+    'GenerationalSnapshotVectorStoreRepository',
+    'current_generation',
+    'generation_path',
+    'is_generations_root',
+    'ReducedDimensionVectorStoreRepository',
+    'FullVectorStore'
 ]
@@ -1,36 +1,184 @@
 """
 Implementação do repositório vetorial com ChromaDB
 """
-from typing import List, Dict
+import hashlib
+import re
+from collections import defaultdict
+from typing import List, Dict, Optional
 import chromadb
 from chromadb.config import Settings
 
 from src.domain.repositories import IVectorStoreRepository
-from src.domain.entities import DocumentChunk
+from src.domain.entities import DocumentChunk, SearchFilter
 
 
 class ChromaVectorStoreRepository(IVectorStoreRepository):
     """Implementação concreta usando ChromaDB"""
 
-    def __init__(self, persist_directory: str = "./chroma_db"):
+    # Limite usado quando o cliente não informa o tamanho máximo de lote
+    DEFAULT_MAX_BATCH_SIZE = 5000
+    # Prefixo da cópia criada por rebuild() antes de substituir a coleção
+    REBUILD_PREFIX = "rebuild__"
+
+    def __init__(
+        self,
+        persist_directory: str = "./chroma_db",
+        distance_space: str = "cosine",
+        hnsw_construction_ef: int = 200,
+        hnsw_search_ef: int = 100,
+        hnsw_m: int = 16,
+        batch_size: int = 0,
+        tenant_partitioning: bool = False,
+        embedding_model: str = "",
+        embedding_dimension: int = 0
+    ):
         """
         Inicializa ChromaDB
 
         Args:
             persist_directory: Diretório para persistência
+            distance_space: Métrica de distância (cosine, l2 ou ip)
+            hnsw_construction_ef: Tamanho da lista de candidatos na construção do HNSW
+            hnsw_search_ef: Tamanho da lista de candidatos na busca
+            hnsw_m: Vizinhos por nó do grafo HNSW
+            batch_size: Chunks por upsert (0 = limite do cliente)
+            tenant_partitioning: Uma coleção por tenant (user_id) em vez de
+                uma coleção compartilhada
+            embedding_model: Identidade do modelo de embeddings, gravada nos
+                metadados da coleção (vazio = não verifica)
+            embedding_dimension: Dimensão dos vetores indexados (0 = não verifica)
+
+        Raises:
+            ValueError: Se o índice existente usa outro modelo ou outra dimensão
         """
         self.client = chromadb.PersistentClient(path=persist_directory)
         self.collection_name = "documentos"
+        self.distance_space = distance_space
+        self.hnsw_construction_ef = hnsw_construction_ef
+        self.hnsw_search_ef = hnsw_search_ef
+        self.hnsw_m = hnsw_m
+        self.batch_size = self._resolve_batch_size(batch_size)
+        self.tenant_partitioning = tenant_partitioning
+        self.embedding_model = embedding_model
+        self.embedding_dimension = embedding_dimension
+        self._tenant_collections: Dict = {}
+
+        # Antes do get_or_create: não pode criar uma coleção vazia no lugar
+        # de uma que ficou só na cópia de uma reconstrução interrompida
+        self._resume_interrupted_rebuilds()
+
         self.collection = self.client.get_or_create_collection(
             name=self.collection_name,
-            metadata={"description": "Documentos processados"}
+            metadata=self._collection_metadata()
         )
+        self._warn_if_settings_differ()
+        self._check_embedding_model(self.collection)
+        self._check_embedding_dimension(self.collection)
+
+    def _collection_metadata(self) -> Dict:
+        """Metadados de criação da coleção (métrica, HNSW e modelo de embeddings)"""
+        metadata = {
+            "description": "Documentos processados",
+            "hnsw:space": self.distance_space,
+            "hnsw:construction_ef": self.hnsw_construction_ef,
+            "hnsw:search_ef": self.hnsw_search_ef,
+            "hnsw:M": self.hnsw_m
+        }
+        if self.embedding_model:
+            metadata["embedding_model"] = self.embedding_model
+        if self.embedding_dimension:
+            metadata["embedding_dimension"] = self.embedding_dimension
+        return metadata
+
+    def _resolve_batch_size(self, batch_size: int) -> int:
+        """Limita o lote ao máximo aceito pelo cliente"""
+        try:
+            client_limit = self.client.get_max_batch_size()
+        except AttributeError:
+            client_limit = getattr(self.client, "max_batch_size", self.DEFAULT_MAX_BATCH_SIZE)
+
+        if batch_size <= 0:
+            return client_limit
+        return min(batch_size, client_limit)
+
+    def _warn_if_settings_differ(self) -> None:
+        """Avisa quando a coleção existente foi criada com outra configuração"""
+        current = self.collection.metadata or {}
+        expected = self._collection_metadata()
+
+        # Coleções antigas sem hnsw:space usam L2 (padrão do ChromaDB)
+        if current.get("hnsw:space", "l2") != expected["hnsw:space"]:
+            print(
+                f"[AVISO] Coleção '{self.collection_name}' usa distância "
+                f"{current.get('hnsw:space', 'l2')} (configurado: {self.distance_space}). "
+                "Execute 'python main.py --rebuild-index' para aplicar."
+            )
+
+    def _check_embedding_model(self, collection) -> None:
+        """Impede misturar vetores de modelos de embeddings diferentes"""
+        recorded = (collection.metadata or {}).get("embedding_model")
+        if (
+            self.embedding_model and
+            recorded and
+            recorded != self.embedding_model and
+            collection.count() > 0
+        ):
+            raise ValueError(
+                f"Coleção '{collection.name}' foi indexada com o modelo de embeddings "
+                f"'{recorded}', mas o configurado é '{self.embedding_model}'. "
+                "Use o mesmo EMBEDDING_BACKEND ou reprocesse os documentos em um "
+                "CHROMA_DB_PATH novo."
+            )
+
+    def _check_embedding_dimension(self, collection) -> None:
+        """Valida a dimensão configurada contra os vetores já indexados"""
+        if not self.embedding_dimension or collection.count() == 0:
+            return
+
+        recorded = (collection.metadata or {}).get("embedding_dimension")
+        if recorded is None:
+            # Coleções antigas: confere pelo primeiro vetor armazenado
+            sample = collection.peek(limit=1)
+            if sample["embeddings"] is not None and len(sample["embeddings"]):
+                recorded = len(sample["embeddings"][0])
+
+        if recorded is not None and recorded != self.embedding_dimension:
+            raise ValueError(
+                f"Coleção '{collection.name}' tem vetores de {recorded} dimensões, "
+                f"mas EMBEDDING_DIMENSION={self.embedding_dimension}. Reprocesse os "
+                "documentos em um CHROMA_DB_PATH novo ou restaure a configuração."
+            )
 
     def add_chunks(self, chunks: List[DocumentChunk]) -> None:
-        """Adiciona chunks ao banco vetorial"""
+        """
+        Adiciona chunks ao banco vetorial
+
+        Usa upsert em lotes (idempotente: reprocessar um arquivo sobrescreve
+        os mesmos IDs) e remove chunks antigos das mesmas fontes que não
+        existem mais na nova versão.
+        """
         if not chunks:
             return
 
+        # Agrupa por tenant (cada grupo vai para sua coleção)
+        chunks_by_tenant: Dict[Optional[str], List[DocumentChunk]] = defaultdict(list)
+        for chunk in chunks:
+            chunks_by_tenant[chunk.metadata.get("tenant_id")].append(chunk)
+
+        for tenant_id, tenant_chunks in chunks_by_tenant.items():
+            if self.tenant_partitioning and tenant_id:
+                collection = self._tenant_collection(tenant_id, create=True)
+            else:
+                collection = self.collection
+            self._upsert_chunks(collection, tenant_chunks, tenant_id)
+
+    def _upsert_chunks(
+        self,
+        collection,
+        chunks: List[DocumentChunk],
+        tenant_id: Optional[str]
+    ) -> None:
+        """Upsert em lotes de chunks de um mesmo tenant"""
         documents = []
         metadatas = []
         ids = []
@@ -38,10 +186,7 @@ class ChromaVectorStoreRepository(IVectorStoreRepository):
 
         for chunk in chunks:
             documents.append(chunk.content)
-            metadatas.append({
-                "source": chunk.metadata.get("source", "unknown"),
-                "chunk_id": chunk.chunk_index
-            })
+            metadatas.append(self._chunk_metadata(chunk))
             ids.append(chunk.id)
 
             # Pega embedding do metadata
@@ -51,58 +196,374 @@ class ChromaVectorStoreRepository(IVectorStoreRepository):
 
         # Adiciona ao ChromaDB
         if embeddings:
-            self.collection.add(
-                documents=documents,
-                metadatas=metadatas,
-                ids=ids,
-                embeddings=embeddings
+            for start in range(0, len(ids), self.batch_size):
+                end = start + self.batch_size
+                collection.upsert(
+                    documents=documents[start:end],
+                    metadatas=metadatas[start:end],
+                    ids=ids[start:end],
+                    embeddings=embeddings[start:end]
+                )
+
+            self._delete_stale_chunks(
+                collection,
+                sources={metadata["source"] for metadata in metadatas},
+                current_ids=set(ids),
+                tenant_id=tenant_id
+            )
+
+    @staticmethod
+    def _chunk_metadata(chunk: DocumentChunk) -> Dict:
+        """Metadados gravados no ChromaDB (sem valores None)"""
+        metadata = {
+            "source": chunk.metadata.get("source", "unknown"),
+            "chunk_id": chunk.chunk_index
+        }
+        for key in ("page_start", "page_end", "ingested_at", "tenant_id"):
+            if chunk.metadata.get(key) is not None:
+                metadata[key] = chunk.metadata[key]
+        return metadata
+
+    def _delete_stale_chunks(
+        self,
+        collection,
+        sources: set,
+        current_ids: set,
+        tenant_id: Optional[str]
+    ) -> None:
+        """Remove chunks das fontes (do mesmo tenant) que não fazem parte do upsert atual"""
+        for source in sources:
+            existing = collection.get(where={"source": source}, include=["metadatas"])
+            stale_ids = [
+                chunk_id
+                for chunk_id, metadata in zip(existing["ids"], existing["metadatas"])
+                if chunk_id not in current_ids
+                and (metadata or {}).get("tenant_id") == tenant_id
+            ]
+            for start in range(0, len(stale_ids), self.batch_size):
+                collection.delete(ids=stale_ids[start:start + self.batch_size])
+
+    # ==========================================
+    # Partições por tenant
+    # ==========================================
+
+    def _tenant_collection_name(self, tenant_id: str) -> str:
+        """Nome válido e estável da coleção de um tenant"""
+        slug = re.sub(r"[^a-zA-Z0-9_-]", "_", tenant_id)[:24]
+        digest = hashlib.sha1(tenant_id.encode("utf-8")).hexdigest()[:8]
+        return f"{self.collection_name}__{slug}_{digest}"
+
+    def _tenant_collection(self, tenant_id: str, create: bool = False):
+        """Coleção do tenant (None se não existir e create=False)"""
+        if tenant_id in self._tenant_collections:
+            return self._tenant_collections[tenant_id]
+
+        name = self._tenant_collection_name(tenant_id)
+        if create:
+            collection = self.client.get_or_create_collection(
+                name=name,
+                metadata=self._collection_metadata()
+            )
+        else:
+            try:
+                collection = self.client.get_collection(name)
+            except Exception:
+                return None
+
+        self._check_embedding_model(collection)
+        self._check_embedding_dimension(collection)
+        self._tenant_collections[tenant_id] = collection
+        return collection
+
+    def _collection_names(self) -> List[str]:
+        """Coleção padrão e todas as partições de tenants"""
+        names = [self.collection_name]
+        for name in self._existing_collection_names():
+            if name.startswith(f"{self.collection_name}__"):
+                names.append(name)
+        return names
+
+    def _existing_collection_names(self) -> List[str]:
+        # Versões novas retornam nomes; antigas retornam objetos Collection
+        return [getattr(collection, "name", collection) for collection in self.client.list_collections()]
+
+    def _search_collection(self, search_filter: Optional[SearchFilter]):
+        """Coleção consultada para o filtro (None se o tenant não tiver dados)"""
+        if self.tenant_partitioning and search_filter and search_filter.tenant_id:
+            return self._tenant_collection(search_filter.tenant_id)
+        return self.collection
+
+    def _build_where(self, search_filter: Optional[SearchFilter]) -> Optional[Dict]:
+        """Converte o filtro em cláusula where do ChromaDB"""
+        if search_filter is None:
+            return None
+
+        conditions = []
+        # Sem partição, a coleção é compartilhada: o tenant vira condição
+        # (com partição, a própria coleção já é do tenant)
+        if search_filter.tenant_id and not self.tenant_partitioning:
+            conditions.append({"tenant_id": search_filter.tenant_id})
+        if search_filter.sources:
+            conditions.append({"source": {"$in": list(search_filter.sources)}})
+        if search_filter.ingested_after is not None:
+            conditions.append({"ingested_at": {"$gte": int(search_filter.ingested_after.timestamp())}})
+        if search_filter.ingested_before is not None:
+            conditions.append({"ingested_at": {"$lte": int(search_filter.ingested_before.timestamp())}})
+        # Páginas: o chunk precisa ter interseção com o intervalo pedido
+        if search_filter.page_from is not None:
+            conditions.append({"page_end": {"$gte": search_filter.page_from}})
+        if search_filter.page_to is not None:
+            conditions.append({"page_start": {"$lte": search_filter.page_to}})
+
+        if not conditions:
+            return None
+        if len(conditions) == 1:
+            return conditions[0]
+        return {"$and": conditions}
+
+    def rebuild(self) -> int:
+        """
+        Reconstrói as coleções com a configuração atual (offline)
+
+        Copia todos os chunks em lotes para uma coleção nova criada com a
+        métrica e os parâmetros HNSW configurados, descarta a antiga e
+        renomeia a nova. O grafo é reconstruído do zero, eliminando entradas
+        removidas (compactação). Partições de tenants são reconstruídas
+        da mesma forma.
+
+        Returns:
+            Quantidade de chunks copiados
+        """
+        copied = 0
+        for name in self._collection_names():
+            copied += self._rebuild_collection(name)
+
+        self.collection = self.client.get_collection(self.collection_name)
+        self._tenant_collections = {}
+        return copied
+
+    def rebalance(self) -> int:
+        raise NotImplementedError("Índice sem shards: nada a rebalancear (veja VECTOR_STORE_SHARDS)")
+
+    def _rebuild_collection(self, name: str) -> int:
+        """Reconstrói uma coleção"""
+        rebuild_name = f"{self.REBUILD_PREFIX}{name}"
+        if rebuild_name in self._existing_collection_names():
+            self._finish_interrupted_rebuild(name, rebuild_name)
+        source = self.client.get_collection(name)
+
+        # Mantém o modelo registrado: os vetores são copiados, não recalculados
+        metadata = self._collection_metadata()
+        for key in ("embedding_model", "embedding_dimension"):
+            metadata.pop(key, None)
+            recorded = (source.metadata or {}).get(key)
+            if recorded:
+                metadata[key] = recorded
+
+        target = self.client.create_collection(
+            name=rebuild_name,
+            metadata=metadata
+        )
+
+        total = source.count()
+        copied = 0
+        for offset in range(0, total, self.batch_size):
+            batch = source.get(
+                offset=offset,
+                limit=self.batch_size,
+                include=["embeddings", "documents", "metadatas"]
             )
+            if not batch["ids"]:
+                break
+
+            target.upsert(
+                ids=batch["ids"],
+                embeddings=batch["embeddings"],
+                documents=batch["documents"],
+                metadatas=batch["metadatas"]
+            )
+            copied += len(batch["ids"])
+
+        # O original só é descartado com a cópia completa e conferida
+        if target.count() != total:
+            self.client.delete_collection(rebuild_name)
+            raise RuntimeError(
+                f"Reconstrução de '{name}' incompleta: {target.count()} de {total} chunks copiados"
+            )
+
+        self.client.delete_collection(name)
+        target.modify(name=name)
+
+        return copied
+
+    def _resume_interrupted_rebuilds(self) -> None:
+        """Resolve cópias deixadas por reconstruções interrompidas"""
+        for rebuild_name in self._existing_collection_names():
+            if rebuild_name.startswith(self.REBUILD_PREFIX):
+                self._finish_interrupted_rebuild(rebuild_name[len(self.REBUILD_PREFIX):], rebuild_name)
+
+    def _finish_interrupted_rebuild(self, name: str, rebuild_name: str) -> None:
+        """
+        Conclui ou descarta a cópia de uma reconstrução interrompida
+
+        Com o original presente e com dados, a interrupção foi durante a
+        cópia e ela é descartada. Sem original (ou vazio), a interrupção foi
+        entre a exclusão do original e a renomeação: a cópia, já conferida,
+        é a única com os dados e assume o nome.
+        """
+        try:
+            original = self.client.get_collection(name)
+        except Exception:
+            original = None
+
+        if original is not None and original.count() > 0:
+            self.client.delete_collection(rebuild_name)
+            return
+
+        if original is not None:
+            self.client.delete_collection(name)
+        self.client.get_collection(rebuild_name).modify(name=name)
+        print(f"[AVISO] Reconstrução interrompida de '{name}' concluída")
+
+    def search_similar(
+        self,
+        query: str,
+        top_k: int = 5,
+        query_embedding: Optional[List[float]] = None,
+        search_filter: Optional[SearchFilter] = None
+    ) -> List[Dict]:
+        """Busca chunks similares (filtros aplicados pelo ChromaDB)"""
+        collection = self._search_collection(search_filter)
+        if collection is None:
+            return []
+
+        where = self._build_where(search_filter)
 
-    def search_similar(self, query: str, top_k: int = 5, query_embedding: List[float] = None) -> List[Dict]:
-        """Busca chunks similares"""
         # Se temos embedding da query, usamos ele diretamente
         # Senão, ChromaDB vai gerar automaticamente (pode dar incompatibilidade)
 
         if query_embedding:
-            results = self.collection.query(
+            results = collection.query(
                 query_embeddings=[query_embedding],
-                n_results=top_k
+                n_results=top_k,
+                where=where
             )
         else:
-            results = self.collection.query(
+            results = collection.query(
                 query_texts=[query],
-                n_results=top_k
+                n_results=top_k,
+                where=where
             )
 
+        return self._format_results(results, 0)
+
+    def search_similar_batch(
+        self,
+        query_embeddings: List[List[float]],
+        top_k: int = 5,
+        search_filter: Optional[SearchFilter] = None
+    ) -> List[List[Dict]]:
+        """Busca chunks similares para várias queries em uma única consulta"""
+        if not query_embeddings:
+            return []
+
+        collection = self._search_collection(search_filter)
+        if collection is None:
+            return [[] for _ in query_embeddings]
+
+        results = collection.query(
+            query_embeddings=query_embeddings,
+            n_results=top_k,
+            where=self._build_where(search_filter)
+        )
+
+        return [
+            self._format_results(results, i)
+            for i in range(len(query_embeddings))
+        ]
+
+    @staticmethod
+    def _format_results(results: Dict, index: int) -> List[Dict]:
+        """Converte o resultado da query i do ChromaDB em lista de dicionários"""
         formatted_results = []
-        if results['documents'] and len(results['documents']) > 0:
-            for i in range(len(results['documents'][0])):
+        if results['documents'] and len(results['documents']) > index:
+            for i in range(len(results['documents'][index])):
                 formatted_results.append({
-                    'text': results['documents'][0][i],
-                    'source': results['metadatas'][0][i].get('source', 'unknown'),
-                    'distance': results['distances'][0][i] if 'distances' in results else None
+                    'id': results['ids'][index][i],
+                    'text': results['documents'][index][i],
+                    'source': results['metadatas'][index][i].get('source', 'unknown'),
+                    'distance': results['distances'][index][i] if 'distances' in results else None
                 })
 
         return formatted_results
 
+    def list_sources(self) -> List[str]:
+        """Lista as fontes presentes (todas as partições)"""
+        sources = set()
+        for name in self._collection_names():
+            collection = self.client.get_collection(name)
+            total = collection.count()
+            for offset in range(0, total, self.batch_size):
+                batch = collection.get(
+                    offset=offset,
+                    limit=self.batch_size,
+                    include=["metadatas"]
+                )
+                sources.update(
+                    (metadata or {}).get("source", "unknown")
+                    for metadata in batch["metadatas"]
+                )
+        return sorted(sources)
+
+    def get_chunks_by_source(self, source: str) -> List[DocumentChunk]:
+        """Retorna os chunks de uma fonte (todas as partições) com embeddings"""
+        chunks = []
+        for name in self._collection_names():
+            result = self.client.get_collection(name).get(
+                where={"source": source},
+                include=["embeddings", "documents", "metadatas"]
+            )
+            for chunk_id, document, metadata, embedding in zip(
+                result["ids"],
+                result["documents"],
+                result["metadatas"],
+                result["embeddings"]
+            ):
+                metadata = dict(metadata or {})
+                chunks.append(DocumentChunk(
+                    id=chunk_id,
+                    content=document,
+                    chunk_index=metadata.pop("chunk_id", 0),
+                    metadata={**metadata, "embedding": [float(value) for value in embedding]}
+                ))
+        return chunks
+
     def delete_by_source(self, source: str) -> bool:
-        """Remove chunks de uma fonte"""
+        """Remove chunks de uma fonte (em todas as partições)"""
         try:
             # ChromaDB permite delete por metadata
-            self.collection.delete(
-                where={"source": source}
-            )
+            for name in self._collection_names():
+                self.client.get_collection(name).delete(
+                    where={"source": source}
+                )
             return True
         except Exception:
             return False
 
     def count_chunks(self) -> int:
-        """Conta total de chunks"""
-        return self.collection.count()
+        """Conta total de chunks (todas as partições)"""
+        return sum(
+            self.client.get_collection(name).count()
+            for name in self._collection_names()
+        )
 
     def clear(self) -> None:
-        """Limpa todo o banco"""
-        self.client.delete_collection(self.collection_name)
+        """Limpa todo o banco (inclusive partições de tenants)"""
+        for name in self._collection_names():
+            self.client.delete_collection(name)
+        self._tenant_collections = {}
+
         self.collection = self.client.create_collection(
-            name=self.collection_name
+            name=self.collection_name,
+            metadata=self._collection_metadata()
         )
@@ -0,0 +1,122 @@
+"""
+Repositório vetorial somente leitura que acompanha a geração publicada
+"""
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+from src.domain.repositories import IVectorStoreRepository
+from src.domain.entities import DocumentChunk, SearchFilter
+from src.infrastructure.storage.index_generations import current_generation, generation_path
+from src.infrastructure.storage.snapshot_vector_store import SnapshotVectorStoreRepository
+
+
+class GenerationalSnapshotVectorStoreRepository(IVectorStoreRepository):
+    """
+    Serve sempre a geração atual de uma pasta de gerações
+
+    Cada operação consulta a geração (valor compartilhado fornecido pelo
+    supervisor ou, sem supervisor, o arquivo CURRENT a cada
+    `check_interval` segundos) e troca o snapshot quando ela muda. Abrir
+    uma geração só lê o manifest; buscas em andamento continuam com o
+    snapshot anterior, liberado quando deixa de ser referenciado.
+    """
+
+    def __init__(
+        self,
+        root: str,
+        generation_source: Optional[Callable[[], int]] = None,
+        embedding_model: str = "",
+        check_interval: float = 1.0
+    ):
+        """
+        Abre a geração atual
+
+        Args:
+            root: Pasta das gerações
+            generation_source: Geração a servir (None = lê CURRENT)
+            embedding_model: Modelo de embeddings das queries (vazio = não verifica)
+            check_interval: Intervalo de leitura do CURRENT sem supervisor (s)
+        """
+        self.root = root
+        self.embedding_model = embedding_model
+        self.check_interval = check_interval
+        self._generation_source = generation_source or self._read_current
+        self._lock = threading.Lock()
+        self._checked_at = 0.0
+        self._current_read = 0
+
+        self._generation = 0
+        self._store: Optional[SnapshotVectorStoreRepository] = None
+        self._current()
+
+    @property
+    def generation(self) -> int:
+        """Geração servida atualmente"""
+        return self._generation
+
+    def _read_current(self) -> int:
+        now = time.monotonic()
+        if now - self._checked_at >= self.check_interval:
+            self._current_read = current_generation(self.root)
+            self._checked_at = now
+        return self._current_read
+
+    def _current(self) -> SnapshotVectorStoreRepository:
+        """Snapshot da geração atual (reabre se a geração mudou)"""
+        generation = self._generation_source()
+        store = self._store
+        if store is not None and generation == self._generation:
+            return store
+
+        with self._lock:
+            if self._store is None or generation != self._generation:
+                if generation <= 0:
+                    raise RuntimeError(f"Nenhuma geração do índice publicada em {self.root}")
+                self._store = SnapshotVectorStoreRepository(
+                    snapshot_path=generation_path(self.root, generation),
+                    embedding_model=self.embedding_model
+                )
+                self._generation = generation
+            return self._store
+
+    def add_chunks(self, chunks: List[DocumentChunk]) -> None:
+        raise RuntimeError("Gerações são somente leitura: use --publish-index")
+
+    def delete_by_source(self, source: str) -> bool:
+        raise RuntimeError("Gerações são somente leitura")
+
+    def clear(self) -> None:
+        raise RuntimeError("Gerações são somente leitura")
+
+    def count_chunks(self) -> int:
+        return self._current().count_chunks()
+
+    def search_similar(
+        self,
+        query: str,
+        top_k: int = 5,
+        query_embedding: Optional[List[float]] = None,
+        search_filter: Optional[SearchFilter] = None
+    ) -> List[Dict]:
+        return self._current().search_similar(query, top_k, query_embedding, search_filter)
+
+    def search_similar_batch(
+        self,
+        query_embeddings: List[List[float]],
+        top_k: int = 5,
+        search_filter: Optional[SearchFilter] = None
+    ) -> List[List[Dict]]:
+        return self._current().search_similar_batch(query_embeddings, top_k, search_filter)
+
+    def list_sources(self) -> List[str]:
+        return self._current().list_sources()
+
+    def get_chunks_by_source(self, source: str) -> List[DocumentChunk]:
+        return self._current().get_chunks_by_source(source)
+
+    def rebuild(self) -> int:
+        raise NotImplementedError("Snapshot é somente leitura: reconstrua o índice de origem e exporte de novo")
+
+    def rebalance(self) -> int:
+        raise NotImplementedError("Snapshot é somente leitura: não há shards a rebalancear")
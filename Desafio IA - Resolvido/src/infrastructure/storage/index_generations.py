@@ -0,0 +1,90 @@
+"""
+Gerações de snapshots do índice (publicação atômica)
+
+Layout da pasta raiz:
+- gen-000001/, gen-000002/, ...: snapshots completos (ver index_snapshot)
+- CURRENT: nome da geração em uso, trocado com os.replace (atômico)
+
+Leitores abrem sempre a geração apontada por CURRENT; a publicação grava
+a geração nova inteira antes de trocar o ponteiro. Gerações antigas são
+removidas mantendo as `keep` mais recentes; em POSIX, processos que ainda
+mapeiam uma geração removida continuam lendo até reabrir.
+"""
+import os
+import re
+import shutil
+from typing import Callable, List, Tuple
+
+
+CURRENT_FILE = "CURRENT"
+_GENERATION_PATTERN = re.compile(r"^gen-(\d{6,})$")
+
+
+def generation_name(generation: int) -> str:
+    return f"gen-{generation:06d}"
+
+
+def generation_path(root: str, generation: int) -> str:
+    return os.path.join(root, generation_name(generation))
+
+
+def is_generations_root(path: str) -> bool:
+    """Verifica se a pasta contém gerações publicadas (arquivo CURRENT)"""
+    return os.path.isfile(os.path.join(path, CURRENT_FILE))
+
+
+def current_generation(root: str) -> int:
+    """Geração apontada por CURRENT (0 se nenhuma foi publicada)"""
+    try:
+        with open(os.path.join(root, CURRENT_FILE), encoding="utf-8") as f:
+            match = _GENERATION_PATTERN.match(f.read().strip())
+    except FileNotFoundError:
+        return 0
+    return int(match.group(1)) if match else 0
+
+
+def list_generations(root: str) -> List[int]:
+    """Gerações presentes na pasta, em ordem crescente"""
+    if not os.path.isdir(root):
+        return []
+    generations = []
+    for name in os.listdir(root):
+        match = _GENERATION_PATTERN.match(name)
+        if match:
+            generations.append(int(match.group(1)))
+    return sorted(generations)
+
+
+def publish_generation(
+    root: str,
+    write: Callable[[str], int],
+    keep: int = 3
+) -> Tuple[int, int]:
+    """
+    Grava uma geração nova e aponta CURRENT para ela
+
+    Args:
+        root: Pasta das gerações
+        write: Grava o snapshot na pasta informada e retorna a quantidade de chunks
+        keep: Gerações mantidas (incluindo a nova)
+
+    Returns:
+        (geração publicada, chunks gravados)
+    """
+    os.makedirs(root, exist_ok=True)
+    existing = list_generations(root)
+    generation = max(existing + [current_generation(root)]) + 1
+
+    count = write(generation_path(root, generation))
+
+    pointer_tmp = os.path.join(root, f".{CURRENT_FILE}.{os.getpid()}")
+    with open(pointer_tmp, "w", encoding="utf-8") as f:
+        f.write(generation_name(generation) + "\n")
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(pointer_tmp, os.path.join(root, CURRENT_FILE))
+
+    for old in list_generations(root)[:-max(keep, 1)]:
+        shutil.rmtree(generation_path(root, old), ignore_errors=True)
+
+    return generation, count
@@ -0,0 +1,332 @@
+"""
+Snapshot portátil e mapeável em memória do índice vetorial
+
+Formato (uma pasta):
+- manifest.json: formato, versão, dimensão, métrica e sha256 de cada arquivo
+- embeddings.npy: matriz float32 (N, dim)
+- norms.npy: norma L2 de cada embedding (float32)
+- <coluna>.npy: colunas inteiras int64 (-1 = ausente)
+- <coluna>.offsets.npy + <coluna>.bin: colunas de texto (offsets int64 + UTF-8)
+- <coluna>.codes.npy + manifest: colunas de baixa cardinalidade (dicionário)
+
+Todos os arquivos são lidos com np.load(mmap_mode="r") / mmap, sem parsing:
+abrir um snapshot custa apenas a leitura do manifest.
+"""
+import hashlib
+import json
+import mmap
+import os
+import shutil
+import tempfile
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from src.domain.repositories import IIndexSnapshotRepository
+from src.domain.entities import DocumentChunk
+from src.infrastructure.storage.index_generations import publish_generation
+
+
+SNAPSHOT_FORMAT = "rag-index-snapshot"
+SNAPSHOT_VERSION = 1
+
+INT_COLUMNS = ("chunk_id", "page_start", "page_end", "ingested_at")
+STRING_COLUMNS = ("ids", "text")
+DICTIONARY_COLUMNS = ("source", "tenant_id")
+
+
+def _sha256(path: str) -> str:
+    """Checksum de um arquivo (leitura em blocos)"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class IndexSnapshot:
+    """Snapshot aberto (somente leitura, mapeado em memória)"""
+
+    def __init__(self, path: str, verify: bool = False):
+        """
+        Abre um snapshot
+
+        Args:
+            path: Pasta do snapshot
+            verify: Confere os checksums (lê todos os arquivos)
+
+        Raises:
+            ValueError: Formato/versão incompatível ou checksum inválido
+        """
+        self.path = path
+
+        with open(os.path.join(path, "manifest.json"), encoding="utf-8") as f:
+            self.manifest = json.load(f)
+
+        if self.manifest.get("format") != SNAPSHOT_FORMAT:
+            raise ValueError(f"Pasta não contém um snapshot de índice: {path}")
+        if self.manifest.get("version") != SNAPSHOT_VERSION:
+            raise ValueError(
+                f"Versão de snapshot não suportada: {self.manifest.get('version')}"
+            )
+
+        if verify:
+            self.verify()
+
+        self.embeddings = self._load_array("embeddings.npy")
+        self.norms = self._load_array("norms.npy")
+        self.int_columns = {
+            name: self._load_array(f"{name}.npy") for name in INT_COLUMNS
+        }
+        self.dictionary_codes = {
+            name: self._load_array(f"{name}.codes.npy") for name in DICTIONARY_COLUMNS
+        }
+        self.dictionaries: Dict[str, List[str]] = self.manifest["dictionaries"]
+
+        self._offsets = {
+            name: self._load_array(f"{name}.offsets.npy") for name in STRING_COLUMNS
+        }
+        self._files = {}
+        self._blobs = {}
+        for name in STRING_COLUMNS:
+            blob_path = os.path.join(path, f"{name}.bin")
+            if os.path.getsize(blob_path) == 0:
+                self._blobs[name] = b""
+                continue
+            self._files[name] = open(blob_path, "rb")
+            self._blobs[name] = mmap.mmap(self._files[name].fileno(), 0, access=mmap.ACCESS_READ)
+
+    def _load_array(self, filename: str) -> np.ndarray:
+        return np.load(os.path.join(self.path, filename), mmap_mode="r")
+
+    def verify(self) -> None:
+        """Confere o sha256 de todos os arquivos do manifest"""
+        for filename, info in self.manifest["files"].items():
+            if _sha256(os.path.join(self.path, filename)) != info["sha256"]:
+                raise ValueError(f"Checksum inválido no snapshot: {filename}")
+
+    def __len__(self) -> int:
+        return int(self.manifest["count"])
+
+    @property
+    def dimension(self) -> int:
+        return int(self.manifest["dimension"])
+
+    @property
+    def distance_space(self) -> str:
+        return self.manifest.get("distance_space", "cosine")
+
+    def string(self, column: str, index: int) -> str:
+        """Valor de uma coluna de texto"""
+        offsets = self._offsets[column]
+        return self._blobs[column][int(offsets[index]):int(offsets[index + 1])].decode("utf-8")
+
+    def dictionary_value(self, column: str, index: int) -> Optional[str]:
+        """Valor de uma coluna de dicionário (None se ausente)"""
+        code = int(self.dictionary_codes[column][index])
+        return self.dictionaries[column][code] if code >= 0 else None
+
+    def metadata(self, index: int) -> Dict:
+        """Metadados do chunk (sem embedding)"""
+        metadata = {"source": self.dictionary_value("source", index)}
+        tenant_id = self.dictionary_value("tenant_id", index)
+        if tenant_id is not None:
+            metadata["tenant_id"] = tenant_id
+        for name in ("page_start", "page_end", "ingested_at"):
+            value = int(self.int_columns[name][index])
+            if value >= 0:
+                metadata[name] = value
+        return metadata
+
+    def chunk(self, index: int) -> DocumentChunk:
+        """Materializa um chunk completo (com embedding)"""
+        return DocumentChunk(
+            id=self.string("ids", index),
+            content=self.string("text", index),
+            chunk_index=int(self.int_columns["chunk_id"][index]),
+            metadata={
+                **self.metadata(index),
+                "embedding": self.embeddings[index].tolist()
+            }
+        )
+
+    def warm(self) -> None:
+        """Lê os vetores inteiros, trazendo as páginas mapeadas para o page cache"""
+        np.add.reduce(self.embeddings, axis=None)
+        np.add.reduce(self.norms, axis=None)
+
+    def check_embedding_model(self, embedding_model: str) -> None:
+        """Recusa snapshots gerados com outro modelo de embeddings"""
+        recorded = self.manifest.get("embedding_model")
+        if embedding_model and recorded and recorded != embedding_model:
+            raise ValueError(
+                f"Snapshot gerado com o modelo de embeddings '{recorded}', "
+                f"mas o configurado é '{embedding_model}'"
+            )
+
+    def close(self) -> None:
+        for blob in self._blobs.values():
+            if isinstance(blob, mmap.mmap):
+                blob.close()
+        for file in self._files.values():
+            file.close()
+
+
+class NumpyIndexSnapshotRepository(IIndexSnapshotRepository):
+    """Grava e lê snapshots no formato descrito no módulo"""
+
+    def __init__(self, distance_space: str = "cosine", embedding_model: str = ""):
+        """
+        Inicializa repositório de snapshots
+
+        Args:
+            distance_space: Métrica registrada no manifest
+            embedding_model: Modelo de embedding registrado no manifest
+        """
+        self.distance_space = distance_space
+        self.embedding_model = embedding_model
+
+    def write(self, path: str, chunks: Iterable[DocumentChunk]) -> int:
+        """Grava o snapshot em uma pasta temporária e a move ao final (atômico)"""
+        parent = os.path.dirname(os.path.abspath(path))
+        os.makedirs(parent, exist_ok=True)
+        tmp_dir = tempfile.mkdtemp(prefix=".snapshot_", dir=parent)
+
+        try:
+            count, dimension, dictionaries = self._write_columns(tmp_dir, chunks)
+
+            files = {
+                filename: {
+                    "sha256": _sha256(os.path.join(tmp_dir, filename)),
+                    "bytes": os.path.getsize(os.path.join(tmp_dir, filename))
+                }
+                for filename in sorted(os.listdir(tmp_dir))
+            }
+            manifest = {
+                "format": SNAPSHOT_FORMAT,
+                "version": SNAPSHOT_VERSION,
+                "created_at": datetime.now().isoformat(),
+                "count": count,
+                "dimension": dimension,
+                "dtype": "float32",
+                "distance_space": self.distance_space,
+                "embedding_model": self.embedding_model,
+                "dictionaries": dictionaries,
+                "files": files
+            }
+            with open(os.path.join(tmp_dir, "manifest.json"), "w", encoding="utf-8") as f:
+                json.dump(manifest, f, ensure_ascii=False, indent=2)
+
+            if os.path.exists(path):
+                shutil.rmtree(path)
+            os.replace(tmp_dir, path)
+            return count
+
+        except Exception:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            raise
+
+    def publish(self, root: str, chunks: Iterable[DocumentChunk]) -> Tuple[int, int]:
+        """Grava a próxima geração em root e troca o ponteiro CURRENT"""
+        return publish_generation(root, lambda path: self.write(path, chunks))
+
+    def _write_columns(self, directory: str, chunks: Iterable[DocumentChunk]):
+        """Grava as colunas em streaming; retorna (count, dimension, dictionaries)"""
+        raw_path = os.path.join(directory, "embeddings.raw")
+        int_values: Dict[str, List[int]] = {name: [] for name in INT_COLUMNS}
+        codes: Dict[str, List[int]] = {name: [] for name in DICTIONARY_COLUMNS}
+        dictionaries: Dict[str, List[str]] = {name: [] for name in DICTIONARY_COLUMNS}
+        dictionary_index: Dict[str, Dict[str, int]] = {name: {} for name in DICTIONARY_COLUMNS}
+        offsets: Dict[str, List[int]] = {name: [0] for name in STRING_COLUMNS}
+        norms: List[float] = []
+        dimension = 0
+        count = 0
+
+        blob_files = {
+            name: open(os.path.join(directory, f"{name}.bin"), "wb")
+            for name in STRING_COLUMNS
+        }
+        try:
+            with open(raw_path, "wb") as raw:
+                for chunk in chunks:
+                    vector = np.asarray(chunk.metadata["embedding"], dtype=np.float32)
+                    if dimension == 0:
+                        dimension = vector.shape[0]
+                    elif vector.shape[0] != dimension:
+                        raise ValueError(
+                            f"Dimensão inconsistente no chunk {chunk.id}: "
+                            f"{vector.shape[0]} (esperado {dimension})"
+                        )
+                    raw.write(vector.tobytes())
+                    norms.append(float(np.linalg.norm(vector)))
+
+                    for name, value in (("ids", chunk.id), ("text", chunk.content)):
+                        encoded = value.encode("utf-8")
+                        blob_files[name].write(encoded)
+                        offsets[name].append(offsets[name][-1] + len(encoded))
+
+                    int_values["chunk_id"].append(chunk.chunk_index)
+                    for name in ("page_start", "page_end", "ingested_at"):
+                        value = chunk.metadata.get(name)
+                        int_values[name].append(-1 if value is None else int(value))
+
+                    for name in DICTIONARY_COLUMNS:
+                        value = chunk.metadata.get(name)
+                        if value is None:
+                            codes[name].append(-1)
+                            continue
+                        if value not in dictionary_index[name]:
+                            dictionary_index[name][value] = len(dictionaries[name])
+                            dictionaries[name].append(value)
+                        codes[name].append(dictionary_index[name][value])
+
+                    count += 1
+        finally:
+            for blob in blob_files.values():
+                blob.close()
+
+        # Cabeçalho .npy + dados brutos (sem carregar a matriz inteira)
+        with open(os.path.join(directory, "embeddings.npy"), "wb") as f:
+            np.lib.format.write_array_header_1_0(f, {
+                "descr": np.lib.format.dtype_to_descr(np.dtype(np.float32)),
+                "fortran_order": False,
+                "shape": (count, dimension)
+            })
+            with open(raw_path, "rb") as raw:
+                shutil.copyfileobj(raw, f)
+        os.remove(raw_path)
+
+        np.save(os.path.join(directory, "norms.npy"), np.asarray(norms, dtype=np.float32))
+        for name, values in int_values.items():
+            np.save(os.path.join(directory, f"{name}.npy"), np.asarray(values, dtype=np.int64))
+        for name, values in codes.items():
+            np.save(os.path.join(directory, f"{name}.codes.npy"), np.asarray(values, dtype=np.int32))
+        for name, values in offsets.items():
+            np.save(os.path.join(directory, f"{name}.offsets.npy"), np.asarray(values, dtype=np.int64))
+
+        return count, dimension, dictionaries
+
+    def read(self, path: str) -> Iterator[List[DocumentChunk]]:
+        """Lê o snapshot (com verificação de checksums), uma fonte por vez"""
+        snapshot = IndexSnapshot(path, verify=True)
+        try:
+            snapshot.check_embedding_model(self.embedding_model)
+            current_key = None
+            current: List[DocumentChunk] = []
+
+            for index in range(len(snapshot)):
+                key = (
+                    int(snapshot.dictionary_codes["source"][index]),
+                    int(snapshot.dictionary_codes["tenant_id"][index])
+                )
+                if current and key != current_key:
+                    yield current
+                    current = []
+                current_key = key
+                current.append(snapshot.chunk(index))
+
+            if current:
+                yield current
+        finally:
+            snapshot.close()
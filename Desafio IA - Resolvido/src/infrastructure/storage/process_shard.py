@@ -0,0 +1,124 @@
+"""
+Shard vetorial executado em um processo separado
+"""
+import multiprocessing
+import threading
+from typing import Callable, Dict, List, Optional
+
+from src.domain.repositories import IVectorStoreRepository
+from src.domain.entities import DocumentChunk, SearchFilter
+
+
+def _serve(factory: Callable[[], IVectorStoreRepository], connection) -> None:
+    """Loop do processo worker: executa as chamadas recebidas pelo pipe"""
+    store = factory()
+
+    while True:
+        message = connection.recv()
+        if message is None:
+            break
+
+        method, args, kwargs = message
+        try:
+            connection.send(("ok", getattr(store, method)(*args, **kwargs)))
+        except Exception as e:
+            connection.send(("error", f"{type(e).__name__}: {str(e)}"))
+
+    connection.close()
+
+
+class ProcessVectorStoreShard(IVectorStoreRepository):
+    """
+    Proxy para um repositório vetorial que roda em outro processo
+
+    Cada shard tem seu próprio processo (e seu próprio cliente ChromaDB),
+    então consultas em shards diferentes não disputam o GIL.
+    """
+
+    def __init__(self, factory: Callable[[], IVectorStoreRepository]):
+        """
+        Inicia o processo worker
+
+        Args:
+            factory: Cria o repositório dentro do worker (precisa ser picklable,
+                ex: functools.partial(ChromaVectorStoreRepository, persist_directory=...))
+        """
+        context = multiprocessing.get_context("spawn")
+        self._connection, worker_connection = context.Pipe()
+        self._process = context.Process(
+            target=_serve,
+            args=(factory, worker_connection),
+            daemon=True
+        )
+        self._process.start()
+        self._lock = threading.Lock()
+
+    def _call(self, method: str, *args, **kwargs):
+        """Envia a chamada ao worker e aguarda a resposta"""
+        with self._lock:
+            self._connection.send((method, args, kwargs))
+            status, result = self._connection.recv()
+
+        if status == "error":
+            raise RuntimeError(f"Erro no shard (pid {self._process.pid}): {result}")
+        return result
+
+    def add_chunks(self, chunks: List[DocumentChunk]) -> None:
+        self._call("add_chunks", chunks)
+
+    def search_similar(
+        self,
+        query: str,
+        top_k: int = 5,
+        query_embedding: Optional[List[float]] = None,
+        search_filter: Optional[SearchFilter] = None
+    ) -> List[Dict]:
+        return self._call(
+            "search_similar",
+            query,
+            top_k=top_k,
+            query_embedding=query_embedding,
+            search_filter=search_filter
+        )
+
+    def search_similar_batch(
+        self,
+        query_embeddings: List[List[float]],
+        top_k: int = 5,
+        search_filter: Optional[SearchFilter] = None
+    ) -> List[List[Dict]]:
+        return self._call(
+            "search_similar_batch",
+            query_embeddings,
+            top_k=top_k,
+            search_filter=search_filter
+        )
+
+    def list_sources(self) -> List[str]:
+        return self._call("list_sources")
+
+    def get_chunks_by_source(self, source: str) -> List[DocumentChunk]:
+        return self._call("get_chunks_by_source", source)
+
+    def delete_by_source(self, source: str) -> bool:
+        return self._call("delete_by_source", source)
+
+    def count_chunks(self) -> int:
+        return self._call("count_chunks")
+
+    def clear(self) -> None:
+        self._call("clear")
+
+    def rebuild(self) -> int:
+        return self._call("rebuild")
+
+    def rebalance(self) -> int:
+        return self._call("rebalance")
+
+    def close(self) -> None:
+        """Encerra o processo worker"""
+        with self._lock:
+            if self._process.is_alive():
+                self._connection.send(None)
+                self._process.join(timeout=10)
+            self._connection.close()
@@ -0,0 +1,289 @@
+"""
+Índice com embeddings de dimensão reduzida (Matryoshka) e re-rank completo
+"""
+import os
+import sqlite3
+import threading
+from array import array
+from dataclasses import replace
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from src.domain.repositories import IVectorStoreRepository
+from src.domain.entities import DocumentChunk, SearchFilter
+
+
+def truncate_embedding(embedding: List[float], dimension: int) -> List[float]:
+    """Primeiras `dimension` coordenadas, renormalizadas (norma L2 = 1)"""
+    vector = np.asarray(embedding[:dimension], dtype=np.float32)
+    norm = float(np.linalg.norm(vector))
+    if norm > 0:
+        vector = vector / norm
+    return vector.tolist()
+
+
+class FullVectorStore:
+    """Embeddings completos em SQLite, por id de chunk (lidos só no re-rank)"""
+
+    def __init__(self, db_path: str):
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(db_path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.executescript("""
+            CREATE TABLE IF NOT EXISTS full_vectors (
+                id TEXT PRIMARY KEY,
+                source TEXT NOT NULL,
+                tenant_id TEXT NOT NULL DEFAULT '',
+                embedding BLOB NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_full_vectors_source
+                ON full_vectors (source, tenant_id);
+        """)
+
+    def replace_sources(self, chunks: List[DocumentChunk]) -> None:
+        """Substitui os vetores das fontes (e tenants) presentes em chunks"""
+        keys = {
+            (chunk.metadata.get("source", "unknown"), chunk.metadata.get("tenant_id") or "")
+            for chunk in chunks
+        }
+        rows = [
+            (
+                chunk.id,
+                chunk.metadata.get("source", "unknown"),
+                chunk.metadata.get("tenant_id") or "",
+                array("f", chunk.metadata["embedding"]).tobytes()
+            )
+            for chunk in chunks
+        ]
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "DELETE FROM full_vectors WHERE source = ? AND tenant_id = ?",
+                list(keys)
+            )
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO full_vectors (id, source, tenant_id, embedding) "
+                "VALUES (?, ?, ?, ?)",
+                rows
+            )
+
+    def get(self, ids: Iterable[str]) -> Dict[str, np.ndarray]:
+        """Vetores completos dos ids informados (ausentes são omitidos)"""
+        ids = list(ids)
+        vectors = {}
+        # Limite de variáveis por consulta do SQLite
+        for start in range(0, len(ids), 500):
+            batch = ids[start:start + 500]
+            placeholders = ",".join("?" * len(batch))
+            with self._lock:
+                rows = self._connection.execute(
+                    f"SELECT id, embedding FROM full_vectors WHERE id IN ({placeholders})",
+                    batch
+                ).fetchall()
+            for chunk_id, blob in rows:
+                vectors[chunk_id] = np.frombuffer(blob, dtype=np.float32)
+        return vectors
+
+    def delete_source(self, source: str) -> None:
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM full_vectors WHERE source = ?", (source,))
+
+    def clear(self) -> None:
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM full_vectors")
+
+
+class ReducedDimensionVectorStoreRepository(IVectorStoreRepository):
+    """
+    Decorador que indexa apenas as primeiras `dimension` coordenadas
+
+    Modelos treinados com Matryoshka (ex: text-embedding-004) concentram a
+    informação nas primeiras dimensões: o índice fica ~3x menor com 256 de
+    768 dimensões. A busca recupera `rerank_factor * top_k` candidatos no
+    índice reduzido e reordena com os vetores completos, guardados em disco.
+    """
+
+    def __init__(
+        self,
+        inner: IVectorStoreRepository,
+        dimension: int,
+        full_vectors: Optional[FullVectorStore] = None,
+        rerank_factor: int = 4,
+        distance_space: str = "cosine"
+    ):
+        """
+        Inicializa o decorador
+
+        Args:
+            inner: Repositório que armazena os vetores reduzidos
+            dimension: Dimensão indexada
+            full_vectors: Vetores completos para re-rank (None desativa)
+            rerank_factor: Candidatos por resultado no re-rank (<= 1 desativa)
+            distance_space: Métrica usada no re-rank (cosine, l2 ou ip)
+        """
+        if dimension <= 0:
+            raise ValueError("dimension deve ser positiva")
+
+        self.inner = inner
+        self.dimension = dimension
+        self.full_vectors = full_vectors
+        self.rerank_factor = rerank_factor
+        self.distance_space = distance_space
+
+    @property
+    def reranks(self) -> bool:
+        return self.full_vectors is not None and self.rerank_factor > 1
+
+    # ==========================================
+    # Escrita
+    # ==========================================
+
+    def add_chunks(self, chunks: List[DocumentChunk]) -> None:
+        """Grava vetores completos no disco e reduzidos no índice"""
+        if not chunks:
+            return
+
+        for chunk in chunks:
+            size = len(chunk.metadata["embedding"])
+            if size < self.dimension:
+                raise ValueError(
+                    f"Embedding do chunk {chunk.id} tem {size} dimensões "
+                    f"(menor que EMBEDDING_DIMENSION={self.dimension})"
+                )
+
+        if self.full_vectors is not None:
+            self.full_vectors.replace_sources(chunks)
+
+        self.inner.add_chunks([
+            replace(chunk, metadata={
+                **chunk.metadata,
+                "embedding": truncate_embedding(chunk.metadata["embedding"], self.dimension)
+            })
+            for chunk in chunks
+        ])
+
+    def delete_by_source(self, source: str) -> bool:
+        if self.full_vectors is not None:
+            self.full_vectors.delete_source(source)
+        return self.inner.delete_by_source(source)
+
+    def clear(self) -> None:
+        if self.full_vectors is not None:
+            self.full_vectors.clear()
+        self.inner.clear()
+
+    def count_chunks(self) -> int:
+        return self.inner.count_chunks()
+
+    def rebuild(self) -> int:
+        return self.inner.rebuild()
+
+    def rebalance(self) -> int:
+        return self.inner.rebalance()
+
+    def list_sources(self) -> List[str]:
+        return self.inner.list_sources()
+
+    def get_chunks_by_source(self, source: str) -> List[DocumentChunk]:
+        """Chunks com o embedding completo quando disponível (exportação)"""
+        chunks = self.inner.get_chunks_by_source(source)
+        if self.full_vectors is None:
+            return chunks
+
+        full = self.full_vectors.get(chunk.id for chunk in chunks)
+        return [
+            replace(chunk, metadata={**chunk.metadata, "embedding": full[chunk.id].tolist()})
+            if chunk.id in full else chunk
+            for chunk in chunks
+        ]
+
+    # ==========================================
+    # Busca
+    # ==========================================
+
+    def search_similar(
+        self,
+        query: str,
+        top_k: int = 5,
+        query_embedding: Optional[List[float]] = None,
+        search_filter: Optional[SearchFilter] = None
+    ) -> List[Dict]:
+        """Busca no índice reduzido e reordena com os vetores completos"""
+        if not query_embedding:
+            return self.inner.search_similar(query, top_k, search_filter=search_filter)
+
+        candidates = self.inner.search_similar(
+            query,
+            top_k=self._candidates(top_k),
+            query_embedding=truncate_embedding(query_embedding, self.dimension),
+            search_filter=search_filter
+        )
+        return self._rerank([(query_embedding, candidates)], top_k)[0]
+
+    def search_similar_batch(
+        self,
+        query_embeddings: List[List[float]],
+        top_k: int = 5,
+        search_filter: Optional[SearchFilter] = None
+    ) -> List[List[Dict]]:
+        """Busca em lote no índice reduzido e reordena cada query"""
+        if not query_embeddings:
+            return []
+
+        candidates = self.inner.search_similar_batch(
+            [truncate_embedding(embedding, self.dimension) for embedding in query_embeddings],
+            top_k=self._candidates(top_k),
+            search_filter=search_filter
+        )
+        return self._rerank(list(zip(query_embeddings, candidates)), top_k)
+
+    def _candidates(self, top_k: int) -> int:
+        return top_k * self.rerank_factor if self.reranks else top_k
+
+    def _rerank(
+        self,
+        queries: List[Tuple[List[float], List[Dict]]],
+        top_k: int
+    ) -> List[List[Dict]]:
+        """Recalcula as distâncias dos candidatos com os vetores completos"""
+        if not self.reranks:
+            return [candidates[:top_k] for _, candidates in queries]
+
+        full = self.full_vectors.get({
+            result["id"] for _, candidates in queries for result in candidates
+        })
+
+        reranked = []
+        for query_embedding, candidates in queries:
+            query = np.asarray(query_embedding, dtype=np.float32)
+            scored = []
+            for position, result in enumerate(candidates):
+                vector = full.get(result["id"])
+                distance = (
+                    self._distance(query, vector) if vector is not None
+                    else float("inf")  # Sem vetor completo: vai para o fim
+                )
+                scored.append((distance, position, result))
+
+            scored.sort(key=lambda item: (item[0], item[1]))
+            reranked.append([
+                {**result, "distance": distance if distance != float("inf") else result["distance"]}
+                for distance, _, result in scored[:top_k]
+            ])
+        return reranked
+
+    def _distance(self, query: np.ndarray, vector: np.ndarray) -> float:
+        """Distância na mesma convenção do ChromaDB (menor = mais próximo)"""
+        if self.distance_space == "ip":
+            return float(1.0 - query @ vector)
+        if self.distance_space == "l2":
+            difference = query - vector
+            return float(difference @ difference)
+        denominator = max(float(np.linalg.norm(query) * np.linalg.norm(vector)), 1e-12)
+        return float(1.0 - (query @ vector) / denominator)
+
+    def close(self) -> None:
+        close = getattr(self.inner, "close", None)
+        if close:
+            close()
@@ -0,0 +1,267 @@
+"""
+Repositório vetorial particionado (shards) com busca scatter-gather
+"""
+import hashlib
+import heapq
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+from src.domain.repositories import IVectorStoreRepository
+from src.domain.entities import DocumentChunk, SearchFilter
+
+
+class ShardedVectorStoreRepository(IVectorStoreRepository):
+    """
+    Distribui chunks entre N repositórios vetoriais
+
+    O particionamento é por fonte (documento) com rendezvous hashing: todos
+    os chunks de um documento ficam no mesmo shard, então leituras por
+    fonte vão direto ao shard dono, e adicionar um shard só move ~1/N das
+    fontes. Uma fonte fora do dono (mudança de topologia ainda não
+    rebalanceada) continua visível: a leitura recorre aos demais shards e a
+    remoção vale para todos. As buscas consultam todos os shards em
+    paralelo e fazem merge top-k.
+    """
+
+    def __init__(
+        self,
+        shards: Dict[str, IVectorStoreRepository],
+        max_workers: Optional[int] = None
+    ):
+        """
+        Inicializa repositório particionado
+
+        Args:
+            shards: Shards por nome estável (o nome entra no hash)
+            max_workers: Consultas simultâneas (padrão: um por shard)
+        """
+        if not shards:
+            raise ValueError("É necessário ao menos um shard")
+
+        self.shards: Dict[str, IVectorStoreRepository] = dict(shards)
+        self.max_workers = max_workers
+        self._executor = ThreadPoolExecutor(max_workers=max_workers or len(shards))
+        self._topology_lock = threading.Lock()
+
+    # ==========================================
+    # Roteamento
+    # ==========================================
+
+    def shard_for(self, source: str) -> str:
+        """Nome do shard dono da fonte (rendezvous hashing)"""
+        with self._topology_lock:
+            names = list(self.shards)
+
+        return max(
+            names,
+            key=lambda name: hashlib.sha1(f"{name}:{source}".encode("utf-8")).digest()
+        )
+
+    def add_chunks(self, chunks: List[DocumentChunk]) -> None:
+        """Envia cada chunk ao shard dono da sua fonte"""
+        chunks_by_shard: Dict[str, List[DocumentChunk]] = defaultdict(list)
+        for chunk in chunks:
+            source = chunk.metadata.get("source", "unknown")
+            chunks_by_shard[self.shard_for(source)].append(chunk)
+
+        with self._topology_lock:
+            shards = dict(self.shards)
+
+        for name, shard_chunks in chunks_by_shard.items():
+            shards[name].add_chunks(shard_chunks)
+
+    def delete_by_source(self, source: str) -> bool:
+        """Remove a fonte de todos os shards (inclusive cópias fora do dono)"""
+        return any(self._scatter(lambda shard: shard.delete_by_source(source)))
+
+    def count_chunks(self) -> int:
+        """Soma os chunks de todos os shards"""
+        return sum(self._scatter(lambda shard: shard.count_chunks()))
+
+    def clear(self) -> None:
+        """Limpa todos os shards"""
+        self._scatter(lambda shard: shard.clear())
+
+    def list_sources(self) -> List[str]:
+        """Lista as fontes de todos os shards"""
+        sources = set()
+        for shard_sources in self._scatter(lambda shard: shard.list_sources()):
+            sources.update(shard_sources)
+        return sorted(sources)
+
+    def get_chunks_by_source(self, source: str) -> List[DocumentChunk]:
+        """Lê os chunks da fonte no shard dono (ou nos demais, se ela estiver fora do dono)"""
+        owner = self.shard_for(source)
+        with self._topology_lock:
+            shards = dict(self.shards)
+
+        chunks = shards[owner].get_chunks_by_source(source)
+        if chunks:
+            return chunks
+
+        for name, shard in shards.items():
+            if name != owner:
+                chunks = shard.get_chunks_by_source(source)
+                if chunks:
+                    return chunks
+        return []
+
+    def rebuild(self) -> int:
+        """Reconstrói todos os shards"""
+        return sum(self._scatter(lambda shard: shard.rebuild()))
+
+    # ==========================================
+    # Busca (scatter-gather)
+    # ==========================================
+
+    def search_similar(
+        self,
+        query: str,
+        top_k: int = 5,
+        query_embedding: Optional[List[float]] = None,
+        search_filter: Optional[SearchFilter] = None
+    ) -> List[Dict]:
+        """Consulta todos os shards em paralelo e mantém os top_k mais próximos"""
+        shard_results = self._scatter(
+            lambda shard: shard.search_similar(
+                query=query,
+                top_k=top_k,
+                query_embedding=query_embedding,
+                search_filter=search_filter
+            )
+        )
+        return self._merge(shard_results, top_k)
+
+    def search_similar_batch(
+        self,
+        query_embeddings: List[List[float]],
+        top_k: int = 5,
+        search_filter: Optional[SearchFilter] = None
+    ) -> List[List[Dict]]:
+        """Busca em lote em cada shard e faz o merge por query"""
+        if not query_embeddings:
+            return []
+
+        shard_results = self._scatter(
+            lambda shard: shard.search_similar_batch(
+                query_embeddings=query_embeddings,
+                top_k=top_k,
+                search_filter=search_filter
+            )
+        )
+
+        return [
+            self._merge([results[i] for results in shard_results], top_k)
+            for i in range(len(query_embeddings))
+        ]
+
+    @staticmethod
+    def _merge(shard_results: List[List[Dict]], top_k: int) -> List[Dict]:
+        """Merge top-k por distância (heap), descartando ids duplicados"""
+        seen = set()
+        unique = []
+        for results in shard_results:
+            for result in results:
+                key = result.get("id") or (result["source"], result["text"])
+                if key in seen:
+                    continue  # Chunk em dois shards durante um rebalanceamento
+                seen.add(key)
+                unique.append(result)
+
+        return heapq.nsmallest(
+            top_k,
+            unique,
+            key=lambda result: (
+                result["distance"] if result["distance"] is not None else float("inf")
+            )
+        )
+
+    def _scatter(self, operation) -> list:
+        """Executa a operação em todos os shards em paralelo"""
+        with self._topology_lock:
+            shards = list(self.shards.values())
+            executor = self._executor
+        return list(executor.map(operation, shards))
+
+    # ==========================================
+    # Topologia
+    # ==========================================
+
+    def add_shard(self, name: str, shard: IVectorStoreRepository) -> int:
+        """
+        Adiciona um shard e rebalanceia online
+
+        O shard passa a receber escritas imediatamente; as fontes que mudaram
+        de dono são copiadas e só então removidas do shard antigo, então as
+        buscas continuam completas durante a migração.
+
+        Returns:
+            Quantidade de fontes movidas
+        """
+        with self._topology_lock:
+            if name in self.shards:
+                raise ValueError(f"Shard já existe: {name}")
+            self.shards[name] = shard
+            if self.max_workers is None:
+                # Um worker por shard: substitui o pool pelo novo tamanho
+                previous = self._executor
+                self._executor = ThreadPoolExecutor(max_workers=len(self.shards))
+                previous.shutdown(wait=False)
+
+        return self.rebalance()
+
+    def rebalance(self) -> int:
+        """
+        Move fontes que estão fora do shard dono
+
+        Returns:
+            Quantidade de fontes movidas
+        """
+        with self._topology_lock:
+            shards = dict(self.shards)
+
+        moved = 0
+        for name, shard in shards.items():
+            for source in shard.list_sources():
+                owner = self.shard_for(source)
+                if owner == name:
+                    continue
+
+                chunks = shard.get_chunks_by_source(source)
+                if chunks:
+                    # Copia antes de apagar: a fonte nunca fica invisível
+                    shards[owner].add_chunks(chunks)
+                shard.delete_by_source(source)
+                moved += 1
+
+        return moved
+
+    def absorb(self, store: IVectorStoreRepository) -> int:
+        """
+        Move as fontes de um índice fora da topologia para o shard dono
+
+        Usado com o índice não particionado de antes de VECTOR_STORE_SHARDS
+        ou com shards que saíram da topologia. Cada fonte é copiada antes de
+        ser removida da origem.
+
+        Returns:
+            Quantidade de fontes movidas
+        """
+        moved = 0
+        for source in store.list_sources():
+            chunks = store.get_chunks_by_source(source)
+            if chunks:
+                self.add_chunks(chunks)
+            store.delete_by_source(source)
+            moved += 1
+        return moved
+
+    def close(self) -> None:
+        """Libera o pool de threads e shards que mantêm processos"""
+        self._executor.shutdown(wait=True)
+        for shard in self.shards.values():
+            close = getattr(shard, "close", None)
+            if close:
+                close()
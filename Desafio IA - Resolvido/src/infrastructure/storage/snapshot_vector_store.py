@@ -0,0 +1,198 @@
+"""
+Repositório vetorial somente leitura servido direto de um snapshot
+"""
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from src.domain.repositories import IVectorStoreRepository
+from src.domain.entities import DocumentChunk, SearchFilter
+from src.infrastructure.storage.index_snapshot import IndexSnapshot
+
+
+class SnapshotVectorStoreRepository(IVectorStoreRepository):
+    """
+    Busca exata (força bruta) sobre o snapshot mapeado em memória
+
+    Abrir o repositório não lê os embeddings: as páginas do arquivo são
+    carregadas sob demanda pelo sistema operacional e compartilhadas entre
+    processos que abrem o mesmo snapshot. Uma réplica nova fica pronta assim
+    que o manifest é lido.
+    """
+
+    def __init__(
+        self,
+        snapshot_path: str,
+        verify: bool = False,
+        embedding_model: str = ""
+    ):
+        """
+        Abre o snapshot
+
+        Args:
+            snapshot_path: Pasta do snapshot
+            verify: Confere os checksums ao abrir (lê todos os arquivos)
+            embedding_model: Modelo de embeddings das queries (vazio = não verifica)
+        """
+        self.snapshot = IndexSnapshot(snapshot_path, verify=verify)
+        self.snapshot.check_embedding_model(embedding_model)
+
+    def add_chunks(self, chunks: List[DocumentChunk]) -> None:
+        raise RuntimeError("Snapshot é somente leitura: use --import-snapshot no ChromaDB")
+
+    def delete_by_source(self, source: str) -> bool:
+        raise RuntimeError("Snapshot é somente leitura")
+
+    def clear(self) -> None:
+        raise RuntimeError("Snapshot é somente leitura")
+
+    def count_chunks(self) -> int:
+        return len(self.snapshot)
+
+    # ==========================================
+    # Busca
+    # ==========================================
+
+    def search_similar(
+        self,
+        query: str,
+        top_k: int = 5,
+        query_embedding: Optional[List[float]] = None,
+        search_filter: Optional[SearchFilter] = None
+    ) -> List[Dict]:
+        """Busca chunks similares (requer o embedding da query)"""
+        if not query_embedding:
+            raise ValueError("Busca em snapshot requer query_embedding")
+        return self.search_similar_batch([query_embedding], top_k, search_filter)[0]
+
+    def search_similar_batch(
+        self,
+        query_embeddings: List[List[float]],
+        top_k: int = 5,
+        search_filter: Optional[SearchFilter] = None
+    ) -> List[List[Dict]]:
+        """Distâncias de todas as queries em uma multiplicação de matrizes"""
+        if not query_embeddings:
+            return []
+
+        rows = self._filter_rows(search_filter)
+        total = len(self.snapshot) if rows is None else rows.size
+        if total == 0 or top_k <= 0:
+            return [[] for _ in query_embeddings]
+
+        queries = np.asarray(query_embeddings, dtype=np.float32)
+        if queries.shape[1] > self.snapshot.dimension:
+            # Índice exportado com EMBEDDING_DIMENSION (sem re-rank): a query
+            # é truncada às primeiras dimensões e renormalizada, como os vetores
+            queries = queries[:, :self.snapshot.dimension]
+            queries /= np.maximum(np.linalg.norm(queries, axis=1, keepdims=True), 1e-12)
+        if queries.shape[1] != self.snapshot.dimension:
+            raise ValueError(
+                f"Dimensão da query ({queries.shape[1]}) difere do índice "
+                f"({self.snapshot.dimension})"
+            )
+
+        embeddings = self.snapshot.embeddings if rows is None else self.snapshot.embeddings[rows]
+        distances = self._distances(queries, embeddings, rows)
+
+        k = min(top_k, distances.shape[1])
+        results = []
+        for query_distances in distances:
+            nearest = np.argpartition(query_distances, k - 1)[:k]
+            nearest = nearest[np.argsort(query_distances[nearest])]
+            results.append([
+                self._format_result(
+                    int(rows[i]) if rows is not None else int(i),
+                    float(query_distances[i])
+                )
+                for i in nearest
+            ])
+        return results
+
+    def _distances(
+        self,
+        queries: np.ndarray,
+        embeddings: np.ndarray,
+        rows: Optional[np.ndarray]
+    ) -> np.ndarray:
+        """Distâncias na mesma convenção do ChromaDB (menor = mais próximo)"""
+        products = queries @ embeddings.T
+        space = self.snapshot.distance_space
+
+        if space == "ip":
+            return 1.0 - products
+
+        norms = self.snapshot.norms if rows is None else self.snapshot.norms[rows]
+        if space == "l2":
+            query_norms = np.einsum("ij,ij->i", queries, queries)[:, None]
+            return query_norms - 2.0 * products + (norms ** 2)[None, :]
+
+        query_norms = np.linalg.norm(queries, axis=1)[:, None]
+        denominator = np.maximum(query_norms * norms[None, :], 1e-12)
+        return 1.0 - products / denominator
+
+    def _filter_rows(self, search_filter: Optional[SearchFilter]) -> Optional[np.ndarray]:
+        """Índices das linhas que passam no filtro (None = todas)"""
+        if search_filter is None:
+            return None
+
+        # O snapshot é uma tabela única: o tenant sempre restringe as linhas,
+        # com ou sem partição no índice de origem
+        use_tenant = bool(search_filter.tenant_id)
+        if search_filter.is_empty and not use_tenant:
+            return None
+
+        snapshot = self.snapshot
+        mask = np.ones(len(snapshot), dtype=bool)
+
+        if use_tenant:
+            mask &= self._dictionary_mask("tenant_id", [search_filter.tenant_id])
+        if search_filter.sources:
+            mask &= self._dictionary_mask("source", search_filter.sources)
+        if search_filter.ingested_after is not None:
+            mask &= snapshot.int_columns["ingested_at"] >= int(search_filter.ingested_after.timestamp())
+        if search_filter.ingested_before is not None:
+            ingested_at = snapshot.int_columns["ingested_at"]
+            mask &= (ingested_at >= 0) & (ingested_at <= int(search_filter.ingested_before.timestamp()))
+        # Páginas: o chunk precisa ter interseção com o intervalo pedido
+        if search_filter.page_from is not None:
+            mask &= snapshot.int_columns["page_end"] >= search_filter.page_from
+        if search_filter.page_to is not None:
+            page_start = snapshot.int_columns["page_start"]
+            mask &= (page_start >= 0) & (page_start <= search_filter.page_to)
+
+        return np.flatnonzero(mask)
+
+    def _dictionary_mask(self, column: str, values) -> np.ndarray:
+        """Máscara das linhas cujo valor de dicionário está em values"""
+        dictionary = self.snapshot.dictionaries[column]
+        codes = [dictionary.index(value) for value in values if value in dictionary]
+        return np.isin(self.snapshot.dictionary_codes[column], codes)
+
+    def _format_result(self, index: int, distance: float) -> Dict:
+        return {
+            'id': self.snapshot.string("ids", index),
+            'text': self.snapshot.string("text", index),
+            'source': self.snapshot.dictionary_value("source", index) or 'unknown',
+            'distance': distance
+        }
+
+    # ==========================================
+    # Leitura por fonte
+    # ==========================================
+
+    def list_sources(self) -> List[str]:
+        return sorted(self.snapshot.dictionaries["source"])
+
+    def get_chunks_by_source(self, source: str) -> List[DocumentChunk]:
+        rows = np.flatnonzero(self._dictionary_mask("source", [source]))
+        return [self.snapshot.chunk(int(i)) for i in rows]
+
+    def rebuild(self) -> int:
+        raise NotImplementedError("Snapshot é somente leitura: reconstrua o índice de origem e exporte de novo")
+
+    def rebalance(self) -> int:
+        raise NotImplementedError("Snapshot é somente leitura: não há shards a rebalancear")
+
+    def close(self) -> None:
+        self.snapshot.close()
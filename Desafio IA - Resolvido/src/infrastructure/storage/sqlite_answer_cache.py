@@ -0,0 +1,75 @@
+"""
+Cache de respostas pré-calculadas em SQLite
+"""
+import json
+import os
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Dict, Optional
+
+from src.domain.repositories import IAnswerCacheRepository
+
+
+class SQLiteAnswerCacheRepository(IAnswerCacheRepository):
+    """
+    Respostas por chave de pergunta em SQLite
+
+    O arquivo é compartilhado entre processos (CLI que aquece o cache e
+    interface web que o consulta); em modo WAL a leitura não bloqueia a
+    troca do conteúdo, que é feita em uma única transação.
+    """
+
+    def __init__(self, db_path: str = "./cache/answers.db"):
+        """
+        Abre (ou cria) o cache
+
+        Args:
+            db_path: Caminho do arquivo SQLite
+        """
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(db_path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("""
+            CREATE TABLE IF NOT EXISTS answers (
+                key TEXT PRIMARY KEY,
+                answer TEXT NOT NULL,
+                created_at TEXT NOT NULL
+            )
+        """)
+
+    def get(self, key: str) -> Optional[Dict]:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT answer FROM answers WHERE key = ?",
+                (key,)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def replace_all(self, entries: Dict[str, Dict]) -> None:
+        created_at = datetime.now().isoformat()
+        rows = [
+            (key, json.dumps(answer, ensure_ascii=False), created_at)
+            for key, answer in entries.items()
+        ]
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM answers")
+            self._connection.executemany(
+                "INSERT INTO answers (key, answer, created_at) VALUES (?, ?, ?)",
+                rows
+            )
+
+    def clear(self) -> None:
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM answers")
+
+    def count(self) -> int:
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM answers").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
@@ -0,0 +1,302 @@
+"""
+Repositório de documentos persistente em SQLite
+"""
+import json
+import os
+import sqlite3
+import threading
+from array import array
+from collections.abc import Sequence
+from datetime import datetime
+from typing import Iterator, List, Optional
+
+from src.domain.repositories import IDocumentRepository
+from src.domain.entities import Document, DocumentChunk
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    id TEXT PRIMARY KEY,
+    filename TEXT NOT NULL,
+    content TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    metadata TEXT,
+    chunk_count INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_documents_filename ON documents (filename);
+
+CREATE TABLE IF NOT EXISTS chunks (
+    document_id TEXT NOT NULL,
+    chunk_index INTEGER NOT NULL,
+    id TEXT NOT NULL,
+    content TEXT NOT NULL,
+    metadata TEXT NOT NULL,
+    embedding BLOB,
+    PRIMARY KEY (document_id, chunk_index)
+);
+CREATE INDEX IF NOT EXISTS idx_chunks_id ON chunks (id);
+"""
+
+
+class LazyChunkList(Sequence):
+    """
+    Chunks de um documento lidos do banco sob demanda
+
+    Só a quantidade é conhecida na criação; texto, metadados e embedding de
+    cada chunk são carregados no acesso (índice ou iteração) e não ficam
+    retidos pela lista.
+    """
+
+    def __init__(self, repository: "SQLiteDocumentRepository", document_id: str, count: int):
+        self._repository = repository
+        self._document_id = document_id
+        self._count = count
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._count))]
+
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("Índice de chunk fora do intervalo")
+
+        chunk = self._repository._load_chunk(self._document_id, index)
+        if chunk is None:
+            raise IndexError(f"Chunk {index} não encontrado (documento removido?)")
+        return chunk
+
+    def __iter__(self) -> Iterator[DocumentChunk]:
+        return self._repository._iter_chunks(self._document_id)
+
+    def __repr__(self) -> str:
+        return f"LazyChunkList(document_id={self._document_id!r}, count={self._count})"
+
+
+class LazyDocument(Document):
+    """
+    Documento cujo texto completo é lido do banco no primeiro acesso
+
+    Listagens e buscas trazem só id, nome, data e metadados; `content` é
+    carregado (e guardado no objeto) quando alguém o lê.
+    """
+
+    def __init__(self, repository: "SQLiteDocumentRepository", **fields):
+        self._repository = repository
+        self._content: Optional[str] = None
+        super().__init__(content=None, **fields)
+
+    def __post_init__(self):
+        # O texto foi validado no save; não é lido só para validar de novo
+        if not self.filename:
+            raise ValueError("Filename não pode ser vazio")
+
+    @property
+    def content(self) -> str:
+        if self._content is None:
+            content = self._repository._load_content(self.id)
+            if content is None:
+                raise LookupError(f"Documento {self.id} não encontrado (removido?)")
+            self._content = content
+        return self._content
+
+    @content.setter
+    def content(self, value: Optional[str]) -> None:
+        self._content = value
+
+
+class SQLiteDocumentRepository(IDocumentRepository):
+    """
+    Documentos e chunks em SQLite
+
+    O estado da ingestão sobrevive a reinícios e nada fica em memória além
+    do documento consultado. Cada save é uma única transação com inserção
+    em lote dos chunks; embeddings são gravados como float32 binário.
+    Consultas não leem o texto completo nem os chunks (ver LazyDocument).
+    """
+
+    _DOCUMENT_COLUMNS = "id, filename, created_at, metadata, chunk_count"
+    _CHUNK_COLUMNS = "id, chunk_index, content, metadata, embedding"
+
+    def __init__(self, db_path: str = "./documents.db"):
+        """
+        Abre (ou cria) o banco
+
+        Args:
+            db_path: Caminho do arquivo SQLite
+        """
+        directory = os.path.dirname(os.path.abspath(db_path))
+        os.makedirs(directory, exist_ok=True)
+
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        # Streamlit executa reruns em threads diferentes; o lock serializa o acesso
+        self._connection = sqlite3.connect(db_path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.executescript(_SCHEMA)
+
+    def save(self, document: Document) -> None:
+        """Salva documento e chunks em uma transação (substitui versão anterior)"""
+        chunk_rows = [
+            (
+                document.id,
+                chunk.chunk_index,
+                chunk.id,
+                chunk.content,
+                json.dumps(
+                    {key: value for key, value in chunk.metadata.items() if key != "embedding"},
+                    ensure_ascii=False
+                ),
+                self._pack_embedding(chunk.metadata.get("embedding"))
+            )
+            for chunk in document.chunks
+        ]
+
+        with self._lock, self._connection:
+            self._connection.execute(
+                "DELETE FROM chunks WHERE document_id = ?",
+                (document.id,)
+            )
+            self._connection.execute(
+                "INSERT OR REPLACE INTO documents "
+                "(id, filename, content, created_at, metadata, chunk_count) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    document.id,
+                    document.filename,
+                    document.content,
+                    document.created_at.isoformat(),
+                    json.dumps(document.metadata, ensure_ascii=False)
+                    if document.metadata is not None else None,
+                    len(chunk_rows)
+                )
+            )
+            self._connection.executemany(
+                "INSERT INTO chunks "
+                "(document_id, chunk_index, id, content, metadata, embedding) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                chunk_rows
+            )
+
+    def find_by_id(self, document_id: str) -> Optional[Document]:
+        """Busca por ID (texto e chunks carregados sob demanda)"""
+        return self._find_one("WHERE id = ?", (document_id,))
+
+    def find_by_filename(self, filename: str) -> Optional[Document]:
+        """Busca por nome de arquivo (texto e chunks carregados sob demanda)"""
+        return self._find_one("WHERE filename = ? ORDER BY created_at DESC", (filename,))
+
+    def find_all(self) -> List[Document]:
+        """Retorna todos (texto e chunks carregados sob demanda)"""
+        with self._lock:
+            rows = self._connection.execute(
+                f"SELECT {self._DOCUMENT_COLUMNS} FROM documents ORDER BY created_at"
+            ).fetchall()
+        return [self._to_document(row) for row in rows]
+
+    def delete(self, document_id: str) -> bool:
+        """Remove documento e chunks"""
+        with self._lock, self._connection:
+            self._connection.execute(
+                "DELETE FROM chunks WHERE document_id = ?",
+                (document_id,)
+            )
+            cursor = self._connection.execute(
+                "DELETE FROM documents WHERE id = ?",
+                (document_id,)
+            )
+        return cursor.rowcount > 0
+
+    def count(self) -> int:
+        """Conta documentos"""
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM documents").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    # ==========================================
+    # Leitura
+    # ==========================================
+
+    def _find_one(self, where: str, params: tuple) -> Optional[Document]:
+        with self._lock:
+            row = self._connection.execute(
+                f"SELECT {self._DOCUMENT_COLUMNS} FROM documents {where} LIMIT 1",
+                params
+            ).fetchone()
+        return self._to_document(row) if row else None
+
+    def _to_document(self, row) -> Document:
+        document_id, filename, created_at, metadata, chunk_count = row
+        return LazyDocument(
+            self,
+            id=document_id,
+            filename=filename,
+            chunks=LazyChunkList(self, document_id, chunk_count),
+            created_at=datetime.fromisoformat(created_at),
+            metadata=json.loads(metadata) if metadata else None
+        )
+
+    def _load_content(self, document_id: str) -> Optional[str]:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT content FROM documents WHERE id = ?",
+                (document_id,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def _load_chunk(self, document_id: str, chunk_index: int) -> Optional[DocumentChunk]:
+        with self._lock:
+            row = self._connection.execute(
+                f"SELECT {self._CHUNK_COLUMNS} FROM chunks "
+                "WHERE document_id = ? AND chunk_index = ?",
+                (document_id, chunk_index)
+            ).fetchone()
+        return self._to_chunk(row) if row else None
+
+    def _iter_chunks(self, document_id: str) -> Iterator[DocumentChunk]:
+        """Itera os chunks em páginas (não materializa a lista inteira)"""
+        last_index = -1
+        while True:
+            with self._lock:
+                rows = self._connection.execute(
+                    f"SELECT {self._CHUNK_COLUMNS} FROM chunks "
+                    "WHERE document_id = ? AND chunk_index > ? "
+                    "ORDER BY chunk_index LIMIT 64",
+                    (document_id, last_index)
+                ).fetchall()
+            if not rows:
+                return
+            for row in rows:
+                yield self._to_chunk(row)
+            last_index = rows[-1][1]
+
+    def _to_chunk(self, row) -> DocumentChunk:
+        chunk_id, chunk_index, content, metadata, embedding = row
+        metadata = json.loads(metadata)
+        if embedding is not None:
+            metadata["embedding"] = self._unpack_embedding(embedding)
+        return DocumentChunk(
+            id=chunk_id,
+            content=content,
+            chunk_index=chunk_index,
+            metadata=metadata
+        )
+
+    @staticmethod
+    def _pack_embedding(embedding) -> Optional[bytes]:
+        if embedding is None:
+            return None
+        return array("f", embedding).tobytes()
+
+    @staticmethod
+    def _unpack_embedding(blob: bytes) -> List[float]:
+        values = array("f")
+        values.frombytes(blob)
+        return values.tolist()
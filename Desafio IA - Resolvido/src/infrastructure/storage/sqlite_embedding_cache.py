@@ -0,0 +1,79 @@
+"""
+Cache de embeddings em SQLite
+"""
+import hashlib
+import os
+import sqlite3
+import threading
+from typing import List, Optional
+
+import numpy as np
+
+from src.domain.repositories import IEmbeddingCacheRepository
+
+
+class SQLiteEmbeddingCacheRepository(IEmbeddingCacheRepository):
+    """
+    Embeddings por hash de (modelo, texto) em SQLite
+
+    Os vetores ficam em float32 (BLOB). A chave inclui o identificador do
+    modelo, então trocar o modelo ou a dimensão não reaproveita vetores.
+    """
+
+    # Limite de parâmetros por consulta do SQLite
+    LOOKUP_BATCH = 500
+
+    def __init__(self, db_path: str = "./cache/embeddings.db"):
+        """
+        Abre (ou cria) o cache
+
+        Args:
+            db_path: Caminho do arquivo SQLite
+        """
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(db_path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("""
+            CREATE TABLE IF NOT EXISTS embeddings (
+                key TEXT PRIMARY KEY,
+                vector BLOB NOT NULL
+            )
+        """)
+
+    def get_many(self, model_id: str, texts: List[str]) -> List[Optional[List[float]]]:
+        keys = [self._key(model_id, text) for text in texts]
+        found = {}
+        with self._lock:
+            for start in range(0, len(keys), self.LOOKUP_BATCH):
+                batch = keys[start:start + self.LOOKUP_BATCH]
+                found.update(self._connection.execute(
+                    f"SELECT key, vector FROM embeddings WHERE key IN ({','.join('?' * len(batch))})",
+                    batch
+                ).fetchall())
+
+        return [
+            np.frombuffer(found[key], dtype=np.float32).tolist() if key in found else None
+            for key in keys
+        ]
+
+    def put_many(self, model_id: str, texts: List[str], embeddings: List[List[float]]) -> None:
+        rows = [
+            (self._key(model_id, text), np.asarray(embedding, dtype=np.float32).tobytes())
+            for text, embedding in zip(texts, embeddings)
+        ]
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)",
+                rows
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    @staticmethod
+    def _key(model_id: str, text: str) -> str:
+        return hashlib.sha1(f"{model_id}\0{text}".encode("utf-8")).hexdigest()
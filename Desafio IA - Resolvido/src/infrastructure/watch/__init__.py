@@ -0,0 +1,11 @@
+"""Folder Watching"""
+from .inotify_watcher import InotifyFolderWatcher, is_inotify_available
+from .polling_watcher import PollingFolderWatcher
+from .factory import create_folder_watcher
+
+__all__ = [
+    'InotifyFolderWatcher',
+    'PollingFolderWatcher',
+    'create_folder_watcher',
+    'is_inotify_available'
+]
@@ -0,0 +1,36 @@
+"""
+Escolha do observador de pasta
+"""
+from src.domain.repositories import IFolderWatcher
+from src.infrastructure.watch.inotify_watcher import InotifyFolderWatcher, is_inotify_available
+from src.infrastructure.watch.polling_watcher import PollingFolderWatcher
+
+
+def create_folder_watcher(
+    folder: str,
+    suffix: str = ".pdf",
+    poll_interval: float = 2.0,
+    backend: str = "auto"
+) -> IFolderWatcher:
+    """
+    Cria o observador da pasta
+
+    Args:
+        folder: Pasta observada
+        suffix: Extensão dos arquivos observados
+        poll_interval: Intervalo da varredura (apenas polling)
+        backend: auto (inotify quando disponível), inotify ou polling
+    """
+    if backend not in ("auto", "inotify", "polling"):
+        raise ValueError(f"WATCH_BACKEND desconhecido: {backend}")
+
+    if backend == "inotify" or (backend == "auto" and is_inotify_available()):
+        try:
+            return InotifyFolderWatcher(folder, suffix=suffix)
+        except OSError as e:
+            if backend == "inotify":
+                raise
+            # Ex.: limite de watches atingido ou sistema de arquivos de rede
+            print(f"[AVISO] inotify indisponível ({str(e)}); usando varredura periódica")
+
+    return PollingFolderWatcher(folder, suffix=suffix, interval=poll_interval)
@@ -0,0 +1,141 @@
+"""
+Observador de pasta com inotify (Linux), via ctypes sobre a libc
+"""
+import ctypes
+import ctypes.util
+import errno
+import os
+import select
+import struct
+import sys
+from typing import List, Optional, Tuple
+
+from src.domain.repositories import IFolderWatcher
+
+
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_Q_OVERFLOW = 0x00004000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = os.O_NONBLOCK
+IN_CLOEXEC = 0o2000000
+
+_WATCH_MASK = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+_EVENT_HEADER = struct.Struct("iIII")  # wd, mask, cookie, len
+_READ_SIZE = 64 * 1024
+
+_libc = None
+
+
+def _load_libc() -> Optional[ctypes.CDLL]:
+    global _libc
+    if _libc is None and sys.platform.startswith("linux"):
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+            libc.inotify_init1, libc.inotify_add_watch  # AttributeError se ausentes
+            _libc = libc
+        except (OSError, AttributeError):
+            _libc = False
+    return _libc or None
+
+
+def is_inotify_available() -> bool:
+    """Verifica se a plataforma oferece inotify"""
+    return _load_libc() is not None
+
+
+class InotifyFolderWatcher(IFolderWatcher):
+    """
+    Recebe do kernel as mudanças dos arquivos da pasta (sem varreduras)
+
+    Criação e escrita viram "modified" a cada bloco gravado (o debounce de
+    quem consome decide quando o arquivo está pronto); renomear para dentro
+    da pasta é "created" e para fora, "deleted". Se a fila do kernel
+    transbordar, a pasta é relida e todos os arquivos são reportados.
+    """
+
+    def __init__(self, folder: str, suffix: str = ".pdf"):
+        """
+        Inicia a observação
+
+        Args:
+            folder: Pasta observada
+            suffix: Extensão dos arquivos observados
+
+        Raises:
+            OSError: inotify indisponível ou pasta inexistente
+        """
+        libc = _load_libc()
+        if libc is None:
+            raise OSError("inotify indisponível nesta plataforma")
+
+        self.folder = folder
+        self.suffix = suffix.lower()
+        self._fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self._fd < 0:
+            raise self._error("inotify_init1")
+
+        if libc.inotify_add_watch(self._fd, os.fsencode(folder), _WATCH_MASK) < 0:
+            error = self._error(f"inotify_add_watch({folder})")
+            os.close(self._fd)
+            raise error
+
+    def poll(self, timeout: float) -> List[Tuple[str, str]]:
+        readable, _, _ = select.select([self._fd], [], [], max(timeout, 0.0))
+        if not readable:
+            return []
+
+        try:
+            data = os.read(self._fd, _READ_SIZE)
+        except BlockingIOError:
+            return []
+
+        events = []
+        offset = 0
+        while offset + _EVENT_HEADER.size <= len(data):
+            _, mask, _, length = _EVENT_HEADER.unpack_from(data, offset)
+            offset += _EVENT_HEADER.size
+            name = data[offset:offset + length].rstrip(b"\0")
+            offset += length
+
+            if mask & IN_Q_OVERFLOW:
+                events.extend(self._rescan())
+                continue
+            if mask & IN_ISDIR or not name:
+                continue
+
+            filename = os.fsdecode(name)
+            if filename.startswith(".") or not filename.lower().endswith(self.suffix):
+                continue
+
+            path = os.path.join(self.folder, filename)
+            if mask & (IN_DELETE | IN_MOVED_FROM):
+                events.append(("deleted", path))
+            elif mask & IN_MOVED_TO:
+                events.append(("created", path))
+            else:
+                events.append(("modified", path))
+
+        return events
+
+    def close(self) -> None:
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+    def _rescan(self) -> List[Tuple[str, str]]:
+        """Eventos perdidos: reporta todos os arquivos atuais"""
+        return [
+            ("modified", entry.path)
+            for entry in os.scandir(self.folder)
+            if not entry.name.startswith(".") and entry.name.lower().endswith(self.suffix)
+        ]
+
+    @staticmethod
+    def _error(operation: str) -> OSError:
+        code = ctypes.get_errno()
+        return OSError(code, f"{operation}: {os.strerror(code or errno.EIO)}")
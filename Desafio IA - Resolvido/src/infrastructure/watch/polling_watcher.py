@@ -0,0 +1,71 @@
+"""
+Observador de pasta por varredura periódica (qualquer plataforma)
+"""
+import os
+import time
+from typing import Dict, List, Tuple
+
+from src.domain.repositories import IFolderWatcher
+
+
+class PollingFolderWatcher(IFolderWatcher):
+    """
+    Compara (mtime, tamanho) dos arquivos da pasta a cada `interval` segundos
+
+    Alternativa ao inotify: custa um stat por arquivo a cada varredura, sem
+    ler o conteúdo.
+    """
+
+    def __init__(self, folder: str, suffix: str = ".pdf", interval: float = 2.0):
+        """
+        Inicializa o observador
+
+        Args:
+            folder: Pasta observada
+            suffix: Extensão dos arquivos observados
+            interval: Intervalo entre varreduras (s)
+        """
+        self.folder = folder
+        self.suffix = suffix.lower()
+        self.interval = interval
+        self._files = self._scan()
+        self._next_scan = time.monotonic() + interval
+
+    def poll(self, timeout: float) -> List[Tuple[str, str]]:
+        delay = self._next_scan - time.monotonic()
+        if delay > timeout:
+            time.sleep(max(timeout, 0.0))
+            return []
+        if delay > 0:
+            time.sleep(delay)
+        self._next_scan = time.monotonic() + self.interval
+
+        files = self._scan()
+        events = []
+        for path, signature in files.items():
+            previous = self._files.get(path)
+            if previous is None:
+                events.append(("created", path))
+            elif previous != signature:
+                events.append(("modified", path))
+        events.extend(("deleted", path) for path in self._files.keys() - files.keys())
+
+        self._files = files
+        return events
+
+    def _scan(self) -> Dict[str, Tuple[int, int]]:
+        files = {}
+        try:
+            entries = list(os.scandir(self.folder))
+        except FileNotFoundError:
+            return files
+
+        for entry in entries:
+            if entry.name.startswith(".") or not entry.name.lower().endswith(self.suffix):
+                continue
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            files[entry.path] = (stat.st_mtime_ns, stat.st_size)
+        return files
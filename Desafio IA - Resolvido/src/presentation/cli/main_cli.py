@@ -3,14 +3,41 @@ Interface CLI - Clean Architecture
 """
 import argparse
 import os
+import random
 import json
-from typing import Optional
+from dataclasses import replace
+from datetime import datetime
+from typing import TYPE_CHECKING, Callable, Iterable, List, Optional, Tuple
 
-from src.application.use_cases import ProcessDocumentsUseCase, AskQuestionUseCase
+from src.domain.entities import SearchFilter
+from src.application.use_cases import (
+    ProcessDocumentsUseCase,
+    AskQuestionUseCase,
+    ManageIndexUseCase,
+    BenchmarkDimensionsUseCase,
+    WarmAnswerCacheUseCase,
+    ReplayTrafficUseCase,
+    CalibratePDFBackendsUseCase,
+    WatchDocumentsUseCase,
+    TuneRetrievalUseCase
+)
 from src.application.dtos import (
     ProcessDocumentInputDTO,
-    AskQuestionInputDTO
+    AskQuestionInputDTO,
+    DimensionBenchmarkInputDTO,
+    WarmCacheInputDTO,
+    ReplayInputDTO,
+    PDFCalibrationInputDTO,
+    TuningExampleDTO,
+    RetrievalTuningInputDTO,
+    WatchInputDTO,
+    WatchEventDTO
 )
+from src.presentation.cli.profiler import CLIProfiler
+
+if TYPE_CHECKING:
+    # Só para anotação: o servidor é criado pela server_factory (--serve)
+    from src.presentation.server import PreforkServer
 
 
 class MainCLI:
@@ -20,7 +47,21 @@ class MainCLI:
         self,
         process_use_case: ProcessDocumentsUseCase,
         ask_use_case: AskQuestionUseCase,
-        docs_folder: str = "./dados"
+        docs_folder: str = "./dados",
+        index_use_case: Optional[ManageIndexUseCase] = None,
+        benchmark_use_case: Optional[BenchmarkDimensionsUseCase] = None,
+        warm_cache_use_case: Optional[WarmAnswerCacheUseCase] = None,
+        warm_cache_input: Optional[WarmCacheInputDTO] = None,
+        replay_use_case: Optional[ReplayTrafficUseCase] = None,
+        calibrate_pdf_use_case: Optional[CalibratePDFBackendsUseCase] = None,
+        tune_retrieval_use_case: Optional[TuneRetrievalUseCase] = None,
+        chunk_size: int = 1000,
+        chunk_overlap: int = 200,
+        watch_use_case: Optional[WatchDocumentsUseCase] = None,
+        watch_input: Optional[WatchInputDTO] = None,
+        server_factory: Optional[Callable[..., "PreforkServer"]] = None,
+        index_generations_path: str = "./snapshots/generations",
+        publish_index_on_ingest: bool = False
     ):
         """
         Inicializa CLI
@@ -29,28 +70,167 @@ class MainCLI:
             process_use_case: Caso de uso de processamento
             ask_use_case: Caso de uso de perguntas
             docs_folder: Pasta de documentos
+            index_use_case: Caso de uso de manutenção do índice
+            benchmark_use_case: Caso de uso de comparação de dimensões
+            warm_cache_use_case: Caso de uso de aquecimento do cache de respostas
+            warm_cache_input: Limites do aquecimento
+            replay_use_case: Caso de uso de replay de tráfego (teste de carga)
+            calibrate_pdf_use_case: Caso de uso de calibração dos backends de PDF
+            tune_retrieval_use_case: Caso de uso de ajuste de chunking e top_k
+            chunk_size: Tamanho dos chunks na ingestão (CHUNK_SIZE)
+            chunk_overlap: Sobreposição entre chunks (CHUNK_OVERLAP)
+            watch_use_case: Caso de uso de ingestão contínua da pasta
+            watch_input: Debounce e concorrência da observação
+            server_factory: Cria o servidor HTTP multi-worker (host, port, workers)
+            index_generations_path: Pasta das gerações publicadas do índice
+            publish_index_on_ingest: Publica uma geração ao fim de --process
         """
         self.process_use_case = process_use_case
         self.ask_use_case = ask_use_case
         self.docs_folder = docs_folder
+        self.index_use_case = index_use_case
+        self.benchmark_use_case = benchmark_use_case
+        self.warm_cache_use_case = warm_cache_use_case
+        self.warm_cache_input = warm_cache_input
+        self.replay_use_case = replay_use_case
+        self.calibrate_pdf_use_case = calibrate_pdf_use_case
+        self.tune_retrieval_use_case = tune_retrieval_use_case
+        self.chunk_size = chunk_size
+        self.chunk_overlap = chunk_overlap
+        self.watch_use_case = watch_use_case
+        self.watch_input = watch_input or WatchInputDTO(folder=docs_folder)
+        self.server_factory = server_factory
+        self.index_generations_path = index_generations_path
+        self.publish_index_on_ingest = publish_index_on_ingest
+        self.search_filter: Optional[SearchFilter] = None
+        self.user_id: Optional[str] = None
+        self.fast_mode: Optional[bool] = None
+        self.deadline_ms: Optional[float] = None
 
     def run(self, args: Optional[list] = None):
         """Executa CLI"""
         parser = self._create_parser()
         parsed_args = parser.parse_args(args)
 
-        if parsed_args.ask is not None:
-            if parsed_args.ask:
-                self._ask_question_command(parsed_args.ask)
-            else:
-                self._ask_question_command(None)
+        try:
+            self.search_filter = self._parse_search_filter(parsed_args)
+        except ValueError as e:
+            parser.error(str(e))
+        self.user_id = parsed_args.user_id
+        self.fast_mode = parsed_args.fast_mode
+        self.deadline_ms = parsed_args.deadline_ms
 
-        elif parsed_args.interactive:
-            self._interactive_mode()
+        command_name, command = self._select_command(parsed_args)
 
-        else:
+        if command is None:
             parser.print_help()
             self._print_examples()
+            return
+
+        if parsed_args.profile or parsed_args.trace_memory:
+            profiler = CLIProfiler(
+                output_dir=parsed_args.profile_dir,
+                cpu=parsed_args.profile,
+                memory=parsed_args.trace_memory
+            )
+            with profiler.session(command_name):
+                command()
+            profiler.print_summary()
+        else:
+            command()
+
+    def _select_command(
+        self,
+        parsed_args: argparse.Namespace
+    ) -> Tuple[str, Optional[Callable[[], None]]]:
+        """Seleciona o comando a executar a partir dos argumentos"""
+        if parsed_args.process:
+            return "process", self._process_documents_command
+
+        if parsed_args.watch:
+            return "watch", self._watch_command
+
+        if parsed_args.warm_cache:
+            return "warm_cache", self._warm_cache_command
+
+        if parsed_args.rebuild_index:
+            return "rebuild_index", self._rebuild_index_command
+
+        if parsed_args.rebalance_shards:
+            return "rebalance_shards", self._rebalance_shards_command
+
+        if parsed_args.benchmark_dimensions:
+            return "benchmark_dimensions", lambda: self._benchmark_dimensions_command(
+                parsed_args.benchmark_dimensions,
+                parsed_args.top_k,
+                parsed_args.rerank_factor
+            )
+
+        if parsed_args.calibrate_pdf:
+            return "calibrate_pdf", lambda: self._calibrate_pdf_command(
+                parsed_args.calibrate_sample,
+                parsed_args.min_parity
+            )
+
+        if parsed_args.tune_retrieval:
+            return "tune_retrieval", lambda: self._tune_retrieval_command(
+                parsed_args.tune_retrieval,
+                parsed_args.tune_chunk_sizes,
+                parsed_args.tune_overlaps,
+                parsed_args.tune_top_k,
+                apply=not parsed_args.tune_dry_run
+            )
+
+        if parsed_args.replay:
+            return "replay", lambda: self._replay_command(ReplayInputDTO(
+                log_path=parsed_args.replay,
+                rate_scale=parsed_args.replay_rate,
+                virtual_users=parsed_args.virtual_users,
+                limit=parsed_args.replay_limit
+            ))
+
+        if parsed_args.export_snapshot:
+            return "export_snapshot", lambda: self._snapshot_command(
+                "EXPORTANDO SNAPSHOT",
+                lambda: self.index_use_case.export_snapshot(parsed_args.export_snapshot)
+            )
+
+        if parsed_args.import_snapshot:
+            return "import_snapshot", lambda: self._snapshot_command(
+                "IMPORTANDO SNAPSHOT",
+                lambda: self.index_use_case.import_snapshot(parsed_args.import_snapshot)
+            )
+
+        if parsed_args.publish_index:
+            return "publish_index", self._publish_index_command
+
+        if parsed_args.serve:
+            return "serve", lambda: self._serve_command(
+                parsed_args.host,
+                parsed_args.port,
+                parsed_args.workers
+            )
+
+        if parsed_args.ask_file:
+            return "ask_file", lambda: self._ask_file_command(
+                parsed_args.ask_file,
+                parsed_args.out,
+                parsed_args.batch_size,
+                parsed_args.concurrency
+            )
+
+        if parsed_args.ask is not None:
+            return "ask", lambda: self._ask_question_command(parsed_args.ask or None)
+
+        if parsed_args.script:
+            return "interactive", lambda: self._interactive_mode(
+                self._read_script(parsed_args.script)
+            )
+
+        if parsed_args.interactive:
+            return "interactive", self._interactive_mode
+
+        return "", None
 
     def _create_parser(self) -> argparse.ArgumentParser:
         """Cria parser de argumentos"""
@@ -71,8 +251,317 @@ class MainCLI:
             help='Modo interativo'
         )
 
+        parser.add_argument(
+            '--source',
+            action='append',
+            metavar='ARQUIVO.pdf',
+            help='Restringe a busca a este documento (pode repetir)'
+        )
+
+        parser.add_argument(
+            '--pages',
+            metavar='INICIO-FIM',
+            help='Restringe a busca a um intervalo de páginas (ex: 3-10)'
+        )
+
+        parser.add_argument(
+            '--since',
+            metavar='AAAA-MM-DD',
+            help='Apenas documentos processados a partir desta data'
+        )
+
+        parser.add_argument(
+            '--until',
+            metavar='AAAA-MM-DD',
+            help='Apenas documentos processados até esta data'
+        )
+
+        parser.add_argument(
+            '--user-id',
+            help=(
+                'Usuário/tenant: com --process/--watch, dono dos documentos ingeridos; '
+                'nas perguntas, restringe a busca aos documentos desse tenant '
+                '(os ingeridos sem --user-id não aparecem)'
+            )
+        )
+
+        parser.add_argument(
+            '--fast',
+            dest='fast_mode',
+            action='store_const',
+            const=True,
+            help='Modo rápido: resposta sem raciocínio (padrão: FAST_MODE)'
+        )
+
+        parser.add_argument(
+            '--full',
+            dest='fast_mode',
+            action='store_const',
+            const=False,
+            help='Resposta completa com raciocínio (Chain of Thought)'
+        )
+
+        parser.add_argument(
+            '--deadline-ms',
+            type=float,
+            metavar='MS',
+            help='Prazo por pergunta; ao esgotar, responde só com os trechos (padrão: DEADLINE_MS)'
+        )
+
+        parser.add_argument(
+            '--ask-file',
+            metavar='ARQUIVO',
+            help='Responde em lote as perguntas de um arquivo JSONL'
+        )
+
+        parser.add_argument(
+            '--out',
+            default='answers.jsonl',
+            help='Arquivo JSONL de saída do modo em lote (padrão: answers.jsonl)'
+        )
+
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=32,
+            help='Perguntas por lote de embedding/busca (padrão: 32)'
+        )
+
+        parser.add_argument(
+            '--concurrency',
+            type=int,
+            default=4,
+            help='Gerações simultâneas no modo em lote (padrão: 4)'
+        )
+
+        parser.add_argument(
+            '--process',
+            action='store_true',
+            help='Processa (ingere) todos os PDFs da pasta de documentos'
+        )
+
+        parser.add_argument(
+            '--warm-cache',
+            action='store_true',
+            help='Pré-calcula as respostas das perguntas mais frequentes do log (também roda após --process)'
+        )
+
+        parser.add_argument(
+            '--rebuild-index',
+            action='store_true',
+            help='Reconstrói/compacta o índice vetorial com a configuração atual'
+        )
+
+        parser.add_argument(
+            '--rebalance-shards',
+            action='store_true',
+            help='Move documentos para o shard dono após mudar VECTOR_STORE_SHARDS'
+        )
+
+        parser.add_argument(
+            '--benchmark-dimensions',
+            metavar='DIMS',
+            help='Compara recall/latência/tamanho do índice por dimensão (ex: 128,256,512)'
+        )
+
+        parser.add_argument(
+            '--top-k',
+            type=int,
+            default=5,
+            help='Resultados por busca em --benchmark-dimensions (padrão: 5)'
+        )
+
+        parser.add_argument(
+            '--rerank-factor',
+            type=int,
+            default=4,
+            help='Candidatos por resultado no re-rank de --benchmark-dimensions (padrão: 4)'
+        )
+
+        parser.add_argument(
+            '--watch',
+            action='store_true',
+            help='Observa a pasta de documentos e ingere/remove PDFs conforme mudam (Ctrl+C encerra)'
+        )
+
+        parser.add_argument(
+            '--calibrate-pdf',
+            action='store_true',
+            help='Mede os backends de PDF instalados na pasta de documentos e escolhe o mais rápido'
+        )
+
+        parser.add_argument(
+            '--calibrate-sample',
+            type=int,
+            default=10,
+            help='PDFs da amostra em --calibrate-pdf (padrão: 10)'
+        )
+
+        parser.add_argument(
+            '--min-parity',
+            type=float,
+            default=0.95,
+            help='Similaridade mínima com o texto do pypdf em --calibrate-pdf (padrão: 0.95)'
+        )
+
+        parser.add_argument(
+            '--tune-retrieval',
+            metavar='ARQUIVO',
+            help='Ajusta CHUNK_SIZE, CHUNK_OVERLAP e TOP_K_RESULTS com perguntas rotuladas (JSONL)'
+        )
+
+        parser.add_argument(
+            '--tune-chunk-sizes',
+            default='500,750,1000,1500',
+            help='Tamanhos de chunk testados em --tune-retrieval (padrão: 500,750,1000,1500)'
+        )
+
+        parser.add_argument(
+            '--tune-overlaps',
+            default='0,100,200',
+            help='Sobreposições testadas em --tune-retrieval (padrão: 0,100,200)'
+        )
+
+        parser.add_argument(
+            '--tune-top-k',
+            default='3,5,8',
+            help='Valores de top_k testados em --tune-retrieval (padrão: 3,5,8)'
+        )
+
+        parser.add_argument(
+            '--tune-dry-run',
+            action='store_true',
+            help='Só relata o --tune-retrieval, sem gravar a configuração no .env'
+        )
+
+        parser.add_argument(
+            '--replay',
+            metavar='LOG',
+            help='Reproduz um log de perguntas (QUERY_LOG_PATH) e relata vazão e latências'
+        )
+
+        parser.add_argument(
+            '--replay-rate',
+            type=float,
+            default=1.0,
+            help='Escala da taxa de chegada no --replay (2 = dobro; 0 = sem espera; padrão: 1)'
+        )
+
+        parser.add_argument(
+            '--virtual-users',
+            type=int,
+            default=8,
+            help='Requisições simultâneas no --replay (padrão: 8)'
+        )
+
+        parser.add_argument(
+            '--replay-limit',
+            type=int,
+            default=0,
+            help='Máximo de perguntas reproduzidas (padrão: todas)'
+        )
+
+        parser.add_argument(
+            '--export-snapshot',
+            metavar='PASTA',
+            help='Exporta o índice vetorial para um snapshot portátil'
+        )
+
+        parser.add_argument(
+            '--import-snapshot',
+            metavar='PASTA',
+            help='Recarrega um snapshot no índice vetorial (sem reprocessar PDFs)'
+        )
+
+        parser.add_argument(
+            '--publish-index',
+            action='store_true',
+            help='Publica o índice atual como nova geração (servida por --serve)'
+        )
+
+        parser.add_argument(
+            '--serve',
+            action='store_true',
+            help='Servidor HTTP multi-worker sobre a geração publicada do índice'
+        )
+
+        parser.add_argument(
+            '--host',
+            help='Endereço do servidor (padrão: SERVE_HOST)'
+        )
+
+        parser.add_argument(
+            '--port',
+            type=int,
+            help='Porta do servidor (padrão: SERVE_PORT)'
+        )
+
+        parser.add_argument(
+            '--workers',
+            type=int,
+            help='Processos worker do servidor (padrão: SERVE_WORKERS)'
+        )
+
+        parser.add_argument(
+            '--script',
+            metavar='ARQUIVO',
+            help='Executa o modo interativo com as perguntas do arquivo (uma por linha)'
+        )
+
+        parser.add_argument(
+            '--profile',
+            action='store_true',
+            help='Executa o comando sob cProfile (gera .pstats, .collapsed e relatório por pacote)'
+        )
+
+        parser.add_argument(
+            '--trace-memory',
+            action='store_true',
+            help='Executa o comando sob tracemalloc (gera relatório de alocações por pacote)'
+        )
+
+        parser.add_argument(
+            '--profile-dir',
+            default='./profiles',
+            help='Pasta dos relatórios de profiling (padrão: ./profiles)'
+        )
+
         return parser
 
+    @staticmethod
+    def _parse_search_filter(parsed_args: argparse.Namespace) -> Optional[SearchFilter]:
+        """Monta o filtro de busca a partir dos argumentos"""
+        page_from = page_to = None
+        if parsed_args.pages:
+            start, _, end = parsed_args.pages.partition('-')
+            page_from = int(start) if start else None
+            page_to = int(end) if end else page_from
+
+        ingested_after = None
+        if parsed_args.since:
+            ingested_after = datetime.strptime(parsed_args.since, '%Y-%m-%d')
+
+        ingested_before = None
+        if parsed_args.until:
+            ingested_before = datetime.strptime(
+                parsed_args.until, '%Y-%m-%d'
+            ).replace(hour=23, minute=59, second=59)
+
+        search_filter = SearchFilter(
+            sources=parsed_args.source,
+            ingested_after=ingested_after,
+            ingested_before=ingested_before,
+            page_from=page_from,
+            page_to=page_to
+        )
+        return None if search_filter.is_empty else search_filter
+
+    @staticmethod
+    def _read_script(path: str) -> list:
+        """Lê perguntas de um arquivo de script (uma por linha)"""
+        with open(path, encoding='utf-8') as f:
+            return [line.strip() for line in f if line.strip()]
+
     def _process_documents_command(self):
         """Processa documentos"""
         print("=" * 60)
@@ -98,7 +587,12 @@ class MainCLI:
             pdf_path = os.path.join(self.docs_folder, pdf_file)
             print(f"\nProcessando: {pdf_file}...")
 
-            input_dto = ProcessDocumentInputDTO(file_path=pdf_path)
+            input_dto = ProcessDocumentInputDTO(
+                file_path=pdf_path,
+                chunk_size=self.chunk_size,
+                chunk_overlap=self.chunk_overlap,
+                tenant_id=self.user_id
+            )
             output_dto = self.process_use_case.execute(input_dto)
 
             if output_dto.success:
@@ -108,6 +602,330 @@ class MainCLI:
 
         print("\n[OK] Processamento concluido!")
 
+        if self.publish_index_on_ingest:
+            print()
+            self._publish_index_command()
+
+        # O índice mudou: respostas pré-calculadas são refeitas antes do tráfego
+        if self.warm_cache_use_case is not None:
+            print()
+            self._warm_cache_command()
+
+    def _warm_cache_command(self):
+        """Aquece o cache de respostas a partir do log de perguntas"""
+        print("=" * 60)
+        print("AQUECENDO CACHE DE RESPOSTAS")
+        print("=" * 60)
+
+        if self.warm_cache_use_case is None:
+            print("Erro: Cache de respostas (ANSWER_CACHE_PATH) ou log de perguntas (QUERY_LOG_PATH) desativado")
+            return
+
+        output_dto = self.warm_cache_use_case.execute(self.warm_cache_input)
+
+        if output_dto.success:
+            print(f"\n{output_dto.questions_count} pergunta(s) no log")
+            print(f"[OK] {output_dto.message}")
+            if output_dto.failed_count:
+                print(f"  {output_dto.failed_count} grupo(s) sem resposta armazenável")
+        else:
+            print(f"\n[ERRO] {output_dto.message}")
+
+    def _rebuild_index_command(self):
+        """Reconstrói o índice vetorial"""
+        print("=" * 60)
+        print("RECONSTRUINDO ÍNDICE")
+        print("=" * 60)
+
+        if self.index_use_case is None:
+            print("Erro: Manutenção de índice não configurada")
+            return
+
+        output_dto = self.index_use_case.rebuild()
+
+        if output_dto.success:
+            print(f"\n[OK] {output_dto.message}")
+        else:
+            print(f"\n[ERRO] {output_dto.message}")
+
+    def _rebalance_shards_command(self):
+        """Rebalanceia os shards do índice vetorial"""
+        print("=" * 60)
+        print("REBALANCEANDO SHARDS")
+        print("=" * 60)
+
+        if self.index_use_case is None:
+            print("Erro: Manutenção de índice não configurada")
+            return
+
+        output_dto = self.index_use_case.rebalance()
+
+        if output_dto.success:
+            print(f"\n[OK] {output_dto.message}")
+        else:
+            print(f"\n[ERRO] {output_dto.message}")
+
+    def _benchmark_dimensions_command(self, dimensions: str, top_k: int, rerank_factor: int):
+        """Compara dimensões de embedding sobre o índice atual"""
+        print("=" * 60)
+        print("COMPARAÇÃO DE DIMENSÕES")
+        print("=" * 60)
+
+        if self.benchmark_use_case is None:
+            print("Erro: Comparação de dimensões não configurada")
+            return
+
+        try:
+            dimension_list = [int(value) for value in dimensions.split(',') if value.strip()]
+        except ValueError:
+            print(f"Erro: Dimensões inválidas: {dimensions}")
+            return
+
+        output_dto = self.benchmark_use_case.execute(DimensionBenchmarkInputDTO(
+            dimensions=dimension_list,
+            top_k=top_k,
+            rerank_factor=rerank_factor
+        ))
+
+        if not output_dto.success:
+            print(f"\n[ERRO] {output_dto.message}")
+            return
+
+        print(
+            f"\n{output_dto.chunks_count} chunks, {output_dto.queries_count} queries, "
+            f"referência: {output_dto.full_dimension} dimensões (recall@{top_k})\n"
+        )
+        print(f"{'dim':>6} {'re-rank':>8} {'recall':>8} {'ms/query':>10} {'índice (MB)':>12}")
+        for row in output_dto.rows:
+            print(
+                f"{row.dimension:>6} {('sim' if row.rerank else 'não'):>8} "
+                f"{row.recall:>8.3f} {row.search_ms:>10.3f} "
+                f"{row.index_bytes / 1024 / 1024:>12.2f}"
+            )
+
+    def _watch_command(self):
+        """Mantém o índice sincronizado com a pasta de documentos"""
+        print("=" * 60)
+        print("OBSERVANDO DOCUMENTOS")
+        print("=" * 60)
+
+        if self.watch_use_case is None:
+            print("Erro: Observação da pasta não configurada")
+            return
+
+        if not os.path.exists(self.watch_input.folder):
+            print(f"Erro: Pasta {self.watch_input.folder} não encontrada")
+            return
+
+        print(f"\nPasta: {self.watch_input.folder} (Ctrl+C para encerrar)\n")
+
+        def print_event(event: WatchEventDTO):
+            status = "OK" if event.success else "ERRO"
+            action = "Ingerido" if event.action == "ingest" else "Removido"
+            detail = f"{event.chunks_count} chunks" if event.success and event.action == "ingest" else event.message
+            print(f"  [{status}] {action}: {event.filename} ({detail}, {event.seconds:.1f}s)")
+
+        watch_input = self.watch_input
+        if self.user_id:
+            watch_input = replace(watch_input, tenant_id=self.user_id)
+
+        summary = self.watch_use_case.execute(watch_input, on_event=print_event)
+
+        if summary.success:
+            print(f"\n[OK] {summary.message}")
+        else:
+            print(f"\n[ERRO] {summary.message}")
+
+    def _calibrate_pdf_command(self, sample_size: int, min_parity: float):
+        """Calibra os backends de extração de PDF"""
+        print("=" * 60)
+        print("CALIBRAÇÃO DOS BACKENDS DE PDF")
+        print("=" * 60)
+
+        if self.calibrate_pdf_use_case is None:
+            print("Erro: Calibração de PDF não configurada")
+            return
+
+        if not os.path.exists(self.docs_folder):
+            print(f"Erro: Pasta {self.docs_folder} não encontrada")
+            return
+
+        pdf_files = sorted(f for f in os.listdir(self.docs_folder) if f.endswith('.pdf'))
+        if len(pdf_files) > sample_size:
+            pdf_files = sorted(random.Random(0).sample(pdf_files, sample_size))
+
+        output_dto = self.calibrate_pdf_use_case.execute(PDFCalibrationInputDTO(
+            file_paths=[os.path.join(self.docs_folder, f) for f in pdf_files],
+            min_parity=min_parity
+        ))
+
+        if output_dto.results:
+            print(f"\n{output_dto.files_count} PDF(s), referência: {output_dto.reference}\n")
+            print(f"{'Backend':<12}{'Versão':<12}{'Tempo (s)':>10}{'Páginas':>9}{'Paridade':>10}{'Erros':>7}")
+            for result in output_dto.results:
+                marker = "*" if result.name == output_dto.selected else " " if result.acceptable else "x"
+                print(
+                    f"{result.name:<12}{result.version[:11]:<12}{result.seconds:>10.2f}"
+                    f"{result.pages_count:>9}{result.parity:>10.3f}{result.errors:>7} {marker}"
+                )
+
+        if output_dto.success:
+            print(f"\n[OK] {output_dto.message} (usado com PDF_BACKEND=auto)")
+        else:
+            print(f"\n[ERRO] {output_dto.message}")
+
+    def _tune_retrieval_command(
+        self,
+        examples_path: str,
+        chunk_sizes: str,
+        overlaps: str,
+        top_ks: str,
+        apply: bool
+    ):
+        """
+        Ajusta chunking e top_k com perguntas rotuladas
+
+        Cada linha do arquivo é um objeto {"pergunta": ..., "trecho": ..., "fonte"?}
+        em que "trecho" é o texto do PDF que responde a pergunta.
+        """
+        print("=" * 60)
+        print("AJUSTE DE RECUPERAÇÃO")
+        print("=" * 60)
+
+        if self.tune_retrieval_use_case is None:
+            print("Erro: Ajuste de recuperação não configurado")
+            return
+
+        if not os.path.exists(self.docs_folder):
+            print(f"Erro: Pasta {self.docs_folder} não encontrada")
+            return
+
+        try:
+            input_dto = RetrievalTuningInputDTO(
+                file_paths=[
+                    os.path.join(self.docs_folder, f)
+                    for f in sorted(os.listdir(self.docs_folder)) if f.endswith('.pdf')
+                ],
+                examples=[
+                    TuningExampleDTO(
+                        question=record["pergunta"],
+                        passage=record["trecho"],
+                        source=record.get("fonte")
+                    )
+                    for record in self._read_question_records(examples_path)
+                ],
+                chunk_sizes=[int(value) for value in chunk_sizes.split(',') if value.strip()],
+                chunk_overlaps=[int(value) for value in overlaps.split(',') if value.strip()],
+                top_ks=[int(value) for value in top_ks.split(',') if value.strip()],
+                apply=apply
+            )
+        except (KeyError, ValueError) as e:
+            print(f"Erro: Entrada inválida: {str(e)}")
+            return
+
+        output_dto = self.tune_retrieval_use_case.execute(input_dto)
+
+        if output_dto.rows:
+            print(
+                f"\n{output_dto.examples_count} pergunta(s), "
+                f"{output_dto.unmatched_count} trecho(s) não encontrado(s); "
+                f"embeddings: {output_dto.embedded_count} novo(s), {output_dto.cached_count} do cache\n"
+            )
+            print(f"{'chunk':>6} {'overlap':>8} {'top_k':>6} {'recall':>8} {'contexto':>9} {'ms/busca':>9} {'chunks':>7}")
+            for row in output_dto.rows:
+                marker = "*" if row is output_dto.selected else "p" if row.pareto else " "
+                print(
+                    f"{row.chunk_size:>6} {row.chunk_overlap:>8} {row.top_k:>6} "
+                    f"{row.recall:>8.3f} {row.context_chars:>9.0f} {row.search_ms:>9.3f} "
+                    f"{row.chunks_count:>7} {marker}"
+                )
+            print("\n* escolhida, p = fronteira de Pareto (recall x contexto em caracteres)")
+
+        if not output_dto.success:
+            print(f"\n[ERRO] {output_dto.message}")
+        elif output_dto.applied:
+            print(f"\n[OK] {output_dto.message} gravado no .env")
+            if (output_dto.selected.chunk_size, output_dto.selected.chunk_overlap) != (
+                self.chunk_size, self.chunk_overlap
+            ):
+                print("Chunking alterado: execute --process para reindexar os documentos")
+        else:
+            print(f"\n[OK] {output_dto.message}")
+
+    def _replay_command(self, input_dto: ReplayInputDTO):
+        """Reproduz tráfego gravado e imprime o relatório de carga"""
+        print("=" * 60)
+        print("REPLAY DE TRÁFEGO")
+        print("=" * 60)
+
+        if self.replay_use_case is None:
+            print("Erro: Replay de tráfego não configurado")
+            return
+
+        report = self.replay_use_case.execute(input_dto)
+
+        if not report.success:
+            print(f"\n[ERRO] {report.message}")
+            return
+
+        print(
+            f"\n{report.requests} requisições em {report.duration_s:.1f}s "
+            f"({input_dto.virtual_users} usuários virtuais, taxa x{input_dto.rate_scale:g})"
+        )
+        print(f"Vazão: {report.throughput_rps:.2f} req/s")
+        print(f"Erros: {report.errors} ({report.error_rate:.1%})")
+        print(f"Acertos do cache: {report.cache_hit_rate:.1%}")
+
+        columns = ["p50", "p90", "p95", "p99", "max"]
+        print(f"\n{'(ms)':<22}" + "".join(f"{name:>10}" for name in columns))
+        rows = [
+            ("latência", report.latency_ms),
+            ("serviço", report.service_ms),
+            ("original (total)", report.recorded_ms)
+        ] + [(f"  {stage}", values) for stage, values in report.stages_ms.items()]
+        for label, values in rows:
+            if values:
+                print(f"{label:<22}" + "".join(f"{values[name]:>10.1f}" for name in columns))
+
+    def _snapshot_command(self, title: str, operation):
+        """Exporta ou importa um snapshot do índice"""
+        print("=" * 60)
+        print(title)
+        print("=" * 60)
+
+        if self.index_use_case is None:
+            print("Erro: Manutenção de índice não configurada")
+            return
+
+        output_dto = operation()
+
+        if output_dto.success:
+            print(f"\n[OK] {output_dto.message}")
+        else:
+            print(f"\n[ERRO] {output_dto.message}")
+
+    def _publish_index_command(self):
+        """Publica o índice atual como nova geração"""
+        self._snapshot_command(
+            "PUBLICANDO GERAÇÃO DO ÍNDICE",
+            lambda: self.index_use_case.publish_snapshot(self.index_generations_path)
+        )
+
+    def _serve_command(self, host: Optional[str], port: Optional[int], workers: Optional[int]):
+        """Serve perguntas por HTTP com vários processos"""
+        print("=" * 60)
+        print("SERVIDOR HTTP")
+        print("=" * 60)
+
+        if self.server_factory is None:
+            print("Erro: Servidor não configurado")
+            return
+
+        try:
+            self.server_factory(host=host, port=port, workers=workers).serve_forever()
+        except (OSError, RuntimeError) as e:
+            print(f"\n[ERRO] {str(e)}")
+
     def _auto_process_if_needed(self):
         """Processa documentos automaticamente se necessário"""
         # Verifica se já existem documentos processados
@@ -148,7 +966,12 @@ class MainCLI:
             pdf_path = os.path.join(self.docs_folder, pdf_file)
             print(f"\nProcessando: {pdf_file}...")
 
-            input_dto = ProcessDocumentInputDTO(file_path=pdf_path)
+            input_dto = ProcessDocumentInputDTO(
+                file_path=pdf_path,
+                chunk_size=self.chunk_size,
+                chunk_overlap=self.chunk_overlap,
+                tenant_id=self.user_id
+            )
             output_dto = self.process_use_case.execute(input_dto)
 
             if output_dto.success:
@@ -183,7 +1006,13 @@ class MainCLI:
         print(f"\nPergunta: {question}")
         print("\nBuscando resposta...")
 
-        input_dto = AskQuestionInputDTO(question_text=question)
+        input_dto = AskQuestionInputDTO(
+            question_text=question,
+            user_id=self.user_id,
+            search_filter=self.search_filter,
+            fast_mode=self.fast_mode,
+            deadline_ms=self.deadline_ms
+        )
         output_dto = self.ask_use_case.execute(input_dto)
 
         print("\n" + "=" * 60)
@@ -191,8 +1020,130 @@ class MainCLI:
         print("=" * 60)
         print(json.dumps(output_dto.to_dict(), indent=2, ensure_ascii=False))
 
-    def _interactive_mode(self):
-        """Modo interativo"""
+    def _ask_file_command(
+        self,
+        input_path: str,
+        output_path: str,
+        batch_size: int,
+        concurrency: int
+    ):
+        """
+        Responde em lote as perguntas de um arquivo JSONL
+
+        Cada linha é um objeto {"pergunta": ..., "id"?, "top_k"?, "user_id"?, "rapido"?, "prazo_ms"?}
+        (ou uma string JSON). As respostas são gravadas na mesma ordem, uma
+        por linha; se a saída já existir, retoma após a última linha completa.
+        """
+        try:
+            records = self._read_question_records(input_path)
+        except ValueError as e:
+            print(f"Erro: Entrada inválida: {str(e)}")
+            return
+
+        self._auto_process_if_needed()
+
+        completed = self._completed_output_lines(output_path)
+        remaining = records[completed:]
+
+        print("=" * 60)
+        print("PERGUNTAS EM LOTE")
+        print("=" * 60)
+        print(f"\n{len(records)} pergunta(s), {completed} já respondida(s)")
+
+        input_dtos = (
+            AskQuestionInputDTO(
+                question_text=record["pergunta"],
+                top_k=record.get("top_k"),
+                user_id=record.get("user_id", self.user_id),
+                search_filter=(
+                    SearchFilter(sources=record["fontes"])
+                    if record.get("fontes") else self.search_filter
+                ),
+                fast_mode=record.get("rapido", self.fast_mode),
+                deadline_ms=record.get("prazo_ms", self.deadline_ms)
+            )
+            for record in remaining
+        )
+
+        answered = 0
+        with open(output_path, 'a', encoding='utf-8') as out:
+            outputs = self.ask_use_case.execute_batch(
+                input_dtos,
+                batch_size=batch_size,
+                max_workers=concurrency
+            )
+            for record, output_dto in zip(remaining, outputs):
+                line = {
+                    "id": record.get("id"),
+                    "pergunta": record["pergunta"],
+                    **output_dto.to_dict(),
+                    "sucesso": output_dto.success,
+                    "degradada": output_dto.degraded,
+                    "tempos_ms": output_dto.timings
+                }
+                out.write(json.dumps(line, ensure_ascii=False) + "\n")
+                out.flush()
+
+                answered += 1
+                if answered % 100 == 0:
+                    print(f"  {completed + answered}/{len(records)}")
+
+        print(f"\n[OK] {answered} resposta(s) gravada(s) em {output_path}")
+
+    @staticmethod
+    def _read_question_records(path: str) -> List[dict]:
+        """
+        Lê as perguntas do arquivo JSONL (linhas vazias são ignoradas)
+
+        Raises:
+            ValueError: Linha que não é JSON, nem objeto ou string
+        """
+        records = []
+        with open(path, encoding='utf-8') as f:
+            for line_number, line in enumerate(f, start=1):
+                if not line.strip():
+                    continue
+
+                try:
+                    record = json.loads(line)
+                except ValueError as e:
+                    raise ValueError(f"linha {line_number}: JSON inválido ({str(e)})")
+
+                if isinstance(record, str):
+                    record = {"pergunta": record}
+                elif not isinstance(record, dict):
+                    raise ValueError(f"linha {line_number}: esperado um objeto ou uma string JSON")
+                elif "pergunta" not in record:
+                    record["pergunta"] = record.get("question", "")
+                records.append(record)
+        return records
+
+    @staticmethod
+    def _completed_output_lines(path: str) -> int:
+        """
+        Conta respostas completas já gravadas
+
+        Uma linha parcial no final (execução interrompida) é descartada.
+        """
+        if not os.path.exists(path):
+            return 0
+
+        with open(path, 'rb+') as f:
+            content = f.read()
+            last_newline = content.rfind(b"\n")
+            if last_newline + 1 != len(content):
+                f.truncate(last_newline + 1)
+                content = content[:last_newline + 1]
+
+        return content.count(b"\n")
+
+    def _interactive_mode(self, script: Optional[Iterable[str]] = None):
+        """
+        Modo interativo
+
+        Args:
+            script: Perguntas pré-definidas (sessão roteirizada); se None lê do teclado
+        """
         # Processa documentos automaticamente se necessário
         self._auto_process_if_needed()
 
@@ -201,8 +1152,14 @@ class MainCLI:
         print("=" * 60)
         print("\nDigite 'sair' para encerrar\n")
 
+        scripted = iter(script) if script is not None else None
+
         while True:
-            question = input("\n> ").strip()
+            if scripted is not None:
+                question = next(scripted, 'sair')
+                print(f"\n> {question}")
+            else:
+                question = input("\n> ").strip()
 
             if question.lower() in ['sair', 'exit', 'quit']:
                 print("\nEncerrando...")
@@ -211,7 +1168,13 @@ class MainCLI:
             if not question:
                 continue
 
-            input_dto = AskQuestionInputDTO(question_text=question)
+            input_dto = AskQuestionInputDTO(
+                question_text=question,
+                user_id=self.user_id,
+                search_filter=self.search_filter,
+                fast_mode=self.fast_mode,
+                deadline_ms=self.deadline_ms
+            )
             output_dto = self.ask_use_case.execute(input_dto)
 
             print("\n" + "-" * 60)
@@ -225,4 +1188,17 @@ class MainCLI:
         print("\nExemplos:")
         print("  python main.py --ask \"Qual e o codigo de etica?\"")
         print("  python main.py --interactive")
+        print("  python main.py --ask \"Brindes\" --source codigo_etica_sbk_2025.pdf --pages 3-10")
+        print("  python main.py --ask-file perguntas.jsonl --out respostas.jsonl")
+        print("  python main.py --process --profile --trace-memory")
+        print("  python main.py --warm-cache")
+        print("  python main.py --watch")
+        print("  python main.py --calibrate-pdf --calibrate-sample 5")
+        print("  python main.py --replay metrics/queries.jsonl --replay-rate 4 --virtual-users 16")
+        print("  python main.py --rebuild-index")
+        print("  python main.py --export-snapshot snapshots/index")
+        print("  python main.py --publish-index && python main.py --serve --workers 4")
+        print("  python main.py --benchmark-dimensions 128,256,512")
+        print("  python main.py --tune-retrieval perguntas_rotuladas.jsonl")
+        print("  python main.py --script perguntas.txt --profile")
         print("\nNota: Os documentos sao processados automaticamente na primeira execucao")
@@ -0,0 +1,258 @@
+"""
+Profiling de comandos da CLI (cProfile, amostragem de pilhas e tracemalloc)
+"""
+import cProfile
+import io
+import os
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, List, Optional
+
+
+# Pacotes agrupados nos relatórios (prefixos relativos a site-packages)
+PACKAGE_GROUPS = (
+    ("pypdf", ("pypdf",)),
+    ("langchain", ("langchain",)),
+    ("chromadb", ("chromadb", "hnswlib", "onnxruntime")),
+    ("genai", ("google/generativeai", "google/genai", "google/ai", "google/api_core", "grpc")),
+)
+
+
+def package_of(filename: str) -> str:
+    """
+    Identifica o grupo de pacote de um arquivo de código
+
+    Returns:
+        pypdf, langchain, chromadb, genai, app, builtins ou other
+    """
+    if not filename or filename.startswith("<") or filename == "~":
+        return "builtins"
+
+    path = filename.replace("\\", "/")
+
+    for marker in ("/site-packages/", "/dist-packages/"):
+        if marker in path:
+            relative = path.split(marker, 1)[1]
+            for group, prefixes in PACKAGE_GROUPS:
+                if any(relative.startswith(prefix) for prefix in prefixes):
+                    return group
+            return "other"
+
+    if "/src/" in path or path.startswith("src/"):
+        return "app"
+    return "other"
+
+
+class StackSampler:
+    """Amostra a pilha da thread principal para gerar collapsed stacks"""
+
+    def __init__(self, interval: float = 0.005):
+        self.interval = interval
+        self.stacks: Counter = Counter()
+        self._thread_id = threading.get_ident()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self._thread_id)
+            if frame is None:
+                continue
+
+            names = []
+            while frame is not None:
+                code = frame.f_code
+                names.append(
+                    f"{package_of(code.co_filename)}:"
+                    f"{os.path.basename(code.co_filename)}:{code.co_name}"
+                )
+                frame = frame.f_back
+            self.stacks[";".join(reversed(names))] += 1
+
+    def write_collapsed(self, path: str) -> None:
+        """Grava no formato collapsed stack (entrada do flamegraph.pl/speedscope)"""
+        with open(path, "w", encoding="utf-8") as f:
+            for stack, count in self.stacks.most_common():
+                f.write(f"{stack} {count}\n")
+
+
+class CLIProfiler:
+    """
+    Executa um comando sob cProfile e/ou tracemalloc
+
+    Arquivos gerados em output_dir (prefixo <comando>_<timestamp>):
+    - .pstats: estatísticas do cProfile (abrir com `python -m pstats`)
+    - .collapsed: pilhas amostradas para flame graphs
+    - .cpu.txt: funções mais caras agrupadas por pacote
+    - .memory.txt: maiores alocações agrupadas por pacote
+    """
+
+    def __init__(
+        self,
+        output_dir: str = "./profiles",
+        cpu: bool = True,
+        memory: bool = False,
+        top_n: int = 25
+    ):
+        """
+        Inicializa profiler
+
+        Args:
+            output_dir: Pasta dos relatórios
+            cpu: Ativa cProfile e amostragem de pilhas
+            memory: Ativa tracemalloc
+            top_n: Quantidade de linhas por relatório
+        """
+        self.output_dir = output_dir
+        self.cpu = cpu
+        self.memory = memory
+        self.top_n = top_n
+        self.generated_files: List[str] = []
+
+    @contextmanager
+    def session(self, command_name: str):
+        """Perfila o bloco de código e grava os relatórios ao final"""
+        os.makedirs(self.output_dir, exist_ok=True)
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        prefix = os.path.join(self.output_dir, f"{command_name}_{timestamp}")
+
+        profiler = cProfile.Profile() if self.cpu else None
+        sampler = StackSampler() if self.cpu else None
+
+        if self.memory:
+            tracemalloc.start(25)
+        if sampler:
+            sampler.start()
+        if profiler:
+            profiler.enable()
+
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+
+            if profiler:
+                profiler.disable()
+            if sampler:
+                sampler.stop()
+
+            if profiler:
+                self._write_cpu_reports(prefix, profiler, sampler, elapsed)
+
+            if self.memory:
+                snapshot = tracemalloc.take_snapshot()
+                _, peak = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+                self._write_memory_report(prefix, snapshot, peak)
+
+    def print_summary(self) -> None:
+        """Lista os arquivos gerados"""
+        if not self.generated_files:
+            return
+
+        print("\n" + "=" * 60)
+        print("PROFILING")
+        print("=" * 60)
+        for path in self.generated_files:
+            print(f"  {path}")
+
+    def _write_cpu_reports(
+        self,
+        prefix: str,
+        profiler: cProfile.Profile,
+        sampler: Optional[StackSampler],
+        elapsed: float
+    ) -> None:
+        pstats_path = f"{prefix}.pstats"
+        profiler.dump_stats(pstats_path)
+        self.generated_files.append(pstats_path)
+
+        if sampler:
+            collapsed_path = f"{prefix}.collapsed"
+            sampler.write_collapsed(collapsed_path)
+            self.generated_files.append(collapsed_path)
+
+        stats = pstats.Stats(profiler, stream=io.StringIO())
+
+        # Agrupa tempo próprio (tottime) por pacote
+        package_time: Dict[str, float] = defaultdict(float)
+        functions_by_package: Dict[str, list] = defaultdict(list)
+        for (filename, line, func_name), (_, ncalls, tottime, cumtime, _) in stats.stats.items():
+            package = package_of(filename)
+            package_time[package] += tottime
+            functions_by_package[package].append(
+                (tottime, cumtime, ncalls, f"{os.path.basename(filename)}:{line}({func_name})")
+            )
+
+        lines = [f"Tempo total: {elapsed:.3f}s", "", "Tempo próprio por pacote:"]
+        for package, seconds in sorted(package_time.items(), key=lambda item: -item[1]):
+            lines.append(f"  {package:<10} {seconds:10.3f}s")
+
+        for package in sorted(package_time, key=lambda name: -package_time[name]):
+            lines.append("")
+            lines.append(f"[{package}] tottime    cumtime     ncalls  função")
+            top = sorted(functions_by_package[package], reverse=True)[:self.top_n]
+            for tottime, cumtime, ncalls, name in top:
+                lines.append(f"  {tottime:10.4f} {cumtime:10.4f} {ncalls:10d}  {name}")
+
+        report_path = f"{prefix}.cpu.txt"
+        with open(report_path, "w", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+        self.generated_files.append(report_path)
+
+    def _write_memory_report(
+        self,
+        prefix: str,
+        snapshot: tracemalloc.Snapshot,
+        peak: int
+    ) -> None:
+        snapshot = snapshot.filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+        ))
+
+        # Atribui cada alocação ao frame mais recente fora de builtins/stdlib
+        # (o traceback vem do mais antigo para o mais recente)
+        package_bytes: Dict[str, int] = defaultdict(int)
+        for trace in snapshot.traces:
+            package = "other"
+            for frame in reversed(trace.traceback):
+                candidate = package_of(frame.filename)
+                if candidate not in ("other", "builtins"):
+                    package = candidate
+                    break
+            package_bytes[package] += trace.size
+
+        lines = [f"Pico de memória rastreada: {peak / 1024 / 1024:.2f} MiB", "", "Memória viva por pacote:"]
+        for package, size in sorted(package_bytes.items(), key=lambda item: -item[1]):
+            lines.append(f"  {package:<10} {size / 1024:12.1f} KiB")
+
+        lines.append("")
+        lines.append(f"Top {self.top_n} alocações (por linha):")
+        for stat in snapshot.statistics("lineno")[:self.top_n]:
+            frame = stat.traceback[0]
+            lines.append(
+                f"  {stat.size / 1024:10.1f} KiB {stat.count:8d} blocos  "
+                f"[{package_of(frame.filename)}] {frame.filename}:{frame.lineno}"
+            )
+
+        report_path = f"{prefix}.memory.txt"
+        with open(report_path, "w", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+        self.generated_files.append(report_path)
@@ -0,0 +1,5 @@
+"""HTTP Server (pre-fork)"""
+from .http_api import create_http_server
+from .prefork import PreforkServer
+
+__all__ = ['create_http_server', 'PreforkServer']
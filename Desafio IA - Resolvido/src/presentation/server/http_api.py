@@ -0,0 +1,107 @@
+"""
+API HTTP mínima de perguntas (um processo worker)
+"""
+import json
+import os
+import socket
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from typing import Callable
+
+from src.application.dtos import AskQuestionInputDTO
+from src.application.use_cases import AskQuestionUseCase
+
+
+class _WorkerHTTPServer(HTTPServer):
+    """HTTPServer sobre um socket de escuta herdado do supervisor"""
+
+    def __init__(self, listen_socket: socket.socket, handler_class):
+        super().__init__(listen_socket.getsockname()[:2], handler_class, bind_and_activate=False)
+        self.socket.close()
+        self.socket = listen_socket
+
+    def get_request(self):
+        # O socket de escuta é não bloqueante (vários workers no mesmo accept)
+        connection, address = self.socket.accept()
+        connection.setblocking(True)
+        return connection, address
+
+    def server_close(self):
+        # O socket de escuta pertence ao supervisor
+        pass
+
+
+def create_http_server(
+    listen_socket: socket.socket,
+    ask_use_case: AskQuestionUseCase,
+    generation: Callable[[], int],
+    keep_alive_s: float = 5.0
+) -> HTTPServer:
+    """
+    Cria o servidor HTTP de um worker
+
+    Rotas:
+    - POST /ask: {"pergunta", "top_k"?, "user_id"?, "rapido"?, "prazo_ms"?} -> resposta em JSON
+    - GET /health: status, geração do índice e pid do worker
+
+    Args:
+        listen_socket: Socket de escuta compartilhado
+        ask_use_case: Use case de perguntas do worker
+        generation: Geração do índice em uso
+        keep_alive_s: Tempo máximo de espera por dados numa conexão keep-alive
+    """
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        # Cada worker atende uma conexão por vez: sem limite, um cliente com
+        # pool ocioso prenderia o worker no recv (e o SIGTERM no shutdown)
+        timeout = keep_alive_s
+
+        def do_GET(self):
+            if self.path != "/health":
+                self._send(404, {"erro": "Rota não encontrada"})
+                return
+            self._send(200, {"status": "ok", "geracao": generation(), "pid": os.getpid()})
+
+        def do_POST(self):
+            if self.path != "/ask":
+                self._send(404, {"erro": "Rota não encontrada"})
+                return
+
+            try:
+                length = int(self.headers.get("Content-Length", 0))
+                record = json.loads(self.rfile.read(length) or b"{}")
+                input_dto = AskQuestionInputDTO(
+                    question_text=record["pergunta"],
+                    top_k=int(record["top_k"]) if record.get("top_k") is not None else None,
+                    user_id=record.get("user_id"),
+                    fast_mode=record.get("rapido"),
+                    deadline_ms=(
+                        float(record["prazo_ms"]) if record.get("prazo_ms") is not None else None
+                    )
+                )
+            except (KeyError, TypeError, ValueError) as e:
+                self._send(400, {"erro": f"Requisição inválida: {str(e)}"})
+                return
+
+            output_dto = ask_use_case.execute(input_dto)
+            self._send(200 if output_dto.success else 422, {
+                **output_dto.to_dict(),
+                "sucesso": output_dto.success,
+                "degradada": output_dto.degraded,
+                "tempos_ms": output_dto.timings,
+                "geracao": generation()
+            })
+
+        def _send(self, status: int, body: dict):
+            payload = json.dumps(body, ensure_ascii=False).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, format, *args):
+            # Métricas e log de perguntas já registram as requisições
+            pass
+
+    return _WorkerHTTPServer(listen_socket, Handler)
@@ -0,0 +1,186 @@
+"""
+Servidor pre-fork: N workers sobre um índice mapeado em memória
+"""
+import multiprocessing
+import os
+import signal
+import socket
+import time
+from typing import Callable, Dict
+
+from src.application.use_cases import AskQuestionUseCase
+from src.presentation.server.http_api import create_http_server
+
+
+class PreforkServer:
+    """
+    Supervisor de workers HTTP (modelo pre-fork)
+
+    O supervisor abre a geração atual do índice (aquecendo o page cache),
+    cria o socket de escuta e faz fork dos workers. Cada worker monta o seu
+    use case depois do fork e mapeia os mesmos arquivos somente leitura, de
+    modo que o índice ocupa memória física uma única vez. Workers que caem
+    são recriados no mesmo slot (0 a workers - 1).
+
+    A geração servida fica num valor compartilhado: ao detectar uma
+    publicação nova (arquivo CURRENT), o supervisor abre, verifica e aquece
+    a geração e só então troca o valor; cada worker reabre o snapshot na
+    próxima requisição, sem reiniciar processos nem perder requisições.
+    """
+
+    def __init__(
+        self,
+        worker_factory: Callable[[Callable[[], int], int], AskQuestionUseCase],
+        generation_reader: Callable[[], int],
+        generation_warmer: Callable[[int], None],
+        host: str = "127.0.0.1",
+        port: int = 8000,
+        workers: int = 4,
+        poll_interval: float = 1.0
+    ):
+        """
+        Inicializa o supervisor
+
+        Args:
+            worker_factory: Cria o use case de um worker (fonte da geração, slot)
+            generation_reader: Geração publicada atual (0 = nenhuma)
+            generation_warmer: Abre, verifica e aquece uma geração (erro = não servir)
+            host: Endereço de escuta
+            port: Porta de escuta
+            workers: Quantidade de processos worker
+            poll_interval: Intervalo de verificação de workers e do CURRENT (s)
+        """
+        self.worker_factory = worker_factory
+        self.generation_reader = generation_reader
+        self.generation_warmer = generation_warmer
+        self.host = host
+        self.port = port
+        self.workers = max(1, workers)
+        self.poll_interval = poll_interval
+        self._stopping = False
+
+    def serve_forever(self) -> None:
+        """Serve até receber SIGTERM/SIGINT"""
+        generation = self.generation_reader()
+        if generation <= 0:
+            raise RuntimeError("Nenhuma geração do índice publicada. Execute com --publish-index")
+        self.generation_warmer(generation)
+
+        listen_socket = socket.create_server((self.host, self.port), backlog=128)
+        listen_socket.setblocking(False)
+
+        try:
+            if not hasattr(os, "fork"):
+                print("⚠ fork indisponível nesta plataforma: servindo com um único processo")
+                self._serve_single(listen_socket)
+                return
+
+            shared = multiprocessing.RawValue("q", generation)
+            self._supervise(listen_socket, shared)
+        finally:
+            listen_socket.close()
+
+    def _supervise(self, listen_socket: socket.socket, shared) -> None:
+        """Mantém os workers vivos e publica as gerações novas"""
+        previous_handlers = {
+            signum: signal.signal(signum, self._request_stop)
+            for signum in (signal.SIGTERM, signal.SIGINT)
+        }
+        children: Dict[int, int] = {}  # pid -> slot
+        failed_generation = 0
+
+        try:
+            for slot in range(self.workers):
+                children[self._spawn(listen_socket, shared, slot)] = slot
+
+            print(
+                f"✓ Servindo em http://{self.host}:{self.port} com {self.workers} worker(s), "
+                f"geração {shared.value}"
+            )
+
+            while not self._stopping:
+                time.sleep(self.poll_interval)
+                self._reap(children, listen_socket, shared)
+
+                generation = self.generation_reader()
+                if generation in (0, shared.value, failed_generation):
+                    continue
+                try:
+                    self.generation_warmer(generation)
+                except Exception as e:
+                    failed_generation = generation
+                    print(f"❌ Geração {generation} ignorada: {str(e)}")
+                    continue
+                shared.value = generation
+                print(f"✓ Geração {generation} em serviço")
+
+        finally:
+            for pid in children:
+                self._signal(pid, signal.SIGTERM)
+            for pid in list(children):
+                try:
+                    os.waitpid(pid, 0)
+                except ChildProcessError:
+                    pass
+            for signum, handler in previous_handlers.items():
+                signal.signal(signum, handler)
+
+    def _reap(self, children: Dict[int, int], listen_socket: socket.socket, shared) -> None:
+        """Recolhe workers encerrados e recria os que caíram"""
+        while children:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                return
+            if pid == 0:
+                return
+
+            slot = children.pop(pid, None)
+            if slot is None or self._stopping:
+                continue
+            print(f"⚠ Worker {pid} encerrou (status {status}); recriando")
+            children[self._spawn(listen_socket, shared, slot)] = slot
+
+    def _spawn(self, listen_socket: socket.socket, shared, slot: int) -> int:
+        pid = os.fork()
+        if pid:
+            return pid
+
+        # Processo worker: nunca retorna para o código do supervisor
+        exit_code = 0
+        try:
+            self._stopping = False
+            signal.signal(signal.SIGTERM, self._request_stop)
+            signal.signal(signal.SIGINT, signal.SIG_IGN)  # Ctrl+C é tratado pelo supervisor
+            self._serve(listen_socket, lambda: shared.value, slot)
+        except Exception as e:
+            print(f"❌ Worker {os.getpid()}: {str(e)}")
+            exit_code = 1
+        finally:
+            os._exit(exit_code)
+
+    def _serve(self, listen_socket: socket.socket, generation: Callable[[], int], slot: int) -> None:
+        """Loop de atendimento de um worker (até SIGTERM)"""
+        ask_use_case = self.worker_factory(generation, slot)
+        httpd = create_http_server(listen_socket, ask_use_case, generation)
+        httpd.timeout = 0.5
+        while not self._stopping:
+            httpd.handle_request()
+
+    def _serve_single(self, listen_socket: socket.socket) -> None:
+        """Sem fork: um worker no próprio processo, lendo o CURRENT diretamente"""
+        print(f"✓ Servindo em http://{self.host}:{self.port}")
+        try:
+            self._serve(listen_socket, self.generation_reader, 0)
+        except KeyboardInterrupt:
+            pass
+
+    def _request_stop(self, signum, frame) -> None:
+        self._stopping = True
+
+    @staticmethod
+    def _signal(pid: int, signum: int) -> None:
+        try:
+            os.kill(pid, signum)
+        except ProcessLookupError:
+            pass
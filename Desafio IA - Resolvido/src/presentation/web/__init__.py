@@ -1,4 +1,5 @@
 """Web Interface (Streamlit)"""
 from .streamlit_app import StreamlitApp
+from .chat_history import ChatHistory
 
-__all__ = ['StreamlitApp']
+__all__ = ['StreamlitApp', 'ChatHistory']
@@ -0,0 +1,113 @@
+"""
+Histórico de chat limitado e compactado (estado da sessão Streamlit)
+"""
+from collections import deque
+from typing import Dict, List
+
+
+class ChatHistory:
+    """
+    Histórico com janela de mensagens completas e arquivo compactado
+
+    As últimas `window` mensagens ficam completas (renderizadas com todos os
+    widgets). As anteriores são reduzidas a um resumo (pergunta, resposta
+    truncada, fonte e confiança) e mantidas até `max_messages`; as mais
+    antigas são descartadas. Assim o custo de cada rerun não cresce com o
+    tamanho da sessão.
+    """
+
+    def __init__(
+        self,
+        max_messages: int = 200,
+        window: int = 6,
+        summary_chars: int = 160
+    ):
+        """
+        Inicializa histórico
+
+        Args:
+            max_messages: Total de mensagens mantidas (completas + resumidas)
+            window: Mensagens recentes mantidas completas
+            summary_chars: Tamanho máximo do texto resumido
+        """
+        if window < 1 or max_messages < window:
+            raise ValueError("max_messages deve ser maior ou igual a window (>= 1)")
+
+        self.window = window
+        self.summary_chars = summary_chars
+        self._recent: deque = deque()
+        self._archive: deque = deque(maxlen=max_messages - window)
+        self._next_id = 0
+
+    def append(self, role: str, content, **extra) -> Dict:
+        """
+        Adiciona mensagem e compacta as que saíram da janela
+
+        Args:
+            role: "user" ou "assistant"
+            content: Texto ou resposta (dicionário)
+            **extra: Campos adicionais mantidos enquanto a mensagem está completa
+
+        Returns:
+            A mensagem armazenada (com "id" estável, usado em chaves de widgets)
+        """
+        message = {"id": self._next_id, "role": role, "content": content, **extra}
+        self._next_id += 1
+        self._recent.append(message)
+
+        while len(self._recent) > self.window:
+            self._archive.append(self._compact(self._recent.popleft()))
+
+        return message
+
+    @property
+    def recent(self) -> List[Dict]:
+        """Mensagens completas, da mais antiga para a mais recente"""
+        return list(self._recent)
+
+    @property
+    def archived_count(self) -> int:
+        return len(self._archive)
+
+    def archive_page(self, page: int, page_size: int = 20) -> List[Dict]:
+        """
+        Página do histórico resumido (página 0 = mais recentes)
+
+        Returns:
+            Mensagens resumidas em ordem cronológica
+        """
+        end = len(self._archive) - page * page_size
+        start = max(0, end - page_size)
+        if end <= 0:
+            return []
+        return [self._archive[i] for i in range(start, end)]
+
+    def page_count(self, page_size: int = 20) -> int:
+        return (len(self._archive) + page_size - 1) // page_size
+
+    def clear(self) -> None:
+        self._recent.clear()
+        self._archive.clear()
+
+    def __len__(self) -> int:
+        return len(self._recent) + len(self._archive)
+
+    def _compact(self, message: Dict) -> Dict:
+        """Resumo da mensagem (descarta raciocínio, citação e JSON completo)"""
+        content = message["content"]
+
+        if isinstance(content, dict):
+            return {
+                "role": message["role"],
+                "content": self._truncate(str(content.get("resposta", ""))),
+                "fonte": content.get("fonte"),
+                "confianca": content.get("confianca")
+            }
+
+        return {"role": message["role"], "content": self._truncate(str(content))}
+
+    def _truncate(self, text: str) -> str:
+        text = " ".join(text.split())
+        if len(text) <= self.summary_chars:
+            return text
+        return text[:self.summary_chars - 1].rstrip() + "…"
@@ -9,6 +9,7 @@ from src.application.dtos import (
     ProcessDocumentInputDTO,
     AskQuestionInputDTO
 )
+from src.presentation.web.chat_history import ChatHistory
 
 
 class StreamlitApp:
@@ -18,7 +19,12 @@ class StreamlitApp:
         self,
         process_use_case: ProcessDocumentsUseCase,
         ask_use_case: AskQuestionUseCase,
-        docs_folder: str = "./dados"
+        docs_folder: str = "./dados",
+        chunk_size: int = 1000,
+        chunk_overlap: int = 200,
+        history_max_messages: int = 200,
+        history_window: int = 6,
+        history_page_size: int = 20
     ):
         """
         Inicializa app Streamlit
@@ -27,10 +33,20 @@ class StreamlitApp:
             process_use_case: Caso de uso de processamento
             ask_use_case: Caso de uso de perguntas
             docs_folder: Pasta de documentos
+            chunk_size: Tamanho dos chunks na ingestão (CHUNK_SIZE)
+            chunk_overlap: Sobreposição entre chunks (CHUNK_OVERLAP)
+            history_max_messages: Mensagens mantidas no histórico da sessão
+            history_window: Mensagens recentes exibidas por completo
+            history_page_size: Mensagens resumidas por página
         """
         self.process_use_case = process_use_case
         self.ask_use_case = ask_use_case
         self.docs_folder = docs_folder
+        self.chunk_size = chunk_size
+        self.chunk_overlap = chunk_overlap
+        self.history_max_messages = history_max_messages
+        self.history_window = history_window
+        self.history_page_size = history_page_size
 
     def run(self):
         """Executa a aplicação"""
@@ -50,8 +66,11 @@ class StreamlitApp:
 
     def _init_session_state(self):
         """Inicializa estado da sessão"""
-        if 'messages' not in st.session_state:
-            st.session_state.messages = []
+        if 'chat_history' not in st.session_state:
+            st.session_state.chat_history = ChatHistory(
+                max_messages=self.history_max_messages,
+                window=self.history_window
+            )
         if 'documents_loaded' not in st.session_state:
             st.session_state.documents_loaded = False
 
@@ -111,7 +130,7 @@ class StreamlitApp:
             st.markdown("---")
 
             if st.button("🗑️ Limpar Histórico", use_container_width=True):
-                st.session_state.messages = []
+                st.session_state.chat_history.clear()
                 st.rerun()
 
     def _render_main_area(self):
@@ -122,18 +141,50 @@ class StreamlitApp:
         # Verifica e processa documentos se necessário
         self._check_and_process_documents()
 
-        # Exibe histórico
-        for message in st.session_state.messages:
+        # Exibe histórico (resumo paginado + janela de mensagens completas)
+        history = st.session_state.chat_history
+        if history.archived_count:
+            self._render_archived_history(history)
+
+        for message in history.recent:
             with st.chat_message(message["role"]):
                 if message["role"] == "user":
                     st.markdown(message["content"])
                 else:
-                    self._display_answer(message["content"])
+                    self._display_answer(message["content"], message)
 
         # Input do usuário
         if prompt := st.chat_input("Faça sua pergunta sobre os documentos..."):
             self._handle_user_input(prompt)
 
+    def _render_archived_history(self, history: ChatHistory):
+        """Renderiza uma página do histórico resumido em um único bloco"""
+        with st.expander(f"🕘 Mensagens anteriores ({history.archived_count})"):
+            pages = history.page_count(self.history_page_size)
+            page = 0
+            if pages > 1:
+                page = st.number_input(
+                    "Página (1 = mais recentes)",
+                    min_value=1,
+                    max_value=pages,
+                    value=1,
+                    step=1
+                ) - 1
+
+            lines = []
+            for message in history.archive_page(page, self.history_page_size):
+                if message["role"] == "user":
+                    lines.append(f"**Você:** {message['content']}")
+                else:
+                    details = ", ".join(
+                        value for value in (message.get("fonte"), message.get("confianca"))
+                        if value
+                    )
+                    suffix = f" _({details})_" if details else ""
+                    lines.append(f"**Assistente:** {message['content']}{suffix}")
+
+            st.markdown("\n\n".join(lines))
+
     def _render_footer(self):
         """Renderiza rodapé"""
         st.markdown("---")
@@ -159,7 +210,11 @@ class StreamlitApp:
             success_count = 0
             for pdf_file in pdf_files:
                 pdf_path = os.path.join(self.docs_folder, pdf_file)
-                input_dto = ProcessDocumentInputDTO(file_path=pdf_path)
+                input_dto = ProcessDocumentInputDTO(
+                    file_path=pdf_path,
+                    chunk_size=self.chunk_size,
+                    chunk_overlap=self.chunk_overlap
+                )
                 output_dto = self.process_use_case.execute(input_dto)
 
                 if output_dto.success:
@@ -179,7 +234,7 @@ class StreamlitApp:
             self._check_and_process_documents()
 
         # Adiciona mensagem do usuário
-        st.session_state.messages.append({"role": "user", "content": prompt})
+        st.session_state.chat_history.append("user", prompt)
 
         with st.chat_message("user"):
             st.markdown(prompt)
@@ -190,14 +245,14 @@ class StreamlitApp:
                 input_dto = AskQuestionInputDTO(question_text=prompt)
                 output_dto = self.ask_use_case.execute(input_dto)
 
-                self._display_answer(output_dto.to_dict())
-
-                st.session_state.messages.append({
-                    "role": "assistant",
-                    "content": output_dto.to_dict()
-                })
+                message = st.session_state.chat_history.append(
+                    "assistant",
+                    output_dto.to_dict(),
+                    question=prompt
+                )
+                self._display_answer(message["content"], message)
 
-    def _display_answer(self, result: dict):
+    def _display_answer(self, result: dict, message: Optional[dict] = None):
         """Exibe resposta formatada"""
         st.markdown(f"**💡 Resposta:** {result['resposta']}")
 
@@ -218,6 +273,21 @@ class StreamlitApp:
         if result.get('raciocinio'):
             with st.expander("🧠 Ver raciocínio"):
                 st.markdown(result['raciocinio'])
+        elif message is not None and message.get("question"):
+            # Modo rápido: raciocínio só é gerado se o usuário pedir
+            with st.expander("🧠 Ver raciocínio"):
+                if st.button("Gerar raciocínio", key=f"reasoning_{message['id']}"):
+                    with st.spinner("Gerando raciocínio..."):
+                        reasoning_dto = self.ask_use_case.explain(
+                            AskQuestionInputDTO(question_text=message["question"]),
+                            result['resposta']
+                        )
+                    if reasoning_dto.success:
+                        # Fica no histórico: não é gerado de novo nos próximos reruns
+                        result['raciocinio'] = reasoning_dto.reasoning
+                        st.markdown(reasoning_dto.reasoning)
+                    else:
+                        st.error(reasoning_dto.reasoning)
 
         with st.expander("🔍 Ver JSON completo"):
             st.json(result)
@@ -0,0 +1,53 @@
+"""
+Testes do modo rápido (resposta sem raciocínio)
+"""
+import unittest
+
+from src.application.dtos import AskQuestionInputDTO
+from src.application.use_cases.ask_question_use_case import AskQuestionUseCase
+from src.infrastructure.fakes import FakeAIRepository, FakeVectorStoreRepository
+
+
+class FastModeTest(unittest.TestCase):
+
+    def setUp(self):
+        self.ai = FakeAIRepository(
+            embedding_ms=0, generation_ms=0, light_generation_ms=0, fast_generation_ms=0
+        )
+        self.use_case = AskQuestionUseCase(
+            vector_store_repository=FakeVectorStoreRepository(chunks_count=50, search_ms=0),
+            ai_repository=self.ai
+        )
+
+    def test_fast_question_answers_without_reasoning(self):
+        output = self.use_case.execute(
+            AskQuestionInputDTO(question_text="Qual o prazo?", fast_mode=True)
+        )
+
+        self.assertTrue(output.success, output.answer)
+        self.assertEqual(output.reasoning, "")
+
+    def test_fast_batch_answers_without_reasoning(self):
+        questions = [
+            AskQuestionInputDTO(question_text=f"Pergunta {i}", fast_mode=True)
+            for i in range(3)
+        ]
+
+        outputs = list(self.use_case.execute_batch(questions))
+
+        self.assertEqual(len(outputs), 3)
+        self.assertTrue(all(output.success for output in outputs))
+        self.assertTrue(all(output.reasoning == "" for output in outputs))
+
+    def test_explain_generates_reasoning_on_demand(self):
+        question = AskQuestionInputDTO(question_text="Qual o prazo?", fast_mode=True)
+        output = self.use_case.execute(question)
+
+        explanation = self.use_case.explain(question, output.answer)
+
+        self.assertTrue(explanation.success)
+        self.assertTrue(explanation.reasoning)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+"""
+Testes do HedgedCaller
+"""
+import itertools
+import threading
+import time
+import unittest
+
+from src.application.resilience import Deadline, HedgedCaller
+
+
+def _is_ok(result):
+    return result != "erro"
+
+
+class HedgedCallerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.caller = HedgedCaller(percentile=50, min_samples=5)
+        # Janela com latência típica de 50 ms: o hedge sai após 50 ms
+        for _ in range(5):
+            self.caller.tracker("generation").record(0.05)
+
+    def _attempts(self, *behaviours):
+        """Cada chamada executa o próximo (atraso, resultado)"""
+        calls = itertools.count()
+        lock = threading.Lock()
+
+        def function():
+            with lock:
+                delay, result = behaviours[next(calls)]
+            time.sleep(delay)
+            if isinstance(result, Exception):
+                raise result
+            return result
+
+        return function
+
+    def _samples(self):
+        return len(self.caller.tracker("generation")._samples)
+
+    def test_rejected_first_attempt_does_not_beat_pending_hedge(self):
+        # 1ª falha em 100 ms (hedge já enviado em 50 ms); hedge responde em 150 ms
+        function = self._attempts((0.1, "erro"), (0.1, "ok"))
+
+        result, hedged = self.caller.call("generation", function, accept=_is_ok)
+
+        self.assertEqual(result, "ok")
+        self.assertTrue(hedged)
+        # Só a resposta aceita entra na janela de latências
+        self.assertEqual(self._samples(), 6)
+
+    def test_without_accept_first_result_wins(self):
+        function = self._attempts((0.1, "erro"), (0.1, "ok"))
+
+        result, hedged = self.caller.call("generation", function)
+
+        self.assertEqual(result, "erro")
+        self.assertTrue(hedged)
+
+    def test_all_attempts_rejected_returns_last_result(self):
+        function = self._attempts((0.1, "erro"), (0.1, "erro"))
+
+        result, hedged = self.caller.call("generation", function, accept=_is_ok)
+
+        self.assertEqual(result, "erro")
+        self.assertTrue(hedged)
+        self.assertEqual(self._samples(), 5)
+
+    def test_exception_then_hedge_succeeds(self):
+        function = self._attempts((0.1, RuntimeError("falha")), (0.1, "ok"))
+
+        result, hedged = self.caller.call("generation", function, accept=_is_ok)
+
+        self.assertEqual(result, "ok")
+        self.assertTrue(hedged)
+
+    def test_direct_call_does_not_record_rejected_latency(self):
+        caller = HedgedCaller()
+
+        result, hedged = caller.call("generation", lambda: "erro", Deadline(), accept=_is_ok)
+
+        self.assertEqual(result, "erro")
+        self.assertFalse(hedged)
+        self.assertEqual(len(caller.tracker("generation")._samples), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
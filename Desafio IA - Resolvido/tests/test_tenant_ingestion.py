@@ -0,0 +1,94 @@
+"""
+Testes da ingestão por tenant (--user-id) seguida de perguntas do tenant
+"""
+import io
+import os
+import shutil
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+
+from src.application.dtos import AskQuestionInputDTO
+from src.application.use_cases import AskQuestionUseCase, ProcessDocumentsUseCase
+from src.infrastructure.fakes import FakeAIRepository
+from src.infrastructure.storage import (
+    InMemoryDocumentRepository,
+    NumpyIndexSnapshotRepository,
+    SnapshotVectorStoreRepository
+)
+from src.presentation.cli.main_cli import MainCLI
+
+
+class _TextExtractor:
+    """Extrator que devolve uma página fixa"""
+
+    def extract_pages(self, path):
+        return [(1, f"Conteúdo do documento {os.path.basename(path)}")]
+
+
+class _RecordingVectorStore:
+    """Guarda os chunks recebidos (publicados depois como snapshot)"""
+
+    def __init__(self):
+        self.chunks = []
+
+    def add_chunks(self, chunks):
+        self.chunks.extend(chunks)
+
+
+class TenantIngestionTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.docs_folder = os.path.join(self.tmp_dir, "dados")
+        os.makedirs(self.docs_folder)
+        with open(os.path.join(self.docs_folder, "politica.pdf"), "wb") as f:
+            f.write(b"%PDF")
+
+        self.ai = FakeAIRepository(
+            embedding_ms=0, generation_ms=0, light_generation_ms=0, fast_generation_ms=0
+        )
+        self.vector_store = _RecordingVectorStore()
+        self.documents = InMemoryDocumentRepository()
+        process_use_case = ProcessDocumentsUseCase(
+            document_repository=self.documents,
+            vector_store_repository=self.vector_store,
+            ai_repository=self.ai,
+            pdf_extractor=_TextExtractor()
+        )
+        self.cli = MainCLI(
+            process_use_case=process_use_case,
+            ask_use_case=None,
+            docs_folder=self.docs_folder
+        )
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def _ask(self, user_id):
+        snapshot_path = os.path.join(self.tmp_dir, "snapshot")
+        NumpyIndexSnapshotRepository().write(snapshot_path, self.vector_store.chunks)
+        use_case = AskQuestionUseCase(
+            vector_store_repository=SnapshotVectorStoreRepository(snapshot_path),
+            ai_repository=self.ai
+        )
+        return use_case.execute(AskQuestionInputDTO(question_text="Qual a política?", user_id=user_id))
+
+    def test_process_with_user_id_ingests_for_tenant(self):
+        with redirect_stdout(io.StringIO()):
+            self.cli.run(["--process", "--user-id", "acme"])
+
+        self.assertTrue(self.vector_store.chunks)
+        self.assertTrue(all(c.metadata["tenant_id"] == "acme" for c in self.vector_store.chunks))
+        self.assertIsNotNone(self.documents.find_by_id("acme:politica.pdf"))
+
+        output = self._ask("acme")
+        self.assertTrue(output.success, output.answer)
+        self.assertEqual(output.source, "politica.pdf")
+
+        # Outros tenants não enxergam os documentos do tenant
+        self.assertFalse(self._ask("outro").success)
+
+
+if __name__ == "__main__":
+    unittest.main()
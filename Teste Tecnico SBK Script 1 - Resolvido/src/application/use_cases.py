@@ -1,8 +1,21 @@
 import logging
+import queue
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import List, Optional, Sequence
 
+from ..domain.models import City, WeatherData
 from ..domain.repositories import IWeatherScraper, IWeatherRepository
 
 
+@dataclass
+class CrawlSummary:
+    """Resultado da coleta de várias cidades"""
+    total: int
+    saved: int
+    failed: int
+
+
 class ExtractAndSaveWeatherDataUseCase:
     def __init__(
         self,
@@ -33,3 +46,78 @@ class ExtractAndSaveWeatherDataUseCase:
         except Exception as e:
             self.logger.error(f"Erro ao executar caso de uso: {e}")
             return False
+
+    def execute_many(
+        self,
+        cities: Sequence[City],
+        fetch_workers: int = 8,
+        parse_workers: int = 2,
+        batch_size: int = 50
+    ) -> CrawlSummary:
+        """
+        Coleta várias cidades
+
+        Os downloads rodam em `fetch_workers` threads (os limites por host
+        ficam na sessão do scraper), cada página baixada vai para o pool de
+        parsing e os resultados são gravados em lotes de `batch_size`
+        conforme ficam prontos.
+        """
+        self.logger.info(f"Iniciando coleta de {len(cities)} cidade(s)")
+
+        # Um item por cidade: WeatherData ou None (falha no download ou no parsing)
+        results: "queue.Queue[Optional[WeatherData]]" = queue.Queue()
+        saved = 0
+        batch: List[WeatherData] = []
+
+        with ThreadPoolExecutor(max_workers=max(1, fetch_workers)) as fetch_pool, \
+                ThreadPoolExecutor(max_workers=max(1, parse_workers)) as parse_pool:
+
+            def fetched(city: City, future):
+                try:
+                    content = future.result()
+                except Exception as e:
+                    self.logger.error(f"Erro ao baixar {city.nome}: {e}")
+                    content = None
+                if content is None:
+                    results.put(None)
+                else:
+                    parse_pool.submit(self._parse, city, content, results)
+
+            for city in cities:
+                fetch_pool.submit(self.scraper.fetch_page, city.url).add_done_callback(
+                    lambda future, city=city: fetched(city, future)
+                )
+
+            for _ in range(len(cities)):
+                weather_data = results.get()
+                if weather_data is None:
+                    continue
+
+                batch.append(weather_data)
+                if len(batch) >= batch_size:
+                    saved += self._flush(batch)
+                    batch = []
+
+        if batch:
+            saved += self._flush(batch)
+
+        failed = len(cities) - saved
+        self.logger.info(f"Coleta concluída: {saved} salva(s), {failed} falha(s)")
+        return CrawlSummary(total=len(cities), saved=saved, failed=failed)
+
+    def _parse(self, city: City, content: bytes, results: queue.Queue) -> None:
+        try:
+            weather_data = self.scraper.parse_weather_data(content)
+            weather_data.cidade = city.nome
+            results.put(weather_data)
+        except Exception as e:
+            self.logger.error(f"Erro ao extrair dados de {city.nome}: {e}")
+            results.put(None)
+
+    def _flush(self, batch: List[WeatherData]) -> int:
+        try:
+            self.repository.save_many(batch)
+            return len(batch)
+        except Exception as e:
+            self.logger.error(f"Erro ao salvar lote de {len(batch)} registro(s): {e}")
+            return 0
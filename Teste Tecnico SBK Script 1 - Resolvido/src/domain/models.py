@@ -1,5 +1,6 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
+from typing import Dict, Optional
 
 
 @dataclass
@@ -12,6 +13,8 @@ class WeatherData:
     umidade_minima: str
     umidade_maxima: str
     data_coleta: datetime = None
+    cidade: Optional[str] = None
+    extras: Dict[str, str] = field(default_factory=dict)  # campos configurados adicionais
 
     def __post_init__(self):
         if self.data_coleta is None:
@@ -19,12 +22,23 @@ class WeatherData:
 
     def to_dict(self) -> dict:
         """Converte os dados para dicionário"""
-        return {
+        data = {
             'data_coleta': self.data_coleta.strftime('%Y-%m-%d %H:%M:%S'),
             'temperatura_minima': self.temperatura_minima,
             'temperatura_maxima': self.temperatura_maxima,
             'chuva': self.chuva,
             'vento': self.vento,
             'umidade_minima': self.umidade_minima,
-            'umidade_maxima': self.umidade_maxima
+            'umidade_maxima': self.umidade_maxima,
+            **self.extras
         }
+        if self.cidade is not None:
+            data['cidade'] = self.cidade
+        return data
+
+
+@dataclass
+class City:
+    """Cidade da coleta (página de previsão no Climatempo)"""
+    nome: str
+    url: str
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import List, Optional
 from .models import WeatherData
 
 
@@ -11,6 +11,16 @@ class IWeatherScraper(ABC):
         """Extrai dados climáticos de uma URL"""
         pass
 
+    @abstractmethod
+    def fetch_page(self, url: str) -> Optional[bytes]:
+        """Baixa a página de previsão (None em caso de erro)"""
+        pass
+
+    @abstractmethod
+    def parse_weather_data(self, content: bytes) -> WeatherData:
+        """Extrai os dados climáticos do HTML de uma página"""
+        pass
+
 
 class IWeatherRepository(ABC):
     """Interface para repositório de dados climáticos"""
@@ -19,3 +29,8 @@ class IWeatherRepository(ABC):
     def save(self, weather_data: WeatherData) -> None:
         """Salva os dados climáticos"""
         pass
+
+    @abstractmethod
+    def save_many(self, weather_data: List[WeatherData]) -> None:
+        """Salva vários registros de uma vez"""
+        pass
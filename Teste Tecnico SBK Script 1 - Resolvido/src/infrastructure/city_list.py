@@ -0,0 +1,32 @@
+from typing import List
+from urllib.parse import urlsplit
+
+from ..domain.models import City
+
+
+def load_cities(path: str) -> List[City]:
+    """
+    Lê a lista de cidades
+
+    Uma cidade por linha, no formato "nome;url" ou apenas a URL (o nome
+    passa a ser o último trecho do caminho). Linhas vazias e iniciadas por
+    "#" são ignoradas; URLs repetidas são coletadas uma única vez.
+    """
+    cities = []
+    seen = set()
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+
+            if ';' in line:
+                nome, url = (part.strip() for part in line.split(';', 1))
+            else:
+                url = line
+                nome = urlsplit(url).path.rstrip('/').rsplit('/', 1)[-1]
+
+            if url not in seen:
+                seen.add(url)
+                cities.append(City(nome=nome, url=url))
+    return cities
@@ -1,6 +1,7 @@
 import csv
 import os
 import logging
+from typing import List, Sequence
 
 from ..domain.models import WeatherData
 from ..domain.repositories import IWeatherRepository
@@ -9,7 +10,7 @@ from ..domain.repositories import IWeatherRepository
 class CSVWeatherRepository(IWeatherRepository):
     """Implementação do repositório para salvar em CSV"""
 
-    def __init__(self, file_path: str = 'weather_data.csv'):
+    def __init__(self, file_path: str = 'weather_data.csv', extra_fields: Sequence[str] = ()):
         self.file_path = file_path
         self.logger = logging.getLogger(__name__)
         self.fieldnames = [
@@ -19,11 +20,16 @@ class CSVWeatherRepository(IWeatherRepository):
             'chuva',
             'vento',
             'umidade_minima',
-            'umidade_maxima'
+            'umidade_maxima',
+            *extra_fields
         ]
 
     def save(self, weather_data: WeatherData) -> None:
         """Salva os dados climáticos em arquivo CSV"""
+        self.save_many([weather_data])
+
+    def save_many(self, weather_data: List[WeatherData]) -> None:
+        """Salva vários registros abrindo o arquivo uma única vez"""
         try:
             file_exists = os.path.isfile(self.file_path)
 
@@ -35,8 +41,8 @@ class CSVWeatherRepository(IWeatherRepository):
                     self.logger.info(f"Arquivo CSV criado: {self.file_path}")
 
                 # Escreve os dados
-                writer.writerow(weather_data.to_dict())
-                self.logger.info(f"Dados salvos com sucesso em: {self.file_path}")
+                writer.writerows(data.to_dict() for data in weather_data)
+                self.logger.info(f"{len(weather_data)} registro(s) salvo(s) em: {self.file_path}")
 
         except Exception as e:
             self.logger.error(f"Erro ao salvar dados no CSV: {e}")
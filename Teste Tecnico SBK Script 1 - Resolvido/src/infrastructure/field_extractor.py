@@ -0,0 +1,107 @@
+import hashlib
+import json
+from dataclasses import dataclass
+from typing import Dict, List, Sequence, Tuple
+
+from lxml import etree, html
+
+
+@dataclass(frozen=True)
+class FieldSpec:
+    """
+    Campo extraído da página
+
+    Cada seletor é tentado em ordem até um deles retornar um valor não vazio.
+    Seletores com prefixo "css:" usam seletor CSS (requer cssselect); os
+    demais são XPath (o prefixo "xpath:" é opcional). Prefira ancorar o
+    XPath em id('...'), que usa o índice de ids do documento, a
+    //*[@id='...'], que percorre a página inteira.
+    """
+    name: str
+    selectors: Tuple[str, ...]
+    mode: str = "text"  # text, text_content ou attr:<atributo>
+    default: str = "N/A"
+
+
+class CompiledFieldExtractor:
+    """Seletores compilados uma única vez e aplicados a um único parse lxml"""
+
+    def __init__(self, specs: Sequence[FieldSpec], encoding: str = 'utf-8'):
+        self.specs = list(specs)
+        # Identifica campos e seletores (resultados guardados de outra configuração não valem)
+        self.fingerprint = hashlib.sha1(json.dumps(
+            [[spec.name, list(spec.selectors), spec.mode, spec.default] for spec in self.specs] + [encoding]
+        ).encode('utf-8')).hexdigest()[:12]
+        # Sem encoding explícito, o lxml assume latin-1 em bytes sem <meta charset>
+        self._parser = html.HTMLParser(encoding=encoding)
+        self._compiled: List[Tuple[FieldSpec, List[etree.XPath]]] = [
+            (spec, [self._compile(selector) for selector in spec.selectors])
+            for spec in self.specs
+        ]
+
+    @property
+    def field_names(self) -> List[str]:
+        return [spec.name for spec in self.specs]
+
+    def parse(self, content: bytes) -> html.HtmlElement:
+        """Parse único do HTML"""
+        return html.fromstring(content, parser=self._parser)
+
+    def extract(self, tree: html.HtmlElement) -> Dict[str, str]:
+        """Valor de cada campo (primeiro seletor com resultado, senão o padrão)"""
+        values = {}
+        for spec, selectors in self._compiled:
+            values[spec.name] = spec.default
+            for selector in selectors:
+                value = self._value(selector(tree), spec.mode)
+                if value:
+                    values[spec.name] = value
+                    break
+        return values
+
+    @staticmethod
+    def _compile(selector: str) -> etree.XPath:
+        if selector.startswith("css:"):
+            # CSSSelector é um etree.XPath (a tradução para XPath ocorre aqui)
+            from lxml.cssselect import CSSSelector
+            return CSSSelector(selector[len("css:"):], translator="html")
+        if selector.startswith("xpath:"):
+            selector = selector[len("xpath:"):]
+        return etree.XPath(selector)
+
+    @staticmethod
+    def _value(result, mode: str) -> str:
+        # XPath pode retornar string, número ou lista de elementos/strings
+        if isinstance(result, (str, float)):
+            return str(result).strip()
+        if not result:
+            return ""
+
+        first = result[0]
+        if isinstance(first, str):
+            return first.strip()
+        if mode == "text_content":
+            return first.text_content().strip()
+        if mode.startswith("attr:"):
+            return (first.get(mode[len("attr:"):]) or "").strip()
+        return (first.text or "").strip()
+
+
+def load_field_specs(path: str) -> List[FieldSpec]:
+    """
+    Lê os campos de um arquivo JSON
+
+    Formato: [{"name": ..., "selectors": [...], "mode"?: ..., "default"?: ...}]
+    """
+    with open(path, encoding='utf-8') as f:
+        entries = json.load(f)
+
+    return [
+        FieldSpec(
+            name=entry["name"],
+            selectors=tuple(entry["selectors"]),
+            mode=entry.get("mode", "text"),
+            default=entry.get("default", "N/A")
+        )
+        for entry in entries
+    ]
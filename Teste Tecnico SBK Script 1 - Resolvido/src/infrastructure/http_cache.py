@@ -0,0 +1,166 @@
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+import time
+from dataclasses import asdict, dataclass
+from typing import Dict, Optional
+
+import requests
+
+
+_MAX_AGE = re.compile(r'(?:^|,)\s*(?:s-)?max-age\s*=\s*"?(\d+)', re.IGNORECASE)
+
+
+@dataclass
+class CacheEntry:
+    """Validadores e frescor de uma página guardada"""
+    url: str
+    content_hash: str
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    fresh_until: float = 0.0  # time.time() até quando vale sem consultar o servidor
+
+
+@dataclass
+class CachedResponse:
+    content: bytes
+    content_hash: str
+    source: str  # 'rede', '304' ou 'fresco'
+
+
+class HTTPCache:
+    """
+    Cache HTTP em disco com requisições condicionais
+
+    Guarda o corpo de cada página e seus validadores (ETag, Last-Modified)
+    em `directory`. Enquanto o Cache-Control (max-age) diz que a cópia está
+    fresca, nem há requisição; depois disso a página é pedida com
+    If-None-Match/If-Modified-Since e um 304 devolve o corpo do disco.
+    Respostas com no-store não são guardadas e no-cache sempre revalida.
+
+    Também guarda os campos já extraídos de cada conteúdo (pelo hash do
+    corpo), para o scraper não refazer o parsing de uma página inalterada.
+    """
+
+    def __init__(self, directory: str, session: Optional[requests.Session] = None):
+        self.directory = directory
+        self.session = session or requests.Session()
+        self.logger = logging.getLogger(__name__)
+        os.makedirs(os.path.join(directory, 'parsed'), exist_ok=True)
+
+    def get(self, url: str, **kwargs) -> CachedResponse:
+        """GET com cache; erros HTTP (exceto 304) levantam RequestException"""
+        entry = self._load_entry(url)
+        content = self._read(self._path(url, '.body')) if entry else None
+        if content is None:
+            entry = None
+
+        if entry and time.time() < entry.fresh_until:
+            self.logger.info(f"Cache fresco: {url}")
+            return CachedResponse(content, entry.content_hash, 'fresco')
+
+        headers = dict(kwargs.pop('headers', None) or {})
+        if entry and entry.etag:
+            headers['If-None-Match'] = entry.etag
+        if entry and entry.last_modified:
+            headers['If-Modified-Since'] = entry.last_modified
+
+        response = self.session.get(url, headers=headers, **kwargs)
+
+        if entry and response.status_code == 304:
+            self.logger.info(f"Não modificada (304): {url}")
+            # O 304 pode trazer validadores e Cache-Control atualizados
+            self._store(url, entry.content_hash, response, previous=entry)
+            return CachedResponse(content, entry.content_hash, '304')
+
+        response.raise_for_status()
+        content = response.content
+        content_hash = hashlib.sha256(content).hexdigest()
+        if self._store(url, content_hash, response):
+            if entry is None or entry.content_hash != content_hash:
+                self._write(self._path(url, '.body'), content)
+        return CachedResponse(content, content_hash, 'rede')
+
+    def load_parsed(self, content_hash: str, fingerprint: str) -> Optional[Dict[str, str]]:
+        """Campos extraídos antes de um conteúdo (mesmos seletores)"""
+        data = self._read(self._parsed_path(content_hash, fingerprint))
+        return json.loads(data) if data is not None else None
+
+    def save_parsed(self, content_hash: str, fingerprint: str, values: Dict[str, str]) -> None:
+        self._write(
+            self._parsed_path(content_hash, fingerprint),
+            json.dumps(values, ensure_ascii=False).encode('utf-8')
+        )
+
+    def _store(
+        self,
+        url: str,
+        content_hash: str,
+        response: requests.Response,
+        previous: Optional[CacheEntry] = None
+    ) -> bool:
+        cache_control = response.headers.get('Cache-Control', '').lower()
+        if 'no-store' in cache_control:
+            self._remove(url)
+            return False
+
+        max_age = 0
+        match = _MAX_AGE.search(cache_control)
+        if match and 'no-cache' not in cache_control:
+            age = response.headers.get('Age', '0')
+            max_age = max(0, int(match.group(1)) - (int(age) if age.isdigit() else 0))
+
+        entry = CacheEntry(
+            url=url,
+            content_hash=content_hash,
+            etag=response.headers.get('ETag') or (previous.etag if previous else None),
+            last_modified=response.headers.get('Last-Modified') or (previous.last_modified if previous else None),
+            fresh_until=time.time() + max_age
+        )
+        self._write(self._path(url, '.json'), json.dumps(asdict(entry)).encode('utf-8'))
+        return True
+
+    def _load_entry(self, url: str) -> Optional[CacheEntry]:
+        data = self._read(self._path(url, '.json'))
+        if data is None:
+            return None
+        try:
+            return CacheEntry(**json.loads(data))
+        except (ValueError, TypeError):
+            return None
+
+    def _remove(self, url: str) -> None:
+        for suffix in ('.json', '.body'):
+            try:
+                os.remove(self._path(url, suffix))
+            except FileNotFoundError:
+                pass
+
+    def _path(self, url: str, suffix: str) -> str:
+        return os.path.join(self.directory, hashlib.sha1(url.encode('utf-8')).hexdigest() + suffix)
+
+    def _parsed_path(self, content_hash: str, fingerprint: str) -> str:
+        return os.path.join(self.directory, 'parsed', f"{content_hash}-{fingerprint}.json")
+
+    @staticmethod
+    def _read(path: str) -> Optional[bytes]:
+        try:
+            with open(path, 'rb') as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    @staticmethod
+    def _write(path: str, data: bytes) -> None:
+        # Escrita atômica: um arquivo pela metade nunca é lido como cache
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
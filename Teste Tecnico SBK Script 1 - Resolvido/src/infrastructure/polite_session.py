@@ -0,0 +1,64 @@
+import threading
+import time
+from collections import defaultdict
+from typing import Dict
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+class HostLimiter:
+    """Limite de requisições simultâneas e de taxa para um host"""
+
+    def __init__(self, max_concurrent: int, requests_per_second: float):
+        self.semaphore = threading.BoundedSemaphore(max_concurrent)
+        self.interval = 1.0 / requests_per_second if requests_per_second > 0 else 0.0
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def wait_turn(self) -> None:
+        """Espera o próximo horário livre (início das requisições espaçado por `interval`)"""
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+class PoliteSession(requests.Session):
+    """
+    Sessão keep-alive com limites de cortesia por host
+
+    As conexões ficam num pool reaproveitado entre requisições (sem novo
+    handshake TCP/TLS a cada página). Cada host tem no máximo
+    `max_per_host` requisições simultâneas e `requests_per_second` inícios
+    de requisição por segundo, independentemente de quantas threads usam a
+    sessão.
+    """
+
+    def __init__(self, max_per_host: int = 4, requests_per_second: float = 2.0, pool_hosts: int = 10):
+        super().__init__()
+        self.max_per_host = max_per_host
+        self.requests_per_second = requests_per_second
+        self._limiters: Dict[str, HostLimiter] = defaultdict(
+            lambda: HostLimiter(max_per_host, requests_per_second)
+        )
+        self._limiters_lock = threading.Lock()
+
+        adapter = HTTPAdapter(pool_connections=pool_hosts, pool_maxsize=max_per_host)
+        self.mount('http://', adapter)
+        self.mount('https://', adapter)
+
+    def request(self, method, url, *args, **kwargs):
+        limiter = self._limiter(urlsplit(url).netloc)
+        with limiter.semaphore:
+            limiter.wait_turn()
+            return super().request(method, url, *args, **kwargs)
+
+    def _limiter(self, host: str) -> HostLimiter:
+        with self._limiters_lock:
+            return self._limiters[host]
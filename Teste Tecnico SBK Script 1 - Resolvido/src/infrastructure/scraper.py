@@ -1,74 +1,100 @@
+import hashlib
+import os
 import requests
-from bs4 import BeautifulSoup
-from lxml import html
-from typing import Optional
+from typing import List, Optional, Sequence
 import logging
 
 from ..domain.models import WeatherData
 from ..domain.repositories import IWeatherScraper
+from .field_extractor import CompiledFieldExtractor, FieldSpec, load_field_specs
+from .http_cache import HTTPCache
+
+
+# Campos do WeatherData; os demais campos configurados vão para `extras`
+WEATHER_FIELDS = (
+    'temperatura_minima',
+    'temperatura_maxima',
+    'chuva',
+    'vento',
+    'umidade_minima',
+    'umidade_maxima'
+)
+
+DEFAULT_FIELDS_PATH = os.path.join(os.path.dirname(__file__), 'climatempo_fields.json')
 
 
 class ClimatempoScraper(IWeatherScraper):
 
-    def __init__(self):
+    def __init__(
+        self,
+        fields: Optional[Sequence[FieldSpec]] = None,
+        session: Optional[requests.Session] = None,
+        cache: Optional[HTTPCache] = None
+    ):
         self.logger = logging.getLogger(__name__)
+        # Sessão keep-alive (conexões reaproveitadas entre páginas)
+        self.session = session or requests.Session()
+        # Cache HTTP em disco (requisições condicionais e parsing reaproveitado)
+        self.cache = cache
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         }
+        # Seletores compilados uma única vez (campos em climatempo_fields.json)
+        self.extractor = CompiledFieldExtractor(
+            fields if fields is not None else load_field_specs(DEFAULT_FIELDS_PATH)
+        )
 
-    def extract_weather_data(self, url: str) -> Optional[WeatherData]:
-        try:
-            self.logger.info(f"Extraindo dados de: {url}")
+    @property
+    def extra_fields(self) -> List[str]:
+        """Campos configurados além dos do WeatherData"""
+        return [name for name in self.extractor.field_names if name not in WEATHER_FIELDS]
 
-            response = requests.get(url, headers=self.headers, timeout=10)
-            response.raise_for_status()
+    def extract_weather_data(self, url: str) -> Optional[WeatherData]:
+        content = self.fetch_page(url)
+        if content is None:
+            return None
 
-            soup = BeautifulSoup(response.content, 'html.parser')
-            tree = html.fromstring(response.content)
-
-            # Extrair temperatura mínima
-            temp_min_elem = soup.find(id='min-temp-1')
-            temperatura_minima = temp_min_elem.text.strip() if temp_min_elem else 'N/A'
-
-            # Extrair temperatura máxima
-            temp_max_elem = soup.find(id='max-temp-1')
-            temperatura_maxima = temp_max_elem.text.strip() if temp_max_elem else 'N/A'
-
-            # Extrair chuva
-            chuva_xpath = '//*[@id="mainContent"]/div[7]/div[3]/div[1]/div[2]/div[2]/div[3]/div[1]/ul/li[2]/div/span'
-            chuva_elem = tree.xpath(chuva_xpath)
-            chuva = chuva_elem[0].text.strip() if chuva_elem and chuva_elem[0].text else 'N/A'
-
-            # Extrair vento
-            vento_xpath = '//*[@id="mainContent"]/div[7]/div[3]/div[1]/div[2]/div[2]/div[3]/div[1]/ul/li[3]/div'
-            vento_elem = tree.xpath(vento_xpath)
-            vento = vento_elem[0].text_content().strip() if vento_elem else 'N/A'
-
-            # Extrair umidade mínima
-            umidade_min_xpath = '//*[@id="mainContent"]/div[7]/div[3]/div[1]/div[2]/div[2]/div[3]/div[1]/ul/li[4]/div/p/span[1]'
-            umidade_min_elem = tree.xpath(umidade_min_xpath)
-            umidade_minima = umidade_min_elem[0].text.strip() if umidade_min_elem and umidade_min_elem[0].text else 'N/A'
-
-            # Extrair umidade máxima
-            umidade_max_xpath = '//*[@id="mainContent"]/div[7]/div[3]/div[1]/div[2]/div[2]/div[3]/div[1]/ul/li[4]/div/p/span[2]'
-            umidade_max_elem = tree.xpath(umidade_max_xpath)
-            umidade_maxima = umidade_max_elem[0].text.strip() if umidade_max_elem and umidade_max_elem[0].text else 'N/A'
-
-            weather_data = WeatherData(
-                temperatura_minima=temperatura_minima,
-                temperatura_maxima=temperatura_maxima,
-                chuva=chuva,
-                vento=vento,
-                umidade_minima=umidade_minima,
-                umidade_maxima=umidade_maxima
-            )
+        try:
+            weather_data = self.parse_weather_data(content)
 
             self.logger.info("Dados extraídos com sucesso")
             return weather_data
 
-        except requests.exceptions.RequestException as e:
-            self.logger.error(f"Erro ao fazer requisição: {e}")
-            return None
         except Exception as e:
             self.logger.error(f"Erro ao extrair dados: {e}")
             return None
+
+    def fetch_page(self, url: str) -> Optional[bytes]:
+        try:
+            self.logger.info(f"Extraindo dados de: {url}")
+
+            if self.cache is not None:
+                return self.cache.get(url, headers=self.headers, timeout=10).content
+
+            response = self.session.get(url, headers=self.headers, timeout=10)
+            response.raise_for_status()
+            return response.content
+
+        except requests.exceptions.RequestException as e:
+            self.logger.error(f"Erro ao fazer requisição: {e}")
+            return None
+
+    def parse_weather_data(self, content: bytes) -> WeatherData:
+        """Extrai os campos configurados de um único parse do HTML"""
+        if self.cache is None:
+            values = self.extractor.extract(self.extractor.parse(content))
+        else:
+            # Conteúdo já visto (304 ou mesmo hash) reaproveita os campos sem parsing
+            content_hash = hashlib.sha256(content).hexdigest()
+            fingerprint = self.extractor.fingerprint
+            values = self.cache.load_parsed(content_hash, fingerprint)
+            if values is None:
+                values = self.extractor.extract(self.extractor.parse(content))
+                self.cache.save_parsed(content_hash, fingerprint, values)
+            else:
+                self.logger.info("Página inalterada, parsing ignorado")
+
+        return WeatherData(
+            **{name: values.pop(name, 'N/A') for name in WEATHER_FIELDS},
+            extras=values
+        )
@@ -1,8 +1,12 @@
+import argparse
 import logging
 import sys
 
 from ..infrastructure.scraper import ClimatempoScraper
 from ..infrastructure.csv_repository import CSVWeatherRepository
+from ..infrastructure.polite_session import PoliteSession
+from ..infrastructure.http_cache import HTTPCache
+from ..infrastructure.city_list import load_cities
 from ..application.use_cases import ExtractAndSaveWeatherDataUseCase
 
 
@@ -18,7 +22,26 @@ def setup_logging():
     )
 
 
-def main():
+def parse_args(args=None):
+    parser = argparse.ArgumentParser(description="Web Scraper de Dados Climáticos - Climatempo")
+    parser.add_argument(
+        '--cidades',
+        metavar='ARQUIVO',
+        help='Lista de cidades (uma por linha: "nome;url" ou só a URL) para coleta em lote'
+    )
+    parser.add_argument('--saida', help='Arquivo CSV de saída')
+    parser.add_argument('--por-host', type=int, default=4, help='Requisições simultâneas por host (padrão: 4)')
+    parser.add_argument('--req-por-segundo', type=float, default=2.0, help='Requisições por segundo por host (padrão: 2)')
+    parser.add_argument('--parsers', type=int, default=2, help='Workers de parsing (padrão: 2)')
+    parser.add_argument('--lote', type=int, default=50, help='Registros por gravação no CSV (padrão: 50)')
+    parser.add_argument('--cache', default='.cache_http', help='Diretório do cache HTTP (padrão: .cache_http)')
+    parser.add_argument('--sem-cache', action='store_true', help='Sempre baixa e analisa as páginas')
+    return parser.parse_args(args)
+
+
+def main(args=None):
+    options = parse_args(args)
+
     # Configura logging
     setup_logging()
     logger = logging.getLogger(__name__)
@@ -27,14 +50,18 @@ def main():
     logger.info("Iniciando Web Scraper de Dados Climáticos")
     logger.info("=" * 50)
 
+    if options.cidades:
+        return crawl_cities(options, logger)
+
     url = "https://www.climatempo.com.br/previsao-do-tempo/cidade/558/saopaulo-sp"
 
     # Nome do arquivo CSV de saída
-    csv_file = "dados_climaticos.csv"
+    csv_file = options.saida or "dados_climaticos.csv"
 
     # Injeção de dependências
-    scraper = ClimatempoScraper()
-    repository = CSVWeatherRepository(file_path=csv_file)
+    session = PoliteSession()
+    scraper = ClimatempoScraper(session=session, cache=build_cache(options, session))
+    repository = CSVWeatherRepository(file_path=csv_file, extra_fields=scraper.extra_fields)
     use_case = ExtractAndSaveWeatherDataUseCase(scraper=scraper, repository=repository)
 
     # Executa o caso de uso
@@ -50,5 +77,39 @@ def main():
         return 1
 
 
+def build_cache(options, session):
+    if options.sem_cache:
+        return None
+    return HTTPCache(options.cache, session=session)
+
+
+def crawl_cities(options, logger):
+    cities = load_cities(options.cidades)
+    if not cities:
+        print(f"\n✗ Nenhuma cidade em {options.cidades}")
+        return 1
+
+    csv_file = options.saida or "dados_climaticos_cidades.csv"
+
+    # Sessão única: conexões reaproveitadas e limites de cortesia por host
+    session = PoliteSession(max_per_host=options.por_host, requests_per_second=options.req_por_segundo)
+    scraper = ClimatempoScraper(session=session, cache=build_cache(options, session))
+    repository = CSVWeatherRepository(file_path=csv_file, extra_fields=['cidade', *scraper.extra_fields])
+    use_case = ExtractAndSaveWeatherDataUseCase(scraper=scraper, repository=repository)
+
+    summary = use_case.execute_many(
+        cities,
+        fetch_workers=options.por_host,
+        parse_workers=options.parsers,
+        batch_size=options.lote
+    )
+
+    logger.info(f"{summary.saved}/{summary.total} cidade(s) salva(s) em: {csv_file}")
+    print(f"\n✓ {summary.saved}/{summary.total} cidade(s) salva(s) em: {csv_file}")
+    if summary.failed:
+        print(f"✗ {summary.failed} falha(s). Verifique o arquivo de log.")
+    return 0 if summary.saved else 1
+
+
 if __name__ == "__main__":
     sys.exit(main())